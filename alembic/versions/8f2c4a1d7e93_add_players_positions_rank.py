@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Add players positions rank.
+
+Revision ID: 8f2c4a1d7e93
+Revises: 130784632737
+Create Date: 2026-10-19 18:42:11.204518
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f2c4a1d7e93"
+down_revision = "130784632737"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade."""
+    op.add_column(
+        "players_positions",
+        sa.Column("rank", sa.BigInteger(), sa.Identity(), nullable=False),
+    )
+
+
+def downgrade():
+    """Downgrade."""
+    op.drop_column("players_positions", "rank")
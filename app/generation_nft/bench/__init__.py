@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/bench/__init__.py
+"""
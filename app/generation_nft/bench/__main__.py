@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/bench/__main__.py
+"""
+import argparse
+import json
+import sys
+
+from app.generation_nft.bench.bench import (
+    compare_reports,
+    get_environment,
+    get_photos,
+    run_benchmark,
+)
+from app.generation_nft.bench.constants import (
+    BENCH_ITERATIONS,
+    BENCH_PICTURES_PATH,
+    BENCH_REGRESSION_THRESHOLD,
+    BENCH_SEED,
+    BENCH_SWEEP_THREADS,
+    BENCH_SWEEP_WORKERS,
+    BENCH_WARMUP,
+)
+from app.generation_nft.bench.startup import profile_imports
+from app.generation_nft.bench.sweep import run_sweep
+from app.generation_nft.libraries.card.constants import EncodingProfile
+from app.generation_nft.threads import configure_threads
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-i",
+        "--iterations",
+        type=int,
+        default=BENCH_ITERATIONS,
+        help="Nombre de générations mesurées.",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=BENCH_WARMUP,
+        help="Nombre de générations non mesurées avant le benchmark.",
+    )
+    parser.add_argument(
+        "-p",
+        "--pictures",
+        default=BENCH_PICTURES_PATH,
+        help="Dossier du jeu de photos.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=[profile.name for profile in EncodingProfile],
+        default=EncodingProfile.ARTIFACT.name,
+        help="Profil d'encodage de la carte.",
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=BENCH_SEED,
+        help="Graine du tirage des parties du NFT.",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="Mesure uniquement le démarrage de l'API (python -X importtime), sans générer de NFT.",
+    )
+    parser.add_argument(
+        "--skip-startup",
+        action="store_true",
+        help="Ne mesure pas le démarrage de l'API.",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Mesure le débit de chaque combinaison workers × threads, chaque worker est un processus.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=BENCH_SWEEP_WORKERS,
+        help="Nombres de workers du balayage.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=BENCH_SWEEP_THREADS,
+        help="Nombres de threads OpenCV et torch par worker du balayage.",
+    )
+    parser.add_argument(
+        "--pin",
+        action="store_true",
+        help="Réserve des CPU à chaque worker du balayage (WORKER_CPU_AFFINITY).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Fichier JSON du rapport, affiché sur la sortie standard par défaut.",
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        help="Rapport JSON de référence, le code de sortie vaut 1 en cas de régression.",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=BENCH_REGRESSION_THRESHOLD,
+        help="Hausse relative tolérée avant de signaler une régression.",
+    )
+    args = parser.parse_args()
+
+    if args.sweep:
+        report = run_sweep(
+            args.pictures,
+            workers_counts=args.workers,
+            threads_counts=args.threads,
+            pin=args.pin,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            profile=EncodingProfile[args.profile].value,
+            seed=args.seed,
+        )
+    elif args.startup:
+        report = get_environment()
+    else:
+        threads = configure_threads()
+        report = run_benchmark(
+            get_photos(args.pictures),
+            iterations=args.iterations,
+            warmup=args.warmup,
+            profile=EncodingProfile[args.profile].value,
+            seed=args.seed,
+        )
+        report["config"]["threads"] = threads
+    if not (args.sweep or args.skip_startup):
+        report["startup"] = profile_imports()
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            regressions = compare_reports(
+                json.load(baseline_file), report, args.threshold
+            )
+        for regression in regressions:
+            print(f"|-- RÉGRESSION {regression} --|", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/bench/bench.py
+"""
+import os
+import platform
+import random
+import resource
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from app import logger
+from app.exceptions import PronochainException
+from app.generation_nft.bench.constants import (
+    BENCH_ITERATIONS,
+    BENCH_PARTS_PATH,
+    BENCH_PICTURE_EXTENSIONS,
+    BENCH_PICTURES_PATH,
+    BENCH_REGRESSION_THRESHOLD,
+    BENCH_REPORT_VERSION,
+    BENCH_SEED,
+    BENCH_WARMUP,
+)
+from app.generation_nft.handler import GenerateNFT
+from app.generation_nft.libraries.card.constants import EncodingProfile
+from app.generation_nft.libraries.generation.constants import PartType
+from app.generation_nft.libraries.generation.generation import Generation
+from app.generation_nft.timing import job_timings, span, timed
+from app.generation_nft_db.models.countries import Country
+from app.generation_nft_db.models.generation import Combination
+from app.generation_nft_db.models.nft_parts import Element
+from app.generation_nft_db.models.players import Player
+from app.generation_nft_db.schemas.generation import GenerationPart
+from app.settings import settings
+
+
+class BenchGenerateNFT(GenerateNFT):
+    """Génération du NFT dont les images sont lues en local plutôt que sur nft.storage."""
+
+    def __init__(self, parts: List[GenerationPart], photo_path: str):
+        """Initialise la génération.
+
+        Args:
+            parts (List[GenerationPart]): liste des parties du NFT.
+            photo_path (str): photo utilisée à la place de celle du joueur.
+        """
+        self.photo_path = photo_path
+        super().__init__(parts)
+
+    def get_value(
+        self, type: int, model: Union[Element, Country, Player, str], channel: int
+    ) -> Union[np.array, str, tuple]:
+        """Récupère la valeur, les images sont lues dans les fixtures.
+
+        Args:
+            type (int): type de la partie.
+            model (Union[Element, Country, Player, str]): modèle.
+            channel (int): dimension de la couleur.
+
+        Returns:
+            Union[np.array, str, tuple]: valeur.
+        """
+        if type != PartType.PICTURE.value:
+            return super().get_value(type, model, channel)
+        return self.local_picture(model, channel)
+
+    def get_picture_path(self, model: Union[Element, Country, Player]) -> str:
+        """Récupère le chemin local de l'image d'une partie, comme enregistrée par les fixtures.
+
+        Args:
+            model (Union[Element, Country, Player]): modèle.
+
+        Raises:
+            PronochainException: aucune image locale pour ce modèle.
+
+        Returns:
+            str: chemin de l'image.
+        """
+        if isinstance(model, Player):
+            return self.photo_path
+        elif isinstance(model, Country):
+            return f"{BENCH_PARTS_PATH}/flags/{model.code.lower()}.png"
+        elif isinstance(model, Element):
+            return f"{BENCH_PARTS_PATH}/{'/'.join(model.name.split('_')[:-1])}/{model.name}.png"
+        raise PronochainException(
+            f"Aucune image locale pour le modèle {type(model).__name__}."
+        )
+
+    @timed("asset_fetch")
+    def local_picture(
+        self, model: Union[Element, Country, Player], channel: int
+    ) -> np.array:
+        """Lit l'image locale d'une partie.
+
+        Args:
+            model (Union[Element, Country, Player]): modèle.
+            channel (int): dimension de la couleur.
+
+        Raises:
+            PronochainException: l'image n'a pas été téléchargée.
+
+        Returns:
+            np.array: image.
+        """
+        picture_path = self.get_picture_path(model)
+        try:
+            with open(picture_path, "rb") as picture_file:
+                return self.decode_picture(picture_file.read(), channel)
+        except FileNotFoundError:
+            raise PronochainException(
+                f"L'image {picture_path} est introuvable, les fixtures doivent être téléchargées (DOWNLOAD_DATA)."
+            )
+
+
+class BenchGeneration(Generation):
+    """Génération de référence, les combinaisons ne sont pas enregistrées et rien n'est envoyé sur nft.storage."""
+
+    def get_or_create(self, params: dict) -> int:
+        """Récupère le nombre de fois que la combinaison est apparue, sans l'enregistrer.
+
+        Args:
+            params (dict): parties du NFT.
+
+        Returns:
+            int: nombre de fois où la combinaison serait apparue.
+        """
+        combination = self.db.query(Combination).filter_by(**params).one_or_none()
+        return 1 if combination is None else combination.count + 1
+
+    def generate_picture(self, photo_path: str, profile: int) -> bytes:
+        """Génère l'image du NFT à partir d'une photo.
+
+        Args:
+            photo_path (str): photo du joueur.
+            profile (int): profil d'encodage de la carte.
+
+        Returns:
+            bytes: image encodée.
+        """
+        with job_timings("la génération de référence") as self.timings:
+            with span("db"):
+                generation_parts = self.get_generation_parts()
+
+            generate_nft = BenchGenerateNFT(generation_parts, photo_path)
+            future = generate_nft.handler(profile)
+            with span("encode"):
+                return future.result()
+
+
+def get_photos(pictures_path: str = BENCH_PICTURES_PATH) -> List[str]:
+    """Récupère le jeu de photos, dans un ordre fixe.
+
+    Args:
+        pictures_path (str, optional): dossier des photos. Défaut à BENCH_PICTURES_PATH.
+
+    Returns:
+        List[str]: chemins des photos.
+    """
+    return sorted(
+        str(path)
+        for path in Path(pictures_path).iterdir()
+        if path.suffix.lower() in BENCH_PICTURE_EXTENSIONS
+    )
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """Résume les durées d'une étape.
+
+    Args:
+        durations (List[float]): durées en secondes.
+
+    Returns:
+        Dict[str, float]: nombre de mesures, moyenne, p50, p95, minimum et maximum.
+    """
+    p50, p95 = np.percentile(durations, [50, 95])
+    return {
+        "count": len(durations),
+        "mean": float(np.mean(durations)),
+        "p50": float(p50),
+        "p95": float(p95),
+        "min": float(np.min(durations)),
+        "max": float(np.max(durations)),
+    }
+
+
+def get_peak_rss() -> float:
+    """Récupère le pic de mémoire résidente du processus.
+
+    Returns:
+        float: pic de mémoire en Mo.
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en kilo-octets sous Linux et en octets sous macOS
+    return peak_rss / (1024**2 if platform.system() == "Darwin" else 1024)
+
+
+def get_commit() -> Optional[str]:
+    """Récupère le commit courant, pour comparer les rapports.
+
+    Returns:
+        Optional[str]: hash du commit, None hors d'un dépôt git.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_environment() -> dict:
+    """Récupère l'environnement du benchmark, enregistré dans chaque rapport.
+
+    Returns:
+        dict: version du rapport, commit, date, version de python, plateforme et nombre de CPU.
+    """
+    return {
+        "version": BENCH_REPORT_VERSION,
+        "commit": get_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmark(
+    photos: List[str],
+    iterations: int = BENCH_ITERATIONS,
+    warmup: int = BENCH_WARMUP,
+    profile: int = EncodingProfile.ARTIFACT.value,
+    seed: int = BENCH_SEED,
+) -> dict:
+    """Mesure la génération complète du NFT sur un jeu de photos fixe.
+
+    Les photos sont utilisées à tour de rôle, les parties du NFT sont tirées avec une graine fixe.
+    Le cache des visages prétraités est désactivé pour mesurer chaque étape à chaque génération.
+
+    Args:
+        photos (List[str]): chemins des photos.
+        iterations (int, optional): nombre de générations mesurées. Défaut à BENCH_ITERATIONS.
+        warmup (int, optional): nombre de générations non mesurées (chargement des modèles). Défaut à BENCH_WARMUP.
+        profile (int, optional): profil d'encodage de la carte. Défaut à EncodingProfile.ARTIFACT.value.
+        seed (int, optional): graine du tirage des parties. Défaut à BENCH_SEED.
+
+    Raises:
+        PronochainException: aucune photo à mesurer.
+
+    Returns:
+        dict: rapport du benchmark.
+    """
+    if not photos:
+        raise PronochainException("Aucune photo pour le benchmark.")
+    timing_enabled = settings.TIMING_ENABLED
+    face_preprocessing_cache = settings.FACE_PREPROCESSING_CACHE
+    settings.TIMING_ENABLED = True
+    settings.FACE_PREPROCESSING_CACHE = False
+    random.seed(seed)
+
+    durations: Dict[str, List[float]] = {}
+    failures = 0
+    try:
+        with BenchGeneration() as generation:
+            start = time.perf_counter()
+            for index in range(warmup + iterations):
+                if index == warmup:
+                    start = time.perf_counter()
+                photo = photos[index % len(photos)]
+                try:
+                    generation.generate_picture(photo, profile)
+                except PronochainException as err:
+                    failures += index >= warmup
+                    logger.warning(
+                        f"Échec de la génération avec la photo {photo} : {err}"
+                    )
+                    continue
+                if index >= warmup:
+                    for stage, duration in generation.timings.totals().items():
+                        durations.setdefault(stage, []).append(duration)
+            wall_time = time.perf_counter() - start
+    finally:
+        settings.TIMING_ENABLED = timing_enabled
+        settings.FACE_PREPROCESSING_CACHE = face_preprocessing_cache
+
+    return {
+        **get_environment(),
+        "config": {
+            "iterations": iterations,
+            "warmup": warmup,
+            "profile": EncodingProfile(profile).name,
+            "seed": seed,
+            "photos": [Path(photo).name for photo in photos],
+        },
+        "failures": failures,
+        "throughput": (iterations - failures) / wall_time,
+        "peak_rss_mb": get_peak_rss(),
+        "stages": {
+            stage: summarize(stage_durations)
+            for stage, stage_durations in sorted(durations.items())
+        },
+    }
+
+
+def compare_reports(
+    baseline: dict, report: dict, threshold: float = BENCH_REGRESSION_THRESHOLD
+) -> List[str]:
+    """Compare un rapport à un rapport de référence.
+
+    Args:
+        baseline (dict): rapport de référence.
+        report (dict): rapport à comparer.
+        threshold (float, optional): hausse relative tolérée. Défaut à BENCH_REGRESSION_THRESHOLD.
+
+    Returns:
+        List[str]: régressions, vide si aucune.
+    """
+    regressions = []
+    for stage, summary in report.get("stages", {}).items():
+        if (baseline_summary := baseline.get("stages", {}).get(stage)) is None:
+            continue
+        for percentile in ("p50", "p95"):
+            if summary[percentile] > baseline_summary[percentile] * (1 + threshold):
+                regressions.append(
+                    f"{stage} {percentile} : {baseline_summary[percentile]:.4f}s -> {summary[percentile]:.4f}s"
+                )
+    if "throughput" in report and "throughput" in baseline:
+        if report["throughput"] < baseline["throughput"] * (1 - threshold):
+            regressions.append(
+                f"débit : {baseline['throughput']:.2f}/s -> {report['throughput']:.2f}/s"
+            )
+        if report["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + threshold):
+            regressions.append(
+                f"pic de mémoire : {baseline['peak_rss_mb']:.0f}Mo -> {report['peak_rss_mb']:.0f}Mo"
+            )
+    if "startup" in report and "startup" in baseline:
+        startup, baseline_startup = report["startup"], baseline["startup"]
+        if startup["import_time"] > baseline_startup["import_time"] * (1 + threshold):
+            regressions.append(
+                f"démarrage : {baseline_startup['import_time']:.2f}s -> {startup['import_time']:.2f}s"
+            )
+        if new_modules := set(startup["heavy_modules"]) - set(
+            baseline_startup["heavy_modules"]
+        ):
+            regressions.append(
+                f"démarrage : {', '.join(sorted(new_modules))} importé(s) au démarrage"
+            )
+    return regressions
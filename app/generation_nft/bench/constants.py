@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/bench/constants.py
+"""
+from app.settings import settings
+
+# version du format du rapport, à incrémenter si sa structure change
+BENCH_REPORT_VERSION = 1
+
+# jeu de photos fixe, partagé avec les tests
+BENCH_PICTURES_PATH = f"{settings.GENERATION_NFT_PATH}/tests/pictures"
+BENCH_PICTURE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# images des parties du NFT, téléchargées avec les fixtures
+BENCH_PARTS_PATH = f"{settings.FIXTURE_FILES_PATH}/pictures"
+
+BENCH_ITERATIONS = 20
+BENCH_WARMUP = 2
+BENCH_SEED = 0
+BENCH_REGRESSION_THRESHOLD = 0.1
+
+# démarrage d'un worker de l'API, mesuré avec python -X importtime
+STARTUP_MODULE = "app.generation_nft_api.main"
+STARTUP_SLOWEST_IMPORTS = 15
+# bibliothèques de la génération, qui ne doivent pas être importées au démarrage de l'API
+HEAVY_MODULES = (
+    "coloraide",
+    "cv2",
+    "mediapipe",
+    "scipy",
+    "sklearn",
+    "torch",
+    "torchvision",
+)
+
+# balayage workers × threads : nombres de workers et de threads par worker essayés
+BENCH_SWEEP_WORKERS = (1, 2, 4)
+BENCH_SWEEP_THREADS = (1, 2, 4)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/bench/startup.py
+"""
+import subprocess
+import sys
+import time
+from typing import Dict
+
+from app.generation_nft.bench.constants import (
+    HEAVY_MODULES,
+    STARTUP_MODULE,
+    STARTUP_SLOWEST_IMPORTS,
+)
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def parse_import_times(output: str) -> Dict[str, float]:
+    """Lit la sortie de python -X importtime.
+
+    Args:
+        output (str): sortie d'erreur du processus.
+
+    Returns:
+        Dict[str, float]: durée cumulée de l'import de chaque module, en secondes.
+    """
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        _, cumulative, module = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        if cumulative.strip().isdigit():
+            import_times[module.strip()] = int(cumulative) / 1_000_000
+    return import_times
+
+
+def profile_imports(module: str = STARTUP_MODULE) -> dict:
+    """Mesure l'import d'un module dans un nouvel interpréteur, comme au démarrage d'un worker.
+
+    Args:
+        module (str, optional): module importé. Défaut à STARTUP_MODULE.
+
+    Returns:
+        dict: durée du processus, durée de l'import, bibliothèques lourdes importées et imports les plus lents.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    wall_time = time.perf_counter() - start
+    import_times = parse_import_times(process.stderr)
+    return {
+        "module": module,
+        "wall_time": wall_time,
+        "import_time": import_times[module],
+        "heavy_modules": [
+            heavy_module
+            for heavy_module in HEAVY_MODULES
+            if heavy_module in import_times
+        ],
+        "slowest": [
+            {"module": name, "cumulative": cumulative}
+            for name, cumulative in sorted(
+                import_times.items(), key=lambda item: item[1], reverse=True
+            )[:STARTUP_SLOWEST_IMPORTS]
+        ],
+    }
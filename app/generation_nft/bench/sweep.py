@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/bench/sweep.py
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List
+
+from app import logger
+from app.generation_nft.bench.bench import get_environment
+from app.generation_nft.bench.constants import (
+    BENCH_ITERATIONS,
+    BENCH_PICTURES_PATH,
+    BENCH_SEED,
+    BENCH_SWEEP_THREADS,
+    BENCH_SWEEP_WORKERS,
+    BENCH_WARMUP,
+)
+from app.generation_nft.libraries.card.constants import EncodingProfile
+
+
+def get_worker_cpus(worker: int, threads: int, cpus: List[int]) -> List[int]:
+    """Récupère les CPU réservés à un worker, chaque worker a ses propres CPU tant qu'il y en a assez.
+
+    Args:
+        worker (int): index du worker.
+        threads (int): nombre de threads par worker.
+        cpus (List[int]): CPU disponibles.
+
+    Returns:
+        List[int]: CPU du worker.
+    """
+    start = worker * threads
+    return sorted({cpus[(start + index) % len(cpus)] for index in range(threads)})
+
+
+def get_worker_env(worker: int, threads: int, pin: bool) -> Dict[str, str]:
+    """Récupère l'environnement d'un worker du balayage.
+
+    Args:
+        worker (int): index du worker.
+        threads (int): nombre de threads par worker.
+        pin (bool): réserver des CPU à chaque worker ?
+
+    Returns:
+        Dict[str, str]: environnement du worker.
+    """
+    env = {
+        **os.environ,
+        "OPENCV_THREADS": str(threads),
+        "TORCH_THREADS": str(threads),
+        "TORCH_INTEROP_THREADS": "1",
+    }
+    env.pop("WORKER_CPU_AFFINITY", None)
+    if pin and hasattr(os, "sched_getaffinity"):
+        cpus = get_worker_cpus(worker, threads, sorted(os.sched_getaffinity(0)))
+        env["WORKER_CPU_AFFINITY"] = ",".join(str(cpu) for cpu in cpus)
+    return env
+
+
+def run_workers(
+    workers: int,
+    threads: int,
+    pin: bool,
+    arguments: List[str],
+) -> dict:
+    """Lance des workers de benchmark en parallèle et additionne leur débit.
+
+    Args:
+        workers (int): nombre de workers.
+        threads (int): nombre de threads par worker.
+        pin (bool): réserver des CPU à chaque worker ?
+        arguments (List[str]): arguments du benchmark de chaque worker.
+
+    Returns:
+        dict: débit cumulé, échecs, durée totale p95 la plus haute et mémoire cumulée.
+    """
+    with TemporaryDirectory() as report_folder:
+        processes = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "app.generation_nft.bench",
+                    *arguments,
+                    "--skip-startup",
+                    "-o",
+                    f"{report_folder}/{worker}.json",
+                ],
+                env=get_worker_env(worker, threads, pin),
+                stdout=subprocess.DEVNULL,
+            )
+            for worker in range(workers)
+        ]
+        reports = []
+        for worker, process in enumerate(processes):
+            if process.wait() != 0:
+                logger.warning(
+                    f"Échec du worker {worker} ({workers} workers × {threads} threads)."
+                )
+                continue
+            with open(f"{report_folder}/{worker}.json", encoding="utf-8") as report:
+                reports.append(json.load(report))
+
+    return {
+        "workers": workers,
+        "threads": threads,
+        "succeeded_workers": len(reports),
+        "throughput": sum(report["throughput"] for report in reports),
+        "failures": sum(report["failures"] for report in reports),
+        "total_p95": max(
+            (
+                report["stages"]["total"]["p95"]
+                for report in reports
+                if "total" in report["stages"]
+            ),
+            default=None,
+        ),
+        "peak_rss_mb": sum(report["peak_rss_mb"] for report in reports),
+    }
+
+
+def run_sweep(
+    pictures: str = BENCH_PICTURES_PATH,
+    workers_counts: List[int] = BENCH_SWEEP_WORKERS,
+    threads_counts: List[int] = BENCH_SWEEP_THREADS,
+    pin: bool = False,
+    iterations: int = BENCH_ITERATIONS,
+    warmup: int = BENCH_WARMUP,
+    profile: int = EncodingProfile.ARTIFACT.value,
+    seed: int = BENCH_SEED,
+) -> dict:
+    """Mesure le débit de chaque combinaison workers × threads pour trouver la meilleure sur l'hôte.
+
+    Chaque worker est un processus de benchmark, les workers d'une combinaison tournent en parallèle.
+
+    Args:
+        pictures (str, optional): dossier du jeu de photos. Défaut à BENCH_PICTURES_PATH.
+        workers_counts (List[int], optional): nombres de workers. Défaut à BENCH_SWEEP_WORKERS.
+        threads_counts (List[int], optional): nombres de threads par worker. Défaut à BENCH_SWEEP_THREADS.
+        pin (bool, optional): réserver des CPU à chaque worker ? Défaut à False.
+        iterations (int, optional): nombre de générations mesurées par worker. Défaut à BENCH_ITERATIONS.
+        warmup (int, optional): nombre de générations non mesurées par worker. Défaut à BENCH_WARMUP.
+        profile (int, optional): profil d'encodage de la carte. Défaut à EncodingProfile.ARTIFACT.value.
+        seed (int, optional): graine du tirage des parties. Défaut à BENCH_SEED.
+
+    Returns:
+        dict: rapport du balayage, avec la meilleure combinaison.
+    """
+    arguments = [
+        "-p",
+        str(Path(pictures)),
+        "-i",
+        str(iterations),
+        "-w",
+        str(warmup),
+        "--profile",
+        EncodingProfile(profile).name,
+        "-s",
+        str(seed),
+    ]
+    results = []
+    for workers in workers_counts:
+        for threads in threads_counts:
+            result = run_workers(workers, threads, pin, arguments)
+            logger.info(
+                f"{workers} workers × {threads} threads : {result['throughput']:.2f} NFT/s"
+            )
+            results.append(result)
+
+    best = max(results, key=lambda result: result["throughput"], default=None)
+    return {
+        **get_environment(),
+        "config": {
+            "iterations": iterations,
+            "warmup": warmup,
+            "profile": EncodingProfile(profile).name,
+            "seed": seed,
+            "pin": pin,
+        },
+        "sweep": results,
+        "best": None
+        if best is None or best["throughput"] == 0
+        else {"workers": best["workers"], "threads": best["threads"]},
+    }
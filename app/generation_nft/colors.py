@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/colors.py
+"""
+from functools import lru_cache
+
+import numpy as np
+
+SRGB_TO_XYZ_D50 = np.array(
+    [
+        [0.43606574687426924, 0.3851515095901599, 0.14307841996513868],
+        [0.22249317711056504, 0.7168870130944827, 0.06061980979495235],
+        [0.01392392146316937, 0.09708132423141015, 0.7140993568158809],
+    ]
+)
+WHITE_D50 = np.array([0.9642956764295677, 1.0, 0.8251046025104602])
+LAB_EPSILON = 216 / 24389
+LAB_KAPPA = 24389 / 27
+
+SRGB_TO_LMS = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+LMS_TO_OKLAB = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+LMS_TO_SRGB = np.linalg.inv(SRGB_TO_LMS)
+OKLAB_TO_LMS = np.linalg.inv(LMS_TO_OKLAB)
+
+
+def to_channels(colors: np.array, bgr: bool = True) -> np.array:
+    """Converti des couleurs 8 bits en canaux RGB flottants compris entre 0 et 1.
+
+    Args:
+        colors (np.array): couleurs (..., 3).
+        bgr (bool, optional): sont sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: canaux RGB (..., 3).
+    """
+    colors = np.asarray(colors, dtype=np.float64)[..., :3] / 255
+    return colors[..., ::-1] if bgr else colors
+
+
+def from_channels(channels: np.array, bgr: bool = True) -> np.array:
+    """Converti des canaux RGB flottants compris entre 0 et 1 en couleurs 8 bits.
+
+    Args:
+        channels (np.array): canaux RGB (..., 3).
+        bgr (bool, optional): renvoyer sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: couleurs (..., 3).
+    """
+    colors = np.rint(np.clip(channels, 0, 1) * 255).astype(np.uint8)
+    return colors[..., ::-1] if bgr else colors
+
+
+def linearize(channels: np.array) -> np.array:
+    """Applique la fonction de transfert inverse sRGB.
+
+    Args:
+        channels (np.array): canaux sRGB.
+
+    Returns:
+        np.array: canaux linéaires.
+    """
+    return np.where(
+        channels <= 0.04045, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4
+    )
+
+
+def gamma_encode(channels: np.array) -> np.array:
+    """Applique la fonction de transfert sRGB.
+
+    Args:
+        channels (np.array): canaux linéaires.
+
+    Returns:
+        np.array: canaux sRGB.
+    """
+    channels = np.clip(channels, 0, None)
+    return np.where(
+        channels <= 0.0031308,
+        channels * 12.92,
+        1.055 * channels ** (1 / 2.4) - 0.055,
+    )
+
+
+def bgr_to_hsl(colors: np.array, bgr: bool = True) -> np.array:
+    """Converti des couleurs en HSL.
+
+    Args:
+        colors (np.array): couleurs (..., 3).
+        bgr (bool, optional): sont sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: teinte en degrés, saturation et luminosité en pourcentage (..., 3).
+    """
+    channels = to_channels(colors, bgr)
+    red, green, blue = channels[..., 0], channels[..., 1], channels[..., 2]
+    maximum, minimum = channels.max(axis=-1), channels.min(axis=-1)
+    chroma = maximum - minimum
+    lightness = (maximum + minimum) / 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        saturation = np.where(
+            (lightness > 0) & (lightness < 1),
+            chroma / (1 - np.abs(2 * lightness - 1)),
+            0,
+        )
+        hue = np.select(
+            [chroma == 0, maximum == red, maximum == green],
+            [
+                0,
+                ((green - blue) / chroma) % 6,
+                (blue - red) / chroma + 2,
+            ],
+            (red - green) / chroma + 4,
+        )
+    return np.stack([hue * 60, saturation * 100, lightness * 100], axis=-1)
+
+
+def hsl_to_bgr(hsl: np.array, bgr: bool = True) -> np.array:
+    """Converti des couleurs HSL en couleurs 8 bits.
+
+    Args:
+        hsl (np.array): teinte en degrés, saturation et luminosité en pourcentage (..., 3).
+        bgr (bool, optional): renvoyer sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: couleurs (..., 3).
+    """
+    hsl = np.asarray(hsl, dtype=np.float64)
+    hue = (hsl[..., 0] % 360)[..., None]
+    saturation, lightness = hsl[..., 1:2] / 100, hsl[..., 2:3] / 100
+    coefficients = (np.array([0, 8, 4]) + hue / 30) % 12
+    amplitude = saturation * np.minimum(lightness, 1 - lightness)
+    channels = lightness - amplitude * np.clip(
+        np.minimum(coefficients - 3, 9 - coefficients), -1, 1
+    )
+    return from_channels(channels, bgr)
+
+
+def bgr_to_lab(colors: np.array, bgr: bool = True) -> np.array:
+    """Converti des couleurs en CIELab (D50), l'espace utilisé par le delta E 76.
+
+    Args:
+        colors (np.array): couleurs (..., 3).
+        bgr (bool, optional): sont sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: couleurs Lab (..., 3).
+    """
+    xyz = linearize(to_channels(colors, bgr)) @ SRGB_TO_XYZ_D50.T / WHITE_D50
+    xyz = np.where(xyz > LAB_EPSILON, np.cbrt(xyz), (LAB_KAPPA * xyz + 16) / 116)
+    return np.stack(
+        [
+            116 * xyz[..., 1] - 16,
+            500 * (xyz[..., 0] - xyz[..., 1]),
+            200 * (xyz[..., 1] - xyz[..., 2]),
+        ],
+        axis=-1,
+    )
+
+
+def bgr_to_oklab(colors: np.array, bgr: bool = True) -> np.array:
+    """Converti des couleurs en Oklab, l'espace utilisé pour les dégradés.
+
+    Args:
+        colors (np.array): couleurs (..., 3).
+        bgr (bool, optional): sont sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: couleurs Oklab (..., 3).
+    """
+    lms = linearize(to_channels(colors, bgr)) @ SRGB_TO_LMS.T
+    return np.cbrt(lms) @ LMS_TO_OKLAB.T
+
+
+def oklab_to_bgr(oklab: np.array, bgr: bool = True) -> np.array:
+    """Converti des couleurs Oklab en couleurs 8 bits.
+
+    Args:
+        oklab (np.array): couleurs Oklab (..., 3).
+        bgr (bool, optional): renvoyer sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: couleurs (..., 3).
+    """
+    lms = (np.asarray(oklab) @ OKLAB_TO_LMS.T) ** 3
+    return from_channels(gamma_encode(lms @ LMS_TO_SRGB.T), bgr)
+
+
+def delta_e(colors: np.array, reference: np.array, bgr: bool = True) -> np.array:
+    """Calcule le delta E 76 entre des couleurs et une couleur de référence.
+
+    Args:
+        colors (np.array): couleurs (..., 3).
+        reference (np.array): couleur de référence (3).
+        bgr (bool, optional): sont sous format BGR ? Défaut à True.
+
+    Returns:
+        np.array: distances (...).
+    """
+    return np.linalg.norm(bgr_to_lab(colors, bgr) - bgr_to_lab(reference, bgr), axis=-1)
+
+
+def hex_to_bgr(hex_color: str) -> tuple:
+    """Converti une couleur HEX en BGR.
+
+    Args:
+        hex_color (str): couleur HEX (#RRGGBB).
+
+    Returns:
+        tuple: couleur BGR.
+    """
+    hex_color = hex_color.lstrip("#")
+    return tuple(int(hex_color[index : index + 2], 16) for index in (4, 2, 0))
+
+
+@lru_cache(maxsize=1024)
+def get_shade(color: tuple, value: int, darker: bool = True) -> tuple:
+    """Calcule, une seule fois par couple (couleur, delta), la nuance d'une couleur BGR.
+
+    La luminosité est modifiée en HSL sur des valeurs entières, comme le faisait coloraide.
+
+    Args:
+        color (tuple): couleur BGR.
+        value (int): delta de luminosité en pourcentage.
+        darker (bool, optional): rendre plus sombre ? Défaut à True.
+
+    Returns:
+        tuple: nuance BGR.
+    """
+    hsl = np.floor(bgr_to_hsl(color) + 0.5)
+    hsl[2] = np.clip(hsl[2] - value if darker else hsl[2] + value, 0, 100)
+    return tuple(int(channel) for channel in hsl_to_bgr(hsl))
+
+
+@lru_cache(maxsize=256)
+def get_gradient(
+    first_color: tuple, last_color: tuple, steps: int, progress: float = 1.0
+) -> np.array:
+    """Calcule, une seule fois par paramètres, un dégradé entre deux couleurs BGR.
+
+    L'interpolation est réalisée dans l'espace Oklab. Le tableau renvoyé est partagé par le
+    cache et ne doit pas être modifié.
+
+    Args:
+        first_color (tuple): première couleur BGR.
+        last_color (tuple): dernière couleur BGR.
+        steps (int): nombre de couleurs.
+        progress (float, optional): facteur appliqué à la progression. Défaut à 1.0.
+
+    Returns:
+        np.array: couleurs BGR (steps, 3).
+    """
+    first, last = bgr_to_oklab(first_color), bgr_to_oklab(last_color)
+    # comme coloraide, une seule couleur correspond au milieu du dégradé
+    ratios = (np.linspace(0, 1, steps) if steps > 1 else np.full(1, 0.5)) * progress
+    gradient = oklab_to_bgr(first + (last - first) * ratios[:, None])
+    gradient.setflags(write=False)
+    return gradient
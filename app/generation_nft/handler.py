@@ -24,6 +24,7 @@ ______                           _           _
 
 File: app/generation_nft/handler.py
 """
+from concurrent.futures import Future
 from typing import List, Union
 
 import numpy as np
@@ -33,22 +34,33 @@ from pydantic import BaseModel
 from app import logger
 from app.exceptions import PronochainException
 from app.generation_nft.libraries.card.card import CardStyling
+from app.generation_nft.libraries.card.constants import EncodingProfile
+from app.generation_nft.libraries.card.encoding import submit_encoding
 from app.generation_nft.libraries.face.face_aligner.face_aligner import FaceAligner
-from app.generation_nft.libraries.face.face_detect.face_detect import FaceDetect
-from app.generation_nft.libraries.face.face_landmarks.constants import (
-    LEFT_EYE,
-    RIGHT_EYE,
+from app.generation_nft.libraries.face.face_detect.constants import (
+    MIN_DETECTION_CONFIDENCE,
 )
+from app.generation_nft.libraries.face.face_detect.face_detect import FaceDetect
 from app.generation_nft.libraries.face.face_landmarks.face_landmarks import (
     FaceLandmarks,
 )
 from app.generation_nft.libraries.face.face_parsing.face_parsing import FaceParsing
+from app.generation_nft.libraries.face.face_preprocessing.face_preprocessing import (
+    FacePreprocessing,
+    PreprocessedFace,
+)
+from app.generation_nft.libraries.face.face_quality.constants import RejectReason
+from app.generation_nft.libraries.face.face_quality.face_quality import (
+    FaceQuality,
+    quality_gate_metrics,
+)
 from app.generation_nft.libraries.face.face_resizing.face_resizing import FaceResizing
 from app.generation_nft.libraries.face.face_styling.face_styling import FaceStyling
 from app.generation_nft.libraries.face.tilt_learning.tilt_learning import TiltLearning
-from app.generation_nft.libraries.generation.constants import PartType
+from app.generation_nft.libraries.generation.constants import PartType, PictureChannel
 from app.generation_nft.libraries.shirt.shirt import ShirtStyling
 from app.generation_nft.libraries.storage.storage import Storage
+from app.generation_nft_db.models.players import Player
 from app.generation_nft_db.schemas.generation import GenerationPart
 
 
@@ -60,6 +72,8 @@ class GenerateNFT(
     FaceAligner,
     FaceResizing,
     TiltLearning,
+    FaceQuality,
+    FacePreprocessing,
     ShirtStyling,
     CardStyling,
     Storage,
@@ -74,6 +88,8 @@ class GenerateNFT(
         FaceAligner (FaceAligner): modèle FaceAligner.
         FaceResizing (FaceResizing): modèle FaceResizing.
         TiltLearning (TiltLearning): modèle TiltLearning.
+        FaceQuality (FaceQuality): modèle FaceQuality.
+        FacePreprocessing (FacePreprocessing): modèle FacePreprocessing.
         ShirtStyling (ShirtStyling): modèle ShirtStyling.
         CardStyling (CardStyling): modèle CardStyling.
         Storage (Storage): modèle Storage.
@@ -94,7 +110,7 @@ class GenerateNFT(
 
         # Initalise data
         (self.height, self.width) = self.player_picture.shape[:2]
-        self.min_detection_confidence = 0.8
+        self.min_detection_confidence = MIN_DETECTION_CONFIDENCE
 
         FaceDetect.__init__(self)
         FaceParsing.__init__(self)
@@ -103,6 +119,8 @@ class GenerateNFT(
         FaceAligner.__init__(self)
         FaceResizing.__init__(self)
         TiltLearning.__init__(self)
+        FaceQuality.__init__(self)
+        FacePreprocessing.__init__(self)
         ShirtStyling.__init__(self)
         CardStyling.__init__(self)
         Storage.__init__(self)
@@ -150,74 +168,100 @@ class GenerateNFT(
                 ImageColor.getcolor(model, "RGB")[0],
             )
 
-    def handler(self) -> bytes:
+    def handler(self, profile: int = EncodingProfile.ARTIFACT.value) -> Future:
         """Génération du joueur.
 
+        Args:
+            profile (int, optional): profil d'encodage de la carte. Défaut à EncodingProfile.ARTIFACT.value.
+
         Raises:
             PronochainException: impossible de générer le joueur.
 
         Returns:
-            bytes: joueur dessiné.
+            Future: encodage de la carte du joueur dessiné, réalisé en dehors du thread de rendu.
         """
-        faces = self.face_detection()  # détection des visages
-
-        for initial_face in faces:
-            # récupère les landmarks du visage
-            result_check_landmark_points = self.face_landmark(initial_face)
-            if result_check_landmark_points is None:
-                logger.info(
-                    f"Aucun landmark détecté pour l'image du joueur {self.player.code}, arrêt du processus pour ce visage."
-                )
-                continue
-            check_landmark_points = result_check_landmark_points.landmark
-
-            # récupère les coordonnées de l'oeil gauche
-            left_eye_coordinates = self.get_coordinates_from_list(
-                initial_face, check_landmark_points, LEFT_EYE
-            )
-
-            # récupère les coordonnées de l'oeil droit
-            right_eye_coordinates = self.get_coordinates_from_list(
-                initial_face, check_landmark_points, RIGHT_EYE
-            )
-
-            # aligne la tête pour quelle soit la plus droite possible
-            face = self.face_align(
-                initial_face, left_eye_coordinates, right_eye_coordinates
-            )
-
-            face_resized = self.face_parsing_resizing(face)
-
-            result_landmark_points, normalized_landmark_points = self.face_landmark(
-                face_resized, check=False
-            )
-
-            if result_landmark_points is None:
-                logger.info(
-                    f"Aucun landmarks detecte pour l'image du joueur {self.player.code}, arret du processus pour ce visage."
-                )
-                continue
-
-            try:
-                (
-                    face_resized,
-                    result_landmark_points,
-                    normalized_landmark_points,
-                ) = self.face_landmark_resizing(face_resized)
-            except Exception:
-                continue
-
+        # la détection, l'alignement, le redimensionnement et le face parsing ne dépendent
+        # que de la photo : le visage prétraité est réutilisé pour chaque carte du joueur
+        for preprocessed_face in self.preprocessed_faces():
             self.drawing_face = self.face_parsing(
-                face_resized, landmarks=normalized_landmark_points
+                preprocessed_face.face,
+                landmarks=preprocessed_face.landmarks,
+                prediction=preprocessed_face.parsing,
             )
 
+            # un visage en cache a été compté à son prétraitement : ni accepté, ni rejeté ici
             if self.drawing_face is not None:
+                if not preprocessed_face.cached:
+                    quality_gate_metrics.record_accepted()
+                    self.save_preprocessed_face(preprocessed_face)
                 self.drawing_shirt, self.drawing_crest = self.draw_shirt()
-                self.drawing_card_bytes = self.draw_card()
-                return self.drawing_card_bytes
+                self.drawing_card = self.draw_card()
+                return submit_encoding(self.drawing_card, profile)
+            if not preprocessed_face.cached:
+                quality_gate_metrics.record_rejected(RejectReason.PARSING_FAILED)
 
         error_message = (
             f"Impossible de générer le NFT pour le joueur {self.player.code}."
         )
         logger.error(error_message)
         raise PronochainException(error_message)
+
+
+class PreprocessPlayer(
+    FaceDetect,
+    FaceParsing,
+    FaceStyling,
+    FaceLandmarks,
+    FaceAligner,
+    FaceResizing,
+    TiltLearning,
+    FaceQuality,
+    FacePreprocessing,
+    Storage,
+):
+    """Classe pour prétraiter la photo d'un joueur sans générer de carte.
+
+    Args:
+        FaceDetect (FaceDetect): modèle FaceDetect.
+        FaceParsing (FaceParsing): modèle FaceParsing.
+        FaceStyling (FaceStyling): modèle FaceStyling.
+        FaceLandmarks (FaceLandmarks): modèle FaceLandmarks.
+        FaceAligner (FaceAligner): modèle FaceAligner.
+        FaceResizing (FaceResizing): modèle FaceResizing.
+        TiltLearning (TiltLearning): modèle TiltLearning.
+        FaceQuality (FaceQuality): modèle FaceQuality.
+        FacePreprocessing (FacePreprocessing): modèle FacePreprocessing.
+        Storage (Storage): modèle Storage.
+    """
+
+    def __init__(self, player: Player):
+        """Initialise la classe pour prétraiter la photo d'un joueur.
+
+        Args:
+            player (Player): joueur dont la photo est stockée sur nft.storage.
+        """
+        Storage.__init__(self)
+        self.player = player
+        self.player_picture = self.picture(
+            player.cid, filename=player.filename, channel=PictureChannel.RGB.value
+        )
+        (self.height, self.width) = self.player_picture.shape[:2]
+        self.min_detection_confidence = MIN_DETECTION_CONFIDENCE
+
+        FaceDetect.__init__(self)
+        FaceParsing.__init__(self)
+        FaceStyling.__init__(self)
+        FaceLandmarks.__init__(self)
+        FaceAligner.__init__(self)
+        FaceResizing.__init__(self)
+        TiltLearning.__init__(self)
+        FaceQuality.__init__(self)
+        FacePreprocessing.__init__(self)
+
+    def handler(self) -> PreprocessedFace:
+        """Prétraitement de la photo du joueur.
+
+        Returns:
+            PreprocessedFace: visage prétraité, enregistré dans le cache.
+        """
+        return self.preprocess()
@@ -24,6 +24,7 @@ ______                           _           _
 
 File: app/generation_nft/libraries/card/card.py
 """
+from functools import lru_cache
 from typing import Union
 
 import cv2 as open_cv
@@ -43,6 +44,8 @@ from app.generation_nft.libraries.card.constants import (
     PictureName,
     Type,
 )
+from app.generation_nft.libraries.compositor.compositor import new_layer, over
+from app.generation_nft.timing import timed
 from app.generation_nft.utils import (
     draw_contours,
     get_coordinates,
@@ -52,15 +55,31 @@ from app.generation_nft.utils import (
 from app.generation_nft_db.constants import FixtureEnum
 from app.settings import settings
 
+CARD_FONT_PATH = (
+    f"{settings.FIXTURE_FILES_PATH}/fonts/{FixtureEnum.CARD_FONT.value}.ttf"
+)
+
+
+@lru_cache(maxsize=None)
+def load_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Charge la police de la carte une seule fois par taille.
+
+    Args:
+        font_path (str): chemin de la police.
+        size (int): taille de la police.
+
+    Returns:
+        ImageFont.FreeTypeFont: police.
+    """
+    return ImageFont.truetype(font_path, size)
+
 
 class CardStyling(object):
     """Classe permettant de styliser la carte."""
 
     def __init__(self):
         """Initialise la classe pour dessiner le carte."""
-        self.font_path = (
-            f"{settings.FIXTURE_FILES_PATH}/fonts/{FixtureEnum.CARD_FONT.value}.ttf"
-        )
+        self.font_path = CARD_FONT_PATH
 
         self.margin = MARGIN
         self.font_size_note = FONT_SIZE_NOTE
@@ -69,11 +88,12 @@ class CardStyling(object):
         self.height_note = str(self.player.height)
         self.weight_note = str(self.player.weight)
 
+    @timed("card")
     def draw_card(self) -> np.array:
-        """Dessine la carte du NFT.
+        """Dessine la carte du NFT, l'encodage est réalisé à part (voir encoding.py).
 
         Returns:
-            np.array: carte du NFT.
+            np.array: carte du NFT (BGRA).
         """
         virgin_card_part = np.full(
             (self.card_shape.shape[0], self.card_shape.shape[1], 4),
@@ -113,20 +133,15 @@ class CardStyling(object):
             open_cv.FILLED,
         )
 
-        card_pil = Image.fromarray(virgin_card_part.astype("uint8"), "RGBA")
-        card_pattern_pil = Image.fromarray(card_pattern.astype("uint8"), "RGBA")
-        card_pil.paste(card_pattern_pil, (0, 0), card_pattern_pil)
-        self.add_parts(card_pil)
-        card_part = np.array(card_pil)
+        card_part = over(virgin_card_part, card_pattern)
+        self.add_parts(card_part)
+        return card_part
 
-        _, card_bytes = open_cv.imencode(".png", card_part)
-        return card_bytes.tobytes()
-
-    def add_parts(self, card_pil: Image):
+    def add_parts(self, card_part: np.array):
         """Ajoute les parties constituant la carte du NFT.
 
         Args:
-            card_pil (Image): carte du NFT.
+            card_part (np.array): carte du NFT, modifiée sur place.
         """
         for coordinates_part in COORDINATES_PARTS:
             color = coordinates_part.get("color")
@@ -154,7 +169,7 @@ class CardStyling(object):
 
             if card_type == Type.FONT.value:
                 self.draw_text(
-                    card_pil,
+                    card_part,
                     value,
                     position,
                     size,
@@ -163,7 +178,7 @@ class CardStyling(object):
                 )
             elif card_type in [Type.PICTURE.value, Type.PICTURES.value]:
                 self.draw_picture(
-                    card_pil,
+                    card_part,
                     value,
                     position,
                     size,
@@ -172,9 +187,39 @@ class CardStyling(object):
                     margin,
                 )
 
+    def write_text(
+        self,
+        part: np.array,
+        position: tuple,
+        text: str,
+        size: int,
+        fill: tuple,
+        anchor: str,
+    ):
+        """Écrit du texte sur une partie, seule étape passant par PIL (rendu de la police).
+
+        Args:
+            part (np.array): partie 4 canaux, modifiée sur place.
+            position (tuple): position (x, y).
+            text (str): texte.
+            size (int): taille de la police.
+            fill (tuple): couleur du texte.
+            anchor (str): ancre du texte.
+        """
+        part_pil = Image.fromarray(part, "RGBA")
+        ImageDraw.Draw(part_pil).text(
+            position,
+            text,
+            font=load_font(self.font_path, size),
+            fill=fill,
+            spacing=0,
+            anchor=anchor,
+        )
+        part[:] = np.asarray(part_pil)
+
     def draw_text(
         self,
-        card_pil: Image,
+        card_part: np.array,
         value: str,
         position: tuple,
         size: int,
@@ -184,7 +229,7 @@ class CardStyling(object):
         """Dessine du texte.
 
         Args:
-            card_pil (Image): carte.
+            card_part (np.array): carte.
             value (str): valeur.
             position (tuple): position.
             size (int): taille.
@@ -202,27 +247,25 @@ class CardStyling(object):
             last_y = coordinates_part.get("last_y")
 
             position = get_coordinates(
-                np.array(card_pil), [254, 254, 254, 255], last_x=last_x, last_y=last_y
+                card_part, [254, 254, 254, 255], last_x=last_x, last_y=last_y
             )
             if last_x:
                 position = (position[1] + 25, position[0])
             if last_y:
                 position = (coordinates[1], position[0] + 100)
 
-        draw_card = ImageDraw.Draw(card_pil)
-        font = ImageFont.truetype(self.font_path, size)
-        draw_card.text(
+        self.write_text(
+            card_part,
             position,
             value.upper() if uppercase else value,
-            font=font,
-            fill=(fill[0], fill[1], fill[2], opacity),
-            spacing=0,
-            anchor=anchor,
+            size,
+            (fill[0], fill[1], fill[2], opacity),
+            anchor,
         )
 
     def draw_picture(
         self,
-        card_pil: Image,
+        card_part: np.array,
         value: np.array,
         position: tuple,
         size: Union[int, tuple],
@@ -233,7 +276,7 @@ class CardStyling(object):
         """Dessine une image sur la carte NFT.
 
         Args:
-            card_pil (Image): carte.
+            card_part (np.array): carte.
             value (np.array): valeur.
             position (tuple): position.
             size (Union[int, tuple]): taille.
@@ -257,13 +300,13 @@ class CardStyling(object):
         elif size is not None:
             height, width = size[0], size[1]
         else:
-            (width, height) = card_pil.size
+            height, width = card_part.shape[0], card_part.shape[1]
 
         if anchor == Anchor.TOP_MIDDLE.value:
             position = (coordinates[1] - int(width / 2), coordinates[0])
             if depending is not None:
                 depending_position = get_coordinates(
-                    np.array(card_pil), [254, 254, 254, 255], last_x=False, last_y=True
+                    card_part, [254, 254, 254, 255], last_x=False, last_y=True
                 )
                 position = (position[0], depending_position[0] + margin)
 
@@ -274,7 +317,7 @@ class CardStyling(object):
             position = (coordinates[1] - width, coordinates[0])
             if depending is not None:
                 depending_position = get_coordinates(
-                    np.array(card_pil), [254, 254, 254, 255], last_x=False, last_y=True
+                    card_part, [254, 254, 254, 255], last_x=False, last_y=True
                 )
                 if value_to_add is not None:
                     position = (
@@ -286,7 +329,7 @@ class CardStyling(object):
         else:
             if depending is not None:
                 depending_position = get_coordinates(
-                    np.array(card_pil), [254, 254, 254, 255], last_x=False, last_y=True
+                    card_part, [254, 254, 254, 255], last_x=False, last_y=True
                 )
                 if value_to_add is not None:
                     position = (
@@ -297,8 +340,7 @@ class CardStyling(object):
                     position = (position[0], depending_position[0] + margin)
 
         if name == PictureName.SHIRT_FACE.value:
-            value_pil = Image.fromarray(value.astype("uint8"), "RGBA")
-            card_pil.paste(value_pil, position, value_pil)
+            over(card_part, value, position)
 
         elif name == PictureName.STAR.value:
             number_filled_star = int(int(self.global_note) / 20)
@@ -311,7 +353,7 @@ class CardStyling(object):
                 -(width + 25) if direction == Direction.LEFT.value else (width + 25)
             )
             for i in range(1, loop + 1):
-                percent_star_pil = None
+                percent_star = None
 
                 if i > number_filled_star:
                     replace_color_not_equal(
@@ -332,18 +374,10 @@ class CardStyling(object):
                         percent_star.shape[1] * percent_stay_star
                     )
                     percent_star[:, 0:right_x] = np.array([255, 255, 255, 0])
-                    percent_star_pil = Image.fromarray(
-                        percent_star.astype("uint8"), "RGBA"
-                    )
-
-                value_pil = Image.fromarray(
-                    open_cv.cvtColor(value.astype("uint8"), open_cv.COLOR_RGBA2BGRA),
-                    "RGBA",
-                )
 
-                card_pil.paste(value_pil, position, value_pil)
-                if percent_star_pil is not None:
-                    card_pil.paste(percent_star_pil, position, percent_star_pil)
+                over(card_part, value[:, :, [2, 1, 0, 3]], position)
+                if percent_star is not None:
+                    over(card_part, percent_star, position)
                 position = (position[0] + width_shift, position[1])
 
         elif name == PictureName.FLAG_AND_CREST.value:
@@ -352,55 +386,39 @@ class CardStyling(object):
             flag = childs[0]
             crest = childs[-1]
 
-            flag_and_crest_part = np.full(
-                (card_pil.size[1], card_pil.size[0], 4),
-                np.array([255, 255, 255, 0]),
-                dtype=np.uint8,
-            )
-            flag_and_crest_part_pil = Image.fromarray(
-                flag_and_crest_part.astype("uint8")
-            )
+            flag_and_crest_part = new_layer(card_part.shape[0], card_part.shape[1])
 
             flag_picture = getattr(self, flag.get("value"))
             flag_picture = self.resize(
                 flag_picture, flag.get("resize"), flag.get("resize_orientation")
             )
-            flag_picture_pil = Image.fromarray(flag_picture, "RGBA")
             flag_margin = flag.get("margin")
-            flag_and_crest_part_pil.paste(
-                flag_picture_pil,
+            over(
+                flag_and_crest_part,
+                flag_picture,
                 (position[0] - int(flag_picture.shape[1]) - flag_margin, 0),
-                flag_picture_pil,
             )
 
             with_text = crest.get("with_text")
-            club_part = np.full(
-                (card_pil.size[1], card_pil.size[0], 4),
-                np.array([255, 255, 255, 0]),
-                dtype=np.uint8,
-            )
-            club_part_pil = Image.fromarray(club_part.astype("uint8"))
+            club_part = new_layer(card_part.shape[0], card_part.shape[1])
 
             crest_picture = getattr(self, crest.get("value"))
             crest_picture = self.resize(
                 crest_picture, crest.get("resize"), crest.get("resize_orientation")
             )
-            crest_pil = Image.fromarray(crest_picture)
-            club_part_pil.paste(
-                crest_pil, (position[0] - int(crest_picture.shape[1] / 2), 0), crest_pil
+            over(
+                club_part,
+                crest_picture,
+                (position[0] - int(crest_picture.shape[1] / 2), 0),
             )
-            text = getattr(self, with_text)
-            draw_crest = ImageDraw.Draw(club_part_pil)
-            font = ImageFont.truetype(self.font_path, 96)
-            draw_crest.text(
+            self.write_text(
+                club_part,
                 (position[0], crest_picture.shape[0] + 50),
-                text,
-                font=font,
-                fill=(254, 254, 254, 255),
-                spacing=0,
-                anchor=Anchor.TOP_MIDDLE.value,
+                getattr(self, with_text),
+                96,
+                (254, 254, 254, 255),
+                Anchor.TOP_MIDDLE.value,
             )
-            club_part = np.array(club_part_pil)
             replace_color(
                 club_part,
                 np.array([255, 255, 255, 255]),
@@ -410,29 +428,20 @@ class CardStyling(object):
             crest_margin = flag.get("margin")
             position_crest = (0 + int(crest_picture.shape[1]) + crest_margin, 0)
 
-            club_part_pil = Image.fromarray(
-                open_cv.cvtColor(club_part, open_cv.COLOR_RGBA2BGRA).astype("uint8")
-            )
-            flag_and_crest_part_pil.paste(club_part_pil, position_crest, club_part_pil)
+            over(flag_and_crest_part, club_part[:, :, [2, 1, 0, 3]], position_crest)
 
-            card_pil.paste(
-                flag_and_crest_part_pil, (0, position[1]), flag_and_crest_part_pil
-            )
+            over(card_part, flag_and_crest_part, (0, position[1]))
         else:
-            value_pil = Image.fromarray(value.astype("uint8"), "RGBA")
-            card_pil.paste(value_pil, position, value_pil)
+            over(card_part, value, position)
             with_text = coordinates_part.get("with_text")
             if with_text is not None:
-                text = getattr(self, with_text)
-                draw_note = ImageDraw.Draw(card_pil)
-                font = ImageFont.truetype(self.font_path, self.font_size_note)
-                draw_note.text(
+                self.write_text(
+                    card_part,
                     (coordinates[1], position[1] + value.shape[0] + 50),
-                    text,
-                    font=font,
-                    fill=(254, 254, 254, 255),
-                    spacing=0,
-                    anchor=Anchor.TOP_MIDDLE.value,
+                    getattr(self, with_text),
+                    self.font_size_note,
+                    (254, 254, 254, 255),
+                    Anchor.TOP_MIDDLE.value,
                 )
 
     def resize(self, value: np.array, resize: int, orientation: int) -> np.array:
@@ -74,6 +74,21 @@ class PictureName(Enum):
     WEIGHT = 8
 
 
+class EncodingProfile(Enum):
+    """Classe héritant de la classe native Enum. Permet d'énumérer les profils d'encodage de la carte."""
+
+    PREVIEW = 0
+    ARTIFACT = 1
+
+
+class EncodingFormat(Enum):
+    """Classe héritant de la classe native Enum. Permet d'énumérer les formats d'encodage de la carte."""
+
+    PNG = "png"
+    WEBP = "webp"
+    AVIF = "avif"
+
+
 class OrientationResize(Enum):
     """Classe héritant de la classe native Enum. Permet d'énumérer les différents orientations possibles pour redimensionner une image."""
 
@@ -84,6 +99,12 @@ class OrientationResize(Enum):
 MARGIN = 100
 FONT_SIZE_NOTE = 100
 
+MEDIA_TYPES = {
+    EncodingFormat.PNG.value: "image/png",
+    EncodingFormat.WEBP.value: "image/webp",
+    EncodingFormat.AVIF.value: "image/avif",
+}
+
 WHITE_COLOR = [254, 254, 254]
 GRAY_COLOR = [204, 204, 204]
 STAR_COLOR = [49, 236, 249]
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/libraries/card/encoding.py
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+import cv2 as open_cv
+import numpy as np
+from PIL import Image
+
+from app import logger
+from app.generation_nft.libraries.card.constants import EncodingFormat, EncodingProfile
+from app.settings import settings
+
+ENCODING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.CARD_ENCODING_WORKERS, thread_name_prefix="card_encoding"
+)
+
+
+@lru_cache(maxsize=None)
+def resolve_preview_format(preview_format: str) -> str:
+    """Vérifie une seule fois par format que l'encodeur de l'aperçu est disponible.
+
+    Args:
+        preview_format (str): format de l'aperçu configuré.
+
+    Returns:
+        str: format de l'aperçu, PNG si l'encodeur n'est pas disponible.
+    """
+    preview_format = EncodingFormat(preview_format).value
+    if preview_format != EncodingFormat.PNG.value and not open_cv.haveImageWriter(
+        f".{preview_format}"
+    ):
+        logger.warning(
+            f"Encodeur {preview_format} indisponible, l'aperçu de la carte est encodé en png."
+        )
+        return EncodingFormat.PNG.value
+    return preview_format
+
+
+def get_preview_format() -> str:
+    """Récupère le format d'encodage des aperçus, PNG si l'encodeur n'est pas disponible.
+
+    Returns:
+        str: format de l'aperçu.
+    """
+    return resolve_preview_format(settings.CARD_PREVIEW_FORMAT)
+
+
+def encode_preview(card_part: np.array) -> bytes:
+    """Encode un aperçu de la carte avec un réglage rapide.
+
+    Args:
+        card_part (np.array): carte (BGRA).
+
+    Returns:
+        bytes: aperçu encodé.
+    """
+    preview_format = get_preview_format()
+    if preview_format == EncodingFormat.WEBP.value:
+        params = [open_cv.IMWRITE_WEBP_QUALITY, settings.CARD_PREVIEW_QUALITY]
+    elif preview_format == EncodingFormat.AVIF.value:
+        params = [open_cv.IMWRITE_AVIF_QUALITY, settings.CARD_PREVIEW_QUALITY]
+    else:
+        params = [
+            open_cv.IMWRITE_PNG_COMPRESSION,
+            settings.CARD_PREVIEW_PNG_COMPRESSION,
+        ]
+    _, card_bytes = open_cv.imencode(f".{preview_format}", card_part, params)
+    return card_bytes.tobytes()
+
+
+def encode_artifact(card_part: np.array) -> bytes:
+    """Encode la carte stockée sur IPFS avec un réglage optimisant la taille.
+
+    La quantification en palette est optionnelle, les aplats de couleur de la carte s'y prêtent bien.
+
+    Args:
+        card_part (np.array): carte (BGRA).
+
+    Returns:
+        bytes: png encodé.
+    """
+    colors = settings.CARD_ARTIFACT_PALETTE_COLORS
+    if colors is None:
+        _, card_bytes = open_cv.imencode(
+            f".{EncodingFormat.PNG.value}",
+            card_part,
+            [
+                open_cv.IMWRITE_PNG_COMPRESSION,
+                settings.CARD_ARTIFACT_PNG_COMPRESSION,
+            ],
+        )
+        return card_bytes.tobytes()
+
+    card_pil = Image.fromarray(
+        open_cv.cvtColor(card_part, open_cv.COLOR_BGRA2RGBA), "RGBA"
+    ).quantize(colors=colors, method=Image.FASTOCTREE)
+    card_bytes = BytesIO()
+    card_pil.save(
+        card_bytes,
+        format=EncodingFormat.PNG.value,
+        optimize=True,
+        compress_level=settings.CARD_ARTIFACT_PNG_COMPRESSION,
+    )
+    return card_bytes.getvalue()
+
+
+def encode_card(card_part: np.array, profile: int) -> bytes:
+    """Encode la carte selon le profil souhaité.
+
+    Args:
+        card_part (np.array): carte (BGRA).
+        profile (int): profil d'encodage (EncodingProfile).
+
+    Returns:
+        bytes: carte encodée.
+    """
+    if profile == EncodingProfile.PREVIEW.value:
+        return encode_preview(card_part)
+    return encode_artifact(card_part)
+
+
+def submit_encoding(card_part: np.array, profile: int) -> Future:
+    """Encode la carte en dehors du thread de rendu.
+
+    Args:
+        card_part (np.array): carte (BGRA).
+        profile (int): profil d'encodage (EncodingProfile).
+
+    Returns:
+        Future: futur renvoyant la carte encodée.
+    """
+    return ENCODING_EXECUTOR.submit(encode_card, card_part, profile)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/libraries/compositor/compositor.py
+"""
+from typing import Optional
+
+import numpy as np
+
+from app.generation_nft.libraries.compositor.constants import (
+    OPAQUE,
+    TRANSPARENT_COLOR,
+    TRANSPARENT_PIXEL,
+)
+
+
+def new_layer(height: int, width: int, color: tuple = TRANSPARENT_PIXEL) -> np.array:
+    """Alloue un calque remplit d'une couleur.
+
+    Args:
+        height (int): hauteur du calque.
+        width (int): largeur du calque.
+        color (tuple, optional): couleur de remplissage, le nombre de canaux du calque correspond à la taille de la couleur. Défaut à TRANSPARENT_PIXEL.
+
+    Returns:
+        np.array: calque.
+    """
+    return np.full((height, width, len(color)), color, dtype=np.uint8)
+
+
+def get_transparent_mask(
+    part: np.array, transparent_color: tuple = TRANSPARENT_COLOR
+) -> np.array:
+    """Récupère le mask des pixels considérés comme transparents.
+
+    Args:
+        part (np.array): partie (3 ou 4 canaux, seuls les 3 premiers sont comparés).
+        transparent_color (tuple, optional): couleur considérée comme transparente. Défaut à TRANSPARENT_COLOR.
+
+    Returns:
+        np.array: mask booléen (hauteur, largeur).
+    """
+    return np.all(part[:, :, :3] == np.array(transparent_color, dtype=np.uint8), axis=2)
+
+
+def to_layer(
+    part: np.array,
+    transparent_color: tuple = TRANSPARENT_COLOR,
+    swap_channels: bool = False,
+) -> np.array:
+    """Converti une partie 3 canaux en calque 4 canaux, la couleur transparente a un alpha à 0.
+
+    Args:
+        part (np.array): partie à convertir.
+        transparent_color (tuple, optional): couleur considérée comme transparente. Défaut à TRANSPARENT_COLOR.
+        swap_channels (bool, optional): inverse l'ordre des canaux de couleur (BGR <-> RGB) ? Défaut à False.
+
+    Returns:
+        np.array: calque.
+    """
+    layer = np.empty((part.shape[0], part.shape[1], 4), dtype=np.uint8)
+    layer[:, :, :3] = part[:, :, 2::-1] if swap_channels else part[:, :, :3]
+    layer[:, :, 3] = OPAQUE
+    layer[get_transparent_mask(part, transparent_color)] = TRANSPARENT_PIXEL
+    return layer
+
+
+def get_overlap(
+    background_shape: tuple, part_shape: tuple, position: tuple
+) -> Optional[tuple]:
+    """Calcule la région commune entre le fond et la partie positionnée en (x, y).
+
+    Args:
+        background_shape (tuple): forme du fond.
+        part_shape (tuple): forme de la partie.
+        position (tuple): position (x, y) du coin haut gauche de la partie dans le fond.
+
+    Returns:
+        Optional[tuple]: découpes du fond et de la partie, None si aucune région commune.
+    """
+    x, y = int(position[0]), int(position[1])
+    top, left = max(y, 0), max(x, 0)
+    bottom = min(y + part_shape[0], background_shape[0])
+    right = min(x + part_shape[1], background_shape[1])
+    if top >= bottom or left >= right:
+        return None
+    return (
+        (slice(top, bottom), slice(left, right)),
+        (slice(top - y, bottom - y), slice(left - x, right - x)),
+    )
+
+
+def paste(
+    background: np.array,
+    part: np.array,
+    position: tuple = (0, 0),
+    transparent_color: tuple = TRANSPARENT_COLOR,
+) -> np.array:
+    """Colle une partie 3 canaux sur le fond, la couleur transparente laisse le fond visible.
+
+    Le fond est modifié sur place, seule la région commune est parcourue.
+
+    Args:
+        background (np.array): fond (3 canaux).
+        part (np.array): partie à coller (3 canaux).
+        position (tuple, optional): position (x, y) de la partie dans le fond. Défaut à (0, 0).
+        transparent_color (tuple, optional): couleur considérée comme transparente. Défaut à TRANSPARENT_COLOR.
+
+    Returns:
+        np.array: fond.
+    """
+    overlap = get_overlap(background.shape, part.shape, position)
+    if overlap is None:
+        return background
+    background_slices, part_slices = overlap
+    part_region = part[part_slices]
+    np.copyto(
+        background[background_slices],
+        part_region[:, :, : background.shape[2]],
+        where=~get_transparent_mask(part_region, transparent_color)[:, :, None],
+    )
+    return background
+
+
+def over(background: np.array, layer: np.array, position: tuple = (0, 0)) -> np.array:
+    """Compose un calque 4 canaux sur le fond avec l'opérateur "over" en alpha prémultiplié.
+
+    Le fond est modifié sur place, seule la région commune est parcourue. Un fond 3 canaux est
+    considéré comme opaque. Lorsque l'alpha du calque est binaire (cas des parties dessinées),
+    la composition se réduit à une copie masquée.
+
+    Args:
+        background (np.array): fond (3 ou 4 canaux).
+        layer (np.array): calque à composer (4 canaux).
+        position (tuple, optional): position (x, y) du calque dans le fond. Défaut à (0, 0).
+
+    Returns:
+        np.array: fond.
+    """
+    overlap = get_overlap(background.shape, layer.shape, position)
+    if overlap is None:
+        return background
+    background_slices, layer_slices = overlap
+    channels = background.shape[2]
+    background_region = background[background_slices]
+    layer_region = layer[layer_slices]
+    alpha = layer_region[:, :, 3]
+
+    partial = (alpha > 0) & (alpha < OPAQUE)
+    if not partial.any():
+        np.copyto(
+            background_region,
+            layer_region[:, :, :channels],
+            where=(alpha == OPAQUE)[:, :, None],
+        )
+        return background
+
+    source_alpha = alpha[:, :, None].astype(np.float32) / OPAQUE
+    destination_alpha = (
+        background_region[:, :, 3:].astype(np.float32) / OPAQUE
+        if channels == 4
+        else np.float32(1.0)
+    )
+    destination_weight = destination_alpha * (1.0 - source_alpha)
+    out_alpha = source_alpha + destination_weight
+    out_color = (
+        layer_region[:, :, :3] * source_alpha
+        + background_region[:, :, :3] * destination_weight
+    )
+    np.divide(out_color, out_alpha, out=out_color, where=out_alpha > 0)
+    background_region[:, :, :3] = np.rint(out_color)
+    if channels == 4:
+        background_region[:, :, 3:] = np.rint(out_alpha * OPAQUE)
+    return background
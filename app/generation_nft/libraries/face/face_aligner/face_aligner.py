@@ -28,6 +28,7 @@ import cv2 as open_cv
 import numpy as np
 
 from app import logger
+from app.generation_nft.timing import timed
 
 
 class FaceAligner(object):
@@ -37,6 +38,7 @@ class FaceAligner(object):
         """Initialise la classe pour aligner les yeux horizontalement."""
         pass
 
+    @timed("alignment")
     def face_align(
         self, face: np.array, left_eye_points: np.array, right_eye_points: np.array
     ) -> np.array:
@@ -61,8 +63,7 @@ class FaceAligner(object):
             right_eye_center = self.get_mass_center(right_eye_points)
         except AttributeError as mass_error:
             logger.error(
-                f"Le format des coordonnées d'un des yeux n'est pas correcte pour l'image du joueur {self.player.code}.",
-                mass_error,
+                f"Le format des coordonnées d'un des yeux n'est pas correcte pour l'image du joueur {self.player.code} : {mass_error}",
             )
             raise mass_error
 
@@ -89,15 +90,13 @@ class FaceAligner(object):
             transformation_matrix = open_cv.getRotationMatrix2D(eyes_center, angle, 1.0)
         except UnboundLocalError as type_rotation_error:
             logger.error(
-                f"Le type des coordonnées du centre des deux yeux est incorrect (float attendu) pour l'image du joueur {self.player.code}.",
-                type_rotation_error,
+                f"Le type des coordonnées du centre des deux yeux est incorrect (float attendu) pour l'image du joueur {self.player.code} : {type_rotation_error}",
             )
             raise type_rotation_error
 
         except Exception as rotation_error:
             logger.error(
-                f"La rotation a rencontrée une erreur pour l'image du joueur {self.player.code}.",
-                rotation_error,
+                f"La rotation a rencontrée une erreur pour l'image du joueur {self.player.code} : {rotation_error}",
             )
             raise rotation_error
 
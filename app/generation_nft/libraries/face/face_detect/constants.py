@@ -39,3 +39,6 @@ CAFFE_FILES = [
         "parent_path": settings.FACE_DETECT_MODELS_PATH,
     },
 ]
+
+# confiance minimum de la détection d'un visage (caffe et FaceMesh) lors de la génération
+MIN_DETECTION_CONFIDENCE = 0.8
@@ -25,7 +25,9 @@ ______                           _           _
 File: app/generation_nft/libraries/face/face_detect/face_detect.py
 """
 
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 
 import cv2 as open_cv
 import gdown
@@ -35,9 +37,28 @@ import requests
 from app import logger
 from app.exceptions import PronochainException
 from app.generation_nft.libraries.face.face_detect.constants import CAFFE_FILES
+from app.generation_nft.timing import timed
 from app.generation_nft.utils import get_dimension_to_append, resize_parsing
 from app.settings import settings
 
+DETECTOR_LOCK = (
+    Lock()
+)  # le réseau caffe partagé n'est pas utilisable par plusieurs threads
+
+
+@lru_cache(maxsize=None)
+def load_face_detect_model(prototxt_path: str, model_path: str) -> open_cv.dnn.Net:
+    """Charge le détecteur de visages caffe une seule fois par processus.
+
+    Args:
+        prototxt_path (str): chemin de l'architecture du réseau.
+        model_path (str): chemin des poids du réseau.
+
+    Returns:
+        open_cv.dnn.Net: détecteur de visages.
+    """
+    return open_cv.dnn.readNetFromCaffe(prototxt_path, model_path)
+
 
 class FaceDetect(object):
     """Classe permettant d'intéragir avec la détection du visage."""
@@ -82,6 +103,7 @@ class FaceDetect(object):
         else:
             self.player_code = self.player.code
 
+    @timed("detection")
     def face_detection(self) -> list:
         """Fonction qui permet de détecter un visage et de retourner uniquement ce visage.
 
@@ -92,7 +114,7 @@ class FaceDetect(object):
         Returns:
             list: liste des visages détectés avec plus de 80% de confiance.
         """
-        detector = open_cv.dnn.readNetFromCaffe(
+        detector = load_face_detect_model(
             self.caffe_prototxt_path, self.caffe_model_path
         )
 
@@ -105,18 +127,17 @@ class FaceDetect(object):
             )
         except Exception as convert_blob_error:
             logger.error(
-                f"Impossible de convertir l'image du joueur {self.player_code} en blob.",
-                convert_blob_error,
+                f"Impossible de convertir l'image du joueur {self.player_code} en blob : {convert_blob_error}",
             )
             raise convert_blob_error
 
         try:
-            detector.setInput(blob_image)
-            face_detections = detector.forward()
+            with DETECTOR_LOCK:
+                detector.setInput(blob_image)
+                face_detections = detector.forward()
         except Exception as detection_error:
             logger.error(
-                f"La détection du visage du joueur {self.player_code} a rencontrée une erreur.",
-                detection_error,
+                f"La détection du visage du joueur {self.player_code} a rencontrée une erreur : {detection_error}",
             )
             raise detection_error
 
@@ -129,7 +150,7 @@ class FaceDetect(object):
             face_detections (np.array): liste des visages détectés
 
         Returns:
-            list: visage découpé.
+            list: visages découpés, leur confiance est stockée dans face_confidences.
         """
         margin_height = int(np.ceil(self.height * self.upscale_detection))
         margin_width = int(np.ceil(self.width * self.upscale_detection))
@@ -186,19 +207,22 @@ class FaceDetect(object):
                 if dimension_to_substract is not None:
                     crop_face = resize_parsing(crop_face, dimension_to_substract)
 
-                faces.append(crop_face)
+                faces.append((crop_face, float(confidence)))
 
         sorted_faces = []
         for face in faces:
             if (
                 len(sorted_faces) > 0
-                and face.shape[0] <= self.height
-                and sorted_faces[0].shape[0] < face.shape[0]
+                and face[0].shape[0] <= self.height
+                and sorted_faces[0][0].shape[0] < face[0].shape[0]
             ):
                 sorted_faces.insert(0, face)
                 continue
             sorted_faces.append(face)
-        return sorted_faces
+
+        # confiance de détection de chaque visage retourné, dans le même ordre
+        self.face_confidences = [confidence for _, confidence in sorted_faces]
+        return [face for face, _ in sorted_faces]
 
     def download_missing_files(self):
         """Télécharge les fichiers manquants.
@@ -31,6 +31,10 @@ from app.generation_nft.libraries.face.face_styling.constants import (
     RIGHT_NARE_POINT,
 )
 
+X_COORDINATE = 0  # COLONNE X
+Y_COORDINATE = 1  # COLONNE Y
+Z_COORDINATE = 2  # COLONNE Z
+
 ADD_POINT_LIST = [
     # EYEBROW
     [107, 9],  # 478
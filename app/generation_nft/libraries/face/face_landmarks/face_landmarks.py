@@ -24,7 +24,11 @@ ______                           _           _
 
 File: app/generation_nft/libraries/face/face_landmarks/face_landmarks.py
 """
-from typing import Union
+from contextlib import contextmanager
+from functools import lru_cache
+from queue import LifoQueue
+from threading import Lock
+from typing import Iterator, Union
 
 import cv2 as open_cv
 import numpy as np
@@ -32,7 +36,73 @@ from mediapipe.python.solutions import face_mesh as mediapipe_fm
 
 from app import logger
 from app.generation_nft.libraries.face.face_landmarks.constants import ADD_POINT_LIST
-from app.generation_nft.utils import normalize_values
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
+from app.generation_nft.timing import timed
+from app.settings import settings
+
+
+class FaceMeshPool(object):
+    """Graphes FaceMesh partagés par le processus, un graphe traite une image à la fois."""
+
+    def __init__(self, min_detection_confidence: float, size: int):
+        """Initialise le pool, les graphes sont créés à la demande.
+
+        Args:
+            min_detection_confidence (float): la valeur minimum de confiance de la détection d'un visage.
+            size (int): nombre maximum de graphes.
+        """
+        self.min_detection_confidence = min_detection_confidence
+        self.size = size
+        self.lock = Lock()
+        self.created = 0
+        self.face_meshes = LifoQueue()
+
+    def create_face_mesh(self) -> mediapipe_fm.FaceMesh:
+        """Initialise un graphe FaceMesh.
+
+        Returns:
+            mediapipe_fm.FaceMesh: détecteur des landmarks, en mode image statique.
+        """
+        return mediapipe_fm.FaceMesh(
+            static_image_mode=True,
+            refine_landmarks=True,
+            max_num_faces=1,
+            min_detection_confidence=self.min_detection_confidence,
+        )
+
+    @contextmanager
+    def acquire(self) -> Iterator[mediapipe_fm.FaceMesh]:
+        """Réserve un graphe, attend qu'un graphe se libère si tous sont créés.
+
+        Yields:
+            Iterator[mediapipe_fm.FaceMesh]: détecteur des landmarks.
+        """
+        with self.lock:
+            create = self.face_meshes.empty() and self.created < self.size
+            if create:
+                self.created += 1
+        face_mesh = self.create_face_mesh() if create else self.face_meshes.get()
+        try:
+            yield face_mesh
+        finally:
+            self.face_meshes.put(face_mesh)
+
+
+@lru_cache(maxsize=None)
+def get_face_mesh_pool(min_detection_confidence: float) -> FaceMeshPool:
+    """Récupère le pool de graphes FaceMesh du processus pour une confiance minimum.
+
+    Un graphe par thread d'évaluation des visages candidats, au moins un.
+
+    Args:
+        min_detection_confidence (float): la valeur minimum de confiance de la détection d'un visage.
+
+    Returns:
+        FaceMeshPool: pool de graphes FaceMesh.
+    """
+    return FaceMeshPool(
+        min_detection_confidence, max(1, settings.FACE_CANDIDATE_WORKERS)
+    )
 
 
 class FaceLandmarks(object):
@@ -47,6 +117,7 @@ class FaceLandmarks(object):
         if min_detection_confidence is not None:
             self.min_detection_confidence = min_detection_confidence
 
+    @timed("landmarks")
     def face_landmark(
         self, face: np.array, check: bool = True
     ) -> Union[tuple, list, None]:
@@ -61,99 +132,33 @@ class FaceLandmarks(object):
             landmark_detect_error: aucune détection de masque.
 
         Returns:
-            Union[tuple, list, None]: liste de coordonnées x, y et z de chaque point des landmarks.
+            Union[tuple, list, None]: résultat MediaPipe et, hors vérification, les landmarks normalisés (Landmarks).
         """
-        with mediapipe_fm.FaceMesh(
-            static_image_mode=True,
-            refine_landmarks=True,
-            max_num_faces=1,
-            min_detection_confidence=self.min_detection_confidence,
-        ) as face_mesh:
-            try:
+        try:
+            with get_face_mesh_pool(
+                self.min_detection_confidence
+            ).acquire() as face_mesh:
                 results = face_mesh.process(
                     open_cv.cvtColor(face, open_cv.COLOR_BGR2RGB)
                 )
 
-            except Exception as mesh_error:
-                logger.error(
-                    f"La détection des landmarks sur le visage du joueur {self.player.code} a rencontrée une erreur.",
-                    mesh_error,
-                )
-                raise mesh_error
-
-            try:
-                face_landmark = results.multi_face_landmarks[0]
-                if not check:
-                    normalized_landmark_points = normalize_values(
-                        face, face_landmark.landmark
-                    )
-                    normalized_landmark_points = self.add_points(
-                        normalized_landmark_points, ADD_POINT_LIST
-                    )
-
-                    return face_landmark, normalized_landmark_points
-                return face_landmark
-            except TypeError as landmark_detect_error:
-                logger.error(
-                    f"Aucune détection de visage sur l'image du joueur {self.player.code} pour les landmarks.",
-                    landmark_detect_error,
-                )
-                return None
-
-    def add_points(self, landmarks: list, point_list: list) -> list:
-        """Ajoute une liste de points dans les coordonnées des parties du visage.
-
-        Args:
-            landmarks (list): coordonnées des parties du visage.
-            point_list (list): liste de points à ajouter.
-
-        Returns:
-            list: coordonnées des parties du visage avec les nouveaux points.
-        """
-        for points in point_list:
-            new_point = self.add_point(landmarks, points[0], points[1])
-            landmarks.append(new_point)
-        return landmarks
-
-    def add_point(self, landmarks: list, first_point: int, second_point: int) -> dict:
-        """Ajoute un point dans les coordonnées des parties du visage.
-
-        Args:
-            landmarks (list): coordonnées des parties du visage.
-            first_point (int): index du premier point.
-            second_point (int): index du deuxième point.
-
-        Returns:
-            dict: nouveau point qui se situe entre les deux points.
-        """
-        first_landmark_point, second_landmark_point = (
-            landmarks[first_point],
-            landmarks[second_point],
-        )
-        first_landmark_point_x, first_landmark_point_y, first_landmark_point_z = (
-            first_landmark_point.get("x"),
-            first_landmark_point.get("y"),
-            first_landmark_point.get("z"),
-        )
-        second_landmark_point_x, second_landmark_point_y, second_landmark_point_z = (
-            second_landmark_point.get("x"),
-            second_landmark_point.get("y"),
-            second_landmark_point.get("z"),
-        )
-        width, height, new_z = (
-            int(round(abs(first_landmark_point_x - second_landmark_point_x) / 2)),
-            int(round(abs(first_landmark_point_y - second_landmark_point_y) / 2)),
-            round((first_landmark_point_z + second_landmark_point_z) / 2, 2),
-        )
-        new_x = (
-            first_landmark_point_x + width
-            if first_landmark_point_x < second_landmark_point_x
-            else first_landmark_point_x - width
-        )
-        new_y = (
-            first_landmark_point_y + height
-            if first_landmark_point_y < second_landmark_point_y
-            else first_landmark_point_y - height
-        )
-
-        return {"x": new_x, "y": new_y, "z": new_z}
+        except Exception as mesh_error:
+            logger.error(
+                f"La détection des landmarks sur le visage du joueur {self.player.code} a rencontrée une erreur : {mesh_error}",
+            )
+            raise mesh_error
+
+        try:
+            face_landmark = results.multi_face_landmarks[0]
+            if not check:
+                normalized_landmark_points = Landmarks.from_mediapipe(
+                    face, face_landmark.landmark
+                ).add_points(ADD_POINT_LIST)
+
+                return face_landmark, normalized_landmark_points
+            return face_landmark
+        except TypeError as landmark_detect_error:
+            logger.error(
+                f"Aucune détection de visage sur l'image du joueur {self.player.code} pour les landmarks : {landmark_detect_error}",
+            )
+            return None
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/libraries/face/face_landmarks/landmarks.py
+"""
+from typing import Iterable
+
+import numpy as np
+
+from app.generation_nft.libraries.face.face_landmarks.constants import (
+    X_COORDINATE,
+    Y_COORDINATE,
+    Z_COORDINATE,
+)
+
+
+class Landmarks(object):
+    """Coordonnées des landmarks d'un visage stockées dans un tableau (N, 3).
+
+    x et y sont en pixels, z est la profondeur relative au point le plus proche.
+    """
+
+    __slots__ = ("points", "xy")
+
+    def __init__(self, points: np.array):
+        """Initialise le conteneur des landmarks.
+
+        Args:
+            points (np.array): tableau (N, 3) des coordonnées x, y et z.
+        """
+        self.points = np.asarray(points, dtype=np.float64)
+        self.xy = self.points[:, [X_COORDINATE, Y_COORDINATE]].astype(np.int32)
+
+    @classmethod
+    def from_mediapipe(cls, face: np.array, landmarks: Iterable) -> "Landmarks":
+        """Convertit les landmarks MediaPipe en coordonnées du visage.
+
+        Args:
+            face (np.array): visage.
+            landmarks (Iterable): landmarks MediaPipe (x, y et z normalisés).
+
+        Returns:
+            Landmarks: landmarks en pixels.
+        """
+        (height, width) = face.shape[:2]
+        points = np.array(
+            [(landmark.x, landmark.y, landmark.z) for landmark in landmarks],
+            dtype=np.float64,
+        )
+        points[:, X_COORDINATE] = np.rint(points[:, X_COORDINATE] * width)
+        points[:, Y_COORDINATE] = np.rint(points[:, Y_COORDINATE] * height)
+        points[:, Z_COORDINATE] = np.round(
+            (points[:, Z_COORDINATE] - points[:, Z_COORDINATE].min()) * 10, 2
+        )
+        return cls(points)
+
+    def __len__(self) -> int:
+        """Nombre de landmarks.
+
+        Returns:
+            int: nombre de landmarks.
+        """
+        return len(self.points)
+
+    def __getitem__(self, index) -> np.array:
+        """Récupère les coordonnées x, y et z d'un ou plusieurs points.
+
+        Args:
+            index: index du ou des points.
+
+        Returns:
+            np.array: coordonnées x, y et z.
+        """
+        return self.points[index]
+
+    @property
+    def x(self) -> np.array:
+        """Coordonnées x de chaque point.
+
+        Returns:
+            np.array: coordonnées x.
+        """
+        return self.xy[:, X_COORDINATE]
+
+    @property
+    def y(self) -> np.array:
+        """Coordonnées y de chaque point.
+
+        Returns:
+            np.array: coordonnées y.
+        """
+        return self.xy[:, Y_COORDINATE]
+
+    @property
+    def z(self) -> np.array:
+        """Profondeur de chaque point.
+
+        Returns:
+            np.array: coordonnées z.
+        """
+        return self.points[:, Z_COORDINATE]
+
+    def point(self, index: int) -> tuple:
+        """Récupère les coordonnées x et y d'un point, utilisables par OpenCV.
+
+        Args:
+            index (int): index du point.
+
+        Returns:
+            tuple: coordonnées x et y.
+        """
+        x, y = self.xy[index]
+        return int(x), int(y)
+
+    def add_points(self, point_list: list) -> "Landmarks":
+        """Ajoute les points situés au milieu de chaque paire de points.
+
+        Une paire peut utiliser un point ajouté précédemment, les paires sont donc
+        calculées par blocs dont les points sont déjà connus.
+
+        Args:
+            point_list (list): liste des paires d'index des points.
+
+        Raises:
+            IndexError: une paire utilise un point qui n'est pas encore défini.
+
+        Returns:
+            Landmarks: landmarks avec les nouveaux points.
+        """
+        pairs = np.asarray(point_list, dtype=np.intp).reshape(-1, 2)
+        length = len(self.points)
+        points = np.empty((length + len(pairs), 3), dtype=np.float64)
+        points[:length] = self.points
+
+        start = 0
+        while start < len(pairs):
+            blocked = np.flatnonzero(pairs[start:].max(axis=1) >= length + start)
+            end = start + blocked[0] if blocked.size else len(pairs)
+            if end == start:
+                raise IndexError(
+                    f"Le point {length + start} dépend d'un point non défini : {pairs[start]}."
+                )
+            first, second = points[pairs[start:end, 0]], points[pairs[start:end, 1]]
+            difference = second[:, :Z_COORDINATE] - first[:, :Z_COORDINATE]
+            points[length + start : length + end, :Z_COORDINATE] = first[
+                :, :Z_COORDINATE
+            ] + np.sign(difference) * np.rint(np.abs(difference) / 2)
+            points[length + start : length + end, Z_COORDINATE] = np.round(
+                (first[:, Z_COORDINATE] + second[:, Z_COORDINATE]) / 2, 2
+            )
+            start = end
+        return Landmarks(points)
@@ -51,7 +51,6 @@ from app.generation_nft.libraries.face.face_landmarks.constants import (
     RIGHT_UP_EYE,
     RIGHT_UP_EYELID,
 )
-from app.generation_nft.libraries.face.face_parsing.model import BiSeNet
 from app.settings import settings
 
 
@@ -327,10 +326,6 @@ class Config(object):
         self.FACE_MODEL = "BiSeNet"  # nom du modèle BiSeNet
         # taille recommandée par le machine learning. Prendre des images ayant le même ratio 256x256 ...
         self.INPUT_IMAGE_SIZE = 512
-        self.MODEL = BiSeNet(
-            resnet=settings.RESNET_URL,
-            n_classes=self.NUM_CLASSES,
-        )
         self.PRETRAINED_MODEL_PATH = Path(f"{self.PRETRAINED_PATH}/face_parts.pth")
         self.SKIN_HSV_COLOR = [130, 255, 255]
         self.HAIR_HSV_COLOR = [15, 255, 255]
@@ -25,6 +25,7 @@ ______                           _           _
 File: app/generation_nft/libraries/face/face_parsing/face_parsing.py
 """
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
 import cv2 as open_cv
@@ -37,16 +38,64 @@ from torchvision import transforms
 
 from app import logger
 from app.exceptions import PronochainException
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
 from app.generation_nft.libraries.face.face_parsing.constants import (
     FACE_PARSING_MODELS,
     Config,
     PartName,
 )
+from app.generation_nft.libraries.face.face_parsing.model import BiSeNet
+from app.generation_nft.timing import timed
 from app.generation_nft.utils import draw_contours, get_roi, replace_color, where
+from app.settings import settings
 
 warnings.filterwarnings("ignore")
 
 
+@lru_cache(maxsize=None)
+def load_face_parsing_model(
+    weights_path: str, device: str, num_classes: int, input_size: int
+) -> torch.nn.Module:
+    """Construit le modèle de face parsing une seule fois par processus.
+
+    Le BiSeNet est construit sans pré-entraînement du backbone (les poids finaux
+    écrasent ceux du resnet), puis ses poids sont chargés et le modèle passé en
+    mode évaluation. Si FACE_PARSING_TORCHSCRIPT est activé, le modèle tracé est
+    sérialisé à côté des poids et rechargé directement aux démarrages suivants.
+
+    Args:
+        weights_path (str): chemin des poids du modèle.
+        device (str): device torch sur lequel charger le modèle.
+        num_classes (int): nombre de parties du visage à détecter.
+        input_size (int): taille des images données au modèle.
+
+    Returns:
+        torch.nn.Module: modèle prêt pour l'inférence.
+    """
+    torch_device = torch.device(device)
+    weights = Path(weights_path)
+    script = weights.with_name(settings.FACE_PARSING_TORCHSCRIPT_FILE)
+    if (
+        settings.FACE_PARSING_TORCHSCRIPT
+        and script.is_file()
+        and script.stat().st_mtime >= weights.stat().st_mtime
+    ):
+        return torch.jit.load(str(script), map_location=torch_device).eval()
+
+    model = BiSeNet(resnet=None, n_classes=num_classes)
+    model.load_state_dict(torch.load(weights, map_location=torch_device))
+    model.to(torch_device).eval()
+
+    if settings.FACE_PARSING_TORCHSCRIPT:
+        example = torch.zeros(1, 3, input_size, input_size, device=torch_device)
+        with torch.no_grad():
+            traced = torch.jit.trace(model, example)
+        traced.save(str(script))
+        logger.info(f"Modèle face parsing sérialisé dans {script}.")
+        return traced.eval()
+    return model
+
+
 class FaceParsing(object):
     """Classe pour récupérer des zones correspondant à des parties du visages identifiées."""
 
@@ -54,37 +103,29 @@ class FaceParsing(object):
         """Initialise la classe d'intéraction des landmarks."""
         self.config = Config("cpu")
         self.download_missing_files()
+        self.model = load_face_parsing_model(
+            str(self.config.PRETRAINED_MODEL_PATH),
+            str(self.config.DEVICE),
+            self.config.NUM_CLASSES,
+            self.config.INPUT_IMAGE_SIZE,
+        )
 
         self.face_bottom_y = None
         self.face_contours = None
 
-    def face_parsing(
-        self, face: np.array, landmarks: list = [], to_resize: bool = False
-    ):
-        """Fonction pour récupèrer les différentes parties du visage souhaitées.
+    @timed("parsing")
+    def parse_face(self, face: np.array) -> np.array:
+        """Prédit la partie du visage de chaque pixel avec le modèle BiSeNet.
 
         Args:
             face (np.array): visage à segmenter.
-            landmarks (list): points du visage.
 
         Returns:
-            list: différents contours des parties du visage voulues.
+            np.array: carte des labels, de la taille du visage.
         """
-        face_shape = face.shape
-        model = self.config.MODEL
-        pretrained_model_path = self.config.PRETRAINED_MODEL_PATH
         device = self.config.DEVICE
         input_size = self.config.INPUT_IMAGE_SIZE
 
-        model.to(device)
-        model.load_state_dict(
-            torch.load(
-                f"{pretrained_model_path.parent}/{pretrained_model_path.name}",
-                map_location=device,
-            )
-        )
-        model.eval()
-
         with torch.no_grad():
             infer_transforms = transforms.Compose(
                 [
@@ -102,7 +143,7 @@ class FaceParsing(object):
                 )  # redimensionne le visage
 
             face_tensor = infer_transforms(resized_face).unsqueeze(0).to(device)
-            prediction = model(face_tensor)[0]
+            prediction = self.model(face_tensor)[0]
 
             prediction = F.interpolate(
                 prediction,
@@ -111,94 +152,112 @@ class FaceParsing(object):
                 align_corners=True,
             )
 
-            prediction = prediction.squeeze(0).cpu().numpy().argmax(0)
+            return prediction.squeeze(0).cpu().numpy().argmax(0).astype(np.uint8)
 
-            black_color = np.array([0, 0, 0])
+    def face_parsing(
+        self,
+        face: np.array,
+        landmarks: Landmarks = None,
+        to_resize: bool = False,
+        prediction: np.array = None,
+    ):
+        """Fonction pour récupèrer les différentes parties du visage souhaitées.
 
-            visual_mask_color = self.clean_mask(
-                prediction, landmarks, to_resize, all=True
-            )
-            visual_face_mask_color = self.clean_mask(prediction, landmarks, to_resize)
-
-            black_mask_color = visual_mask_color.copy()
-            replace_color(black_mask_color, self.config.SKIN_COLOR, black_color)
-            replace_color(black_mask_color, self.config.BROW_COLOR, black_color)
-            replace_color(black_mask_color, self.config.HAIR_COLOR, black_color)
-            replace_color(black_mask_color, self.config.EAR_COLOR, black_color)
-            replace_color(black_mask_color, self.config.NOSE_COLOR, black_color)
-
-            face_mask_color = visual_face_mask_color.copy()
-            replace_color(face_mask_color, self.config.SKIN_COLOR, black_color)
-            replace_color(face_mask_color, self.config.BROW_COLOR, black_color)
-            replace_color(face_mask_color, self.config.EAR_COLOR, black_color)
-            replace_color(face_mask_color, self.config.NOSE_COLOR, black_color)
-
-            y_top, self.face_bottom_y, x_left, x_right = get_roi(
-                black_mask_color, black_color
-            )
-            coordinates = (
-                y_top,
-                self.face_bottom_y,
-                x_left,
-                x_right,
-            )
+        Args:
+            face (np.array): visage à segmenter.
+            landmarks (Landmarks, optional): points du visage. Défaut à None.
+            to_resize (bool, optional): retourne seulement le visage découpé. Défaut à False.
+            prediction (np.array, optional): carte des labels déjà prédite (parse_face). Défaut à None.
 
-            new_face = face.copy()
-            new_face = new_face[y_top : self.face_bottom_y, x_left:x_right]
+        Returns:
+            list: différents contours des parties du visage voulues.
+        """
+        face_shape = face.shape
+        if prediction is None:
+            prediction = self.parse_face(face)
 
-            if to_resize:
-                return new_face
+        black_color = np.array([0, 0, 0])
 
-            landmarks_contours = self.get_landmarks_contours(
-                visual_mask_color, landmarks, coordinates
-            )
+        visual_mask_color = self.clean_mask(prediction, landmarks, to_resize, all=True)
+        visual_face_mask_color = self.clean_mask(prediction, landmarks, to_resize)
 
-            visual_mask_color = visual_mask_color[
-                y_top : self.face_bottom_y, x_left:x_right
-            ]
-            visual_black_color = black_mask_color[
-                y_top : self.face_bottom_y, x_left:x_right
-            ]
+        black_mask_color = visual_mask_color.copy()
+        replace_color(black_mask_color, self.config.SKIN_COLOR, black_color)
+        replace_color(black_mask_color, self.config.BROW_COLOR, black_color)
+        replace_color(black_mask_color, self.config.HAIR_COLOR, black_color)
+        replace_color(black_mask_color, self.config.EAR_COLOR, black_color)
+        replace_color(black_mask_color, self.config.NOSE_COLOR, black_color)
 
-            face_entire_mask, face_entire_contours = draw_contours(
-                visual_black_color,
-                open_cv.cvtColor(visual_black_color, open_cv.COLOR_BGR2HSV),
-                (0, 0, 0),
-                open_cv.FILLED,
-                as_mask=True,
-            )
-            self.face_contours = np.full(
-                (face_entire_mask.shape[0], face_entire_mask.shape[1], 3),
-                255,
-                dtype=np.uint8,
-            )
-            open_cv.drawContours(
-                self.face_contours, face_entire_contours, -1, (0, 0, 0), 2
-            )
+        face_mask_color = visual_face_mask_color.copy()
+        replace_color(face_mask_color, self.config.SKIN_COLOR, black_color)
+        replace_color(face_mask_color, self.config.BROW_COLOR, black_color)
+        replace_color(face_mask_color, self.config.EAR_COLOR, black_color)
+        replace_color(face_mask_color, self.config.NOSE_COLOR, black_color)
 
-            parsing_contours = self.get_parsing_contours(visual_mask_color)
+        y_top, self.face_bottom_y, x_left, x_right = get_roi(
+            black_mask_color, black_color
+        )
+        coordinates = (
+            y_top,
+            self.face_bottom_y,
+            x_left,
+            x_right,
+        )
 
-            contours = landmarks_contours + parsing_contours
+        new_face = face.copy()
+        new_face = new_face[y_top : self.face_bottom_y, x_left:x_right]
 
-            return self.draw_face(
-                new_face,
-                visual_black_color,
-                landmarks,
-                contours,
-                coordinates,
-                face_shape,
-                face_entire_mask,
-                face_entire_contours,
-            )
+        if to_resize:
+            return new_face
+
+        landmarks_contours = self.get_landmarks_contours(
+            visual_mask_color, landmarks, coordinates
+        )
+
+        visual_mask_color = visual_mask_color[
+            y_top : self.face_bottom_y, x_left:x_right
+        ]
+        visual_black_color = black_mask_color[
+            y_top : self.face_bottom_y, x_left:x_right
+        ]
+
+        face_entire_mask, face_entire_contours = draw_contours(
+            visual_black_color,
+            open_cv.cvtColor(visual_black_color, open_cv.COLOR_BGR2HSV),
+            (0, 0, 0),
+            open_cv.FILLED,
+            as_mask=True,
+        )
+        self.face_contours = np.full(
+            (face_entire_mask.shape[0], face_entire_mask.shape[1], 3),
+            255,
+            dtype=np.uint8,
+        )
+        open_cv.drawContours(self.face_contours, face_entire_contours, -1, (0, 0, 0), 2)
+
+        parsing_contours = self.get_parsing_contours(visual_mask_color)
+
+        contours = landmarks_contours + parsing_contours
+
+        return self.draw_face(
+            new_face,
+            visual_black_color,
+            landmarks,
+            contours,
+            coordinates,
+            face_shape,
+            face_entire_mask,
+            face_entire_contours,
+        )
 
     def get_landmarks_contours(
-        self, visual_mask_color: np.array, landmarks: list, coordinates: tuple
+        self, visual_mask_color: np.array, landmarks: Landmarks, coordinates: tuple
     ) -> list:
         """Récupère les contours des différentes parties du visages.
 
         Args:
             visual_mask_color (np.array): prédiction des parties du visage.
-            landmarks (list): coordonnées landmarks.
+            landmarks (Landmarks): coordonnées landmarks.
             coordinates (tuple): coordonnées
 
         Returns:
@@ -208,21 +267,9 @@ class FaceParsing(object):
         for landmark_selected_part in self.config.LANDMARK_SELECTED_PARTS:
             points = landmark_selected_part.get("points")
 
-            landmark_contour = []
-            for point in points:
-                try:
-                    landmark_contour.append(
-                        np.array(
-                            [
-                                int(landmarks[point].get("x")),
-                                int(landmarks[point].get("y")),
-                            ]
-                        )
-                    )
-                except IndexError:
-                    continue
-
-            landmark_contour = np.array([np.array(landmark_contour)])
+            landmark_contour = np.array(
+                [landmarks.xy[[point for point in points if point < len(landmarks)]]]
+            )
 
             virgin_contour = np.full(
                 (visual_mask_color.shape[0], visual_mask_color.shape[1], 1),
@@ -259,13 +306,17 @@ class FaceParsing(object):
         return contours
 
     def clean_mask(
-        self, prediction: np.array, landmarks: list, to_resize: bool, all: bool = False
+        self,
+        prediction: np.array,
+        landmarks: Landmarks,
+        to_resize: bool,
+        all: bool = False,
     ) -> np.array:
         """Récupère seulement les parties souhaitées en supprimant les autres parties.
 
         Args:
             prediction (np.array): prediction.
-            landmarks (list): _description_
+            landmarks (Landmarks): _description_
             to_resize (bool): _description_
             all (bool, optional): _description_. Defaults to False.
 
@@ -284,8 +335,9 @@ class FaceParsing(object):
         )
 
         if all:
-            clean_parts = self.config.CLEAN_FACE_PARTS
-            clean_parts.append(self.config.CLEAN_HAIR_PARTS[-1])
+            clean_parts = self.config.CLEAN_FACE_PARTS + [
+                self.config.CLEAN_HAIR_PARTS[-1]
+            ]
         else:
             clean_parts = self.config.CLEAN_FACE_PARTS
 
@@ -305,12 +357,12 @@ class FaceParsing(object):
             visual_mask_color[max(coordinates_y) :, :] = np.array([255, 255, 255])
         return visual_mask_color.astype(np.uint8)
 
-    def clean_hair(self, visual_mask_color: np.array, landmarks: list) -> np.array:
+    def clean_hair(self, visual_mask_color: np.array, landmarks: Landmarks) -> np.array:
         """Nettoie les cheveux.
 
         Args:
             visual_mask_color (np.array): prédiction des parties du visage.
-            landmarks (list): coordonnées landmarks.
+            landmarks (Landmarks): coordonnées landmarks.
 
         Returns:
             np.array: cheveux nettoyés.
@@ -338,7 +390,7 @@ class FaceParsing(object):
                 virgin_hair_contour, (0, 0, 0), equal=True, count=True
             )
             try:
-                if min(coordinates_y) > int(landmarks[self.config.EAR_POINT].get("y")):
+                if min(coordinates_y) > int(landmarks.y[self.config.EAR_POINT]):
                     open_cv.drawContours(
                         visual_mask_color,
                         np.array([hair_contour]),
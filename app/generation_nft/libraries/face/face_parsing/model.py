@@ -24,6 +24,8 @@ ______                           _           _
 
 File: app/generation_nft/libraries/face/face_parsing/model.py
 """
+from typing import Optional
+
 import numpy as np
 import torch
 import torch.nn as nn
@@ -198,11 +200,12 @@ class ContextPath(nn.Module):
         nn.Module (nn.Module): nn.Module.
     """
 
-    def __init__(self, resnet: str):
+    def __init__(self, resnet: Optional[str] = None):
         """Initialise la classe ContextPath.
 
         Args:
-            resnet (str): url de téléchargement resnet.
+            resnet (Optional[str], optional): url de téléchargement resnet. Si None,
+                le backbone n'est pas pré-entraîné. Défaut à None.
         """
         super(ContextPath, self).__init__()
         self.resnet = Resnet18(resnet)
@@ -399,11 +402,12 @@ class BiSeNet(nn.Module):
         nn.Module (nn.Module): nn.Module.
     """
 
-    def __init__(self, resnet: str, n_classes: int):
+    def __init__(self, resnet: Optional[str], n_classes: int):
         """Initialise la classe BiSeNet.
 
         Args:
-            resnet (str): url de téléchargement resnet.
+            resnet (Optional[str]): url de téléchargement resnet. Si None, le backbone
+                n'est pas pré-entraîné (inutile lorsque les poids finaux sont chargés).
             n_classes (int): nombre de classes à détectées.
         """
         super(BiSeNet, self).__init__()
@@ -559,11 +563,12 @@ class Resnet18(nn.Module):
         nn.Module (nn.Module): nn.Module.
     """
 
-    def __init__(self, resnet: str):
+    def __init__(self, resnet: Optional[str] = None):
         """Initialise la classe Resnet18.
 
         Args:
-            resnet (str): url de téléchargement resnet.
+            resnet (Optional[str], optional): url de téléchargement resnet. Si None,
+                le backbone n'est pas pré-entraîné. Défaut à None.
         """
         super(Resnet18, self).__init__()
         self.conv1 = nn.Conv2d(3, 64, kernel_size=7, stride=2, padding=3, bias=False)
@@ -595,7 +600,9 @@ class Resnet18(nn.Module):
         return feat8, feat16, feat32
 
     def init_weight(self):
-        """Initialise le poids."""
+        """Initialise le poids du backbone à partir du resnet pré-entraîné."""
+        if self.resnet is None:
+            return
         state_dict = modelzoo.load_url(
             self.resnet,
             model_dir=settings.FACE_PARSING_MODEL_PATH,
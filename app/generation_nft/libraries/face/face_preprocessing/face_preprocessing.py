@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/libraries/face/face_preprocessing/face_preprocessing.py
+"""
+import os
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from app import logger
+from app.exceptions import PronochainException
+from app.generation_nft.libraries.face.face_landmarks.constants import (
+    LEFT_EYE,
+    RIGHT_EYE,
+)
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
+from app.generation_nft.libraries.face.face_preprocessing.constants import (
+    PREPROCESSING_VERSION,
+)
+from app.generation_nft.libraries.face.face_quality.constants import RejectReason
+from app.generation_nft.libraries.face.face_quality.face_quality import (
+    quality_gate_metrics,
+)
+from app.generation_nft.timing import timed
+from app.settings import settings
+
+
+@dataclass
+class PreprocessedFace:
+    """Visage prétraité, identique pour toutes les cartes d'une même photo.
+
+    Args:
+        face (np.array): visage aligné et redimensionné.
+        landmarks (Landmarks): landmarks du visage redimensionné.
+        parsing (np.array): carte des labels BiSeNet du visage redimensionné.
+        cached (bool, optional): le visage provient du cache ? Défaut à False.
+    """
+
+    face: np.array
+    landmarks: Landmarks
+    parsing: np.array
+    cached: bool = False
+
+
+def get_preprocessed_face_path(cid: str) -> Path:
+    """Récupère le chemin du visage prétraité d'une photo.
+
+    Args:
+        cid (str): CID de la photo du joueur.
+
+    Returns:
+        Path: chemin du visage prétraité.
+    """
+    return Path(
+        f"{settings.FACE_PREPROCESSING_CACHE_PATH}/{cid}.v{PREPROCESSING_VERSION}.npz"
+    )
+
+
+@timed("preprocessed_face_load")
+def load_preprocessed_face(cid: str) -> Optional[PreprocessedFace]:
+    """Charge le visage prétraité d'une photo.
+
+    Args:
+        cid (str): CID de la photo du joueur.
+
+    Returns:
+        Optional[PreprocessedFace]: visage prétraité, None s'il n'existe pas ou est illisible.
+    """
+    path = get_preprocessed_face_path(cid)
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path) as artifact:
+            return PreprocessedFace(
+                face=artifact["face"],
+                landmarks=Landmarks(artifact["landmarks"]),
+                parsing=artifact["parsing"],
+                cached=True,
+            )
+    except (KeyError, OSError, ValueError, zipfile.BadZipFile) as error:
+        logger.warning(f"Visage prétraité {path.name} illisible : {error}")
+        return None
+
+
+def save_preprocessed_face(cid: str, preprocessed_face: PreprocessedFace):
+    """Enregistre le visage prétraité d'une photo.
+
+    Le fichier est écrit à côté puis renommé, un autre worker ne lit donc jamais un fichier partiel.
+
+    Args:
+        cid (str): CID de la photo du joueur.
+        preprocessed_face (PreprocessedFace): visage prétraité.
+    """
+    path = get_preprocessed_face_path(cid)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "wb") as file:
+        np.savez_compressed(
+            file,
+            face=preprocessed_face.face,
+            landmarks=preprocessed_face.landmarks.points,
+            parsing=preprocessed_face.parsing.astype(np.uint8),
+        )
+    os.replace(temp_path, path)
+
+
+class FacePreprocessing(object):
+    """Classe pour prétraiter la photo du joueur une seule fois, indépendamment des couleurs de la carte.
+
+    S'utilise avec FaceDetect, FaceQuality, FaceLandmarks, FaceAligner, FaceResizing et FaceParsing.
+    """
+
+    def __init__(self):
+        """Initialise le prétraitement du visage."""
+        pass
+
+    def preprocessed_faces(self) -> Iterator[PreprocessedFace]:
+        """Récupère les visages prétraités à essayer, en commençant par celui en cache.
+
+        Yields:
+            Iterator[PreprocessedFace]: visages prétraités.
+        """
+        if settings.FACE_PREPROCESSING_CACHE and (
+            preprocessed_face := load_preprocessed_face(self.player.cid)
+        ):
+            yield preprocessed_face
+        yield from self.preprocess_faces()
+
+    def preprocess_faces(self) -> Iterator[PreprocessedFace]:
+        """Prétraite les visages détectés sur la photo du joueur.
+
+        Yields:
+            Iterator[PreprocessedFace]: visages alignés, redimensionnés et segmentés.
+        """
+        faces = self.face_detection()  # détection des visages
+
+        # écarte et classe les visages avant les étapes coûteuses (face parsing)
+        for candidate in self.select_faces(faces):
+            initial_face = candidate.face
+            check_landmark_points = Landmarks.from_mediapipe(
+                initial_face, candidate.landmarks.landmark
+            )
+
+            # récupère les coordonnées des yeux gauche et droit
+            left_eye_coordinates = check_landmark_points.xy[LEFT_EYE]
+            right_eye_coordinates = check_landmark_points.xy[RIGHT_EYE]
+
+            # aligne la tête pour quelle soit la plus droite possible
+            face = self.face_align(
+                initial_face, left_eye_coordinates, right_eye_coordinates
+            )
+
+            face_resized = self.face_parsing_resizing(face)
+
+            result_landmark_points, normalized_landmark_points = self.face_landmark(
+                face_resized, check=False
+            )
+
+            if result_landmark_points is None:
+                logger.info(
+                    f"Aucun landmarks detecte pour l'image du joueur {self.player.code}, arret du processus pour ce visage."
+                )
+                quality_gate_metrics.record_rejected(
+                    RejectReason.NO_LANDMARKS_AFTER_RESIZE
+                )
+                continue
+
+            try:
+                (
+                    face_resized,
+                    result_landmark_points,
+                    normalized_landmark_points,
+                ) = self.face_landmark_resizing(face_resized)
+            except Exception:
+                quality_gate_metrics.record_rejected(RejectReason.RESIZE_FAILED)
+                continue
+
+            yield PreprocessedFace(
+                face=face_resized,
+                landmarks=normalized_landmark_points,
+                parsing=self.parse_face(face_resized),
+            )
+
+    def save_preprocessed_face(self, preprocessed_face: PreprocessedFace):
+        """Enregistre le visage prétraité du joueur s'il ne provient pas déjà du cache.
+
+        Args:
+            preprocessed_face (PreprocessedFace): visage prétraité.
+        """
+        if settings.FACE_PREPROCESSING_CACHE and not preprocessed_face.cached:
+            save_preprocessed_face(self.player.cid, preprocessed_face)
+
+    def preprocess(self) -> PreprocessedFace:
+        """Prétraite la photo du joueur et enregistre le premier visage exploitable.
+
+        Raises:
+            PronochainException: aucun visage exploitable sur la photo.
+
+        Returns:
+            PreprocessedFace: visage prétraité.
+        """
+        for preprocessed_face in self.preprocess_faces():
+            quality_gate_metrics.record_accepted()
+            save_preprocessed_face(self.player.cid, preprocessed_face)
+            return preprocessed_face
+
+        error_message = f"Aucun visage exploitable pour le joueur {self.player.code}."
+        logger.error(error_message)
+        raise PronochainException(error_message)
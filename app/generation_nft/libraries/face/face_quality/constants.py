@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/libraries/face/face_quality/constants.py
+"""
+from enum import Enum
+
+
+class TiltMode(Enum):
+    """Classe héritant de la classe native Enum. Permet d'énumérer les usages du tilt learning par le contrôle qualité."""
+
+    OFF = "off"  # le tilt learning n'est pas consulté
+    RANK = "rank"  # les visages de face sont essayés en premier
+    REJECT = "reject"  # les visages qui ne sont pas de face sont rejetés
+
+
+class RejectReason(Enum):
+    """Classe héritant de la classe native Enum. Permet d'énumérer les raisons de rejet d'un visage candidat."""
+
+    # contrôle qualité, avant le face parsing
+    LOW_CONFIDENCE = "low_confidence"
+    TOO_SMALL = "too_small"
+    NO_LANDMARKS = "no_landmarks"
+    NOT_FRONT = "not_front"
+    # échecs tardifs, après le face parsing de redimensionnement
+    NO_LANDMARKS_AFTER_RESIZE = "no_landmarks_after_resize"
+    RESIZE_FAILED = "resize_failed"
+    PARSING_FAILED = "parsing_failed"
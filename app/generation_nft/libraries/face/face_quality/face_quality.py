@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/libraries/face/face_quality/face_quality.py
+"""
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app import logger
+from app.exceptions import PronochainException
+from app.generation_nft.libraries.face.face_quality.constants import (
+    RejectReason,
+    TiltMode,
+)
+from app.generation_nft.timing import span, timed
+from app.settings import settings
+
+# erreurs levées par le calcul des features du tilt learning sur un visage dégénéré
+TILT_DATASETS_ERRORS = (IndexError, ValueError, ZeroDivisionError)
+
+# OpenCV, MediaPipe et numpy relâchent le GIL : les visages candidats sont évalués en parallèle
+FACE_CANDIDATE_EXECUTOR = (
+    ThreadPoolExecutor(
+        max_workers=settings.FACE_CANDIDATE_WORKERS,
+        thread_name_prefix="face_candidate",
+    )
+    if settings.FACE_CANDIDATE_WORKERS > 0
+    else None
+)
+
+
+@dataclass
+class FaceCandidate:
+    """Visage détecté candidat à la génération.
+
+    Args:
+        face (np.array): visage découpé.
+        confidence (float): confiance de la détection.
+        landmarks (Any, optional): résultat MediaPipe de la vérification des landmarks.
+        datasets (Optional[dict], optional): features du tilt learning, None si non calculées.
+        front (Optional[bool], optional): le visage regarde en face ? None si inconnu.
+    """
+
+    face: np.array
+    confidence: float
+    landmarks: Any = None
+    datasets: Optional[dict] = None
+    front: Optional[bool] = None
+
+
+class QualityGateMetrics(object):
+    """Compteurs du contrôle qualité des visages, partagés par le processus."""
+
+    def __init__(self):
+        """Initialise les compteurs."""
+        self.lock = Lock()
+        self.candidates = 0
+        self.accepted = 0
+        self.rejected = Counter()
+
+    def record_candidate(self):
+        """Enregistre un visage candidat."""
+        with self.lock:
+            self.candidates += 1
+
+    def record_accepted(self):
+        """Enregistre un visage ayant permis de dessiner le joueur."""
+        with self.lock:
+            self.accepted += 1
+
+    def record_rejected(self, reason: RejectReason):
+        """Enregistre le rejet d'un visage.
+
+        Args:
+            reason (RejectReason): raison du rejet.
+        """
+        with self.lock:
+            self.rejected[reason.value] += 1
+
+
+quality_gate_metrics = QualityGateMetrics()
+
+
+def get_quality_gate_metrics() -> dict:
+    """Récupère les métriques du contrôle qualité des visages.
+
+    Returns:
+        dict: visages candidats, acceptés et rejets par raison.
+    """
+    with quality_gate_metrics.lock:
+        return {
+            "candidates": quality_gate_metrics.candidates,
+            "accepted": quality_gate_metrics.accepted,
+            "rejected": {
+                reason.value: quality_gate_metrics.rejected[reason.value]
+                for reason in RejectReason
+            },
+        }
+
+
+class FaceQuality(object):
+    """Classe pour écarter ou classer les visages détectés avant le face parsing.
+
+    S'utilise avec FaceLandmarks, FaceStyling et TiltLearning (GenerateNFT).
+    """
+
+    def __init__(self):
+        """Initialise le contrôle qualité des visages."""
+        self.tilt_mode = TiltMode(settings.QUALITY_GATE_TILT)
+
+    def select_faces(self, faces: list) -> Iterator[FaceCandidate]:
+        """Récupère les visages à essayer, dans l'ordre où les essayer.
+
+        Args:
+            faces (list): visages détectés, leur confiance est dans face_confidences (face_detection).
+
+        Yields:
+            Iterator[FaceCandidate]: visages candidats avec leurs landmarks.
+        """
+        confidences = self.face_confidences
+        if not settings.QUALITY_GATE_ENABLED:
+            for face, confidence in zip(faces, confidences):
+                candidate = FaceCandidate(face, confidence)
+                quality_gate_metrics.record_candidate()
+                candidate.landmarks = self.face_landmark(face)
+                if candidate.landmarks is None:
+                    self.reject_face(RejectReason.NO_LANDMARKS)
+                    continue
+                yield candidate
+            return
+
+        candidates = []
+        for candidate, reason in self.score_faces(
+            [
+                FaceCandidate(face, confidence)
+                for face, confidence in zip(faces, confidences)
+            ]
+        ):
+            quality_gate_metrics.record_candidate()
+            if reason is not None:
+                self.reject_face(reason)
+                continue
+            candidates.append(candidate)
+
+        if self.tilt_mode != TiltMode.OFF:
+            self.set_front_faces(candidates)
+        if self.tilt_mode == TiltMode.REJECT:
+            for candidate in [c for c in candidates if c.front is False]:
+                self.reject_face(RejectReason.NOT_FRONT)
+                candidates.remove(candidate)
+        # les visages de face sont essayés en premier, le tri stable garde l'ordre de FaceDetect
+        # (le plus grand visage d'abord) : un visage confiant en arrière-plan ne passe pas devant
+        yield from sorted(candidates, key=lambda candidate: candidate.front is False)
+
+    def score_faces(
+        self, candidates: List[FaceCandidate]
+    ) -> List[Tuple[FaceCandidate, Optional[RejectReason]]]:
+        """Évalue les visages candidats, en parallèle si FACE_CANDIDATE_WORKERS.
+
+        Args:
+            candidates (List[FaceCandidate]): visages candidats.
+
+        Returns:
+            List[Tuple[FaceCandidate, Optional[RejectReason]]]: visages candidats et raison de leur rejet.
+        """
+        if FACE_CANDIDATE_EXECUTOR is None or len(candidates) < 2:
+            return [(candidate, self.score_face(candidate)) for candidate in candidates]
+
+        # chaque évaluation reprend le contexte : ses durées comptent dans la génération en cours
+        futures = [
+            FACE_CANDIDATE_EXECUTOR.submit(
+                copy_context().run, self.score_face, candidate
+            )
+            for candidate in candidates
+        ]
+        return [
+            (candidate, future.result())
+            for candidate, future in zip(candidates, futures)
+        ]
+
+    def score_face(self, candidate: FaceCandidate) -> Optional[RejectReason]:
+        """Évalue un visage candidat : contrôle qualité puis features du tilt learning.
+
+        Les landmarks et les features sont conservés sur le candidat pour les étapes suivantes.
+
+        Args:
+            candidate (FaceCandidate): visage candidat.
+
+        Returns:
+            Optional[RejectReason]: raison du rejet, None si le visage est conservé.
+        """
+        if (reason := self.check_face(candidate)) is not None:
+            return reason
+        if self.tilt_mode != TiltMode.OFF:
+            # les features sont mesurées à part : "tilt" mesure la prédiction groupée
+            with span("tilt_features"):
+                try:
+                    candidate.datasets = self.generate_datasets(
+                        candidate.face, self, candidate.landmarks.landmark
+                    )
+                except TILT_DATASETS_ERRORS:
+                    pass
+        return None
+
+    def check_face(self, candidate: FaceCandidate) -> Optional[RejectReason]:
+        """Vérifie un visage candidat, des contrôles les moins coûteux aux plus coûteux.
+
+        Args:
+            candidate (FaceCandidate): visage candidat, ses landmarks sont renseignés.
+
+        Returns:
+            Optional[RejectReason]: raison du rejet, None si le visage est conservé.
+        """
+        if candidate.confidence < settings.QUALITY_GATE_MIN_CONFIDENCE:
+            return RejectReason.LOW_CONFIDENCE
+        if min(candidate.face.shape[:2]) < settings.QUALITY_GATE_MIN_FACE_SIZE:
+            return RejectReason.TOO_SMALL
+        candidate.landmarks = self.face_landmark(candidate.face)
+        if candidate.landmarks is None:
+            return RejectReason.NO_LANDMARKS
+        return None
+
+    @timed("tilt")
+    def set_front_faces(self, candidates: List[FaceCandidate]):
+        """Détermine en une prédiction groupée quels visages regardent en face.
+
+        Args:
+            candidates (List[FaceCandidate]): visages candidats avec leurs features (score_face).
+        """
+        scored = [
+            candidate for candidate in candidates if candidate.datasets is not None
+        ]
+
+        try:
+            predictions = self.predict_many(
+                [candidate.datasets for candidate in scored]
+            )
+        except PronochainException:
+            logger.warning(
+                "Tilt learning indisponible, les visages ne sont pas classés."
+            )
+            return
+        for candidate, front in zip(scored, predictions):
+            candidate.front = front
+
+    def reject_face(self, reason: RejectReason):
+        """Rejette un visage candidat et l'enregistre dans les métriques.
+
+        Args:
+            reason (RejectReason): raison du rejet.
+        """
+        logger.info(
+            f"Visage rejeté pour l'image du joueur {self.player_code} : {reason.value}."
+        )
+        quality_gate_metrics.record_rejected(reason)
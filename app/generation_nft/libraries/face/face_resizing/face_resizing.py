@@ -122,20 +122,20 @@ class FaceResizing(object):
             raise PronochainException
 
         while (
-            normalized_landmark_points[RIGHT_NECK].get("x")
-            - normalized_landmark_points[LEFT_NECK].get("x")
+            normalized_landmark_points.x[RIGHT_NECK]
+            - normalized_landmark_points.x[LEFT_NECK]
         ) < WIDTH_LANDMARK_REFERENCE - 2 or (
-            normalized_landmark_points[RIGHT_NECK].get("x")
-            - normalized_landmark_points[LEFT_NECK].get("x")
+            normalized_landmark_points.x[RIGHT_NECK]
+            - normalized_landmark_points.x[LEFT_NECK]
         ) > WIDTH_LANDMARK_REFERENCE + 2:
             face_pil = Image.fromarray(
                 open_cv.cvtColor(face_resized, open_cv.COLOR_BGR2RGB).astype("uint8"),
                 "RGB",
             )
 
-            width_difference = WIDTH_LANDMARK_REFERENCE - (
-                normalized_landmark_points[RIGHT_NECK].get("x")
-                - normalized_landmark_points[LEFT_NECK].get("x")
+            width_difference = WIDTH_LANDMARK_REFERENCE - int(
+                normalized_landmark_points.x[RIGHT_NECK]
+                - normalized_landmark_points.x[LEFT_NECK]
             )
             (height, width, _) = face_resized.shape
             new_width = face_resized.shape[1] + width_difference
@@ -29,6 +29,8 @@ from app.settings import settings
 IRIS_CENTER_POINT = (151, 151)
 IRIS_RADIAL = 39
 
+BARYCENTRIC_TOLERANCE = 1e-9
+
 TEMP_PATH = f"{settings.GENERATION_NFT_PATH}/libraries/face/face_styling/temp"  # chemin des svg temporaires
 
 NOSE_POINT = [
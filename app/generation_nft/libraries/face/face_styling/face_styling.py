@@ -41,6 +41,7 @@ from app.generation_nft.libraries.face.face_styling.parts import (
     SkinDrawing,
 )
 from app.generation_nft.libraries.face.face_styling.parts.ear import EarDrawing
+from app.generation_nft.timing import span
 
 warnings.filterwarnings("ignore")
 
@@ -187,15 +188,18 @@ class FaceStyling(
                 cleaned_face = getattr(self, f"clean_{clean_func}")(**params)
 
             if draw_func is not None:
-                if name == PartName.HAIR.value:
-                    new_face_minimize, self.drawing_hair, self.real_hair_mask = getattr(
-                        self, f"draw_{draw_func}"
-                    )(**params)
-                elif name == PartName.NECK.value:
-                    new_face_minimize, self.neck_params = getattr(
-                        self, f"draw_{draw_func}"
-                    )(**params)
-                else:
-                    new_face_minimize = getattr(self, f"draw_{draw_func}")(**params)
+                with span(f"draw_{draw_func}"):
+                    if name == PartName.HAIR.value:
+                        (
+                            new_face_minimize,
+                            self.drawing_hair,
+                            self.real_hair_mask,
+                        ) = getattr(self, f"draw_{draw_func}")(**params)
+                    elif name == PartName.NECK.value:
+                        new_face_minimize, self.neck_params = getattr(
+                            self, f"draw_{draw_func}"
+                        )(**params)
+                    else:
+                        new_face_minimize = getattr(self, f"draw_{draw_func}")(**params)
 
         return new_face_minimize
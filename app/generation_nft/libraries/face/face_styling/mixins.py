@@ -29,17 +29,21 @@ import warnings
 
 import cv2 as open_cv
 import numpy as np
-from coloraide import Color
-from PIL import Image
 from reportlab.graphics import renderPM
 from svglib.svglib import svg2rlg
 
 from app import logger
 from app.exceptions import PronochainException
-from app.generation_nft.libraries.face.face_styling.constants import TEMP_PATH
+from app.generation_nft.colors import get_gradient, hex_to_bgr
+from app.generation_nft.libraries.compositor.compositor import new_layer, paste
+from app.generation_nft.libraries.compositor.constants import TRANSPARENT_COLOR
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
+from app.generation_nft.libraries.face.face_styling.constants import (
+    BARYCENTRIC_TOLERANCE,
+    TEMP_PATH,
+)
 from app.generation_nft.utils import (
     draw_contours,
-    multiply_array,
     replace_color,
     replace_color_not_equal,
 )
@@ -54,36 +58,12 @@ class DrawingMixin(object):
         """Initialise la classe des mixins pour dessiner."""
         pass
 
-    def convert_to_pil_with_transparent_background(
-        self, part: np.array, convert: bool = True
-    ) -> Image:
-        """Converti une image en image pil avec un fond transparent.
-
-        Args:
-            part (np.array): partie à convertir.
-            convert (bool, optional): converti le format de la couleur ? Défaut à True.
-
-        Returns:
-            Image: image pil.
-        """
-        part = open_cv.cvtColor(
-            part, open_cv.COLOR_BGR2RGBA if convert else open_cv.COLOR_RGB2RGBA
-        )
-        part[
-            np.all(
-                [part[:, :, 0] == 255, part[:, :, 1] == 255, part[:, :, 2] == 255],
-                axis=0,
-            )
-        ] = np.array([255, 255, 255, 0])
-        return Image.fromarray(part.astype("uint8"), "RGBA")
-
     def get_coordinates_from_list(
         self,
         image: np.array,
         landmarks: list,
         face_part: list,
         scale: bool = True,
-        is_dict: bool = False,
     ) -> np.array:
         """Récupère les coordonnées d'une partie du visage souhaitée.
 
@@ -92,7 +72,6 @@ class DrawingMixin(object):
             landmarks (list): liste des landmarks de la partie du visage.
             face_part (list): liste des points correspondant à la partie souhaitée.
             scale (bool, optional): détermine si l'on souhaite la coordonnées remise à l'échelle par rapport à l'image. Défaut à True.
-            is_dict (bool, optional): est un dictionnaire ? Défaut à False.
 
         Returns:
             np.array: liste des coordonnées [[x, y]].
@@ -100,10 +79,8 @@ class DrawingMixin(object):
         shape = image.shape
         points = np.zeros((len(face_part), 2), dtype="int")
         for index, landmark in enumerate([landmarks[i] for i in face_part]):
-            landmark_x = landmark.get("x") if is_dict else landmark.x
-            landmark_y = landmark.get("y") if is_dict else landmark.y
-            x = round(landmark_x * shape[1]) if scale else int(landmark_x)
-            y = round(landmark_y * shape[0]) if scale else int(landmark_y)
+            x = round(landmark.x * shape[1]) if scale else int(landmark.x)
+            y = round(landmark.y * shape[0]) if scale else int(landmark.y)
             points[index] = (x, y)
         return points
 
@@ -221,15 +198,7 @@ class DrawingMixin(object):
                 y_top:y_bottom, x_left:x_right
             ]
 
-        mask_pil = self.convert_to_pil_with_transparent_background(
-            visual_mask_part_copy
-        )
-        mask_part_pil = Image.fromarray(
-            open_cv.cvtColor(cleaned_face, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        mask_part_pil.paste(mask_pil, (0, 0), mask_pil)
-        return open_cv.cvtColor(np.array(mask_part_pil), open_cv.COLOR_RGBA2BGR)
+        return paste(cleaned_face.copy(), visual_mask_part_copy)
 
     def resize_natif(
         self, mask_part: np.array, face_shape: tuple, x_left: int, y_top: int
@@ -245,25 +214,15 @@ class DrawingMixin(object):
         Returns:
             np.array: visage redimensionné.
         """
-        virgin_mask_part = np.full(
-            (face_shape[0], face_shape[1], 3),
-            255,
-            dtype=np.uint8,
-        )
-        mask_pil = self.convert_to_pil_with_transparent_background(mask_part)
-        mask_part_pil = Image.fromarray(
-            open_cv.cvtColor(virgin_mask_part, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        mask_part_pil.paste(mask_pil, (x_left, y_top), mask_pil)
-        return open_cv.cvtColor(np.array(mask_part_pil), open_cv.COLOR_RGBA2BGR)
+        virgin_mask_part = new_layer(face_shape[0], face_shape[1], TRANSPARENT_COLOR)
+        return paste(virgin_mask_part, mask_part, (x_left, y_top))
 
     def draw_line_contours(
         self,
         name: str,
         mask_part: np.array,
         parts: list,
-        landmarks: list,
+        landmarks: Landmarks,
         close: bool = True,
     ) -> tuple:
         """Dessine la ligne de contour.
@@ -272,7 +231,7 @@ class DrawingMixin(object):
             name (str): nom.
             mask_part (np.array): mask.
             parts (list): partie du visage.
-            landmarks (list): coordonnées des parties du visage.
+            landmarks (Landmarks): coordonnées des parties du visage.
             close (bool, optional): contour fermé ? Défaut à True.
 
         Returns:
@@ -283,9 +242,7 @@ class DrawingMixin(object):
         drawing_path = ""
 
         for index, part in enumerate(parts):
-            first_point_y, first_point_x = landmarks[part].get("y"), landmarks[
-                part
-            ].get("x")
+            first_point_x, first_point_y = landmarks.point(part)
             if index == 0:
                 drawing_path += f"M {first_point_x} {first_point_y} "
             else:
@@ -347,15 +304,6 @@ class DrawingMixin(object):
         x, y = det(d, xdiff) / div, det(d, ydiff) / div
         return int(round(x)), int(round(y))
 
-    def add_color(self, landmark: dict, color: np.array):
-        """Ajout de la propriété color pour une coordonnée d'un point du visage.
-
-        Args:
-            landmark (dict): coordonnées des parties du visage.
-            color (np.array): couleur.
-        """
-        landmark["color"] = color
-
     def get_longest_contour(
         self, contours: np.array, return_indices: bool = False
     ) -> np.array:
@@ -396,23 +344,21 @@ class DrawingMixin(object):
         )
 
     def superpose_parts(
-        self, mask_part_pil: Image, parts: list, mask_part_name: str
-    ) -> Image:
+        self, mask_part: np.array, parts: list, mask_part_name: str
+    ) -> np.array:
         """Superpose les parties du visage.
 
         Args:
-            mask_part_pil (Image): mask.
+            mask_part (np.array): mask, modifié sur place.
             parts (list): parties du visage.
             mask_part_name (str): mask name.
 
         Returns:
-            Image: image superposée.
+            np.array: image superposée.
         """
         for part in parts:
-            part = part.get(mask_part_name)
-            part = self.convert_to_pil_with_transparent_background(part)
-            mask_part_pil.paste(part, (0, 0), part)
-        return mask_part_pil
+            paste(mask_part, part.get(mask_part_name))
+        return mask_part
 
     def exclude_extern_pixel(
         self, mask_part: np.array, exclude_color: np.array, contour: list
@@ -448,125 +394,6 @@ class DrawingMixin(object):
                 mask_part[point[0], point[1]] = np.array([255, 255, 255])
         return mask_part
 
-    def fill_missing_pixels(
-        self, mask_part: np.array, missing_color: tuple
-    ) -> np.array:
-        """Rempli les pixels avec les couleurs proches.
-
-        Args:
-            mask_part (np.array): mask.
-            missing_color (tuple): couleur à remplacer.
-
-        Returns:
-            np.array: mask rempli.
-        """
-        points = np.where(
-            np.all(
-                [
-                    mask_part[:, :, 0] == missing_color[0],
-                    mask_part[:, :, 1] == missing_color[1],
-                    mask_part[:, :, 2] == missing_color[2],
-                ],
-                axis=0,
-            )
-        )
-        missing_points = list(zip(points[0], points[1]))
-        missing_points = [missing_points, missing_points[::-1]]
-        for points in missing_points:
-            for point in points:
-                y, x = point[0], point[1]
-                mean_b, mean_g, mean_r, pixel_nomber = 0, 0, 0, 0
-
-                new_x = x - 1
-                new_x_b, new_x_g, new_x_r = (
-                    mask_part[y, new_x][0],
-                    mask_part[y, new_x][1],
-                    mask_part[y, new_x][2],
-                )
-                if (
-                    new_x > 0
-                    and (
-                        new_x_b != missing_color[0]
-                        or new_x_g != missing_color[1]
-                        or new_x_r != missing_color[2]
-                    )
-                    and (new_x_b != 255 or new_x_g != 255 or new_x_r != 255)
-                ):
-                    mean_b += mask_part[y, new_x][0]
-                    mean_g += mask_part[y, new_x][1]
-                    mean_r += mask_part[y, new_x][2]
-                    pixel_nomber += 1
-
-                new_x = x + 1
-                new_x_b, new_x_g, new_x_r = (
-                    mask_part[y, new_x][0],
-                    mask_part[y, new_x][1],
-                    mask_part[y, new_x][2],
-                )
-                if (
-                    new_x < mask_part.shape[1] - 1
-                    and (
-                        new_x_b != missing_color[0]
-                        or new_x_g != missing_color[1]
-                        or new_x_r != missing_color[2]
-                    )
-                    and (new_x_b != 255 or new_x_g != 255 or new_x_r != 255)
-                ):
-                    mean_b += mask_part[y, new_x][0]
-                    mean_g += mask_part[y, new_x][1]
-                    mean_r += mask_part[y, new_x][2]
-                    pixel_nomber += 1
-
-                new_y = y - 1
-                new_y_b, new_y_g, new_y_r = (
-                    mask_part[new_y, x][0],
-                    mask_part[new_y, x][1],
-                    mask_part[new_y, x][2],
-                )
-                if (
-                    new_y > 0
-                    and (
-                        new_y_b != missing_color[0]
-                        or new_y_g != missing_color[1]
-                        or new_y_r != missing_color[2]
-                    )
-                    and (new_y_b != 255 or new_y_g != 255 or new_y_r != 255)
-                ):
-                    mean_b += mask_part[new_y, x][0]
-                    mean_g += mask_part[new_y, x][1]
-                    mean_r += mask_part[new_y, x][2]
-                    pixel_nomber += 1
-
-                new_y = y + 1
-                new_y_b, new_y_g, new_y_r = (
-                    mask_part[new_y, x][0],
-                    mask_part[new_y, x][1],
-                    mask_part[new_y, x][2],
-                )
-                if (
-                    new_y < mask_part.shape[0] - 1
-                    and (
-                        new_y_b != missing_color[0]
-                        or new_y_g != missing_color[1]
-                        or new_y_r != missing_color[2]
-                    )
-                    and (new_y_b != 255 or new_y_g != 255 or new_y_r != 255)
-                ):
-                    mean_b += mask_part[new_y, x][0]
-                    mean_g += mask_part[new_y, x][1]
-                    mean_r += mask_part[new_y, x][2]
-                    pixel_nomber += 1
-
-                if pixel_nomber:
-                    mask_part[y, x] = np.array(
-                        [
-                            int(round(mean_b / pixel_nomber)),
-                            int(round(mean_g / pixel_nomber)),
-                            int(round(mean_r / pixel_nomber)),
-                        ]
-                    )
-        return mask_part
-
     def keep_inside(self, part: np.array, contours: list):
         """Supprime les couleurs en dehors de la zone souhaitée.
 
@@ -645,207 +472,107 @@ class DrawingMixin(object):
 
     def set_colors(
         self,
-        landmarks_points: list,
+        landmarks: Landmarks,
         lighter_color: str,
         darker_color: str,
-        with_index: bool = False,
         progress: float = 1.0,
     ) -> tuple:
-        """Ajoute les couleurs.
+        """Calcule la couleur de chaque point selon sa profondeur.
 
         Args:
-            landmarks_points (list): coordonnées des parties du visages.
-            lighter_color (str): couleur claire.
-            darker_color (str): couleur sombre.
-            with_index (bool, optional): avec index ? Défaut à False.
+            landmarks (Landmarks): coordonnées des parties du visages.
+            lighter_color (str): couleur claire (HEX).
+            darker_color (str): couleur sombre (HEX).
             progress (float, optional): progressif ? Défaut à 1.0.
 
         Returns:
-            tuple: coordonnées des parties du visages, couleur sombre et claire.
+            tuple: couleurs de chaque point, couleur claire et sombre.
         """
-        z_values = sorted(
-            list(
-                set(
-                    list(
-                        map(
-                            lambda landmark: landmark.get("info").get("z")
-                            if with_index
-                            else landmark.get("z"),
-                            landmarks_points,
-                        )
-                    )
-                )
-            )
+        z_values, z_indices = np.unique(landmarks.z, return_inverse=True)
+        gradient_colors = get_gradient(
+            hex_to_bgr(lighter_color),
+            hex_to_bgr(darker_color),
+            len(z_values),
+            progress,
         )
-        z_values_length = len(z_values)
-
-        gradients_colors = Color(lighter_color).steps(
-            Color(darker_color), steps=z_values_length, progress=lambda t: t * progress
+        return (
+            gradient_colors[z_indices],
+            gradient_colors[0].copy(),
+            gradient_colors[-1].copy(),
         )
 
-        rgb_colors = []
-        for gradients_color in gradients_colors:
-            colors = (
-                gradients_color.to_string(precision=0)
-                .replace("rgb(", "")
-                .replace(")", "")
-                .split(" ")
-            )
-            rgb_colors.append(
-                np.array([int(colors[2]), int(colors[1]), int(colors[0])]).astype(
-                    np.uint8
-                )
-            )
-
-        for landmark_points in landmarks_points:
-            get_index_z_value = z_values.index(
-                landmark_points.get("info").get("z")
-                if with_index
-                else landmark_points.get("z")
-            )
-            if with_index:
-                landmark_points["info"]["color"] = rgb_colors[get_index_z_value]
-            else:
-                landmark_points["color"] = rgb_colors[get_index_z_value]
-        return landmarks_points, rgb_colors[0], rgb_colors[-1]
-
     def draw_gradient_triangle(
         self,
         mask_part: np.array,
-        landmarks: dict,
+        vertices: np.array,
+        colors: np.array,
         points: list,
-        check_contour: dict = None,
-        with_index: bool = False,
+        check_contour: np.array = None,
     ) -> np.array:
-        """Dessine un dégradé.
+        """Dessine un dégradé par interpolation barycentrique des couleurs de chaque triangle.
+
+        Les arêtes sont incluses, les triangles adjacents ne laissent donc aucun pixel manquant.
 
         Args:
             mask_part (np.array): mask.
-            landmarks (dict): coordonnées des parties du visage.
-            points (list): points du visages.
-            check_contour (dict, optional): vérifie les contours ? Défaut à None.
-            with_index (bool, optional): avec index ? Défaut à False.
+            vertices (np.array): coordonnées x et y de chaque point (N, 2).
+            colors (np.array): couleur de chaque point (N, 3).
+            points (list): triangles, index des trois points de chaque triangle.
+            check_contour (np.array, optional): vérifie les contours ? Défaut à None.
 
         Returns:
             np.array: mask avec le dégradé.
         """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        colors = np.asarray(colors, dtype=np.float64)
+        contour_mask = None
+        if check_contour is not None:
+            contour_mask = np.zeros(mask_part.shape[:2], dtype=np.uint8)
+            open_cv.drawContours(contour_mask, [check_contour], -1, 1, open_cv.FILLED)
+
         for point in points:
-            if with_index:
-                try:
-                    first_landmark = next(
-                        landmark.get("info")
-                        for landmark in landmarks
-                        if landmark.get("index") == point[0]
-                    )
-                    second_landmark = next(
-                        landmark.get("info")
-                        for landmark in landmarks
-                        if landmark.get("index") == point[1]
-                    )
-                    third_landmark = next(
-                        landmark.get("info")
-                        for landmark in landmarks
-                        if landmark.get("index") == point[2]
-                    )
-                except IndexError:
-                    logger.error(
-                        f"L'un des index est trop élévé : {point[0]} {point[1]} {point[2]}"
-                    )
-            else:
-                try:
-                    first_landmark, second_landmark, third_landmark = (
-                        landmarks[point[0]],
-                        landmarks[point[1]],
-                        landmarks[point[2]],
-                    )
-                except IndexError:
-                    logger.error(
-                        f"L'un des index est trop élévé : {point[0]} {point[1]} {point[2]}"
-                    )
-            first_point_x, first_point_y = first_landmark.get("x"), first_landmark.get(
-                "y"
-            )
-            second_point_x, second_point_y = second_landmark.get(
-                "x"
-            ), second_landmark.get("y")
-            third_point_x, third_point_y = third_landmark.get("x"), third_landmark.get(
-                "y"
+            if max(point) >= len(vertices):
+                logger.error(
+                    f"L'un des index est trop élévé : {point[0]} {point[1]} {point[2]}"
+                )
+                continue
+
+            triangle = vertices[point]
+            x_left, y_top = np.maximum(np.floor(triangle.min(axis=0)), 0).astype(int)
+            x_right, y_bottom = np.minimum(
+                np.ceil(triangle.max(axis=0)),
+                (mask_part.shape[1] - 1, mask_part.shape[0] - 1),
+            ).astype(int)
+            if x_left > x_right or y_top > y_bottom:
+                continue
+
+            (first_x, first_y), (second_x, second_y), (third_x, third_y) = triangle
+            area = (second_x - first_x) * (third_y - first_y) - (third_x - first_x) * (
+                second_y - first_y
             )
-            first_point, first_color = (
-                first_point_x,
-                first_point_y,
-            ), first_landmark.get("color")
-            second_point, second_color = (
-                second_point_x,
-                second_point_y,
-            ), second_landmark.get("color")
-            third_point, third_color = (
-                third_point_x,
-                third_point_y,
-            ), third_landmark.get("color")
-
-            triangle_array = np.asarray(
-                [
-                    first_point[0],
-                    second_point[0],
-                    third_point[0],
-                    first_point[1],
-                    second_point[1],
-                    third_point[1],
-                    1,
-                    1,
-                    1,
-                ]
-            ).reshape((3, 3))
-
-            x_left, x_right = min(first_point[0], second_point[0], third_point[0]), max(
-                first_point[0], second_point[0], third_point[0]
+            if area == 0:
+                continue
+
+            ys, xs = np.mgrid[y_top : y_bottom + 1, x_left : x_right + 1]
+            second_weights = (
+                (xs - first_x) * (third_y - first_y)
+                - (third_x - first_x) * (ys - first_y)
+            ) / area
+            third_weights = (
+                (second_x - first_x) * (ys - first_y)
+                - (xs - first_x) * (second_y - first_y)
+            ) / area
+            weights = np.stack(
+                [1 - second_weights - third_weights, second_weights, third_weights],
+                axis=-1,
             )
-            y_top, y_bottom = min(first_point[1], second_point[1], third_point[1]), max(
-                first_point[1], second_point[1], third_point[1]
+            inside = np.all(weights >= -BARYCENTRIC_TOLERANCE, axis=-1)
+            mask_part[ys[inside], xs[inside]] = np.clip(
+                np.rint(weights[inside] @ colors[point]), 0, 255
             )
 
-            x_range, y_range = range(x_left, x_right), range(y_top, y_bottom)
-            xv, yv = np.meshgrid(x_range, y_range)
-            xv, yv = xv.flatten(), yv.flatten()
-
-            alphas, betas, gammas = np.linalg.lstsq(
-                triangle_array, np.array([xv, yv, [1] * len(xv)]), rcond=-1
-            )[0]
-
-            mask = (alphas > 0) & (betas > 0) & (gammas > 0)
-            alphas_m, betas_m, gammas_m = alphas[mask], betas[mask], gammas[mask]
-            xv_m, yv_m = xv[mask], yv[mask]
-
-            try:
-                colors = (
-                    multiply_array(first_color, alphas_m)
-                    + multiply_array(second_color, betas_m)
-                    + multiply_array(third_color, gammas_m)
-                )
-                mask_part[yv_m, xv_m] = colors
-            except TypeError:
-                logger.error(
-                    f"La couleur d'un des trois points n'est pas défini. Premier point {point[0]} : {first_color}, Deuxième point {point[1]} : {second_color}, Troisième point {point[2]} : {third_color}"
-                )
-            except IndexError:
-                logger.error(
-                    f"Un problème est survenue pour l'affectation du dégradé des ces trois points : {point[0]} {point[1]} {point[2]}"
-                )
-
-            if check_contour is not None and (
-                open_cv.pointPolygonTest(
-                    check_contour, (np.float32(x_left), np.float32(y_top)), True
-                )
-                < 0
-                or open_cv.pointPolygonTest(
-                    check_contour, (np.float32(x_right), np.float32(y_bottom)), True
-                )
-                < 0
-            ):
-                for y in range(y_top, y_bottom):
-                    for x in range(x_left, x_right):
-                        if open_cv.pointPolygonTest(check_contour, (x, y), True) < 0:
-                            mask_part[y, x] = np.array([255, 255, 255])
+            if contour_mask is not None:
+                box = (slice(y_top, y_bottom + 1), slice(x_left, x_right + 1))
+                mask_part[box][contour_mask[box] == 0] = np.array([255, 255, 255])
 
         return mask_part
@@ -29,14 +29,13 @@ from typing import Optional
 
 import cv2 as open_cv
 import numpy as np
-from coloraide import Color
 from PIL import Image
 
+from app.generation_nft.colors import delta_e
 from app.generation_nft.utils import (
     draw_contours,
     get_unique_colors,
     replace_color,
-    rgb_to_hex,
     where,
 )
 
@@ -108,10 +107,6 @@ class BeardDrawing(object):
                 self.real_hair_mask, with_frequency_count=True
             )[0]
 
-        rgb_pilosity_hex_color = rgb_to_hex(
-            pilosity_color.get("color"), convert_bgr_to_rgb=True
-        )
-
         face_cleaned_check_beard_pil = Image.fromarray(
             open_cv.cvtColor(face_cleaned_check_beard, open_cv.COLOR_BGR2RGB).astype(
                 "uint8"
@@ -125,17 +120,16 @@ class BeardDrawing(object):
             np.array(face_cleaned_check_beard_pil.convert("RGB")), open_cv.COLOR_BGR2RGB
         )
 
-        bottom_face_colors = get_unique_colors(face_cleaned_check_beard)
-        color_distances = []
-        for bottom_face_color in bottom_face_colors:
-            color = bottom_face_color.get("color")
-            hex_color = rgb_to_hex(color, convert_bgr_to_rgb=True)
-            color_distances.append(
-                int(Color(hex_color).delta_e(rgb_pilosity_hex_color))
-            )
+        bottom_face_colors = np.unique(
+            face_cleaned_check_beard.reshape(-1, face_cleaned_check_beard.shape[2]),
+            axis=0,
+        )
+        color_distances = delta_e(
+            bottom_face_colors, pilosity_color.get("color")
+        ).astype(int)
 
         average_distance = int(np.mean(color_distances))
-        min_pilosity_distance = min(color_distances)
+        min_pilosity_distance = color_distances.min()
 
         if (
             average_distance >= 20
@@ -28,7 +28,8 @@ import warnings
 
 import cv2 as open_cv
 import numpy as np
-from PIL import Image
+
+from app.generation_nft.libraries.compositor.compositor import paste
 
 warnings.filterwarnings("ignore")
 
@@ -60,15 +61,6 @@ class EarDrawing(object):
             open_cv.FILLED,
         )
 
-        mask_pil = self.convert_to_pil_with_transparent_background(copy_face_minimize)
-        mask_part_pil = Image.fromarray(
-            open_cv.cvtColor(new_face_minimize, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        mask_part_pil.paste(mask_pil, (0, 0), mask_pil)
-
-        new_face_minimize = open_cv.cvtColor(
-            np.array(mask_part_pil), open_cv.COLOR_RGBA2BGR
-        )
+        new_face_minimize = paste(new_face_minimize.copy(), copy_face_minimize)
         open_cv.drawContours(new_face_minimize, contour, -1, self.real_black_color, 2)
         return new_face_minimize
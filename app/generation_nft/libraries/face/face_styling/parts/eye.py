@@ -29,8 +29,9 @@ import warnings
 
 import cv2 as open_cv
 import numpy as np
-from PIL import Image
 
+from app.generation_nft.libraries.compositor.compositor import over, paste
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
 from app.generation_nft.libraries.face.face_styling.constants import (
     IRIS_CENTER_POINT,
     IRIS_RADIAL,
@@ -53,13 +54,16 @@ class EyeDrawing(object):
         pass
 
     def set_iris(
-        self, new_contour_depend_mask: np.array, landmarks: list, iris_landmarks: list
+        self,
+        new_contour_depend_mask: np.array,
+        landmarks: Landmarks,
+        iris_landmarks: list,
     ) -> tuple:
         """Dessine le style de l'iris des yeux.
 
         Args:
             new_contour_depend_mask (np.array): mask de la partie dont dépend les iris.
-            landmarks (list): coordonnées des parties du visage.
+            landmarks (Landmarks): coordonnées des parties du visage.
             iris_landmarks (list): coordonnées des points des iris.
 
         Returns:
@@ -76,17 +80,8 @@ class EyeDrawing(object):
             dtype=np.uint8,
         )
 
-        first_landmark, second_landmark, third_landmark, fourth_landmark = (
-            landmarks[iris_landmarks[0]],
-            landmarks[iris_landmarks[1]],
-            landmarks[iris_landmarks[2]],
-            landmarks[iris_landmarks[3]],
-        )
         first_point, second_point, third_point, fourth_point = (
-            (first_landmark.get("x"), first_landmark.get("y")),
-            (second_landmark.get("x"), second_landmark.get("y")),
-            (third_landmark.get("x"), third_landmark.get("y")),
-            (fourth_landmark.get("x"), fourth_landmark.get("y")),
+            landmarks.point(iris_landmark) for iris_landmark in iris_landmarks[:4]
         )
         iris_center = self.line_intersection(
             [first_point, third_point], [second_point, fourth_point]
@@ -122,44 +117,32 @@ class EyeDrawing(object):
             iris_center[1] + percentage_radial,
         )
 
-        self.add_color(first_landmark, self.eyes_color)
-        self.add_color(second_landmark, self.darker_eyes_color)
-        self.add_color(third_landmark, self.darker_eyes_color)
-        self.add_color(fourth_landmark, self.eyes_color)
-
-        gradient_landmarks = {
-            "x": gradient_center[0],
-            "y": gradient_center[1],
-            "color": self.eyes_color,
-        }
-
-        iris_landmarks_points = [
-            first_landmark,
-            second_landmark,
-            third_landmark,
-            fourth_landmark,
-            gradient_landmarks,
-            {
-                "x": first_landmark.get("x"),
-                "y": second_landmark.get("y"),
-                "color": self.darker_eyes_color,
-            },
-            {
-                "x": third_landmark.get("x"),
-                "y": second_landmark.get("y"),
-                "color": self.darker_eyes_color,
-            },
-            {
-                "x": third_landmark.get("x"),
-                "y": fourth_landmark.get("y"),
-                "color": self.darker_eyes_color,
-            },
-            {
-                "x": first_landmark.get("x"),
-                "y": fourth_landmark.get("y"),
-                "color": self.eyes_color,
-            },
-        ]
+        iris_vertices = np.array(
+            [
+                first_point,
+                second_point,
+                third_point,
+                fourth_point,
+                gradient_center,
+                (first_point[0], second_point[1]),
+                (third_point[0], second_point[1]),
+                (third_point[0], fourth_point[1]),
+                (first_point[0], fourth_point[1]),
+            ]
+        )
+        iris_colors = np.array(
+            [
+                self.eyes_color,
+                self.darker_eyes_color,
+                self.darker_eyes_color,
+                self.eyes_color,
+                self.eyes_color,
+                self.darker_eyes_color,
+                self.darker_eyes_color,
+                self.darker_eyes_color,
+                self.eyes_color,
+            ]
+        )
 
         iris_points = [
             [0, 5, 1],
@@ -177,9 +160,8 @@ class EyeDrawing(object):
         )
 
         iris_mask = self.draw_gradient_triangle(
-            iris_mask, iris_landmarks_points, iris_points
+            iris_mask, iris_vertices, iris_colors, iris_points
         )
-        iris_mask = self.fill_missing_pixels(iris_mask, self.black_color)
         iris_mask_part = open_cv.bitwise_and(
             iris_mask, iris_mask, mask=virgin_iris_mask
         )
@@ -194,8 +176,6 @@ class EyeDrawing(object):
             open_cv.LINE_AA,
         )
 
-        iris_pil = Image.fromarray(self.iris_picture.astype("uint8"), "RGBA")
-
         iris_img_radial = IRIS_RADIAL
         iris_img_center_point = IRIS_CENTER_POINT
         iris_width_radial = iris_radial * 0.5
@@ -209,24 +189,22 @@ class EyeDrawing(object):
         width = int(math.ceil(percentage_downscale * self.iris_picture.shape[1] / 100))
         height = int(math.ceil(percentage_downscale * self.iris_picture.shape[0] / 100))
 
-        iris_pil = iris_pil.resize((width, height))
+        iris_layer = open_cv.resize(
+            self.iris_picture, (width, height), interpolation=open_cv.INTER_CUBIC
+        )
 
         y_less, x_less = height - iris_center_point[0], width - iris_center_point[1]
         iris_x, iris_y = iris_center[0] - x_less, iris_center[1] - y_less
 
-        iris_mask_part = open_cv.cvtColor(iris_mask_part, open_cv.COLOR_BGR2RGBA)
-        mask_part_pil = Image.fromarray(iris_mask_part.astype("uint8"), "RGBA")
-        mask_part_pil.paste(iris_pil, (iris_x, iris_y), iris_pil)
-
         return (
-            open_cv.cvtColor(np.array(mask_part_pil), open_cv.COLOR_RGBA2BGR),
+            over(iris_mask_part, iris_layer[:, :, [2, 1, 0, 3]], (iris_x, iris_y)),
             iris_center,
         )
 
     def draw_iris(
         self,
         new_contour_depend_mask: np.array,
-        landmarks: list,
+        landmarks: Landmarks,
         iris_landmarks: list,
         new_face_minimize: np.array,
         contour_depend_on: list,
@@ -237,7 +215,7 @@ class EyeDrawing(object):
 
         Args:
             new_contour_depend_mask (np.array): mask de la partie dont dépend les iris.
-            landmarks (list): coordonnées des parties du visage.
+            landmarks (Landmarks): coordonnées des parties du visage.
             iris_landmarks (list): coordonnées des points des iris.
             new_face_minimize (np.array): visage.
             contour_depend_on (list): contour de la partie dont dépend les iris.
@@ -266,20 +244,13 @@ class EyeDrawing(object):
             iris_mask_translation, np.array([255, 255, 255]), contour_depend_on
         )
 
-        mask_pil = self.convert_to_pil_with_transparent_background(iris_mask_part)
-        mask_part_pil = Image.fromarray(
-            open_cv.cvtColor(new_face_minimize, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        mask_part_pil.paste(mask_pil, (0, 0), mask_pil)
-
-        return open_cv.cvtColor(np.array(mask_part_pil), open_cv.COLOR_RGBA2BGR)
+        return paste(new_face_minimize.copy(), iris_mask_part)
 
     def draw_eye(
         self,
         name: str,
         new_face_minimize: np.array,
-        landmarks: list,
+        landmarks: Landmarks,
         contour_depend_mask: np.array,
         contour_depend_on: list,
         parts: list,
@@ -292,7 +263,7 @@ class EyeDrawing(object):
         Args:
             name (str): name.
             new_face_minimize (np.array): visage.
-            landmarks (list): coordonnées des parties du visage.
+            landmarks (Landmarks): coordonnées des parties du visage.
             contour_depend_mask (np.array): mask de la partie dont dépend les yeux.
             contour_depend_on (list): contour de la partie dont dépend les yeux.
             parts (list): parties du visage.
@@ -305,10 +276,8 @@ class EyeDrawing(object):
         new_contour_depend_mask = contour_depend_mask.copy()
         copy_face_minimize = new_face_minimize.copy()
 
-        eye_landmarks = list(landmarks).copy()
-
-        middle_eye_x = eye_landmarks[parts[4]].get("x") + int(
-            (eye_landmarks[parts[-1]].get("x") - eye_landmarks[parts[4]].get("x")) / 2
+        middle_eye_x = int(landmarks.x[parts[4]]) + int(
+            (landmarks.x[parts[-1]] - landmarks.x[parts[4]]) / 2
         )
 
         virgin_mask_part = np.full(
@@ -332,7 +301,7 @@ class EyeDrawing(object):
         )
 
         _, eyelid_contours = self.draw_line_contours(
-            name, virgin_eyelid_part, parts[3], eye_landmarks
+            name, virgin_eyelid_part, parts[3], landmarks
         )
         open_cv.drawContours(
             copy_face_minimize,
@@ -352,16 +321,10 @@ class EyeDrawing(object):
             next_i = i + 1
             if next_i > eye_up_points_length - 1:
                 break
-            first_point_x, first_point_y = eye_landmarks[parts[1][i]].get(
-                "x"
-            ), eye_landmarks[parts[1][i]].get("y")
-            second_point_x, second_point_y = eye_landmarks[parts[1][next_i]].get(
-                "x"
-            ), eye_landmarks[parts[1][next_i]].get("y")
             open_cv.line(
                 virgin_up_eye_part,
-                (first_point_x, first_point_y),
-                (second_point_x, second_point_y),
+                landmarks.point(parts[1][i]),
+                landmarks.point(parts[1][next_i]),
                 self.black_color,
                 1,
             )
@@ -376,13 +339,7 @@ class EyeDrawing(object):
             copy_face_minimize, eye_up_contours, -1, self.black_color, 3, offset=(0, -3)
         )
 
-        eyelid_up_contours = []
-        for point in parts[2]:
-            eyelid_up_contours.append(
-                np.array([eye_landmarks[point].get("x"), eye_landmarks[point].get("y")])
-            )
-
-        eyelid_clean_contours = np.array(eyelid_up_contours).reshape((-1, 1, 2))
+        eyelid_clean_contours = landmarks.xy[parts[2]].reshape((-1, 1, 2))
         open_cv.polylines(
             copy_face_minimize,
             [eyelid_clean_contours],
@@ -403,7 +360,7 @@ class EyeDrawing(object):
         iris_points = parts[0]
         copy_face_minimize = self.draw_iris(
             mask_part,
-            eye_landmarks,
+            landmarks,
             iris_points,
             copy_face_minimize,
             contour_depend_on,
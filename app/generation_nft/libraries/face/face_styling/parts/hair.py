@@ -28,8 +28,8 @@ import warnings
 
 import cv2 as open_cv
 import numpy as np
-from PIL import Image
 
+from app.generation_nft.libraries.compositor.compositor import paste
 from app.generation_nft.utils import replace_color, where
 
 warnings.filterwarnings("ignore")
@@ -92,18 +92,7 @@ class HairDrawing(object):
             replace_color(virgin_mask_part, self.real_black_color, self.white_color)
             self.no_hair = True
 
-        hair_mask_pil = self.convert_to_pil_with_transparent_background(
-            face_minimize_copy
-        )
-        mask_part_pil = Image.fromarray(
-            open_cv.cvtColor(new_face_minimize, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        mask_part_pil.paste(hair_mask_pil, (0, 0), hair_mask_pil)
-
-        new_face_minimize = open_cv.cvtColor(
-            np.array(mask_part_pil), open_cv.COLOR_RGBA2BGR
-        )
+        new_face_minimize = paste(new_face_minimize.copy(), face_minimize_copy)
         open_cv.drawContours(new_face_minimize, contour, -1, self.real_black_color, 2)
 
         real_hair_mask = open_cv.bitwise_and(face_copy, face_copy, mask=mask_part)
@@ -31,6 +31,7 @@ import numpy as np
 from mediapipe.python.solutions import face_mesh as mediapipe_fm
 from mediapipe.python.solutions.drawing_utils import DrawingSpec
 
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
 from app.generation_nft.utils import draw_landmarks, replace_color
 
 warnings.filterwarnings("ignore")
@@ -49,7 +50,7 @@ class MouthDrawing(object):
         new_face_minimize: np.array,
         contour_depend_mask: np.array,
         contour_depend_on: list,
-        landmarks: list,
+        landmarks: Landmarks,
         parts: list,
         face_shape: tuple,
         coordinates: tuple,
@@ -62,7 +63,7 @@ class MouthDrawing(object):
             new_face_minimize (np.array): visage.
             contour_depend_mask (np.array): mask de la partie dont dépend la bouche.
             contour_depend_on (list): contour de la partie dont dépend la bouche.
-            landmarks (list): coordonnées du visage.
+            landmarks (Landmarks): coordonnées du visage.
             parts (list): parties du visage.
             face_shape (tuple): forme du visage.
             coordinates (tuple): coordonnées.
@@ -86,8 +87,6 @@ class MouthDrawing(object):
             new_contour_depend_mask, face_shape, x_left, y_top
         )
 
-        mouth_landmarks = list(landmarks).copy()
-
         virgin_mask_part = np.full(
             (face_shape[0], face_shape[1], 3),
             255,
@@ -102,7 +101,7 @@ class MouthDrawing(object):
             virgin_intern_mouth_mask, contour_depend_on, -1, 1, open_cv.FILLED
         )
         _, inter_mouth_contours = self.draw_line_contours(
-            name, virgin_mask_part, parts[-1], mouth_landmarks
+            name, virgin_mask_part, parts[-1], landmarks
         )
         open_cv.drawContours(
             virgin_intern_mouth_mask, inter_mouth_contours, -1, 0, open_cv.FILLED
@@ -144,7 +143,7 @@ class MouthDrawing(object):
 
         draw_landmarks(
             image=copy_face_minimize,
-            landmark_list=mouth_landmarks,
+            landmark_list=landmarks,
             connection_drawing_spec=DrawingSpec(
                 color=self.real_black_color, thickness=1
             ),
@@ -28,8 +28,9 @@ import warnings
 
 import cv2 as open_cv
 import numpy as np
-from PIL import Image
 
+from app.generation_nft.libraries.compositor.compositor import paste
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
 from app.generation_nft.utils import draw_contours, get_shade_color
 
 warnings.filterwarnings("ignore")
@@ -46,7 +47,7 @@ class NeckDrawing(object):
         self,
         name: str,
         new_face_minimize: np.array,
-        landmarks: list,
+        landmarks: Landmarks,
         parts: list,
         face_shape: tuple,
         coordinates: tuple,
@@ -57,7 +58,7 @@ class NeckDrawing(object):
         Args:
             name (str): nom.
             new_face_minimize (np.array): visage.
-            landmarks (list): coordonnées du visage.
+            landmarks (Landmarks): coordonnées du visage.
             parts (list): parties du visage.
             face_shape (tuple): forme du visage.
             coordinates (tuple): coordonnées.
@@ -77,12 +78,7 @@ class NeckDrawing(object):
             copy_face_minimize, face_shape, x_left, y_top
         )
 
-        neck_landmarks = list(landmarks).copy()
-
-        neck_points = [
-            [neck_landmarks[point].get("x"), neck_landmarks[point].get("y")]
-            for point in parts
-        ]
+        neck_points = landmarks.xy[parts].tolist()
 
         first_point_max_y, second_point_max_y = max(
             np.where(
@@ -186,14 +182,7 @@ class NeckDrawing(object):
             virgin_neck_part, third_point, fourth_point, self.real_black_color, 2
         )
 
-        copy_face_minimize_pil = self.convert_to_pil_with_transparent_background(
-            copy_face_minimize
-        )
-        neck_mask_part_pil = Image.fromarray(
-            open_cv.cvtColor(virgin_neck_part, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        neck_mask_part_pil.paste(copy_face_minimize_pil, (0, 0), copy_face_minimize_pil)
+        paste(virgin_neck_part, copy_face_minimize)
 
         neck_params = {
             "second_point": (second_point[0] - x_left, second_point[1]),
@@ -202,8 +191,6 @@ class NeckDrawing(object):
         }
 
         return (
-            open_cv.cvtColor(np.array(neck_mask_part_pil), open_cv.COLOR_RGBA2BGR)[
-                y_top:new_bottom_y, x_left:x_right
-            ],
+            virgin_neck_part[y_top:new_bottom_y, x_left:x_right],
             neck_params,
         )
@@ -30,6 +30,7 @@ import cv2 as open_cv
 import numpy as np
 
 from app.generation_nft.libraries.face.face_landmarks.constants import DRAWING_NOSE
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
 from app.generation_nft.utils import draw_contours
 
 warnings.filterwarnings("ignore")
@@ -45,7 +46,7 @@ class NoseDrawing(object):
     def draw_nose(
         self,
         new_face_minimize: np.array,
-        landmarks: list,
+        landmarks: Landmarks,
         coordinates: tuple,
         face_shape: tuple,
         parts: list,
@@ -55,7 +56,7 @@ class NoseDrawing(object):
 
         Args:
             new_face_minimize (np.array): visage.
-            landmarks (list): coordonnées des parties du visage.
+            landmarks (Landmarks): coordonnées des parties du visage.
             coordinates (tuple): coordonnées.
             face_shape (tuple): forme du visage.
             parts (list): parties du visages.
@@ -64,7 +65,6 @@ class NoseDrawing(object):
             np.array: visage avec le nez dessiné.
         """
         copy_face_minimize = new_face_minimize.copy()
-        nose_landmarks = list(landmarks).copy()
 
         (
             y_top,
@@ -84,16 +84,10 @@ class NoseDrawing(object):
             next_i = i + 1
             if next_i > down_nose_points_length - 1:
                 break
-            first_point_x, first_point_y = nose_landmarks[parts[0][i]].get(
-                "x"
-            ), nose_landmarks[parts[0][i]].get("y")
-            second_point_x, second_point_y = nose_landmarks[parts[0][next_i]].get(
-                "x"
-            ), nose_landmarks[parts[0][next_i]].get("y")
             open_cv.line(
                 virgin_down_nose_part,
-                (first_point_x, first_point_y),
-                (second_point_x, second_point_y),
+                landmarks.point(parts[0][i]),
+                landmarks.point(parts[0][next_i]),
                 self.black_color,
                 1,
             )
@@ -120,24 +114,16 @@ class NoseDrawing(object):
                 break
             next_index = index + 1
             next_point = DRAWING_NOSE[0].get("parts")[next_index]
-            first_point_x, first_point_y = landmarks[nose_point].get("x"), landmarks[
-                nose_point
-            ].get("y")
-            second_point_x, second_point_y = landmarks[next_point].get("x"), landmarks[
-                next_point
-            ].get("y")
             open_cv.line(
                 mask_part,
-                (first_point_x, first_point_y),
-                (second_point_x, second_point_y),
+                landmarks.point(nose_point),
+                landmarks.point(next_point),
                 self.black_color,
                 1,
                 open_cv.LINE_AA,
             )
 
-        nose_mask_parts = self.draw_nose_contour(
-            mask_part, DRAWING_NOSE[1:], nose_landmarks
-        )
+        nose_mask_parts = self.draw_nose_contour(mask_part, DRAWING_NOSE[1:], landmarks)
         open_cv.drawContours(
             mask_part,
             nose_mask_parts[0].get("contour"),
@@ -156,14 +142,14 @@ class NoseDrawing(object):
         return mask_part[y_top:y_bottom, x_left:x_right]
 
     def draw_nose_contour(
-        self, mask_part: np.array, nose_parts: list, nose_landmarks: list
+        self, mask_part: np.array, nose_parts: list, nose_landmarks: Landmarks
     ) -> list:
         """Dessine les contours du nez.
 
         Args:
             mask_part (np.array): visage.
             nose_parts (list): parties du nez.
-            nose_landmarks (list): coordonnées des parties du nez.
+            nose_landmarks (Landmarks): coordonnées des parties du nez.
 
         Returns:
             list: contours du nez.
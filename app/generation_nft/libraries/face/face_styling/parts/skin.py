@@ -28,7 +28,8 @@ import warnings
 
 import cv2 as open_cv
 import numpy as np
-from PIL import Image
+
+from app.generation_nft.libraries.compositor.compositor import paste
 
 warnings.filterwarnings("ignore")
 
@@ -60,11 +61,4 @@ class SkinDrawing(object):
             open_cv.FILLED,
         )
 
-        mask_pil = self.convert_to_pil_with_transparent_background(copy_face_minimize)
-        mask_part_pil = Image.fromarray(
-            open_cv.cvtColor(new_face_minimize, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        mask_part_pil.paste(mask_pil, (0, 0), mask_pil)
-
-        return open_cv.cvtColor(np.array(mask_part_pil), open_cv.COLOR_RGBA2BGR)
+        return paste(new_face_minimize.copy(), copy_face_minimize)
@@ -25,90 +25,21 @@ ______                           _           _
 File: app/generation_nft/libraries/face/tilt_learning/constants.py
 """
 
-from sklearn.ensemble import (
-    AdaBoostClassifier,
-    BaggingClassifier,
-    GradientBoostingClassifier,
-    RandomForestClassifier,
-    StackingClassifier,
-    VotingClassifier,
-)
-from sklearn.neighbors import KNeighborsClassifier
-from sklearn.neural_network import MLPClassifier
-from sklearn.svm import SVC
-from sklearn.tree import DecisionTreeClassifier
-
 from app.settings import settings
 
-RANDOM_FOREST_CLASSIFIER = RandomForestClassifier(
-    n_estimators=100, max_features="sqrt", criterion="gini", max_depth=8
+# ordre des features donné aux modèles : ordre alphabétique, identique à celui du
+# DictVectorizer utilisé lors de l'entraînement
+TILT_LEARNING_FEATURES = (
+    "horizontal_distance_difference",
+    "horizontal_z_difference",
+    "percentage_distance_middlepoint_difference",
+    "vertical_distance_difference",
 )
 
-ADA_BOOST_CLASSIFIER = AdaBoostClassifier(n_estimators=100)
-
-BAGGING_CLASSIFIER = BaggingClassifier(
-    DecisionTreeClassifier(max_depth=5),
-    max_features=1.0,
-    max_samples=0.1,
-    n_estimators=100,
-)
+LOOKING_FRONT_CLASS = 2  # classe prédite lorsque le visage regarde en face
 
-GRADIENT_BOOSTING_CLASSIFIER = GradientBoostingClassifier(
-    n_estimators=100,
-    criterion="friedman_mse",
-    learning_rate=0.2,
-    loss="exponential",
-)
-
-K_NEIGHBORS_CLASSIFIER = KNeighborsClassifier(
-    leaf_size=2, n_neighbors=5, p=1, weights="distance"
-)
-
-SVC_CLASSIFIER = SVC(degree=1, gamma=1e-4, C=1000)
-
-MLP_CLASSIFIER = MLPClassifier()
-
-VOTING_CLASSIFIER = VotingClassifier(
-    [
-        (
-            "RANDOM_FOREST_CLASSIFIER",
-            RANDOM_FOREST_CLASSIFIER,
-        ),
-        ("ADA_BOOST_CLASSIFIER", ADA_BOOST_CLASSIFIER),
-        (
-            "BAGGING_CLASSIFIER",
-            BAGGING_CLASSIFIER,
-        ),
-        (
-            "GRADIENT_BOOSTING_CLASSIFIER",
-            GRADIENT_BOOSTING_CLASSIFIER,
-        ),
-        ("K_NEIGHBORS_CLASSIFIER", K_NEIGHBORS_CLASSIFIER),
-        ("SVC_CLASSIFIER", SVC_CLASSIFIER),
-        ("MLP_CLASSIFIER", MLP_CLASSIFIER),
-    ]
-)
-
-STACKING_CLASSIFIER = StackingClassifier(
-    [
-        (
-            "RANDOM_FOREST_CLASSIFIER",
-            RANDOM_FOREST_CLASSIFIER,
-        ),
-        ("ADA_BOOST_CLASSIFIER", ADA_BOOST_CLASSIFIER),
-        (
-            "BAGGING_CLASSIFIER",
-            BAGGING_CLASSIFIER,
-        ),
-        (
-            "GRADIENT_BOOSTING_CLASSIFIER",
-            GRADIENT_BOOSTING_CLASSIFIER,
-        ),
-        ("K_NEIGHBORS_CLASSIFIER", K_NEIGHBORS_CLASSIFIER),
-        ("SVC_CLASSIFIER", SVC_CLASSIFIER),
-        ("MLP_CLASSIFIER", MLP_CLASSIFIER),
-    ]
-)
+# noms des modèles pré-entraînés de l'ensemble
+TILT_LEARNING_MODELS = ("abc", "bc", "gdc", "knc", "rfc", "svc", "mc", "sc", "vc")
 
 PRE_TRAINED_MODELS = [
     {
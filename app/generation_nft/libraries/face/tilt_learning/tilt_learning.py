@@ -26,26 +26,23 @@ File: app/generation_nft/libraries/face/tilt_learning/tilt_learning.py
 """
 
 import warnings
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Tuple
 
 import gdown
+import numpy as np
 import requests
 from joblib import load as load_model
-from sklearn.feature_extraction import DictVectorizer
 
 from app import logger
 from app.exceptions import PronochainException
 from app.generation_nft.libraries.face.tilt_learning.constants import (
-    ADA_BOOST_CLASSIFIER,
-    BAGGING_CLASSIFIER,
-    GRADIENT_BOOSTING_CLASSIFIER,
-    K_NEIGHBORS_CLASSIFIER,
-    MLP_CLASSIFIER,
+    LOOKING_FRONT_CLASS,
     PRE_TRAINED_MODELS,
-    RANDOM_FOREST_CLASSIFIER,
-    STACKING_CLASSIFIER,
-    SVC_CLASSIFIER,
-    VOTING_CLASSIFIER,
+    TILT_LEARNING_FEATURES,
+    TILT_LEARNING_MODELS,
 )
 from app.generation_nft.libraries.face.tilt_learning.tilt_learning_data import (
     TiltLearningData,
@@ -54,6 +51,109 @@ from app.settings import settings
 
 warnings.filterwarnings("ignore")
 
+# erreurs levées par un pickle absent ou incompatible avec la version de scikit-learn
+UNLOADABLE_MODEL_ERRORS = (
+    AttributeError,
+    FileNotFoundError,
+    ModuleNotFoundError,
+    ValueError,
+)
+
+
+class TiltEnsemble(object):
+    """Ensemble des modèles de tilt learning, chargés une seule fois puis partagés."""
+
+    def __init__(self, model_path: str, names: Tuple[str, ...]):
+        """Initialise l'ensemble des modèles.
+
+        Args:
+            model_path (str): préfixe du chemin des modèles pré-entrainés.
+            names (Tuple[str, ...]): noms des modèles de l'ensemble.
+        """
+        self.model_path = model_path
+        self.names = names
+        self.models: Dict[str, Any] = {}  # None si le modèle est indisponible
+        self.lock = Lock()
+
+    def get_model(self, name: str) -> Any:
+        """Récupère un modèle, chargé depuis le disque au premier appel uniquement.
+
+        Args:
+            name (str): nom du modèle.
+
+        Returns:
+            Any: modèle, None s'il ne peut pas être chargé.
+        """
+        if name in self.models:
+            return self.models[name]
+        with self.lock:
+            if name not in self.models:
+                try:
+                    self.models[name] = load_model(
+                        f"{self.model_path}_{name}_model.pkl"
+                    )
+                except UNLOADABLE_MODEL_ERRORS as error:
+                    logger.warning(
+                        f"Modèle de tilt learning {name} indisponible : {error}"
+                    )
+                    self.models[name] = None
+        return self.models[name]
+
+    def predict_many(self, datasets: List[dict]) -> List[int]:
+        """Prédit l'inclinaison de plusieurs visages par vote majoritaire des modèles.
+
+        Args:
+            datasets (List[dict]): données de chaque visage (TiltLearningData.generate_datasets).
+
+        Raises:
+            PronochainException: aucun modèle de tilt learning disponible.
+
+        Returns:
+            List[int]: classe prédite pour chaque visage.
+        """
+        if not datasets:
+            return []
+        features = np.array(
+            [[dataset[key] for key in TILT_LEARNING_FEATURES] for dataset in datasets],
+            dtype=float,
+        )
+
+        votes = []
+        for name in self.names:
+            model = self.get_model(name)
+            if model is None:
+                continue
+            try:
+                votes.append(model.predict(features))
+            except UNLOADABLE_MODEL_ERRORS as error:
+                logger.warning(f"Modèle de tilt learning {name} indisponible : {error}")
+                self.models[name] = None
+
+        if not votes:
+            error_message = "Aucun modèle de tilt learning disponible."
+            logger.error(error_message)
+            raise PronochainException(error_message)
+
+        predictions = []
+        for row_votes in np.stack(votes, axis=1).tolist():
+            # en cas d'égalité, la plus petite classe l'emporte
+            predictions.append(max(sorted(set(row_votes)), key=row_votes.count))
+        return predictions
+
+
+@lru_cache(maxsize=None)
+def get_tilt_ensemble(model_path: str, names: Tuple[str, ...]) -> TiltEnsemble:
+    """Récupère l'ensemble des modèles de tilt learning partagé par le processus.
+
+    Args:
+        model_path (str): préfixe du chemin des modèles pré-entrainés.
+        names (Tuple[str, ...]): noms des modèles de l'ensemble.
+
+    Returns:
+        TiltEnsemble: ensemble des modèles.
+    """
+    return TiltEnsemble(model_path, names)
+
 
 class TiltLearning(TiltLearningData):
     """Classe permettant de créer, entrainer et/ou utiliser le tilt learning model (vérification si la tête regarde en face)."""
@@ -66,18 +166,8 @@ class TiltLearning(TiltLearningData):
             f"{settings.GENERATION_NFT_PATH}/libraries/face/tilt_learning/pre_trained"
         )
         self.model_path = f"{self.model_folder_path}/tilt_learning"
-        self.list_models = [
-            {"model": ADA_BOOST_CLASSIFIER, "name": "abc"},
-            {"model": BAGGING_CLASSIFIER, "name": "bc"},
-            {"model": GRADIENT_BOOSTING_CLASSIFIER, "name": "gdc"},
-            {"model": K_NEIGHBORS_CLASSIFIER, "name": "knc"},
-            {"model": RANDOM_FOREST_CLASSIFIER, "name": "rfc"},
-            {"model": SVC_CLASSIFIER, "name": "svc"},
-            {"model": MLP_CLASSIFIER, "name": "mc"},
-            {"model": STACKING_CLASSIFIER, "name": "sc"},
-            {"model": VOTING_CLASSIFIER, "name": "vc"},
-        ]
         self.download_missing_models()
+        self.tilt_ensemble = get_tilt_ensemble(self.model_path, TILT_LEARNING_MODELS)
 
     def is_looking_front(self, datasets: dict) -> bool:
         """Fonction pour déterminer si le visage regarde en face et non pas en haut/en bas/à droite ou à gauche.
@@ -88,20 +178,21 @@ class TiltLearning(TiltLearningData):
         Returns:
             bool: regarde en face ?
         """
-        predictions = []
+        return self.predict_many([datasets])[0]
 
-        for dict_model in self.list_models:
-            try:
-                model = load_model(
-                    f"{self.model_path}_{dict_model.get('name')}_model.pkl"
-                )
-                datasets_array = DictVectorizer().fit_transform(datasets).toarray()
-                predictions.append(model.predict(datasets_array)[0])
-            except (AttributeError, ModuleNotFoundError):
-                continue
-        prediction_result = max(set(predictions), key=predictions.count)
+    def predict_many(self, datasets: List[dict]) -> List[bool]:
+        """Détermine pour plusieurs visages s'ils regardent en face, en une prédiction par modèle.
 
-        return prediction_result == 2
+        Args:
+            datasets (List[dict]): données de chaque visage.
+
+        Returns:
+            List[bool]: regarde en face ? pour chaque visage.
+        """
+        return [
+            prediction == LOOKING_FRONT_CLASS
+            for prediction in self.tilt_ensemble.predict_many(datasets)
+        ]
 
     def download_missing_models(self):
         """Télécharge les modèles manquants.
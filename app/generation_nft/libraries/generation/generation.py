@@ -33,6 +33,7 @@ from sqlalchemy import func
 
 from app.exceptions import PronochainException
 from app.generation_nft.handler import GenerateNFT
+from app.generation_nft.libraries.card.constants import EncodingProfile
 from app.generation_nft.libraries.generation.constants import (
     CONSTANT_PARTS,
     RANDOM_PARTS,
@@ -44,8 +45,9 @@ from app.generation_nft.libraries.generation.constants import (
 )
 from app.generation_nft.libraries.generation.json_schema import JsonSchema
 from app.generation_nft.libraries.storage.storage import Storage
-from app.generation_nft_api.dependencies import get_db
+from app.generation_nft.timing import job_timings, span
 from app.generation_nft_db.constants import NameTypeCode, StatTypeCode
+from app.generation_nft_db.database import SessionLocal
 from app.generation_nft_db.models import rarities as model_rarities
 from app.generation_nft_db.models.clubs import Club
 from app.generation_nft_db.models.countries import Country
@@ -81,9 +83,26 @@ class Generation:
             rating (float, optional): côte d'un match. Défaut à 1.0.
         """
         self.rating = rating
-        self.db = next(get_db())
+        self.db = SessionLocal()
         self.storage = Storage()
         self.json_schema = JsonSchema()
+        self.timings = None
+
+    def __enter__(self):
+        """Entre dans le contexte, la session est fermée à sa sortie.
+
+        Returns:
+            Generation: instance.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """Sort du contexte et ferme la session."""
+        self.close()
+
+    def close(self):
+        """Ferme la session de la base de donnée et rend sa connexion au pool."""
+        self.db.close()
 
     def adjust_rarities_percentage(
         self, rarities: List[model_rarities.Rarity]
@@ -362,9 +381,12 @@ class Generation:
     ) -> Union[str, bytes]:
         """Génère le NFT.
 
+        Les durées de chaque étape sont conservées dans `self.timings` lorsque
+        `settings.TIMING_ENABLED` est activé.
+
         Args:
             params (CreateGeneration, optional): paramètre choisi lors de la création d'un NFT. Défaut à None.
-            get_picture (bool, optional): récupère l'image png ? Défaut à False.
+            get_picture (bool, optional): récupère l'aperçu de l'image (encodage rapide) ? Défaut à False.
 
         Raises:
             PronochainException: le joueur n'existe pas.
@@ -372,6 +394,42 @@ class Generation:
         Returns:
             Union[str, bytes]: image ou metadata.
         """
+        with job_timings("la génération du NFT") as self.timings:
+            with span("db"):
+                generation_parts = self.get_generation_parts(params)
+
+            generate_nft = GenerateNFT(generation_parts)
+            future = generate_nft.handler(
+                EncodingProfile.PREVIEW.value
+                if get_picture
+                else EncodingProfile.ARTIFACT.value
+            )
+            if get_picture:
+                with span("encode"):
+                    return future.result()
+
+            # les metadata sont préparées depuis la base pendant l'encodage de la carte
+            with span("metadata"):
+                schema = self.json_schema.get_schema(generation_parts)
+            with span("encode"):
+                nft_picture = future.result()
+            json = self.retrieve_json_metadata(nft_picture, schema)
+            return f"https://{self.storage.store(json).value.ipnft}.{settings.NFT_STORAGE_GATEWAY}/metadata.json"
+
+    def get_generation_parts(
+        self, params: CreateGeneration = None
+    ) -> List[GenerationPart]:
+        """Récupère les parties du NFT, choisies ou aléatoires, et enregistre la combinaison.
+
+        Args:
+            params (CreateGeneration, optional): paramètre choisi lors de la création d'un NFT. Défaut à None.
+
+        Raises:
+            PronochainException: le joueur n'existe pas.
+
+        Returns:
+            List[GenerationPart]: parties du NFT.
+        """
         if params is not None:
             self.check_params(params)
             first_name_type = (
@@ -694,15 +752,7 @@ class Generation:
             generation_parts = self.choose_parts()
 
         generation_parts = self.save_combinations(generation_parts)
-        generation_parts = self.calcul_global_note(generation_parts)
-
-        generate_nft = GenerateNFT(generation_parts)
-        nft_picture = generate_nft.handler()
-        if get_picture:
-            return nft_picture
-
-        json = self.retrieve_json_metadata(nft_picture, generation_parts)
-        return f"https://{self.storage.store(json).value.ipnft}.{settings.NFT_STORAGE_GATEWAY}/metadata.json"
+        return self.calcul_global_note(generation_parts)
 
     def calcul_stats(self, player_id: int, position_code: int) -> tuple:
         """Calcul les notes du joueurs.
@@ -829,20 +879,18 @@ class Generation:
             self.db.commit()
         return count
 
-    def retrieve_json_metadata(
-        self, nft_picture: bytes, generation_parts: List[GenerationPart]
-    ) -> str:
+    def retrieve_json_metadata(self, nft_picture: bytes, schema: dict) -> str:
         """Récupère le schéma JSON metadata.
 
         Args:
             nft_picture (bytes): nft.
-            generation_parts (List[GenerationPart]): parties du NFT.
+            schema (dict): schéma de metadata, sans l'image (JsonSchema.get_schema).
 
         Returns:
             str: schéma JSON metadata.
         """
         nft_cid = self.storage.add(nft_picture, is_bytes=True).value.cid
-        return self.json_schema.create_schema(nft_cid, generation_parts)
+        return self.json_schema.create_schema(nft_cid, schema)
 
 
 if __name__ == "__main__":
@@ -862,22 +910,22 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     rating = 2.0
-    generation = Generation(rating)
-    if args.generate:
-        generation.generate_nft()
-    else:
-        if args.less:
-            rarities = (
-                generation.db.query(model_rarities.Rarity)
-                .order_by(model_rarities.Rarity.code)
-                .filter(model_rarities.Rarity.code.in_([1, 4, 7, 9]))
-            )
+    with Generation(rating) as generation:
+        if args.generate:
+            generation.generate_nft()
         else:
-            rarities = (
-                generation.db.query(model_rarities.Rarity)
-                .order_by(model_rarities.Rarity.code)
-                .all()
-            )
+            if args.less:
+                rarities = (
+                    generation.db.query(model_rarities.Rarity)
+                    .order_by(model_rarities.Rarity.code)
+                    .filter(model_rarities.Rarity.code.in_([1, 4, 7, 9]))
+                )
+            else:
+                rarities = (
+                    generation.db.query(model_rarities.Rarity)
+                    .order_by(model_rarities.Rarity.code)
+                    .all()
+                )
 
-        final_rarities = generation.adjust_rarities_percentage(rarities)
-        choosen_rarity = generation.choose_rarity(final_rarities)
+            final_rarities = generation.adjust_rarities_percentage(rarities)
+            choosen_rarity = generation.choose_rarity(final_rarities)
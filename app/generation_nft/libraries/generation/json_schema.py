@@ -39,24 +39,23 @@ class JsonSchema:
         """Initialise la classe pour créer le schéma JSON de metadata."""
         pass
 
-    def create_schema(
-        self, nft_cid: str, generation_parts: List[GenerationPart]
-    ) -> str:
-        """Crée le schéma JSON de metadata.
+    def get_schema(self, generation_parts: List[GenerationPart]) -> dict:
+        """Crée le schéma de metadata, sans l'image du NFT.
+
+        Les relations du joueur sont chargées depuis la base : le schéma peut être préparé
+        pendant l'encodage de la carte.
 
         Args:
-            nft_cid (str): CID du NFT stocké sur nft.storage.
             generation_parts (List[GenerationPart]): liste des parties du NFT.
 
         Returns:
-            str: schéma JSON metadata.
+            dict: schéma de metadata, sans l'image.
         """
         self.set_generation_part_variables(generation_parts)
         position = self.player_picture.positions[0].type.value
-        json_dict = {
+        return {
             "name": f"{getattr(self, PartName.FIRST_NAME.value).value} {getattr(self, PartName.LAST_NAME.value).value} - from {getattr(self, PartName.COUNTRY_FLAG.value).value}, at {getattr(self, PartName.CLUB.value)}, {position} position, {self.player_picture.age} years old, {self.player_picture.height} centimeters, {self.player_picture.weight} kilos | #{getattr(self, PartName.NFT_COUNT.value)}",
             "description": f"I present to you {getattr(self, PartName.FIRST_NAME.value).value} {getattr(self, PartName.LAST_NAME.value).value}, a footballer from {getattr(self, PartName.COUNTRY_FLAG.value).value} currently playing at {getattr(self, PartName.CLUB.value)} to the position of {position}. He is {self.player_picture.age} years old. He is {self.player_picture.height} centimeters tall and weights {self.player_picture.weight} kilos. His skin color is {getattr(self, PartName.SKIN_COLOR.value).hex}, hair color is {getattr(self, PartName.HAIR_COLOR.value).hex}, eyes color is {getattr(self, PartName.EYES_COLOR.value).hex} and mouth color is {getattr(self, PartName.MOUTH_COLOR.value).hex}. His score is {getattr(self, PartName.GLOBAL_NOTE.value)} with {getattr(self, PartName.POSITION_NOTE.value)} in position note, {getattr(self, PartName.MENTAL_NOTE.value)} in mental note and {getattr(self, PartName.PHYSICAL_NOTE.value)} in physical note.",
-            "image": f"https://{nft_cid}.{settings.NFT_STORAGE_GATEWAY}/?filename={nft_cid}.png",
             "properties": self.get_properties(
                 generation_parts,
                 position,
@@ -65,6 +64,23 @@ class JsonSchema:
                 self.player_picture.weight,
             ),
         }
+
+    def create_schema(self, nft_cid: str, schema: dict) -> str:
+        """Crée le schéma JSON de metadata.
+
+        Args:
+            nft_cid (str): CID du NFT stocké sur nft.storage.
+            schema (dict): schéma de metadata, sans l'image (get_schema).
+
+        Returns:
+            str: schéma JSON metadata.
+        """
+        json_dict = {
+            "name": schema["name"],
+            "description": schema["description"],
+            "image": f"https://{nft_cid}.{settings.NFT_STORAGE_GATEWAY}/?filename={nft_cid}.png",
+            "properties": schema["properties"],
+        }
         return json.dumps(json_dict, indent=4)
 
     def set_generation_part_variables(self, generation_parts: List[GenerationPart]):
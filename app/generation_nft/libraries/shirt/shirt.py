@@ -26,9 +26,15 @@ File: app/generation_nft/libraries/shirt/shirt.py
 """
 import cv2 as open_cv
 import numpy as np
-from coloraide import Color
-from PIL import Image
 
+from app.generation_nft.colors import get_shade
+from app.generation_nft.libraries.compositor.compositor import (
+    new_layer,
+    over,
+    paste,
+    to_layer,
+)
+from app.generation_nft.libraries.compositor.constants import TRANSPARENT_COLOR
 from app.generation_nft.libraries.face.face_styling.mixins import DrawingMixin
 from app.generation_nft.libraries.shirt.constants import (
     DARK_PEC,
@@ -36,7 +42,8 @@ from app.generation_nft.libraries.shirt.constants import (
     DEFAULT_NECK_HEIGHT,
     LEFT_UP_POINT,
 )
-from app.generation_nft.utils import draw_contours, replace_color, rgb_to_hex, where
+from app.generation_nft.timing import timed
+from app.generation_nft.utils import draw_contours, replace_color, where
 
 
 class ShirtStyling(DrawingMixin):
@@ -63,6 +70,7 @@ class ShirtStyling(DrawingMixin):
         self.white_color_lighter = np.array([204, 204, 204])
         self.white_color_darker = np.array([179, 179, 179])
 
+    @timed("shirt")
     def draw_shirt(self) -> np.array:
         """Dessine le maillot du joueur.
 
@@ -166,18 +174,7 @@ class ShirtStyling(DrawingMixin):
             shirt_emblem_points[1] - crest_width,
         )
 
-        base_template_shirt_pil = self.convert_to_pil_with_transparent_background(
-            self.base_template_shirt
-        )
-        template_crest_pil = self.convert_to_pil_with_transparent_background(
-            template_crest
-        )
-        base_template_shirt_pil.paste(
-            template_crest_pil, (crest_x, crest_y), template_crest_pil
-        )
-        self.base_template_shirt = open_cv.cvtColor(
-            np.array(base_template_shirt_pil), open_cv.COLOR_RGBA2BGR
-        )
+        paste(self.base_template_shirt, template_crest, (crest_x, crest_y))
 
         self.set_pec(self.base_template_shirt)
 
@@ -193,29 +190,12 @@ class ShirtStyling(DrawingMixin):
         height = self.base_template_shirt.shape[0] + self.face_bottom_y
         face_x = LEFT_UP_POINT[1] - self.get_x_min_neck()
 
-        virgin_shirt_part = np.full(
-            (height, self.base_template_shirt.shape[1], 3),
-            255,
-            dtype=np.uint8,
-        )
-
-        face_pil = self.convert_to_pil_with_transparent_background(self.drawing_face)
-        base_template_shirt_pil = self.convert_to_pil_with_transparent_background(
-            self.base_template_shirt
-        )
+        width = self.base_template_shirt.shape[1]
+        face = self.drawing_face
 
-        shirt_part_pil = Image.fromarray(
-            open_cv.cvtColor(virgin_shirt_part, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        shirt_part_pil.paste(face_pil, (face_x, 0), face_pil)
-        shirt_part_pil.paste(
-            base_template_shirt_pil, (0, self.face_bottom_y), base_template_shirt_pil
-        )
-
-        shirt_part_mask = open_cv.cvtColor(
-            np.array(shirt_part_pil), open_cv.COLOR_RGBA2BGR
-        )
+        shirt_part_mask = new_layer(height, width, TRANSPARENT_COLOR)
+        paste(shirt_part_mask, face, (face_x, 0))
+        paste(shirt_part_mask, self.base_template_shirt, (0, self.face_bottom_y))
 
         _, skin_coordinates_y, _ = where(shirt_part_mask, self.skin_color)
         _, neck_coordinates_y, _ = where(shirt_part_mask, self.neck_color)
@@ -232,12 +212,6 @@ class ShirtStyling(DrawingMixin):
                 255,
                 dtype=np.uint8,
             )
-            new_height_mask_part_pil = Image.fromarray(
-                open_cv.cvtColor(new_height_mask_part, open_cv.COLOR_BGR2RGBA).astype(
-                    "uint8"
-                ),
-                "RGBA",
-            )
             new_first_point, new_second_point = self.neck_params.get(
                 "second_point"
             ), self.neck_params.get("third_point")
@@ -291,57 +265,21 @@ class ShirtStyling(DrawingMixin):
                 new_height_mask_part, new_second_point, new_fourth_point, (0, 0, 0), 2
             )
 
-            new_height_mask_part_pil = Image.fromarray(
-                open_cv.cvtColor(new_height_mask_part, open_cv.COLOR_BGR2RGBA).astype(
-                    "uint8"
-                ),
-                "RGBA",
-            )
-            new_height_mask_part_pil.paste(face_pil, (0, 0), face_pil)
-            face_pil = self.convert_to_pil_with_transparent_background(
-                open_cv.cvtColor(
-                    np.array(new_height_mask_part_pil), open_cv.COLOR_RGBA2BGR
-                )
-            )
+            face = paste(new_height_mask_part, face)
 
-        final_shirt_part_pil = Image.fromarray(
-            open_cv.cvtColor(virgin_shirt_part, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        final_shirt_part_pil.paste(face_pil, (face_x, 0), face_pil)
+        shirt_part_mask = new_layer(height, width, TRANSPARENT_COLOR)
+        paste(shirt_part_mask, face, (face_x, 0))
         if self.drawing_beard is not None:
-            beard_pil = self.convert_to_pil_with_transparent_background(
-                self.drawing_beard
-            )
-            final_shirt_part_pil.paste(beard_pil, (face_x, 0), beard_pil)
-        final_shirt_part_pil.paste(
-            base_template_shirt_pil,
+            paste(shirt_part_mask, self.drawing_beard, (face_x, 0))
+        paste(
+            shirt_part_mask,
+            self.base_template_shirt,
             (0, self.face_bottom_y + neck_height),
-            base_template_shirt_pil,
         )
-        hair_pil = self.convert_to_pil_with_transparent_background(self.drawing_hair)
-        final_shirt_part_pil.paste(hair_pil, (face_x, 0), hair_pil)
+        paste(shirt_part_mask, self.drawing_hair, (face_x, 0))
 
-        virgin_face_contours = np.full(
-            (final_shirt_part_pil.size[1], final_shirt_part_pil.size[0], 3),
-            255,
-            dtype=np.uint8,
-        )
-        virgin_face_contours_pil = Image.fromarray(
-            open_cv.cvtColor(virgin_face_contours, open_cv.COLOR_BGR2RGBA).astype(
-                "uint8"
-            ),
-            "RGBA",
-        )
-        face_contours_pil = self.convert_to_pil_with_transparent_background(
-            self.face_contours
-        )
-        virgin_face_contours_pil.paste(
-            face_contours_pil, (face_x, 0), face_contours_pil
-        )
-        face_contours_mask = open_cv.cvtColor(
-            np.array(virgin_face_contours_pil), open_cv.COLOR_RGBA2BGR
-        )
+        face_contours_mask = new_layer(height, width, TRANSPARENT_COLOR)
+        paste(face_contours_mask, self.face_contours, (face_x, 0))
         face_contours_mask, _ = draw_contours(
             face_contours_mask,
             face_contours_mask,
@@ -350,10 +288,6 @@ class ShirtStyling(DrawingMixin):
             as_mask=True,
         )
 
-        shirt_part_mask = open_cv.cvtColor(
-            np.array(final_shirt_part_pil), open_cv.COLOR_RGBA2BGR
-        )
-
         only_face_mask = open_cv.bitwise_and(
             shirt_part_mask, shirt_part_mask, mask=face_contours_mask
         )
@@ -361,49 +295,13 @@ class ShirtStyling(DrawingMixin):
         _, coordinates_y, coordinates_x = where(only_face_mask, self.neck_color)
         shirt_part_mask[coordinates_y, coordinates_x, :] = self.skin_color
 
-        final_shirt_part_pil = Image.fromarray(
-            open_cv.cvtColor(shirt_part_mask, open_cv.COLOR_BGR2RGBA).astype("uint8"),
-            "RGBA",
-        )
-        face_contours_pil = self.convert_to_pil_with_transparent_background(
-            self.face_contours
-        )
-        final_shirt_part_pil.paste(face_contours_pil, (face_x, 0), face_contours_pil)
+        paste(shirt_part_mask, self.face_contours, (face_x, 0))
 
-        shirt_part_mask = np.array(final_shirt_part_pil)
-
-        replace_color(
-            shirt_part_mask,
-            np.array([255, 255, 255, 255]),
-            np.array([255, 255, 255, 0]),
-            channel=4,
-        )
+        shirt_part_mask = to_layer(shirt_part_mask, swap_channels=True)
         shirt_part_mask = shirt_part_mask[: shirt_part_mask.shape[0] + neck_height, :]
 
-        crest_transparent = np.full(
-            (self.crest_shape.shape[0], self.crest_shape.shape[1], 4),
-            np.array([255, 255, 255, 0]),
-            dtype=np.uint8,
-        )
-        crest_transparent_pil = Image.fromarray(
-            open_cv.cvtColor(crest_transparent, open_cv.COLOR_BGRA2RGBA).astype(
-                "uint8"
-            ),
-            "RGBA",
-        )
-        drawing_crest_pil = self.convert_to_pil_with_transparent_background(
-            template_crest
-        )
-        crest_transparent_pil.paste(drawing_crest_pil, (0, 0), drawing_crest_pil)
-        drawing_crest = open_cv.cvtColor(
-            np.array(crest_transparent_pil), open_cv.COLOR_RGB2RGBA
-        )
-        replace_color(
-            drawing_crest,
-            np.array([255, 255, 255, 255]),
-            np.array([255, 255, 255, 0]),
-            channel=4,
-        )
+        drawing_crest = new_layer(self.crest_shape.shape[0], self.crest_shape.shape[1])
+        over(drawing_crest, to_layer(template_crest, swap_channels=True))
         return shirt_part_mask, drawing_crest
 
     def get_x_min_neck(self) -> int:
@@ -421,134 +319,14 @@ class ShirtStyling(DrawingMixin):
         Args:
             template_shirt (np.array): template du maillot.
         """
-        first_color_hex, second_color_hex = rgb_to_hex(
-            self.first_color, convert_bgr_to_rgb=True
-        ), rgb_to_hex(self.second_color, convert_bgr_to_rgb=True)
-        first_color_hsl, second_color_hsl = Color(first_color_hex).convert(
-            "hsl"
-        ).to_string(precision=0).replace("hsl(", "").replace(")", "").split(" "), Color(
-            second_color_hex
-        ).convert(
-            "hsl"
-        ).to_string(
-            precision=0
-        ).replace(
-            "hsl(", ""
-        ).replace(
-            ")", ""
-        ).split(
-            " "
-        )
-
-        new_lighter_first_percent, new_darker_first_percent = (
-            last_lighter_value
-            if (
-                last_lighter_value := int(first_color_hsl[2].replace("%", ""))
-                - self.dark_pec
-            )
-            > 0
-            else 0,
-            last_darker_value
-            if (
-                last_darker_value := int(first_color_hsl[2].replace("%", ""))
-                - self.darker_pec
-            )
-            > 0
-            else 0,
-        )
-        lighter_first_color_hsl, darker_first_color_hsl = " ".join(
-            [first_color_hsl[0], first_color_hsl[1], f"{new_lighter_first_percent}%"]
-        ), " ".join(
-            [first_color_hsl[0], first_color_hsl[1], f"{new_darker_first_percent}%"]
-        )
-
-        new_lighter_second_percent, new_darker_second_percent = (
-            last_lighter_value
-            if (
-                last_lighter_value := int(second_color_hsl[2].replace("%", ""))
-                - self.dark_pec
-            )
-            > 0
-            else 0,
-            last_darker_value
-            if (
-                last_darker_value := int(second_color_hsl[2].replace("%", ""))
-                - self.darker_pec
-            )
-            > 0
-            else 0,
-        )
-        lighter_second_color_hsl, darker_second_color_hsl = " ".join(
-            [second_color_hsl[0], second_color_hsl[1], f"{new_lighter_second_percent}%"]
-        ), " ".join(
-            [second_color_hsl[0], second_color_hsl[1], f"{new_darker_second_percent}%"]
-        )
-
-        first_color_lighter, first_color_darker = Color(
-            f"hsl({lighter_first_color_hsl})"
-        ).convert("srgb").to_string(precision=0).replace("rgb(", "").replace(
-            ")", ""
-        ).split(
-            " "
-        ), Color(
-            f"hsl({darker_first_color_hsl})"
-        ).convert(
-            "srgb"
-        ).to_string(
-            precision=0
-        ).replace(
-            "rgb(", ""
-        ).replace(
-            ")", ""
-        ).split(
-            " "
-        )
+        first_color = tuple(int(channel) for channel in self.first_color)
+        second_color = tuple(int(channel) for channel in self.second_color)
         first_color_lighter, first_color_darker = np.array(
-            [
-                int(first_color_lighter[2]),
-                int(first_color_lighter[1]),
-                int(first_color_lighter[0]),
-            ]
-        ), np.array(
-            [
-                int(first_color_darker[2]),
-                int(first_color_darker[1]),
-                int(first_color_darker[0]),
-            ]
-        )
-
-        second_color_lighter, second_color_darker = Color(
-            f"hsl({lighter_second_color_hsl})"
-        ).convert("srgb").to_string(precision=0).replace("rgb(", "").replace(
-            ")", ""
-        ).split(
-            " "
-        ), Color(
-            f"hsl({darker_second_color_hsl})"
-        ).convert(
-            "srgb"
-        ).to_string(
-            precision=0
-        ).replace(
-            "rgb(", ""
-        ).replace(
-            ")", ""
-        ).split(
-            " "
-        )
+            get_shade(first_color, self.dark_pec)
+        ), np.array(get_shade(first_color, self.darker_pec))
         second_color_lighter, second_color_darker = np.array(
-            [
-                int(second_color_lighter[2]),
-                int(second_color_lighter[1]),
-                int(second_color_lighter[0]),
-            ]
-        ), np.array(
-            [
-                int(second_color_darker[2]),
-                int(second_color_darker[1]),
-                int(second_color_darker[0]),
-            ]
-        )
+            get_shade(second_color, self.dark_pec)
+        ), np.array(get_shade(second_color, self.darker_pec))
 
         lighter_pec_indices = np.where(
             np.all(
@@ -656,24 +434,8 @@ class ShirtStyling(DrawingMixin):
             self.base_template_emblem, emblem_contours, -1, (0, 0, 0), 1
         )
 
-        crest_content = self.convert_to_pil_with_transparent_background(
-            self.crest_content
-        )
-        emblem = self.convert_to_pil_with_transparent_background(
-            self.base_template_emblem, convert=False
-        )
+        crest_template = self.base_template_crest[:, :, :3].copy()
+        paste(crest_template, self.crest_content[:, :, 2::-1])
+        paste(crest_template, self.base_template_emblem, (emblem_x, emblem_y))
 
-        crest_template_pil = Image.fromarray(
-            open_cv.cvtColor(self.base_template_crest, open_cv.COLOR_RGB2RGBA).astype(
-                "uint8"
-            ),
-            "RGBA",
-        )
-        crest_template_pil.paste(crest_content, (0, 0), crest_content)
-        crest_template_pil.paste(emblem, (emblem_x, emblem_y), emblem)
-
-        return (
-            open_cv.cvtColor(np.array(crest_template_pil), open_cv.COLOR_RGBA2RGB),
-            crest_y,
-            crest_x,
-        )
+        return crest_template, crest_y, crest_x
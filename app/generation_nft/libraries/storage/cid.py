@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/libraries/storage/cid.py
+"""
+import base64
+import hashlib
+import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from app import logger
+from app.generation_nft.libraries.storage.constants import (
+    BASE32_PREFIX,
+    CID_VERSION,
+    SHA2_256_CODE,
+    SHA2_256_LENGTH,
+    Codec,
+)
+from app.settings import settings
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode un entier en varint non signé (multiformats).
+
+    Args:
+        value (int): entier positif.
+
+    Returns:
+        bytes: entier encodé.
+    """
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def digest_to_cid(digest: bytes, codec: Codec = Codec.RAW) -> str:
+    """Construit un CIDv1 en base32 à partir d'une empreinte sha256.
+
+    Avec le codec raw, le résultat est identique au CID "bafkrei..." renvoyé par l'endpoint
+    /get-cid du car-api.
+
+    Args:
+        digest (bytes): empreinte sha256 du fichier.
+        codec (Codec, optional): codec du CID. Défaut à Codec.RAW.
+
+    Returns:
+        str: CIDv1.
+    """
+    cid = (
+        encode_varint(CID_VERSION)
+        + encode_varint(codec.value)
+        + encode_varint(SHA2_256_CODE)
+        + encode_varint(SHA2_256_LENGTH)
+        + digest
+    )
+    return BASE32_PREFIX + base64.b32encode(cid).decode().lower().rstrip("=")
+
+
+def hash_file(file_path: str) -> bytes:
+    """Calcule l'empreinte sha256 d'un fichier en le projetant en mémoire.
+
+    Args:
+        file_path (str): chemin du fichier.
+
+    Returns:
+        bytes: empreinte sha256.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return hashlib.sha256().digest()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            return hashlib.sha256(mapped_file).digest()
+
+
+def load_digest_cache() -> Dict[str, list]:
+    """Charge le cache des empreintes.
+
+    Returns:
+        Dict[str, list]: empreintes indexées par chemin, avec la date de modification et la taille du fichier.
+    """
+    try:
+        with open(settings.CID_CACHE_FILE, "r", encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_digest_cache(digest_cache: Dict[str, list]):
+    """Enregistre le cache des empreintes.
+
+    Args:
+        digest_cache (Dict[str, list]): empreintes indexées par chemin.
+    """
+    try:
+        with open(settings.CID_CACHE_FILE, "w", encoding="utf-8") as cache_file:
+            json.dump(digest_cache, cache_file)
+    except OSError as e:
+        logger.warning(f"Impossible d'enregistrer le cache des CID : {e}")
+
+
+def compute_cids(
+    file_paths: List[str], codec: Codec = Codec.RAW
+) -> List[Optional[str]]:
+    """Calcule les CIDv1 de plusieurs fichiers sans passer par le car-api.
+
+    Les empreintes sont mises en cache par (chemin, date de modification, taille), seuls les
+    fichiers nouveaux ou modifiés sont hachés, en parallèle dans un pool de processus.
+    Les fichiers manquants sont ignorés, leur CID vaut None.
+
+    Args:
+        file_paths (List[str]): chemins des fichiers.
+        codec (Codec, optional): codec des CID. Défaut à Codec.RAW.
+
+    Returns:
+        List[Optional[str]]: CIDv1 dans l'ordre des fichiers, None si le fichier est manquant.
+    """
+    digest_cache = load_digest_cache()
+    file_keys, missing_files = {}, []
+    for file_path in dict.fromkeys(file_paths):
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            missing_files.append(file_path)
+            continue
+        file_keys[file_path] = [file_stat.st_mtime_ns, file_stat.st_size]
+    if missing_files:
+        logger.warning(
+            f"{len(missing_files)} fichier(s) introuvable(s), CID ignoré(s) : {missing_files[:5]}"
+        )
+
+    missing_paths = [
+        file_path
+        for file_path, file_key in file_keys.items()
+        if digest_cache.get(file_path, [None, None])[:2] != file_key
+    ]
+    if missing_paths:
+        workers = settings.CID_WORKERS or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            digests = executor.map(
+                hash_file,
+                missing_paths,
+                chunksize=max(1, len(missing_paths) // (workers * 4)),
+            )
+            for file_path, digest in zip(missing_paths, digests):
+                digest_cache[file_path] = [*file_keys[file_path], digest.hex()]
+        save_digest_cache(digest_cache)
+
+    return [
+        digest_to_cid(bytes.fromhex(digest_cache[file_path][2]), codec)
+        if file_path in file_keys
+        else None
+        for file_path in file_paths
+    ]
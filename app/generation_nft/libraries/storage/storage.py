@@ -26,11 +26,12 @@ File: app/generation_nft/libraries/storage/storage.py
 """
 import argparse
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import BufferedReader, BytesIO
+from functools import lru_cache
+from io import BufferedReader
 from typing import List, Union
 
-import cv2 as open_cv
 import multihash
 import numpy as np
 import requests
@@ -41,11 +42,29 @@ from app import logger
 from app.exceptions import PronochainException
 from app.generation_nft.libraries.generation.constants import PictureChannel
 from app.generation_nft.libraries.storage.models import ResponseStorage
-from app.generation_nft.utils import show
+from app.generation_nft.timing import timed
 from app.generation_nft_db.schemas.players import ResponseCarApi
 from app.settings import settings
 
 
+@lru_cache(maxsize=settings.NFT_STORAGE_PICTURE_CACHE_SIZE)
+def download_picture(url: str) -> bytes:
+    """Télécharge une image depuis la passerelle de nft.storage.
+
+    Le contenu d'un CID ne change jamais : les images sont gardées en cache, seules les
+    réponses valides sont conservées.
+
+    Args:
+        url (str): url de l'image.
+
+    Returns:
+        bytes: image encodée.
+    """
+    response = requests.get(url)
+    response.raise_for_status()
+    return response.content
+
+
 class Storage(object):
     """Classe pour gérer le stockage des images dans IPFS."""
 
@@ -135,6 +154,7 @@ class Storage(object):
             logger.error(e)
             raise PronochainException("Check response wrong format")
 
+    @timed("upload")
     def add(
         self, file: Union[BufferedReader, bytes], is_bytes: bool = False
     ) -> ResponseStorage:
@@ -167,6 +187,7 @@ class Storage(object):
             logger.error(e)
             raise PronochainException("Add file response wrong format")
 
+    @timed("upload")
     def store(self, json: str) -> ResponseStorage:
         """Ajouter des metadatas sur nft.storage.
 
@@ -223,6 +244,68 @@ class Storage(object):
             logger.error(e)
             raise PronochainException("Delete response wrong format")
 
+    def delete_quietly(self, cid: str) -> bool:
+        """Supprimer un élément sur nft.storage sans lever d'erreur.
+
+        Args:
+            cid (str): CID de l'élément.
+
+        Returns:
+            bool: l'élément a été supprimé.
+        """
+        try:
+            self.delete(cid)
+            return True
+        except Exception as e:
+            logger.warning(f"Impossible de supprimer {cid} : {e}")
+            return False
+
+    def delete_many(self, cids: List[str]) -> int:
+        """Supprimer plusieurs éléments sur nft.storage en parallèle.
+
+        Args:
+            cids (List[str]): CID des éléments.
+
+        Returns:
+            int: nombre d'éléments supprimés.
+        """
+        with ThreadPoolExecutor(
+            max_workers=settings.NFT_STORAGE_WORKERS,
+            thread_name_prefix="nft_storage",
+        ) as executor:
+            return sum(executor.map(self.delete_quietly, cids))
+
+    def add_many(self, files: List[bytes]) -> List[str]:
+        """Ajouter plusieurs éléments sur nft.storage en parallèle.
+
+        Si un envoi échoue, les éléments déjà envoyés sont supprimés.
+
+        Args:
+            files (List[bytes]): éléments sous format bytes.
+
+        Raises:
+            PronochainException: un élément n'a pas pu être ajouté.
+
+        Returns:
+            List[str]: CID des éléments, dans l'ordre des fichiers.
+        """
+        with ThreadPoolExecutor(
+            max_workers=settings.NFT_STORAGE_WORKERS,
+            thread_name_prefix="nft_storage",
+        ) as executor:
+            futures = [executor.submit(self.add, file, True) for file in files]
+        cids, errors = [], []
+        for future in futures:
+            if (error := future.exception()) is None:
+                cids.append(future.result().value.cid)
+            else:
+                errors.append(error)
+        if errors:
+            self.delete_many(cids)
+            raise PronochainException(str(errors[0]))
+        return cids
+
+    @timed("asset_fetch")
     def picture(
         self, cid: str, filename: str = None, channel: int = PictureChannel.RGBA.value
     ) -> np.array:
@@ -237,27 +320,41 @@ class Storage(object):
             np.array: image.
         """
         if filename is not None:
-            picture_bytes = BytesIO(
-                requests.get(
-                    f"https://{cid}.{settings.NFT_STORAGE_GATEWAY}/?filename={filename}"
-                ).content
+            picture_bytes = download_picture(
+                f"https://{cid}.{settings.NFT_STORAGE_GATEWAY}/?filename={filename}"
             )
         else:
-            picture_bytes = BytesIO(
-                requests.get(f"https://{cid}.{settings.NFT_STORAGE_GATEWAY}").content
+            picture_bytes = download_picture(
+                f"https://{cid}.{settings.NFT_STORAGE_GATEWAY}"
             )
+        return self.decode_picture(picture_bytes, channel)
+
+    def decode_picture(
+        self, picture_bytes: bytes, channel: int = PictureChannel.RGBA.value
+    ) -> np.array:
+        """Décode une image.
+
+        Args:
+            picture_bytes (bytes): image encodée.
+            channel (int, optional): dimension de la couleur. Défaut à PictureChannel.RGBA.value.
+
+        Returns:
+            np.array: image.
+        """
+        # importé au premier décodage : les repositories CRUD importent Storage sans OpenCV
+        import cv2 as open_cv
 
         if channel == PictureChannel.RGBA.value:
             return open_cv.cvtColor(
                 open_cv.imdecode(
-                    np.frombuffer(picture_bytes.getbuffer().tobytes(), np.uint8),
+                    np.frombuffer(picture_bytes, np.uint8),
                     open_cv.IMREAD_UNCHANGED,
                 ),
                 open_cv.COLOR_BGR2BGRA,
             )
         elif channel == PictureChannel.RGB.value:
             return open_cv.imdecode(
-                np.frombuffer(picture_bytes.getbuffer().tobytes(), np.uint8),
+                np.frombuffer(picture_bytes, np.uint8),
                 open_cv.IMREAD_COLOR,
             )
 
@@ -295,6 +392,8 @@ class Storage(object):
 
 
 if __name__ == "__main__":
+    from app.generation_nft.utils import show
+
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "-ba",
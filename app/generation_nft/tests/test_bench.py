@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_bench.py
+"""
+from pathlib import Path
+
+from app.generation_nft.bench.bench import compare_reports, get_photos, summarize
+from app.generation_nft.bench.startup import parse_import_times
+from app.generation_nft.bench.sweep import get_worker_cpus
+
+
+def test_get_photos(tmp_path: Path):
+    """Test la récupération du jeu de photos.
+
+    Args:
+        tmp_path (Path): dossier temporaire.
+
+    Raises:
+        AssertionError: Les photos doivent être triées et les autres fichiers ignorés.
+    """
+    for filename in ("b.png", "a.JPG", "notes.txt"):
+        (tmp_path / filename).touch()
+
+    if get_photos(str(tmp_path)) != [str(tmp_path / "a.JPG"), str(tmp_path / "b.png")]:
+        raise AssertionError(
+            "Les photos doivent être triées et les autres fichiers ignorés."
+        )
+
+
+def test_compare_reports():
+    """Test la détection des régressions entre deux rapports.
+
+    Raises:
+        AssertionError: Le résumé des durées est incorrect.
+        AssertionError: Aucune régression ne doit être détectée.
+        AssertionError: Les régressions détectées sont incorrectes.
+    """
+    summary = summarize([1.0, 2.0, 3.0, 4.0, 5.0])
+    if (summary["count"], summary["p50"], summary["max"]) != (5, 3.0, 5.0):
+        raise AssertionError("Le résumé des durées est incorrect.")
+
+    baseline = {
+        "throughput": 1.0,
+        "peak_rss_mb": 1000.0,
+        "stages": {"parsing": summary, "total": summary},
+    }
+    report = {
+        "throughput": 0.95,
+        "peak_rss_mb": 1050.0,
+        "stages": {
+            "parsing": summarize([1.0, 2.0, 3.2, 4.0, 5.0]),
+            "total": summary,
+            "card": summary,
+        },
+    }
+    if compare_reports(baseline, report):
+        raise AssertionError("Aucune régression ne doit être détectée.")
+
+    report["stages"]["parsing"] = summarize([2.0, 3.0, 4.0, 5.0, 6.0])
+    report["throughput"] = 0.5
+    if [
+        regression.split(" :")[0] for regression in compare_reports(baseline, report)
+    ] != [
+        "parsing p50",
+        "parsing p95",
+        "débit",
+    ]:
+        raise AssertionError("Les régressions détectées sont incorrectes.")
+
+
+def test_parse_import_times():
+    """Test la lecture de la sortie de python -X importtime.
+
+    Raises:
+        AssertionError: Les durées cumulées des imports sont incorrectes.
+    """
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   fastapi.routing",
+            "import time:      2000 |       2120 | app.generation_nft_api.main",
+            "Traceback (most recent call last):",
+        ]
+    )
+
+    if parse_import_times(output) != {
+        "fastapi.routing": 0.00012,
+        "app.generation_nft_api.main": 0.00212,
+    }:
+        raise AssertionError("Les durées cumulées des imports sont incorrectes.")
+
+
+def test_get_worker_cpus():
+    """Test la répartition des CPU entre les workers du balayage.
+
+    Raises:
+        AssertionError: Chaque worker doit avoir ses propres CPU.
+        AssertionError: Les CPU doivent être partagés s'il n'y en a pas assez.
+    """
+    cpus = [0, 1, 2, 3]
+
+    if [get_worker_cpus(worker, 2, cpus) for worker in range(2)] != [[0, 1], [2, 3]]:
+        raise AssertionError("Chaque worker doit avoir ses propres CPU.")
+    if [get_worker_cpus(worker, 3, cpus) for worker in range(2)] != [
+        [0, 1, 2],
+        [0, 1, 3],
+    ]:
+        raise AssertionError("Les CPU doivent être partagés s'il n'y en a pas assez.")
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_colors.py
+"""
+import numpy as np
+
+from app.generation_nft.colors import delta_e, get_gradient, get_shade
+
+
+def test_get_shade():
+    """Test le calcul de la nuance plus sombre d'une couleur.
+
+    Raises:
+        AssertionError: Le calcul de la nuance d'une couleur ne fonctionne pas.
+    """
+    if get_shade((128, 128, 128), 10) != (102, 102, 102) or get_shade(
+        (0, 0, 0), 10
+    ) != (0, 0, 0):
+        raise AssertionError("Le calcul de la nuance d'une couleur ne fonctionne pas.")
+
+
+def test_get_gradient():
+    """Test le calcul d'un dégradé entre deux couleurs.
+
+    Raises:
+        AssertionError: Le calcul d'un dégradé entre deux couleurs ne fonctionne pas.
+    """
+    gradient = get_gradient((255, 255, 255), (0, 0, 0), 5)
+    if (
+        gradient.shape != (5, 3)
+        or not np.array_equal(gradient[0], [255, 255, 255])
+        or not np.array_equal(gradient[-1], [0, 0, 0])
+    ):
+        raise AssertionError(
+            "Le calcul d'un dégradé entre deux couleurs ne fonctionne pas."
+        )
+
+
+def test_get_gradient_single_step():
+    """Test le calcul d'un dégradé d'une seule couleur.
+
+    Raises:
+        AssertionError: Un dégradé d'une seule couleur doit renvoyer le milieu du dégradé.
+    """
+    first_color, last_color = (10, 30, 200), (220, 40, 20)
+    if not np.array_equal(
+        get_gradient(first_color, last_color, 1),
+        get_gradient(first_color, last_color, 3)[1:2],
+    ) or not np.array_equal(
+        get_gradient(first_color, last_color, 1, 0.5),
+        get_gradient(first_color, last_color, 5)[1:2],
+    ):
+        raise AssertionError(
+            "Un dégradé d'une seule couleur doit renvoyer le milieu du dégradé."
+        )
+
+
+def test_delta_e():
+    """Test le calcul vectorisé du delta E 76 entre plusieurs couleurs et une référence.
+
+    Raises:
+        AssertionError: Le calcul du delta E entre plusieurs couleurs ne fonctionne pas.
+    """
+    distances = delta_e(np.array([[0, 0, 0], [255, 255, 255]]), np.array([0, 0, 0]))
+    if not np.allclose(distances, [0.0, 100.0]):
+        raise AssertionError(
+            "Le calcul du delta E entre plusieurs couleurs ne fonctionne pas."
+        )
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_compositor.py
+"""
+import numpy as np
+
+from app.generation_nft.libraries.compositor.compositor import (
+    new_layer,
+    over,
+    paste,
+    to_layer,
+)
+
+
+def test_paste():
+    """Test le collage d'une partie dont le blanc est transparent, partiellement hors du fond.
+
+    Raises:
+        AssertionError: Le collage d'une partie sur le fond ne fonctionne pas.
+    """
+    background = new_layer(4, 4, (0, 0, 0))
+    part = new_layer(2, 2, (255, 255, 255))
+    part[1, 1] = (10, 20, 30)
+    paste(background, part, (-1, 2))
+    if (
+        not np.array_equal(background[3, 0], [10, 20, 30])
+        or np.count_nonzero(background) != 3
+    ):
+        raise AssertionError("Le collage d'une partie sur le fond ne fonctionne pas.")
+
+
+def test_over():
+    """Test la composition "over" d'un calque semi-transparent sur un fond opaque.
+
+    Raises:
+        AssertionError: La composition d'un calque semi-transparent ne fonctionne pas.
+    """
+    background = new_layer(1, 1, (0, 0, 0, 255))
+    layer = to_layer(new_layer(1, 1, (200, 100, 50)))
+    layer[:, :, 3] = 128
+    over(background, layer)
+    if not np.array_equal(background[0, 0], [100, 50, 25, 255]):
+        raise AssertionError(
+            "La composition d'un calque semi-transparent ne fonctionne pas."
+        )
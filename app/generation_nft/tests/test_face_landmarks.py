@@ -34,6 +34,7 @@ import pytest
 from app.generation_nft.libraries.face.face_landmarks.face_landmarks import (
     FaceLandmarks,
 )
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
 from app.generation_nft.libraries.face.face_styling.face_styling import FaceStyling
 from app.settings import settings
 
@@ -176,3 +177,18 @@ def test_face_landmark_check(landmarks_check: Union[list, None]):
         raise AssertionError(
             "La librairie face_landmark n'a détectée aucun visage ou ne fonctionne pas correctement."
         )
+
+
+def test_landmarks_add_points():
+    """Test l'ajout des points situés entre deux points.
+
+    Raises:
+        AssertionError: Les points ajoutés ne sont pas au milieu des deux points.
+    """
+    landmarks = Landmarks(np.array([[0, 0, 0.0], [10, 5, 1.0], [3, 9, 0.5]]))
+    landmarks = landmarks.add_points([[0, 1], [1, 2], [3, 4]])
+    expected = np.array([[5, 2], [6, 7], [5, 4]])
+    if len(landmarks) != 6 or not np.array_equal(landmarks.xy[3:], expected):
+        raise AssertionError(
+            "Les points ajoutés ne sont pas au milieu des deux points."
+        )
@@ -29,8 +29,13 @@ from pathlib import Path
 import cv2 as open_cv
 import numpy as np
 import pytest
+import torch
 
-from app.generation_nft.libraries.face.face_parsing.face_parsing import FaceParsing
+from app.generation_nft.libraries.face.face_parsing.face_parsing import (
+    FaceParsing,
+    load_face_parsing_model,
+)
+from app.generation_nft.libraries.face.face_parsing.model import BiSeNet
 from app.generation_nft.libraries.face.face_styling.face_styling import FaceStyling
 from app.settings import settings
 
@@ -125,3 +130,20 @@ def test_image(image: np.array):
 
     if image.shape[0] != 1388 or image.shape[1] != 1200:
         raise AssertionError("L'image n'est pas de la bonne taille.")
+
+
+def test_load_face_parsing_model(tmp_path: Path):
+    """Test que le modèle de face parsing n'est construit qu'une fois par processus.
+
+    Args:
+        tmp_path (Path): dossier temporaire.
+    """
+    weights_path = tmp_path / "face_parts.pth"
+    torch.save(BiSeNet(resnet=None, n_classes=19).state_dict(), weights_path)
+
+    model = load_face_parsing_model(str(weights_path), "cpu", 19, 512)
+    if model.training:
+        raise AssertionError("Le modèle doit être en mode évaluation.")
+    if load_face_parsing_model(str(weights_path), "cpu", 19, 512) is not model:
+        raise AssertionError("Le modèle doit être réutilisé entre deux instances.")
+    load_face_parsing_model.cache_clear()
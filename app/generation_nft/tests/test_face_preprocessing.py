@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_face_preprocessing.py
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
+from app.generation_nft.libraries.face.face_preprocessing.face_preprocessing import (
+    PreprocessedFace,
+    get_preprocessed_face_path,
+    load_preprocessed_face,
+    save_preprocessed_face,
+)
+from app.settings import settings
+
+
+@pytest.fixture
+def preprocessed_face() -> PreprocessedFace:
+    """Visage prétraité.
+
+    Returns:
+        PreprocessedFace: visage prétraité.
+    """
+    generator = np.random.default_rng(0)
+    return PreprocessedFace(
+        face=generator.integers(0, 255, (64, 64, 3), dtype=np.uint8),
+        landmarks=Landmarks(generator.random((478, 3))),
+        parsing=generator.integers(0, 19, (64, 64)),
+    )
+
+
+def test_save_preprocessed_face(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    preprocessed_face: PreprocessedFace,
+):
+    """Test l'enregistrement et le chargement d'un visage prétraité.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+        tmp_path (Path): dossier temporaire.
+        preprocessed_face (PreprocessedFace): visage prétraité.
+
+    Raises:
+        AssertionError: Aucun visage prétraité ne doit être trouvé.
+        AssertionError: Le visage prétraité doit provenir du cache.
+        AssertionError: Le visage prétraité chargé est différent.
+    """
+    monkeypatch.setattr(settings, "FACE_PREPROCESSING_CACHE_PATH", str(tmp_path))
+
+    if load_preprocessed_face("cid") is not None:
+        raise AssertionError("Aucun visage prétraité ne doit être trouvé.")
+
+    save_preprocessed_face("cid", preprocessed_face)
+    cached_face = load_preprocessed_face("cid")
+
+    if cached_face is None or not cached_face.cached:
+        raise AssertionError("Le visage prétraité doit provenir du cache.")
+    if (
+        not np.array_equal(cached_face.face, preprocessed_face.face)
+        or not np.array_equal(
+            cached_face.landmarks.points, preprocessed_face.landmarks.points
+        )
+        or not np.array_equal(cached_face.parsing, preprocessed_face.parsing)
+        or list(tmp_path.iterdir()) != [get_preprocessed_face_path("cid")]
+    ):
+        raise AssertionError("Le visage prétraité chargé est différent.")
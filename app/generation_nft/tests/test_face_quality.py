@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_face_quality.py
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import cv2 as open_cv
+import numpy as np
+import pytest
+
+from app.generation_nft.libraries.face.face_landmarks.face_landmarks import (
+    FaceLandmarks,
+)
+from app.generation_nft.libraries.face.face_quality import face_quality
+from app.generation_nft.libraries.face.face_quality.face_quality import (
+    FaceQuality,
+    get_quality_gate_metrics,
+)
+from app.generation_nft.libraries.face.face_styling.face_styling import FaceStyling
+from app.generation_nft.libraries.face.tilt_learning.tilt_learning import (
+    TiltLearning,
+    get_tilt_ensemble,
+)
+from app.settings import settings
+
+
+class QualityGate(FaceQuality, FaceLandmarks, FaceStyling, TiltLearning):
+    """Contrôle qualité des visages sans téléchargement des modèles."""
+
+    def __init__(self):
+        """Initialise le contrôle qualité des visages."""
+        FaceLandmarks.__init__(self, min_detection_confidence=0.8)
+        FaceStyling.__init__(self)
+        FaceQuality.__init__(self)
+        self.player = type("Player", (), {"code": "TEST"})()
+        self.player_code = self.player.code
+        self.tilt_ensemble = get_tilt_ensemble(
+            f"{settings.TILT_LEARNING_MODELS_PATH}/tilt_learning", ("mc", "svc")
+        )
+
+
+@pytest.fixture
+def face() -> np.array:
+    """Visage.
+
+    Returns:
+        np.array: visage.
+    """
+    image_path = Path(f"{settings.GENERATION_NFT_PATH}/tests/pictures/test_one.jpg")
+    return open_cv.imread(f"{image_path.parent}/{image_path.name}")
+
+
+def test_select_faces(face: np.array):
+    """Test le rejet des visages candidats avant le face parsing.
+
+    Args:
+        face (np.array): visage.
+
+    Raises:
+        AssertionError: Seul le visage valide doit être conservé.
+        AssertionError: Les landmarks du visage conservé doivent être renseignés.
+        AssertionError: Les raisons de rejet sont incorrectes.
+    """
+    quality_gate = QualityGate()
+    quality_gate.face_confidences = [0.99, 0.99, 0.99, 0.5]
+    faces = [face, face[:30, :30], np.full((200, 200, 3), 255, np.uint8), face]
+    before = get_quality_gate_metrics()
+
+    candidates = list(quality_gate.select_faces(faces))
+
+    after = get_quality_gate_metrics()
+    if len(candidates) != 1 or candidates[0].face is not face:
+        raise AssertionError("Seul le visage valide doit être conservé.")
+    if candidates[0].landmarks is None:
+        raise AssertionError(
+            "Les landmarks du visage conservé doivent être renseignés."
+        )
+    rejected = {
+        reason: after["rejected"][reason] - count
+        for reason, count in before["rejected"].items()
+        if after["rejected"][reason] != count
+    }
+    if rejected != {"too_small": 1, "no_landmarks": 1, "low_confidence": 1}:
+        raise AssertionError("Les raisons de rejet sont incorrectes.")
+
+
+def test_select_faces_parallel(face: np.array, monkeypatch: pytest.MonkeyPatch):
+    """Test l'évaluation en parallèle et le classement des visages candidats.
+
+    Args:
+        face (np.array): visage.
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    Raises:
+        AssertionError: Les visages doivent être essayés dans l'ordre de détection.
+        AssertionError: L'évaluation en parallèle doit donner les mêmes visages.
+    """
+    quality_gate = QualityGate()
+    quality_gate.face_confidences = [0.85, 0.99, 0.99]
+    faces = [face, face.copy(), face[:30, :30]]
+
+    candidates = list(quality_gate.select_faces(faces))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        monkeypatch.setattr(face_quality, "FACE_CANDIDATE_EXECUTOR", executor)
+        parallel_candidates = list(quality_gate.select_faces(faces))
+
+    if [candidate.confidence for candidate in candidates] != [0.85, 0.99]:
+        raise AssertionError(
+            "Les visages doivent être essayés dans l'ordre de détection."
+        )
+    if [
+        (candidate.confidence, candidate.front, candidate.landmarks is not None)
+        for candidate in parallel_candidates
+    ] != [(candidate.confidence, candidate.front, True) for candidate in candidates]:
+        raise AssertionError("L'évaluation en parallèle doit donner les mêmes visages.")
@@ -170,3 +170,25 @@ def test_get_coordinates_from_points(
         raise AssertionError(
             "La récupération de plusieurs variables d'une coordonnées n'a pas fonctionnée."
         )
+
+
+def test_draw_gradient_triangle(face_styling: FaceStyling):
+    """Test le dégradé de deux triangles adjacents.
+
+    Args:
+        face_styling (FaceStyling):  face styling instance.
+
+    Raises:
+        AssertionError: Le dégradé de deux triangles adjacents laisse des pixels manquants.
+    """
+    color = np.array([0, 0, 200])
+    mask_part = face_styling.draw_gradient_triangle(
+        np.full((10, 10, 3), 255, dtype=np.uint8),
+        np.array([[0, 0], [9, 0], [9, 9], [0, 9]]),
+        np.tile(color, (4, 1)),
+        [[0, 1, 2], [0, 2, 3]],
+    )
+    if not np.all(mask_part == color):
+        raise AssertionError(
+            "Le dégradé de deux triangles adjacents laisse des pixels manquants."
+        )
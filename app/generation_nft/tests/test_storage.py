@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_storage.py
+"""
+import json
+
+from app.exceptions import PronochainException
+from app.generation_nft.libraries.storage.cid import compute_cids, digest_to_cid
+from app.generation_nft.libraries.storage.constants import Codec
+from app.generation_nft.libraries.storage.models import ResponseStorage
+from app.generation_nft.libraries.storage.storage import Storage
+from app.settings import settings
+
+EMPTY_SHA256 = bytes.fromhex(
+    "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+)
+
+
+def test_digest_to_cid():
+    """Test la construction d'un CIDv1 à partir d'une empreinte sha256.
+
+    Raises:
+        AssertionError: La construction d'un CIDv1 ne fonctionne pas.
+    """
+    if (
+        digest_to_cid(EMPTY_SHA256)
+        != "bafkreihdwdcefgh4dqkjv67uzcmw7ojee6xedzdetojuzjevtenxquvyku"
+        or digest_to_cid(EMPTY_SHA256, Codec.DAG_PB)
+        != "bafybeihdwdcefgh4dqkjv67uzcmw7ojee6xedzdetojuzjevtenxquvyku"
+    ):
+        raise AssertionError("La construction d'un CIDv1 ne fonctionne pas.")
+
+
+def test_compute_cids(tmp_path, monkeypatch):
+    """Test le calcul des CID de plusieurs fichiers et leur mise en cache.
+
+    Raises:
+        AssertionError: Le calcul des CID de plusieurs fichiers ne fonctionne pas.
+        AssertionError: Un fichier manquant doit être ignoré.
+        AssertionError: La mise en cache des CID ne fonctionne pas.
+    """
+    cache_file = tmp_path / "cids.json"
+    monkeypatch.setattr(settings, "CID_CACHE_FILE", str(cache_file))
+    empty_file, other_file = tmp_path / "empty.png", tmp_path / "other.png"
+    empty_file.write_bytes(b"")
+    other_file.write_bytes(b"pronochain")
+
+    cids = compute_cids([str(other_file), str(empty_file), str(other_file)])
+    if (
+        cids[1] != digest_to_cid(EMPTY_SHA256)
+        or cids[0] != cids[2]
+        or cids[0] == cids[1]
+    ):
+        raise AssertionError(
+            "Le calcul des CID de plusieurs fichiers ne fonctionne pas."
+        )
+
+    if compute_cids([str(tmp_path / "missing.png"), str(empty_file)]) != [
+        None,
+        cids[1],
+    ]:
+        raise AssertionError("Un fichier manquant doit être ignoré.")
+
+    digest_cache = json.loads(cache_file.read_text())
+    digest_cache[str(empty_file)][2] = "00" * 32
+    cache_file.write_text(json.dumps(digest_cache))
+    if compute_cids([str(empty_file)]) != [digest_to_cid(bytes(32))]:
+        raise AssertionError("La mise en cache des CID ne fonctionne pas.")
+
+
+def test_add_many(monkeypatch):
+    """Test l'ajout de plusieurs éléments et l'annulation en cas d'erreur.
+
+    Raises:
+        AssertionError: L'ajout de plusieurs éléments ne fonctionne pas.
+        AssertionError: Les éléments ajoutés ne sont pas supprimés en cas d'erreur.
+    """
+    deleted = []
+
+    def add(self, file: bytes, is_bytes: bool = False) -> ResponseStorage:
+        if file == b"error":
+            raise PronochainException("error")
+        return ResponseStorage(ok=True, value={"cid": file.decode()})
+
+    def delete_quietly(self, cid: str) -> bool:
+        deleted.append(cid)
+        return True
+
+    monkeypatch.setattr(Storage, "add", add)
+    monkeypatch.setattr(Storage, "delete_quietly", delete_quietly)
+    storage = Storage()
+
+    if storage.add_many([b"a", b"b", b"c"]) != ["a", "b", "c"] or deleted:
+        raise AssertionError("L'ajout de plusieurs éléments ne fonctionne pas.")
+    try:
+        storage.add_many([b"a", b"error", b"c"])
+    except PronochainException:
+        pass
+    if sorted(deleted) != ["a", "c"]:
+        raise AssertionError(
+            "Les éléments ajoutés ne sont pas supprimés en cas d'erreur."
+        )
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_threads.py
+"""
+import cv2 as open_cv
+import pytest
+
+from app.exceptions import PronochainException
+from app.generation_nft.threads import configure_threads, parse_cpu_list
+from app.settings import settings
+
+
+def test_parse_cpu_list():
+    """Test la lecture d'une liste de CPU.
+
+    Raises:
+        AssertionError: Les CPU et intervalles doivent être triés et dédoublonnés.
+        AssertionError: Une liste invalide doit lever une exception.
+    """
+    if parse_cpu_list("6, 0-2,1") != [0, 1, 2, 6]:
+        raise AssertionError(
+            "Les CPU et intervalles doivent être triés et dédoublonnés."
+        )
+    for cpu_list in ("", "a-b", "0,,1"):
+        with pytest.raises(PronochainException):
+            parse_cpu_list(cpu_list)
+
+
+def test_configure_threads(monkeypatch: pytest.MonkeyPatch):
+    """Test l'application du nombre de threads d'OpenCV.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    Raises:
+        AssertionError: Le nombre de threads d'OpenCV doit être appliqué.
+    """
+    threads = open_cv.getNumThreads()
+    monkeypatch.setattr(settings, "OPENCV_THREADS", 1)
+    try:
+        if configure_threads()["opencv_threads"] != 1 or open_cv.getNumThreads() != 1:
+            raise AssertionError("Le nombre de threads d'OpenCV doit être appliqué.")
+    finally:
+        open_cv.setNumThreads(threads)
@@ -44,7 +44,13 @@ from app.generation_nft.libraries.face.face_landmarks.face_landmarks import (
     FaceLandmarks,
 )
 from app.generation_nft.libraries.face.face_styling.face_styling import FaceStyling
-from app.generation_nft.libraries.face.tilt_learning.tilt_learning import TiltLearning
+from app.generation_nft.libraries.face.tilt_learning.constants import (
+    TILT_LEARNING_FEATURES,
+)
+from app.generation_nft.libraries.face.tilt_learning.tilt_learning import (
+    TiltEnsemble,
+    TiltLearning,
+)
 from app.settings import settings
 
 warnings.filterwarnings("ignore")
@@ -295,3 +301,31 @@ def test_is_looking_front(
 
     if tilt_learning.is_looking_front(datasets):
         raise AssertionError("Le visage ne regarde pas en face.")
+
+
+def test_tilt_ensemble_predict_many():
+    """Test la prédiction groupée de l'ensemble des modèles de tilt learning.
+
+    Raises:
+        AssertionError: Le nombre de prédictions est incorrect.
+        AssertionError: Un modèle indisponible doit être mis en cache.
+        AssertionError: Les modèles doivent être chargés une seule fois.
+    """
+    ensemble = TiltEnsemble(
+        f"{settings.TILT_LEARNING_MODELS_PATH}/tilt_learning", ("mc", "svc", "missing")
+    )
+    datasets = [
+        dict.fromkeys(TILT_LEARNING_FEATURES, 0),
+        dict.fromkeys(TILT_LEARNING_FEATURES, 50),
+        dict.fromkeys(TILT_LEARNING_FEATURES, -50),
+    ]
+    predictions = ensemble.predict_many(datasets)
+
+    if len(predictions) != len(datasets):
+        raise AssertionError("Le nombre de prédictions est incorrect.")
+    if "missing" not in ensemble.models or ensemble.models["missing"] is not None:
+        raise AssertionError("Un modèle indisponible doit être mis en cache.")
+    model = ensemble.models["mc"]
+    ensemble.predict_many(datasets[:1])
+    if ensemble.models["mc"] is not model:
+        raise AssertionError("Les modèles doivent être chargés une seule fois.")
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_timing.py
+"""
+import pytest
+
+from app.generation_nft.timing import (
+    NULL_SPAN,
+    STAGE_DURATION_METRIC,
+    StageTimings,
+    job_timings,
+    span,
+    stage_timings,
+    timed,
+)
+from app.settings import settings
+
+
+@timed("stage")
+def stage():
+    """Étape mesurée."""
+
+
+def test_timing_disabled(monkeypatch: pytest.MonkeyPatch):
+    """Test que rien n'est mesuré lorsque les mesures sont désactivées.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    Raises:
+        AssertionError: Le span doit être vide.
+        AssertionError: Aucune durée ne doit être mesurée.
+    """
+    monkeypatch.setattr(settings, "TIMING_ENABLED", False)
+    monkeypatch.setattr(stage_timings, "histograms", {})
+
+    if span("stage") is not NULL_SPAN:
+        raise AssertionError("Le span doit être vide.")
+    with job_timings("test") as job:
+        stage()
+
+    if job.stages or stage_timings.histograms:
+        raise AssertionError("Aucune durée ne doit être mesurée.")
+
+
+def test_timing_enabled(monkeypatch: pytest.MonkeyPatch):
+    """Test la mesure des étapes d'une génération.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    Raises:
+        AssertionError: Les étapes de la génération sont incorrectes.
+        AssertionError: Les histogrammes sont incorrects.
+    """
+    monkeypatch.setattr(settings, "TIMING_ENABLED", True)
+    monkeypatch.setattr(stage_timings, "histograms", {})
+
+    with job_timings("test") as job:
+        stage()
+        stage()
+        with span("block"):
+            pass
+    stage()
+
+    if {name: len(durations) for name, durations in job.stages.items()} != {
+        "stage": 2,
+        "block": 1,
+        "total": 1,
+    }:
+        raise AssertionError("Les étapes de la génération sont incorrectes.")
+    if {name: h.count for name, h in stage_timings.histograms.items()} != {
+        "stage": 3,
+        "block": 1,
+        "total": 1,
+    }:
+        raise AssertionError("Les histogrammes sont incorrects.")
+
+
+def test_stage_timings_render(monkeypatch: pytest.MonkeyPatch):
+    """Test le format Prometheus des histogrammes.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    Raises:
+        AssertionError: Les intervalles doivent être cumulatifs.
+        AssertionError: La somme et le nombre de durées sont incorrects.
+    """
+    monkeypatch.setattr(settings, "TIMING_BUCKETS", [0.1, 1.0])
+    timings = StageTimings()
+    for duration in (0.05, 0.5, 2.0):
+        timings.observe("parsing", duration)
+    lines = timings.render()
+
+    if lines[2:5] != [
+        f'{STAGE_DURATION_METRIC}_bucket{{stage="parsing",le="0.1"}} 1',
+        f'{STAGE_DURATION_METRIC}_bucket{{stage="parsing",le="1.0"}} 2',
+        f'{STAGE_DURATION_METRIC}_bucket{{stage="parsing",le="+Inf"}} 3',
+    ]:
+        raise AssertionError("Les intervalles doivent être cumulatifs.")
+    if lines[5:] != [
+        f'{STAGE_DURATION_METRIC}_sum{{stage="parsing"}} 2.55',
+        f'{STAGE_DURATION_METRIC}_count{{stage="parsing"}} 3',
+    ]:
+        raise AssertionError("La somme et le nombre de durées sont incorrects.")
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/tests/test_warmup.py
+"""
+import pytest
+
+from app.generation_nft.warmup import (
+    WarmupState,
+    WarmupStatus,
+    get_warmup_status,
+    run_warmup,
+    warmup_status,
+)
+from app.settings import settings
+
+
+def failing_step():
+    """Étape du préchauffage en échec.
+
+    Raises:
+        RuntimeError: Modèle introuvable.
+    """
+    raise RuntimeError("Modèle introuvable.")
+
+
+@pytest.fixture(autouse=True)
+def status(monkeypatch: pytest.MonkeyPatch):
+    """Isole l'état du préchauffage de chaque test.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+    """
+    new_status = WarmupStatus()
+    for attribute in ("lock", "state", "duration", "steps"):
+        monkeypatch.setattr(warmup_status, attribute, getattr(new_status, attribute))
+    monkeypatch.setattr(settings, "WARMUP_RETRY_DELAY", 0)
+
+
+def test_warmup_disabled():
+    """Test qu'un worker sans préchauffage est prêt.
+
+    Raises:
+        AssertionError: Le worker doit être prêt.
+    """
+    if not get_warmup_status()["ready"]:
+        raise AssertionError("Le worker doit être prêt.")
+
+
+def test_run_warmup():
+    """Test l'exécution des étapes du préchauffage.
+
+    Raises:
+        AssertionError: Le préchauffage doit réussir.
+        AssertionError: Une étape en échec doit être signalée sans interrompre les suivantes.
+        AssertionError: Le worker ne doit pas être prêt.
+    """
+    if not run_warmup([("models", lambda: "2 modèles")]) or not (
+        get_warmup_status()["ready"]
+    ):
+        raise AssertionError("Le préchauffage doit réussir.")
+
+    succeeded = run_warmup([("models", failing_step), ("fonts", lambda: None)])
+    status = get_warmup_status()
+    if (
+        succeeded
+        or status["steps"]["models"]["state"] != WarmupState.FAILED.value
+        or status["steps"]["models"]["detail"] != "Modèle introuvable."
+        or status["steps"]["fonts"]["state"] != WarmupState.READY.value
+    ):
+        raise AssertionError(
+            "Une étape en échec doit être signalée sans interrompre les suivantes."
+        )
+    if status["ready"] or status["state"] != WarmupState.FAILED.value:
+        raise AssertionError("Le worker ne doit pas être prêt.")
+
+
+def test_run_warmup_retry():
+    """Test des nouveaux essais et des étapes optionnelles du préchauffage.
+
+    Raises:
+        AssertionError: Une étape en échec passager doit réussir au nouvel essai.
+        AssertionError: Une étape optionnelle en échec doit laisser le worker prêt.
+    """
+    attempts = []
+
+    def flaky_step():
+        attempts.append(1)
+        if len(attempts) <= settings.WARMUP_RETRIES:
+            failing_step()
+        return None
+
+    if not run_warmup([("assets", flaky_step)]):
+        raise AssertionError(
+            "Une étape en échec passager doit réussir au nouvel essai."
+        )
+
+    succeeded = run_warmup(
+        [("models", lambda: None), ("assets", failing_step)], optional_steps={"assets"}
+    )
+    status = get_warmup_status()
+    if (
+        succeeded
+        or not status["ready"]
+        or status["state"] != WarmupState.DEGRADED.value
+        or status["steps"]["assets"]["state"] != WarmupState.FAILED.value
+    ):
+        raise AssertionError(
+            "Une étape optionnelle en échec doit laisser le worker prêt."
+        )
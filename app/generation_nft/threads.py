@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/threads.py
+"""
+import os
+from typing import List
+
+from app import logger
+from app.exceptions import PronochainException
+from app.settings import settings
+
+
+def parse_cpu_list(cpu_list: str) -> List[int]:
+    """Récupère les CPU d'une liste au format de taskset, ex. "0-3,8".
+
+    Args:
+        cpu_list (str): liste de CPU et d'intervalles de CPU.
+
+    Raises:
+        PronochainException: liste de CPU invalide.
+
+    Returns:
+        List[int]: CPU triés.
+    """
+    cpus = set()
+    try:
+        for cpu_range in cpu_list.split(","):
+            first, _, last = cpu_range.strip().partition("-")
+            cpus.update(range(int(first), int(last or first) + 1))
+    except ValueError as err:
+        raise PronochainException(f"Liste de CPU invalide : {cpu_list}.", err)
+    if not cpus:
+        raise PronochainException(f"Liste de CPU invalide : {cpu_list}.")
+    return sorted(cpus)
+
+
+def set_cpu_affinity(cpu_list: str):
+    """Restreint le worker aux CPU de la liste, les threads créés ensuite en héritent.
+
+    Args:
+        cpu_list (str): liste de CPU, ex. "0-3,8".
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("Affinité CPU non supportée par la plateforme, ignorée.")
+        return
+    os.sched_setaffinity(0, parse_cpu_list(cpu_list))
+
+
+def set_opencv_threads():
+    """Configure les threads d'OpenCV.
+
+    OpenCV n'est importé que si le réglage est défini : les workers CRUD ne le chargent pas.
+    """
+    if settings.OPENCV_THREADS is None:
+        return
+    import cv2 as open_cv
+
+    open_cv.setNumThreads(settings.OPENCV_THREADS)
+
+
+def set_torch_threads():
+    """Configure les threads de torch (face parsing BiSeNet).
+
+    torch n'est importé que si un réglage est défini : les workers CRUD ne le chargent pas.
+    """
+    if settings.TORCH_THREADS is None and settings.TORCH_INTEROP_THREADS is None:
+        return
+    import torch
+
+    if settings.TORCH_THREADS is not None:
+        torch.set_num_threads(settings.TORCH_THREADS)
+    if settings.TORCH_INTEROP_THREADS is not None:
+        try:
+            torch.set_num_interop_threads(settings.TORCH_INTEROP_THREADS)
+        except RuntimeError as err:
+            # possible une seule fois, avant le premier calcul parallèle de torch
+            logger.warning(f"Threads inter-opérations de torch inchangés : {err}")
+
+
+def configure_threads() -> dict:
+    """Applique au démarrage du worker l'affinité CPU et le nombre de threads d'OpenCV et de torch.
+
+    L'affinité est appliquée en premier : elle borne aussi les threads de MediaPipe,
+    dont le nombre n'est pas configurable.
+
+    Returns:
+        dict: réglages appliqués, None si laissé par défaut.
+    """
+    if settings.WORKER_CPU_AFFINITY is not None:
+        set_cpu_affinity(settings.WORKER_CPU_AFFINITY)
+    set_opencv_threads()
+    set_torch_threads()
+
+    threads = {
+        "cpu_affinity": settings.WORKER_CPU_AFFINITY,
+        "opencv_threads": settings.OPENCV_THREADS,
+        "torch_threads": settings.TORCH_THREADS,
+        "torch_interop_threads": settings.TORCH_INTEROP_THREADS,
+    }
+    logger.info(f"Threads du worker : {threads}")
+    return threads
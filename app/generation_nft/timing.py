@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/timing.py
+"""
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional
+
+from app import logger
+from app.settings import settings
+
+STAGE_DURATION_METRIC = "generation_stage_duration_seconds"
+NULL_SPAN = nullcontext()  # span utilisé lorsque les mesures sont désactivées
+
+
+class StageHistogram(object):
+    """Histogramme cumulatif des durées d'une étape, au format Prometheus."""
+
+    def __init__(self, buckets: List[float]):
+        """Initialise l'histogramme.
+
+        Args:
+            buckets (List[float]): bornes supérieures des intervalles, en secondes.
+        """
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # dernier intervalle : +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, duration: float):
+        """Ajoute une durée.
+
+        Args:
+            duration (float): durée en secondes.
+        """
+        self.counts[bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.sum += duration
+
+
+class StageTimings(object):
+    """Histogrammes des durées de chaque étape de la génération, partagés par le processus."""
+
+    def __init__(self):
+        """Initialise les histogrammes."""
+        self.lock = Lock()
+        self.histograms: Dict[str, StageHistogram] = {}
+
+    def observe(self, stage: str, duration: float):
+        """Ajoute la durée d'une étape.
+
+        Args:
+            stage (str): nom de l'étape.
+            duration (float): durée en secondes.
+        """
+        with self.lock:
+            if (histogram := self.histograms.get(stage)) is None:
+                histogram = self.histograms[stage] = StageHistogram(
+                    settings.TIMING_BUCKETS
+                )
+            histogram.observe(duration)
+
+    def render(self) -> List[str]:
+        """Convertit les histogrammes au format texte Prometheus.
+
+        Returns:
+            List[str]: lignes de l'histogramme.
+        """
+        lines = [
+            f"# HELP {STAGE_DURATION_METRIC} Durée des étapes de la génération des NFT.",
+            f"# TYPE {STAGE_DURATION_METRIC} histogram",
+        ]
+        with self.lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bucket, count in zip(
+                    [*map(str, histogram.buckets), "+Inf"], histogram.counts
+                ):
+                    cumulative += count
+                    lines.append(
+                        f'{STAGE_DURATION_METRIC}_bucket{{stage="{stage}",le="{bucket}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{STAGE_DURATION_METRIC}_sum{{stage="{stage}"}} {histogram.sum}'
+                )
+                lines.append(
+                    f'{STAGE_DURATION_METRIC}_count{{stage="{stage}"}} {histogram.count}'
+                )
+        return lines
+
+
+class JobTimings(object):
+    """Durées des étapes d'une génération."""
+
+    def __init__(self):
+        """Initialise les durées."""
+        self.stages: Dict[str, List[float]] = {}
+
+    def add(self, stage: str, duration: float):
+        """Ajoute la durée d'une étape, une étape peut être mesurée plusieurs fois.
+
+        Args:
+            stage (str): nom de l'étape.
+            duration (float): durée en secondes.
+        """
+        self.stages.setdefault(stage, []).append(duration)
+
+    def totals(self) -> Dict[str, float]:
+        """Récupère la durée totale de chaque étape.
+
+        Returns:
+            Dict[str, float]: durée totale de chaque étape, en secondes.
+        """
+        return {stage: sum(durations) for stage, durations in self.stages.items()}
+
+    def __str__(self) -> str:
+        """Résumé des durées, des plus longues aux plus courtes.
+
+        Returns:
+            str: résumé des durées.
+        """
+        return ", ".join(
+            f"{stage}={duration:.3f}s"
+            for stage, duration in sorted(
+                self.totals().items(), key=lambda item: item[1], reverse=True
+            )
+        )
+
+
+stage_timings = StageTimings()
+current_job: ContextVar[Optional[JobTimings]] = ContextVar("current_job", default=None)
+
+
+def record(stage: str, duration: float):
+    """Enregistre la durée d'une étape dans les histogrammes et la génération en cours.
+
+    Args:
+        stage (str): nom de l'étape.
+        duration (float): durée en secondes.
+    """
+    stage_timings.observe(stage, duration)
+    if (job := current_job.get()) is not None:
+        job.add(stage, duration)
+
+
+@contextmanager
+def measure(stage: str) -> Iterator[None]:
+    """Mesure la durée du bloc.
+
+    Args:
+        stage (str): nom de l'étape.
+
+    Yields:
+        Iterator[None]: bloc mesuré.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+
+def span(stage: str) -> ContextManager:
+    """Mesure une étape si TIMING_ENABLED, sinon ne fait rien.
+
+    Args:
+        stage (str): nom de l'étape.
+
+    Returns:
+        ContextManager: bloc mesuré.
+    """
+    return measure(stage) if settings.TIMING_ENABLED else NULL_SPAN
+
+
+def timed(stage: str = None) -> Callable:
+    """Décorateur mesurant chaque appel de la fonction si TIMING_ENABLED.
+
+    Args:
+        stage (str, optional): nom de l'étape. Défaut au nom de la fonction.
+
+    Returns:
+        Callable: décorateur.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = stage or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not settings.TIMING_ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def job_timings(name: str) -> Iterator[JobTimings]:
+    """Regroupe les durées mesurées pendant une génération.
+
+    Args:
+        name (str): nom de la génération, utilisé dans les logs.
+
+    Yields:
+        Iterator[JobTimings]: durées de la génération.
+    """
+    job = JobTimings()
+    token = current_job.set(job)
+    start = time.perf_counter()
+    try:
+        yield job
+    finally:
+        current_job.reset(token)
+        if settings.TIMING_ENABLED:
+            duration = time.perf_counter() - start
+            stage_timings.observe("total", duration)
+            job.add("total", duration)
+            logger.info(f"Durées de {name} : {job}")
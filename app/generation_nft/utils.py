@@ -31,11 +31,12 @@ from typing import List, Optional, Tuple
 
 import cv2 as open_cv
 import numpy as np
-from coloraide import Color
 from mediapipe.python.solutions.drawing_utils import DrawingSpec
 from scipy.interpolate import splev, splprep
 
 from app.exceptions import PronochainException
+from app.generation_nft.colors import get_shade
+from app.generation_nft.libraries.face.face_landmarks.landmarks import Landmarks
 from app.settings import settings
 
 
@@ -138,19 +139,6 @@ def take_closest(value: int, collection: list) -> int:
     return min(collection, key=lambda x: abs(x - value))
 
 
-def multiply_array(color: np.array, mask_colors: np.array) -> np.array:
-    """Multiplie le masque et la couleur ensemble.
-
-    Args:
-        color (np.array): couleur.
-        mask_colors (np.array): masque.
-
-    Returns:
-        np.array: masque et couleur multiplier
-    """
-    return np.asmatrix(mask_colors).T @ np.asmatrix(color)
-
-
 def draw_contours(
     visual_mask_part: np.array,
     visual_mask_color_hsv: np.array,
@@ -239,37 +227,6 @@ def get_angle(
     return int(round(ang + 360 if ang < 0 else ang))
 
 
-def normalize_values(face: np.array, landmarks: list, with_index: bool = False) -> list:
-    """Normalise les points du visage.
-
-    Args:
-        face (np.array): visage.
-        landmarks (list): points du visage.
-        with_index (bool, optional): avec index ? Défaut à False.
-
-    Returns:
-        list: liste de points du visage normalisée.
-    """
-    normalized_landmarks = []
-    (height, width, _) = face.shape
-    list_z = sorted(
-        [
-            getattr(landmark.get("info") if with_index else landmark, "z")
-            for landmark in landmarks
-        ]
-    )
-    min_z = list_z[0]
-    for landmark in landmarks:
-        landmark_info = landmark.get("info") if with_index else landmark
-        x = int(round(getattr(landmark_info, "x") * width))
-        y = int(round(getattr(landmark_info, "y") * height))
-        z = round(((getattr(landmark_info, "z") - min_z) * 10), 2)
-        normalized_landmarks.append(
-            {"index": landmark.get("index"), "info": {"x": x, "y": y, "z": z}}
-        ) if with_index else normalized_landmarks.append({"x": x, "y": y, "z": z})
-    return normalized_landmarks
-
-
 def rgb_to_hex(rgb: np.array, convert_bgr_to_rgb: bool = False) -> str:
     """Converti le RGB en HEX.
 
@@ -280,15 +237,8 @@ def rgb_to_hex(rgb: np.array, convert_bgr_to_rgb: bool = False) -> str:
     Returns:
         str: hex.
     """
-    if convert_bgr_to_rgb:
-        rgb = np.array([int(rgb[2]), int(rgb[1]), int(rgb[0])])
-    hex_color = "#"
-    for channel in rgb:
-        hexa = ("{:X}").format(channel)
-        if channel < 10 or len(hexa) < 2:
-            hexa = f"0{hexa}"
-        hex_color += hexa
-    return hex_color
+    red, green, blue = (rgb[2], rgb[1], rgb[0]) if convert_bgr_to_rgb else rgb[:3]
+    return f"#{int(red):02X}{int(green):02X}{int(blue):02X}"
 
 
 def replace_color(
@@ -607,7 +557,7 @@ def resize_parsing(crop_face: np.array, dimension_to_substract: int) -> np.array
 
 def draw_landmarks(
     image: np.array,
-    landmark_list: list,
+    landmark_list: Landmarks,
     connection_drawing_spec: DrawingSpec,
     connections: Optional[List[Tuple[int, int]]] = None,
 ):
@@ -615,7 +565,7 @@ def draw_landmarks(
 
     Args:
         image (np.array): image.
-        landmark_list (list): liste des coordonnées.
+        landmark_list (Landmarks): liste des coordonnées.
         connection_drawing_spec (DrawingSpec): connection drawing spec.
         connections (Optional[List[Tuple[int, int]]], optional): connections. Défaut à None.
     """
@@ -624,8 +574,8 @@ def draw_landmarks(
         end_idx = connection[1]
         open_cv.line(
             image,
-            (landmark_list[start_idx].get("x"), landmark_list[start_idx].get("y")),
-            (landmark_list[end_idx].get("x"), landmark_list[end_idx].get("y")),
+            landmark_list.point(start_idx),
+            landmark_list.point(end_idx),
             connection_drawing_spec.color,
             connection_drawing_spec.thickness,
             open_cv.LINE_AA,
@@ -686,39 +636,7 @@ def get_shade_color(
         bgr (bool, optional): est sous format BGR ? Défaut à True.
 
     Returns:
-        list: _description_
+        list: nuance au format BGR.
     """
-    color_hex = rgb_to_hex(color, convert_bgr_to_rgb=bgr)
-
-    color_hsl = (
-        Color(color_hex)
-        .convert("hsl")
-        .to_string(precision=0)
-        .replace("hsl(", "")
-        .replace(")", "")
-        .split(" ")
-    )
-
-    if darker:
-        new_color_percent = (
-            new_value
-            if (new_value := int(color_hsl[2].replace("%", "")) - value) > 0
-            else 0
-        )
-    else:
-        new_color_percent = (
-            new_value
-            if (new_value := int(color_hsl[2].replace("%", "")) + value) < 100
-            else 100
-        )
-
-    new_color_hsl = " ".join([color_hsl[0], color_hsl[1], f"{new_color_percent}%"])
-    new_color_srgb = (
-        Color(f"hsl({new_color_hsl})")
-        .convert("srgb")
-        .to_string(precision=0)
-        .replace("rgb(", "")
-        .replace(")", "")
-        .split(" ")
-    )
-    return [int(new_color_srgb[2]), int(new_color_srgb[1]), int(new_color_srgb[0])]
+    color = tuple(int(channel) for channel in (color if bgr else color[::-1]))
+    return list(get_shade(color, value, darker))
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/warmup.py
+"""
+import time
+from enum import Enum
+from threading import Lock, Thread
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+from app import logger
+from app.settings import settings
+
+
+class WarmupState(Enum):
+    """Classe héritant de la classe native Enum. Permet d'énumérer les états du préchauffage."""
+
+    DISABLED = "disabled"
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+    DEGRADED = "degraded"
+    FAILED = "failed"
+
+
+# états dans lesquels le worker accepte les générations
+READY_STATES = (WarmupState.DISABLED, WarmupState.READY, WarmupState.DEGRADED)
+
+
+class WarmupStatus(object):
+    """État du préchauffage des modèles du worker, partagé par le processus."""
+
+    def __init__(self):
+        """Initialise l'état, le préchauffage est désactivé tant qu'il n'a pas été lancé."""
+        self.lock = Lock()
+        self.state = WarmupState.DISABLED
+        self.duration: Optional[float] = None
+        self.steps: Dict[str, dict] = {}
+
+    def reset(self, names: List[str]):
+        """Prépare un nouveau préchauffage.
+
+        Args:
+            names (List[str]): noms des étapes.
+        """
+        with self.lock:
+            self.state = WarmupState.PENDING
+            self.duration = None
+            self.steps = {
+                name: {
+                    "state": WarmupState.PENDING.value,
+                    "duration": None,
+                    "detail": None,
+                }
+                for name in names
+            }
+
+    def set_step(
+        self,
+        name: str,
+        state: WarmupState,
+        duration: float = None,
+        detail: str = None,
+    ):
+        """Met à jour l'état d'une étape.
+
+        Args:
+            name (str): nom de l'étape.
+            state (WarmupState): état de l'étape.
+            duration (float, optional): durée de l'étape en secondes. Défaut à None.
+            detail (str, optional): détail ou erreur de l'étape. Défaut à None.
+        """
+        with self.lock:
+            self.steps[name] = {
+                "state": state.value,
+                "duration": duration,
+                "detail": detail,
+            }
+
+    def set_state(self, state: WarmupState, duration: float = None):
+        """Met à jour l'état du préchauffage.
+
+        Args:
+            state (WarmupState): état du préchauffage.
+            duration (float, optional): durée du préchauffage en secondes. Défaut à None.
+        """
+        with self.lock:
+            self.state = state
+            self.duration = duration
+
+
+warmup_status = WarmupStatus()
+
+
+def get_warmup_status() -> dict:
+    """Récupère l'état du préchauffage.
+
+    Le worker est prêt lorsque le préchauffage est terminé, dégradé (une étape optionnelle
+    en échec), ou désactivé (worker CRUD).
+
+    Returns:
+        dict: worker prêt, état et durée du préchauffage, état et durée de chaque étape.
+    """
+    with warmup_status.lock:
+        return {
+            "ready": warmup_status.state in READY_STATES,
+            "state": warmup_status.state.value,
+            "duration": warmup_status.duration,
+            "steps": {name: dict(step) for name, step in warmup_status.steps.items()},
+        }
+
+
+def run_step(step: Callable[[], Optional[str]]) -> Optional[str]:
+    """Exécute une étape du préchauffage, réessayée WARMUP_RETRIES fois avec un délai croissant.
+
+    Args:
+        step (Callable[[], Optional[str]]): fonction de l'étape.
+
+    Raises:
+        Exception: la dernière tentative de l'étape a échoué.
+
+    Returns:
+        Optional[str]: détail de l'étape.
+    """
+    for attempt in range(settings.WARMUP_RETRIES + 1):
+        try:
+            return step()
+        except Exception as err:
+            if attempt == settings.WARMUP_RETRIES:
+                raise
+            delay = settings.WARMUP_RETRY_DELAY * 2**attempt
+            logger.warning(f"Préchauffage en échec, nouvel essai dans {delay}s : {err}")
+            time.sleep(delay)
+
+
+def run_warmup(
+    steps: List[Tuple[str, Callable[[], Optional[str]]]],
+    optional_steps: Collection[str] = (),
+) -> bool:
+    """Exécute les étapes du préchauffage, une étape en échec n'interrompt pas les suivantes.
+
+    Une étape optionnelle en échec (police, images) laisse le worker prêt en mode dégradé :
+    la génération la rechargera à la demande.
+
+    Args:
+        steps (List[Tuple[str, Callable[[], Optional[str]]]]): nom et fonction de chaque étape, la fonction renvoie un détail.
+        optional_steps (Collection[str], optional): noms des étapes optionnelles. Défaut à ().
+
+    Returns:
+        bool: toutes les étapes ont réussi.
+    """
+    warmup_status.reset([name for name, _ in steps])
+    warmup_status.set_state(WarmupState.RUNNING)
+    start = time.perf_counter()
+    state = WarmupState.READY
+    for name, step in steps:
+        warmup_status.set_step(name, WarmupState.RUNNING)
+        step_start = time.perf_counter()
+        try:
+            detail = run_step(step)
+        except Exception as err:
+            if name not in optional_steps:
+                state = WarmupState.FAILED
+            elif state == WarmupState.READY:
+                state = WarmupState.DEGRADED
+            warmup_status.set_step(
+                name, WarmupState.FAILED, time.perf_counter() - step_start, str(err)
+            )
+            logger.error(f"Préchauffage {name} en échec : {err}")
+            continue
+        warmup_status.set_step(
+            name, WarmupState.READY, time.perf_counter() - step_start, detail
+        )
+
+    duration = time.perf_counter() - start
+    warmup_status.set_state(state, duration)
+    logger.info(
+        f"Préchauffage terminé en {duration:.2f}s : {get_warmup_status()['steps']}"
+    )
+    return state == WarmupState.READY
+
+
+def start_warmup() -> Optional[Thread]:
+    """Lance le préchauffage en arrière-plan si WARMUP_ENABLED.
+
+    Les modèles sont importés par le thread : l'API répond à la route de disponibilité
+    pendant le préchauffage.
+
+    Returns:
+        Optional[Thread]: thread du préchauffage, None s'il est désactivé.
+    """
+    if not settings.WARMUP_ENABLED:
+        return None
+    warmup_status.set_state(WarmupState.PENDING)
+
+    def warm_up():
+        try:
+            from app.generation_nft.warmup_steps import (
+                OPTIONAL_WARMUP_STEPS,
+                WARMUP_STEPS,
+            )
+        except Exception as err:
+            logger.error(f"Import des modèles du préchauffage en échec : {err}")
+            warmup_status.set_state(WarmupState.FAILED)
+            return
+        run_warmup(WARMUP_STEPS, OPTIONAL_WARMUP_STEPS)
+
+    thread = Thread(target=warm_up, name="warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft/warmup_steps.py
+"""
+from contextlib import ExitStack
+from typing import Optional
+
+import cv2 as open_cv
+import numpy as np
+
+from app.generation_nft.libraries.card.card import CARD_FONT_PATH, load_font
+from app.generation_nft.libraries.card.constants import (
+    COORDINATES_PARTS,
+    FONT_SIZE_NOTE,
+    Type,
+)
+from app.generation_nft.libraries.face.face_detect.constants import (
+    MIN_DETECTION_CONFIDENCE,
+)
+from app.generation_nft.libraries.face.face_detect.face_detect import FaceDetect
+from app.generation_nft.libraries.face.face_landmarks.face_landmarks import (
+    get_face_mesh_pool,
+)
+from app.generation_nft.libraries.face.face_parsing.face_parsing import FaceParsing
+from app.generation_nft.libraries.face.tilt_learning.constants import (
+    TILT_LEARNING_FEATURES,
+)
+from app.generation_nft.libraries.face.tilt_learning.tilt_learning import TiltLearning
+from app.generation_nft.libraries.generation.constants import CONSTANT_PARTS
+from app.generation_nft.libraries.storage.storage import Storage
+from app.generation_nft_db.database import session_scope
+from app.generation_nft_db.models.nft_parts import Element
+
+# image synthétique utilisée pour la première inférence de chaque modèle
+SYNTHETIC_PICTURE = np.full((512, 512, 3), 128, dtype=np.uint8)
+
+
+def warm_up_face_parsing() -> Optional[str]:
+    """Charge le BiSeNet et segmente une image synthétique.
+
+    Returns:
+        Optional[str]: device du modèle.
+    """
+    face_parsing = FaceParsing()
+    face_parsing.parse_face(SYNTHETIC_PICTURE)
+    return str(face_parsing.config.DEVICE)
+
+
+def warm_up_face_detect() -> Optional[str]:
+    """Charge le détecteur caffe et détecte les visages d'une image synthétique.
+
+    Returns:
+        Optional[str]: aucun détail.
+    """
+    FaceDetect(
+        player_picture=SYNTHETIC_PICTURE,
+        player_name="warmup",
+        min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+    ).face_detection()
+    return None
+
+
+def warm_up_face_mesh() -> Optional[str]:
+    """Initialise les graphes FaceMesh et cherche les landmarks d'une image synthétique.
+
+    Returns:
+        Optional[str]: nombre de graphes initialisés.
+    """
+    face_mesh_pool = get_face_mesh_pool(MIN_DETECTION_CONFIDENCE)
+    with ExitStack() as stack:
+        for _ in range(face_mesh_pool.size):
+            stack.enter_context(face_mesh_pool.acquire()).process(
+                open_cv.cvtColor(SYNTHETIC_PICTURE, open_cv.COLOR_BGR2RGB)
+            )
+    return f"{face_mesh_pool.size} graphes"
+
+
+def warm_up_tilt_learning() -> Optional[str]:
+    """Charge les modèles de tilt learning et prédit l'inclinaison d'un visage synthétique.
+
+    Returns:
+        Optional[str]: nombre de modèles disponibles.
+    """
+    tilt_learning = TiltLearning()
+    tilt_ensemble = tilt_learning.tilt_ensemble
+    available_models = [
+        name
+        for name in tilt_ensemble.names
+        if tilt_ensemble.get_model(name) is not None
+    ]
+    tilt_learning.predict_many([dict.fromkeys(TILT_LEARNING_FEATURES, 0.0)])
+    return f"{len(available_models)}/{len(tilt_ensemble.names)} modèles"
+
+
+def warm_up_fonts() -> Optional[str]:
+    """Charge la police de la carte pour chaque taille utilisée.
+
+    Returns:
+        Optional[str]: nombre de tailles chargées.
+    """
+    sizes = {FONT_SIZE_NOTE} | {
+        part["size"]
+        for part in COORDINATES_PARTS
+        if part.get("type") == Type.FONT.value
+    }
+    for size in sizes:
+        load_font(CARD_FONT_PATH, size)
+    return f"{len(sizes)} tailles"
+
+
+def warm_up_assets() -> Optional[str]:
+    """Télécharge les images des parties constantes du NFT dans le cache de nft.storage.
+
+    Returns:
+        Optional[str]: nombre d'images chargées.
+    """
+    channels = {
+        part["element_code"]: part["channel"]
+        for part in CONSTANT_PARTS
+        if part.get("element_code") is not None
+    }
+    storage = Storage()
+    loaded = 0
+    with session_scope() as db:
+        for element in db.query(Element).filter(Element.code.in_(channels)).all():
+            if element.cid is not None:
+                storage.picture(
+                    element.cid,
+                    filename=element.filename,
+                    channel=channels[element.code],
+                )
+                loaded += 1
+    return f"{loaded}/{len(channels)} images"
+
+
+# étapes du préchauffage, dans l'ordre d'exécution
+WARMUP_STEPS = [
+    ("face_parsing", warm_up_face_parsing),
+    ("face_detect", warm_up_face_detect),
+    ("face_mesh", warm_up_face_mesh),
+    ("tilt_learning", warm_up_tilt_learning),
+    ("fonts", warm_up_fonts),
+    ("assets", warm_up_assets),
+]
+
+# étapes dont l'échec ne bloque pas la disponibilité du worker : chargées à la demande
+OPTIONAL_WARMUP_STEPS = {"fonts", "assets"}
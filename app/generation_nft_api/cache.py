@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_api/cache.py
+"""
+import asyncio
+import inspect
+from functools import wraps
+from typing import Any, Callable, Optional, Type
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from pydantic import parse_obj_as
+
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import reference_cache
+from app.settings import settings
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Vérifie si l'en-tête If-None-Match correspond à l'ETag.
+
+    Args:
+        if_none_match (Optional[str]): en-tête If-None-Match.
+        etag (str): ETag de la réponse, entre guillemets.
+
+    Returns:
+        bool: l'ETag correspond.
+    """
+    if if_none_match is None:
+        return False
+    tags = {tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def cache_endpoint(
+    endpoint: Callable, namespace: CacheNamespace, response_model: Any = None
+) -> Callable:
+    """Ajoute le cache des données de référence à une route GET.
+
+    Les dépendances de la route (authentification, session) sont toujours
+    résolues, seul l'appel à la route est remplacé par le cache. La clé ne
+    garde que les paramètres déclarés par la route : un paramètre inconnu
+    ne crée pas de nouvelle entrée.
+
+    Args:
+        endpoint (Callable): route.
+        namespace (CacheNamespace): espace de noms du cache.
+        response_model (Any, optional): modèle de la réponse. Défaut à None.
+
+    Returns:
+        Callable: route avec cache.
+    """
+    signature = inspect.signature(endpoint)
+    parameters = set(signature.parameters)
+
+    @wraps(endpoint)
+    async def wrapper(*, cache_request: Request, **kwargs) -> Response:
+        key = (
+            cache_request.url.path,
+            tuple(
+                sorted(
+                    (name, value)
+                    for name, value in cache_request.query_params.multi_items()
+                    if name in parameters
+                )
+            ),
+        )
+        if (entry := reference_cache.get(namespace, key)) is None:
+            version = reference_cache.version(namespace)
+            if asyncio.iscoroutinefunction(endpoint):
+                result = await endpoint(**kwargs)
+            else:
+                result = await run_in_threadpool(endpoint, **kwargs)
+            if isinstance(result, Response):
+                return result
+            if response_model is not None:
+                result = parse_obj_as(response_model, result)
+            entry = reference_cache.set(
+                namespace, key, jsonable_encoder(result), version
+            )
+
+        headers = {
+            "ETag": f'"{entry.etag}"',
+            "Cache-Control": f"private, max-age={settings.REFERENCE_CACHE_MAX_AGE}",
+        }
+        if etag_matches(cache_request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return Response(entry.body, media_type="application/json", headers=headers)
+
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(
+                "cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+            ),
+        ]
+    )
+    wrapper.cache_namespace = namespace
+    return wrapper
+
+
+def cached_route(namespace: CacheNamespace) -> Type[APIRoute]:
+    """Crée une classe de route dont les routes GET utilisent le cache.
+
+    Args:
+        namespace (CacheNamespace): espace de noms du cache.
+
+    Returns:
+        Type[APIRoute]: classe de route.
+    """
+
+    class CachedRoute(APIRoute):
+        """Route dont les réponses GET passent par le cache des données de référence."""
+
+        def __init__(self, path: str, endpoint: Callable, **kwargs):
+            """Initialise la route.
+
+            Args:
+                path (str): chemin de la route.
+                endpoint (Callable): route.
+            """
+            if "GET" in (kwargs.get("methods") or ()) and not hasattr(
+                endpoint, "cache_namespace"
+            ):
+                endpoint = cache_endpoint(
+                    endpoint, namespace, kwargs.get("response_model")
+                )
+            super().__init__(path, endpoint, **kwargs)
+
+    return CachedRoute
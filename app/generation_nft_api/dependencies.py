@@ -24,13 +24,16 @@ ______                           _           _
 
 File: app/generation_nft_api/dependencies.py
 """
+from typing import Type
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.generation_nft_db.database import SessionLocal
+from app.generation_nft.libraries.card.constants import MEDIA_TYPES
+from app.generation_nft_db.database import SessionLocal, session_scope
 from app.generation_nft_db.models import User
 from app.generation_nft_db.repositories.users import (
     get_user_by_token,
@@ -50,11 +53,35 @@ def get_db() -> SessionLocal:
     Yields:
         Iterator[SessionLocal]: session de la base de donnée.
     """
-    db = SessionLocal()
-    try:
+    with session_scope() as db:
         yield db
-    finally:
-        db.close()
+
+
+def get_generation_class() -> Type:
+    """Récupère la classe de génération des NFT, importée à la première génération.
+
+    La génération importe torch, mediapipe et scikit-learn : les workers qui ne servent que
+    les routes CRUD démarrent sans les charger.
+
+    Returns:
+        Type: classe Generation.
+    """
+    from app.generation_nft.libraries.generation.generation import Generation
+
+    return Generation
+
+
+def get_preview_media_type() -> str:
+    """Récupère le type MIME de l'aperçu des NFT, importé à la première génération.
+
+    L'encodage des cartes importe OpenCV et PIL : les workers CRUD ne le chargent pas.
+
+    Returns:
+        str: type MIME de l'aperçu.
+    """
+    from app.generation_nft.libraries.card.encoding import get_preview_format
+
+    return MEDIA_TYPES[get_preview_format()]
 
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -27,12 +27,15 @@ File: app/generation_nft_api/main.py
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from app.generation_nft.threads import configure_threads
+from app.generation_nft.warmup import start_warmup
 from app.generation_nft_api.routers import (
     clubs,
     countries,
     divisions,
     generation,
     login,
+    metrics,
     names,
     nft_parts,
     players,
@@ -57,6 +60,19 @@ app.include_router(login.router)
 app.include_router(users.router)
 app.include_router(rarities.router)
 app.include_router(generation.router)
+app.include_router(metrics.router)
+
+
+@app.on_event("startup")
+def configure_worker():
+    """Applique les réglages de threads et d'affinité CPU avant le chargement des modèles."""
+    configure_threads()
+
+
+@app.on_event("startup")
+def warm_up():
+    """Précharge les modèles de génération au démarrage du worker si WARMUP_ENABLED."""
+    start_warmup()
 
 
 @app.get("/get_environment_variables")
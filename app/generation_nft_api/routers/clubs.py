@@ -24,7 +24,7 @@ ______                           _           _
 
 File: app/generation_nft_api/routers/clubs.py
 """
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
@@ -32,6 +32,7 @@ from sqlalchemy.orm import Session
 from app.generation_nft_api.dependencies import get_current_active_superuser, get_db
 from app.generation_nft_db.repositories import clubs as crud
 from app.generation_nft_db.schemas.clubs import ClubCreate, ClubNestedOut, ClubUpdate
+from app.generation_nft_db.schemas.pagination import Page
 from app.settings import settings
 
 router = APIRouter(
@@ -105,15 +106,18 @@ async def read_clubs_by_division_code(
         raise HTTPException(status_code=404, detail="Division not found")
 
 
-@router.get("/country/{country_id}", response_model=List[ClubNestedOut])
+@router.get("/country/{country_id}", response_model=Page[ClubNestedOut])
 async def read_clubs_by_country(
-    country_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[ClubNestedOut]:
+    country_id: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[ClubNestedOut]:
     """Route pour récupérer une liste de clubs par pays.
 
     Args:
         country_id (int): id country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -121,25 +125,28 @@ async def read_clubs_by_country(
         HTTPException: le pays n'existe pas.
 
     Returns:
-        List[ClubNestedOut]: liste de club.
+        Page[ClubNestedOut]: page de club et curseur de la page suivante.
     """
     try:
         return crud.get_clubs_by_country(
-            db, country_id=country_id, skip=skip, limit=limit
+            db, country_id=country_id, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail="Country not found")
 
 
-@router.get("/country/code/{country_code}", response_model=List[ClubNestedOut])
+@router.get("/country/code/{country_code}", response_model=Page[ClubNestedOut])
 async def read_clubs_by_country_code(
-    country_code: str, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[ClubNestedOut]:
+    country_code: str,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[ClubNestedOut]:
     """Route pour récupérer une liste de clubs par pays par code.
 
     Args:
         country_code (str): code country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -147,11 +154,11 @@ async def read_clubs_by_country_code(
         HTTPException: le pays n'existe pas.
 
     Returns:
-        List[ClubNestedOut]: liste de club.
+        Page[ClubNestedOut]: page de club et curseur de la page suivante.
     """
     try:
         return crud.get_clubs_by_country_code(
-            db, country_code=country_code, skip=skip, limit=limit
+            db, country_code=country_code, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail="Country not found")
@@ -29,12 +29,15 @@ from typing import List
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile
 from sqlalchemy.orm import Session
 
+from app.generation_nft_api.cache import cached_route
 from app.generation_nft_api.dependencies import get_current_active_superuser, get_db
+from app.generation_nft_db.constants import CacheNamespace
 from app.generation_nft_db.repositories import countries as crud
 from app.generation_nft_db.schemas.countries import CountryOut
 from app.settings import settings
 
 router = APIRouter(
+    route_class=cached_route(CacheNamespace.COUNTRIES),
     prefix="/countries",
     tags=["countries"],
     responses={404: {"description": "Not found"}},
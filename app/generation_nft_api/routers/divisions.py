@@ -29,7 +29,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.generation_nft_api.cache import cached_route
 from app.generation_nft_api.dependencies import get_current_active_superuser, get_db
+from app.generation_nft_db.constants import CacheNamespace
 from app.generation_nft_db.repositories import divisions as crud
 from app.generation_nft_db.schemas.divisions import (
     DivisionCreate,
@@ -40,6 +42,7 @@ from app.generation_nft_db.schemas.divisions import (
 from app.settings import settings
 
 router = APIRouter(
+    route_class=cached_route(CacheNamespace.DIVISIONS),
     prefix="/divisions",
     tags=["divisions"],
     responses={404: {"description": "Not found"}},
@@ -24,15 +24,32 @@ ______                           _           _
 
 File: app/generation_nft_api/routers/generation.py
 """
+from typing import Type
+
 import requests
 from fastapi import APIRouter, Depends, HTTPException, Response
 from requests import Session
 
 from app import logger_api
-from app.generation_nft.libraries.generation.generation import Generation
-from app.generation_nft_api.dependencies import get_current_active_superuser, get_db
+from app.generation_nft.libraries.face.face_quality.face_quality import (
+    get_quality_gate_metrics,
+)
+from app.generation_nft.warmup import get_warmup_status
+from app.generation_nft_api.dependencies import (
+    get_current_active_superuser,
+    get_db,
+    get_generation_class,
+    get_preview_media_type,
+)
+from app.generation_nft_db.database import get_pool_metrics
 from app.generation_nft_db.models import users as models_users
-from app.generation_nft_db.schemas.generation import CreateGeneration, ResponseIsAlive
+from app.generation_nft_db.schemas.generation import (
+    CreateGeneration,
+    ResponseIsAlive,
+    ResponsePoolMetrics,
+    ResponseQualityGateMetrics,
+    ResponseReadiness,
+)
 from app.settings import settings
 
 router = APIRouter(
@@ -50,6 +67,8 @@ router = APIRouter(
 async def generate_nft(
     rating: float,
     get_picture: bool = False,
+    generation_class: Type = Depends(get_generation_class),
+    preview_media_type: str = Depends(get_preview_media_type),
     current_user: models_users.User = Depends(get_current_active_superuser),
 ) -> Response:
     """Route pour générer aléatoirement un NFT.
@@ -57,6 +76,8 @@ async def generate_nft(
     Args:
         rating (float): côte.
         get_picture (bool, optional): renvoyer une image. Défaut à False.
+        generation_class (Type, optional): classe de génération. Défaut à Depends(get_generation_class).
+        preview_media_type (str, optional): type MIME de l'aperçu. Défaut à Depends(get_preview_media_type).
         current_user (models_users.User, optional): utilisateur connecté. Défaut à Depends(get_current_active_superuser).
 
     Raises:
@@ -65,11 +86,11 @@ async def generate_nft(
     Returns:
         Response: response.
     """
-    generation = Generation(rating)
     try:
-        nft = generation.generate_nft(get_picture=get_picture)
+        with generation_class(rating) as generation:
+            nft = generation.generate_nft(get_picture=get_picture)
         if get_picture:
-            return Response(content=nft, media_type="image/png")
+            return Response(content=nft, media_type=preview_media_type)
         return Response(content=nft, media_type="application/text")
     except Exception as err:
         logger_api.error(str(err))
@@ -81,12 +102,16 @@ async def generate_nft(
 )
 async def create_nft(
     nft_parts: CreateGeneration = Depends(),
+    generation_class: Type = Depends(get_generation_class),
+    preview_media_type: str = Depends(get_preview_media_type),
     current_user: models_users.User = Depends(get_current_active_superuser),
 ) -> Response:
     """Route pour créer un NFT.
 
     Args:
         nft_parts (CreateGeneration, optional): parties du NFT. Défaut à Depends().
+        generation_class (Type, optional): classe de génération. Défaut à Depends(get_generation_class).
+        preview_media_type (str, optional): type MIME de l'aperçu. Défaut à Depends(get_preview_media_type).
         current_user (models_users.User, optional): utilisateur connecté. Défaut à Depends(get_current_active_superuser).
 
     Raises:
@@ -95,13 +120,13 @@ async def create_nft(
     Returns:
         Response: response.
     """
-    generation = Generation()
     try:
-        nft = generation.generate_nft(
-            params=nft_parts, get_picture=nft_parts.get_picture
-        )
+        with generation_class() as generation:
+            nft = generation.generate_nft(
+                params=nft_parts, get_picture=nft_parts.get_picture
+            )
         if nft_parts.get_picture:
-            return Response(content=nft, media_type="image/png")
+            return Response(content=nft, media_type=preview_media_type)
         return Response(content=nft, media_type="application/text")
     except Exception as err:
         logger_api.error(str(err))
@@ -128,3 +153,52 @@ async def is_alive(db: Session = Depends(get_db)) -> ResponseIsAlive:
         status=200 if is_active else 400,
         is_active=db.is_active and car_api_response.is_active,
     )
+
+
+@router.get("/ready", response_model=ResponseReadiness)
+async def ready(response: Response) -> ResponseReadiness:
+    """Route pour vérifier que le worker est prêt à générer des NFT.
+
+    Renvoie 503 tant que le préchauffage des modèles n'est pas terminé, le load balancer
+    n'envoie les générations qu'aux workers prêts.
+
+    Args:
+        response (Response): réponse, son status code est modifié si le worker n'est pas prêt.
+
+    Returns:
+        ResponseReadiness: worker prêt, état et durée de chaque étape du préchauffage.
+    """
+    warmup_status = get_warmup_status()
+    if not warmup_status["ready"]:
+        response.status_code = 503
+    return ResponseReadiness(**warmup_status)
+
+
+@router.get("/pool-metrics", response_model=ResponsePoolMetrics)
+async def pool_metrics(
+    current_user: models_users.User = Depends(get_current_active_superuser),
+) -> ResponsePoolMetrics:
+    """Route pour récupérer les métriques du pool de connexions.
+
+    Args:
+        current_user (models_users.User, optional): utilisateur connecté. Défaut à Depends(get_current_active_superuser).
+
+    Returns:
+        ResponsePoolMetrics: connexions utilisées, débordement et temps d'attente.
+    """
+    return ResponsePoolMetrics(**get_pool_metrics())
+
+
+@router.get("/quality-gate-metrics", response_model=ResponseQualityGateMetrics)
+async def quality_gate_metrics(
+    current_user: models_users.User = Depends(get_current_active_superuser),
+) -> ResponseQualityGateMetrics:
+    """Route pour récupérer les métriques du contrôle qualité des visages.
+
+    Args:
+        current_user (models_users.User, optional): utilisateur connecté. Défaut à Depends(get_current_active_superuser).
+
+    Returns:
+        ResponseQualityGateMetrics: visages candidats, acceptés et rejets par raison.
+    """
+    return ResponseQualityGateMetrics(**get_quality_gate_metrics())
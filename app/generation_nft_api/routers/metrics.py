@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_api/routers/metrics.py
+"""
+from typing import List
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.generation_nft.libraries.face.face_quality.face_quality import (
+    get_quality_gate_metrics,
+)
+from app.generation_nft.timing import stage_timings
+from app.generation_nft_api.dependencies import get_current_active_superuser
+from app.generation_nft_db.database import get_pool_metrics
+from app.generation_nft_db.models import users as models_users
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4"
+# métriques cumulées du pool, exportées en counter avec le suffixe _total
+POOL_COUNTERS = {
+    "waits": "generation_db_pool_waits_total",
+    "wait_timeouts": "generation_db_pool_wait_timeouts_total",
+    "wait_time_total": "generation_db_pool_wait_seconds_total",
+}
+
+router = APIRouter(tags=["metrics"])
+
+
+def render_metric(
+    name: str, kind: str, description: str, samples: List[str]
+) -> List[str]:
+    """Convertit une métrique au format texte Prometheus.
+
+    Args:
+        name (str): nom de la métrique.
+        kind (str): type de la métrique (counter, gauge...).
+        description (str): description de la métrique.
+        samples (List[str]): valeurs, avec leurs labels.
+
+    Returns:
+        List[str]: lignes de la métrique.
+    """
+    return [f"# HELP {name} {description}", f"# TYPE {name} {kind}", *samples]
+
+
+def render_quality_gate_metrics() -> List[str]:
+    """Convertit les métriques du contrôle qualité des visages.
+
+    Returns:
+        List[str]: lignes des métriques.
+    """
+    metrics = get_quality_gate_metrics()
+    return [
+        *render_metric(
+            "generation_quality_gate_candidates_total",
+            "counter",
+            "Visages candidats au contrôle qualité.",
+            [f"generation_quality_gate_candidates_total {metrics['candidates']}"],
+        ),
+        *render_metric(
+            "generation_quality_gate_accepted_total",
+            "counter",
+            "Visages acceptés par le contrôle qualité.",
+            [f"generation_quality_gate_accepted_total {metrics['accepted']}"],
+        ),
+        *render_metric(
+            "generation_quality_gate_rejected_total",
+            "counter",
+            "Visages rejetés par le contrôle qualité, par raison.",
+            [
+                f'generation_quality_gate_rejected_total{{reason="{reason}"}} {count}'
+                for reason, count in metrics["rejected"].items()
+            ],
+        ),
+    ]
+
+
+def render_pool_metrics() -> List[str]:
+    """Convertit les métriques du pool de connexions.
+
+    Returns:
+        List[str]: lignes des métriques.
+    """
+    lines = []
+    for name, value in get_pool_metrics().items():
+        metric = POOL_COUNTERS.get(name, f"generation_db_pool_{name}")
+        lines += render_metric(
+            metric,
+            "counter" if name in POOL_COUNTERS else "gauge",
+            f"Pool de connexions : {name}.",
+            [f"{metric} {value}"],
+        )
+    return lines
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(
+    current_user: models_users.User = Depends(get_current_active_superuser),
+) -> PlainTextResponse:
+    """Route pour récupérer les métriques au format Prometheus.
+
+    Args:
+        current_user (models_users.User, optional): utilisateur connecté. Défaut à Depends(get_current_active_superuser).
+
+    Returns:
+        PlainTextResponse: durées des étapes, contrôle qualité et pool de connexions.
+    """
+    lines = [
+        *stage_timings.render(),
+        *render_quality_gate_metrics(),
+        *render_pool_metrics(),
+    ]
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=PROMETHEUS_MEDIA_TYPE)
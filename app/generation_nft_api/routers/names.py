@@ -24,7 +24,7 @@ ______                           _           _
 
 File: app/generation_nft_api/routers/names.py
 """
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
@@ -40,6 +40,7 @@ from app.generation_nft_db.schemas.names import (
     NameTypeUpdate,
     NameUpdate,
 )
+from app.generation_nft_db.schemas.pagination import Page
 from app.settings import settings
 
 router = APIRouter(
@@ -148,15 +149,18 @@ async def read_name_type_by_code(
     return db_name_type_code
 
 
-@router.get("/type/{name_type_id}", response_model=List[NameOut])
+@router.get("/type/{name_type_id}", response_model=Page[NameOut])
 async def read_names_by_type(
-    name_type_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[NameOut]:
+    name_type_id: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[NameOut]:
     """Route pour récupérer une liste de noms par type.
 
     Args:
         name_type_id (int): id name type.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -164,25 +168,28 @@ async def read_names_by_type(
         HTTPException: le type de nom n'existe pas.
 
     Returns:
-        List[NameOut]: liste de name.
+        Page[NameOut]: page de name et curseur de la page suivante.
     """
     try:
         return crud.get_names_by_type(
-            db, name_type_id=name_type_id, skip=skip, limit=limit
+            db, name_type_id=name_type_id, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail=name_type_not_found)
 
 
-@router.get("/type/code/{name_type_code}", response_model=List[NameOut])
+@router.get("/type/code/{name_type_code}", response_model=Page[NameOut])
 async def read_names_by_type_code(
-    name_type_code: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[NameOut]:
+    name_type_code: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[NameOut]:
     """Route pour récupérer une liste de noms par type par code.
 
     Args:
         name_type_code (int): code name type.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -190,11 +197,11 @@ async def read_names_by_type_code(
         HTTPException: le type de nom n'existe pas.
 
     Returns:
-        List[NameOut]: liste de name.
+        Page[NameOut]: page de name et curseur de la page suivante.
     """
     try:
         return crud.get_names_by_type_code(
-            db, name_type_code=name_type_code, skip=skip, limit=limit
+            db, name_type_code=name_type_code, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail=name_type_not_found)
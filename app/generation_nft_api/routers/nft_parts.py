@@ -29,7 +29,9 @@ from typing import List
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile
 from sqlalchemy.orm import Session
 
+from app.generation_nft_api.cache import cached_route
 from app.generation_nft_api.dependencies import get_current_active_superuser, get_db
+from app.generation_nft_db.constants import CacheNamespace
 from app.generation_nft_db.repositories import nft_parts as crud
 from app.generation_nft_db.schemas.nft_parts import (
     ColorCreate,
@@ -53,6 +55,7 @@ from app.generation_nft_db.schemas.nft_parts import (
 from app.settings import settings
 
 router = APIRouter(
+    route_class=cached_route(CacheNamespace.NFT_PARTS),
     prefix="/nft",
     tags=["nft"],
     responses={404: {"description": "Not found"}},
@@ -24,15 +24,18 @@ ______                           _           _
 
 File: app/generation_nft_api/routers/players.py
 """
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile
+from pydantic import ValidationError, parse_raw_as
 from sqlalchemy.orm import Session
 
 from app.generation_nft_api.dependencies import get_current_active_superuser, get_db
 from app.generation_nft_db.repositories import players as crud
+from app.generation_nft_db.schemas.pagination import Page
 from app.generation_nft_db.schemas.players import (
     PlayerCreate,
+    PlayerImport,
     PlayerNestedOut,
     PlayerUpdate,
 )
@@ -107,15 +110,18 @@ async def read_players(
     return crud.get_players(db, skip=skip, limit=limit)
 
 
-@router.get("/country/{country_id}", response_model=List[PlayerNestedOut])
+@router.get("/country/{country_id}", response_model=Page[PlayerNestedOut])
 async def read_players_by_country(
-    country_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    country_id: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par pays.
 
     Args:
         country_id (int): id country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -123,25 +129,28 @@ async def read_players_by_country(
         HTTPException: le pays n'existe pas.
 
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
     try:
         return crud.get_players_by_country(
-            db, country_id=country_id, skip=skip, limit=limit
+            db, country_id=country_id, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail="Country not found")
 
 
-@router.get("/country/code/{country_code}", response_model=List[PlayerNestedOut])
+@router.get("/country/code/{country_code}", response_model=Page[PlayerNestedOut])
 async def read_players_by_country_code(
-    country_code: str, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    country_code: str,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par pays par code.
 
     Args:
         country_code (str): code country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -149,25 +158,28 @@ async def read_players_by_country_code(
         HTTPException: le pays n'existe pas.
 
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
     try:
         return crud.get_players_by_country_code(
-            db, country_code=country_code, skip=skip, limit=limit
+            db, country_code=country_code, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail="Country not found")
 
 
-@router.get("/club/{club_id}", response_model=List[PlayerNestedOut])
+@router.get("/club/{club_id}", response_model=Page[PlayerNestedOut])
 async def read_players_by_club(
-    club_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    club_id: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par club.
 
     Args:
         club_id (int): id club.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -175,23 +187,26 @@ async def read_players_by_club(
         HTTPException: le club n'existe pas.
 
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
     try:
-        return crud.get_players_by_club(db, club_id=club_id, skip=skip, limit=limit)
+        return crud.get_players_by_club(db, club_id=club_id, cursor=cursor, limit=limit)
     except AttributeError:
         raise HTTPException(status_code=404, detail="Club not found")
 
 
-@router.get("/club/code/{club_code}", response_model=List[PlayerNestedOut])
+@router.get("/club/code/{club_code}", response_model=Page[PlayerNestedOut])
 async def read_players_by_club_code(
-    club_code: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    club_code: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par club par code.
 
     Args:
         club_code (int): code club.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -199,25 +214,28 @@ async def read_players_by_club_code(
         HTTPException: le club n'existe pas.
 
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
     try:
         return crud.get_players_by_club_code(
-            db, club_code=club_code, skip=skip, limit=limit
+            db, club_code=club_code, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail="Club not found")
 
 
-@router.get("/rarity/{rarity_id}", response_model=List[PlayerNestedOut])
+@router.get("/rarity/{rarity_id}", response_model=Page[PlayerNestedOut])
 async def read_players_by_rarity(
-    rarity_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    rarity_id: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par rareté.
 
     Args:
         rarity_id (int): id rarity.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -225,25 +243,28 @@ async def read_players_by_rarity(
         HTTPException: la rareté n'existe pas.
 
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
     try:
         return crud.get_players_by_rarity(
-            db, rarity_id=rarity_id, skip=skip, limit=limit
+            db, rarity_id=rarity_id, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail="Rarity not found")
 
 
-@router.get("/rarity/code/{rarity_code}", response_model=List[PlayerNestedOut])
+@router.get("/rarity/code/{rarity_code}", response_model=Page[PlayerNestedOut])
 async def read_players_by_rarity_code(
-    rarity_code: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    rarity_code: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par rareté par code.
 
     Args:
         rarity_code (int): code rarity.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
@@ -251,94 +272,130 @@ async def read_players_by_rarity_code(
         HTTPException: la rareté n'existe pas.
 
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
     try:
         return crud.get_players_by_rarity_code(
-            db, rarity_code=rarity_code, skip=skip, limit=limit
+            db, rarity_code=rarity_code, cursor=cursor, limit=limit
         )
     except AttributeError:
         raise HTTPException(status_code=404, detail="Rarity not found")
 
 
-@router.get("/first-name/{first_name_id}", response_model=List[PlayerNestedOut])
+@router.get("/first-name/{first_name_id}", response_model=Page[PlayerNestedOut])
 async def read_players_by_first_name(
-    first_name_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    first_name_id: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par prénom.
 
     Args:
         first_name_id (int): id first name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
+    Raises:
+        HTTPException: le prénom n'existe pas.
+
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
-    return crud.get_players_by_first_name(
-        db, first_name_id=first_name_id, skip=skip, limit=limit
-    )
+    try:
+        return crud.get_players_by_first_name(
+            db, first_name_id=first_name_id, cursor=cursor, limit=limit
+        )
+    except AttributeError:
+        raise HTTPException(status_code=404, detail="First name not found")
 
 
-@router.get("/first-name/code/{first_name_code}", response_model=List[PlayerNestedOut])
+@router.get("/first-name/code/{first_name_code}", response_model=Page[PlayerNestedOut])
 async def read_players_by_first_name_code(
-    first_name_code: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    first_name_code: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par prénom par code.
 
     Args:
         first_name_code (int): code first name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
+    Raises:
+        HTTPException: le prénom n'existe pas.
+
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
-    return crud.get_players_by_first_name_code(
-        db, first_name_code=first_name_code, skip=skip, limit=limit
-    )
+    try:
+        return crud.get_players_by_first_name_code(
+            db, first_name_code=first_name_code, cursor=cursor, limit=limit
+        )
+    except AttributeError:
+        raise HTTPException(status_code=404, detail="First name not found")
 
 
-@router.get("/last-name/{last_name_id}", response_model=List[PlayerNestedOut])
+@router.get("/last-name/{last_name_id}", response_model=Page[PlayerNestedOut])
 async def read_players_by_last_name(
-    last_name_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    last_name_id: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par nom de famille.
 
     Args:
         last_name_id (int): id last name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
+    Raises:
+        HTTPException: le nom de famille n'existe pas.
+
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
-    return crud.get_players_by_last_name(
-        db, last_name_id=last_name_id, skip=skip, limit=limit
-    )
+    try:
+        return crud.get_players_by_last_name(
+            db, last_name_id=last_name_id, cursor=cursor, limit=limit
+        )
+    except AttributeError:
+        raise HTTPException(status_code=404, detail="Last name not found")
 
 
-@router.get("/last-name/code/{last_name_code}", response_model=List[PlayerNestedOut])
+@router.get("/last-name/code/{last_name_code}", response_model=Page[PlayerNestedOut])
 async def read_players_by_last_name_code(
-    last_name_code: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> List[PlayerNestedOut]:
+    last_name_code: int,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+) -> Page[PlayerNestedOut]:
     """Route pour récupérer une liste de joueur par nom de famille par code.
 
     Args:
         last_name_code (int): code last name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
         db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
 
+    Raises:
+        HTTPException: le nom de famille n'existe pas.
+
     Returns:
-        List[PlayerNestedOut]: liste de player.
+        Page[PlayerNestedOut]: page de player et curseur de la page suivante.
     """
-    return crud.get_players_by_last_name_code(
-        db, last_name_code=last_name_code, skip=skip, limit=limit
-    )
+    try:
+        return crud.get_players_by_last_name_code(
+            db, last_name_code=last_name_code, cursor=cursor, limit=limit
+        )
+    except AttributeError:
+        raise HTTPException(status_code=404, detail="Last name not found")
 
 
 @router.get("/height/{height}", response_model=List[PlayerNestedOut])
@@ -420,6 +477,36 @@ def create_player(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.post("/import", response_model=List[PlayerNestedOut])
+def import_players(
+    players: str = Form(...),
+    file: Optional[UploadFile] = File(None),
+    db: Session = Depends(get_db),
+) -> List[PlayerNestedOut]:
+    """Route pour importer plusieurs joueurs.
+
+    Args:
+        players (str): liste JSON de joueurs au format PlayerImport.
+        file (Optional[UploadFile], optional): archive zip des photos. Défaut à File(None).
+        db (Session, optional): session de la base de donnée. Défaut à Depends(get_db).
+
+    Raises:
+        HTTPException: la liste de joueurs n'est pas valide.
+        HTTPException: les joueurs n'ont pas été crées.
+
+    Returns:
+        List[PlayerNestedOut]: players.
+    """
+    try:
+        players_import = parse_raw_as(List[PlayerImport], players)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+    try:
+        return crud.import_players(db=db, players=players_import, archive=file)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.put("/{player_id}", response_model=PlayerNestedOut)
 def update_player(
     player_id: int,
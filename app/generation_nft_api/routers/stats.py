@@ -29,7 +29,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.generation_nft_api.cache import cached_route
 from app.generation_nft_api.dependencies import get_current_active_superuser, get_db
+from app.generation_nft_db.constants import CacheNamespace
 from app.generation_nft_db.repositories import stats as crud
 from app.generation_nft_db.schemas.stats import (
     StatCreate,
@@ -43,6 +45,7 @@ from app.generation_nft_db.schemas.stats import (
 from app.settings import settings
 
 router = APIRouter(
+    route_class=cached_route(CacheNamespace.STATS),
     prefix="/stats",
     tags=["stats"],
     responses={404: {"description": "Not found"}},
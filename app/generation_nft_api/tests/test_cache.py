@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_api/tests/test_cache.py
+"""
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.generation_nft_api.cache import cached_route
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import (
+    ReferenceCache,
+    invalidates,
+    reference_cache,
+)
+
+calls = []
+
+router = APIRouter(prefix="/cache", route_class=cached_route(CacheNamespace.RARITIES))
+
+
+@router.get("/")
+async def read_cache() -> dict:
+    """Route de test qui compte ses appels.
+
+    Returns:
+        dict: nombre d'appels.
+    """
+    calls.append(1)
+    return {"calls": len(calls)}
+
+
+@invalidates(CacheNamespace.RARITIES)
+def write_cache():
+    """Écriture de test qui invalide le cache."""
+
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_cached_route():
+    """Test du cache des données de référence sur une route GET.
+
+    Raises:
+        AssertionError: La réponse n'est pas mise en cache.
+        AssertionError: La requête conditionnelle ne renvoie pas 304.
+        AssertionError: L'écriture n'invalide pas le cache.
+    """
+    reference_cache.clear()
+    first, second = client.get("/cache/"), client.get("/cache/")
+    if first.json() != second.json() or len(calls) != 1:
+        raise AssertionError("La réponse n'est pas mise en cache.")
+
+    etag = first.headers["etag"]
+    if client.get("/cache/", headers={"If-None-Match": etag}).status_code != 304:
+        raise AssertionError("La requête conditionnelle ne renvoie pas 304.")
+
+    write_cache()
+    third = client.get("/cache/", headers={"If-None-Match": etag})
+    if third.status_code != 200 or third.json() != {"calls": 2}:
+        raise AssertionError("L'écriture n'invalide pas le cache.")
+
+
+def test_reference_cache_bounds():
+    """Test des bornes du cache des données de référence.
+
+    Raises:
+        AssertionError: Un paramètre non déclaré ne doit pas créer d'entrée.
+        AssertionError: L'entrée la moins récemment lue doit être retirée.
+        AssertionError: Les entrées expirées doivent être retirées à l'ajout.
+    """
+    reference_cache.clear()
+    client.get("/cache/")
+    client.get("/cache/", params={"unknown": "value"})
+    if len(reference_cache.entries) != 1:
+        raise AssertionError("Un paramètre non déclaré ne doit pas créer d'entrée.")
+
+    cache = ReferenceCache(max_entries=2)
+    for key in ("first", "second"):
+        cache.set(CacheNamespace.RARITIES, key, key, 0)
+    cache.get(CacheNamespace.RARITIES, "first")
+    cache.set(CacheNamespace.RARITIES, "third", "third", 0)
+    if cache.get(CacheNamespace.RARITIES, "second") is not None:
+        raise AssertionError("L'entrée la moins récemment lue doit être retirée.")
+
+    expired_cache = ReferenceCache(ttl=-1)
+    for key in ("first", "second"):
+        expired_cache.set(CacheNamespace.RARITIES, key, key, 0)
+    if len(expired_cache.entries) != 1:
+        raise AssertionError("Les entrées expirées doivent être retirées à l'ajout.")
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_api/tests/test_players.py
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+
+from app.generation_nft_api.dependencies import get_current_active_superuser
+from app.generation_nft_api.main import app
+from app.generation_nft_db.database import SessionLocal
+from app.generation_nft_db.models.countries import Country
+from app.generation_nft_db.models.players import Player
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def superuser():
+    """Désactive l'authentification pour les routes protégées.
+
+    Yields:
+        None: rien.
+    """
+    app.dependency_overrides[get_current_active_superuser] = lambda: None
+    yield
+    app.dependency_overrides.pop(get_current_active_superuser, None)
+
+
+@pytest.fixture
+def player_import() -> dict:
+    """Construit un joueur à importer à partir d'un joueur existant.
+
+    Yields:
+        dict: joueur à importer, supprimé après le test.
+    """
+    with SessionLocal() as db:
+        player = (
+            db.query(Player)
+            .filter(Player.positions.any(), Player.countries.any())
+            .order_by(Player.id)
+            .first()
+        )
+        code = db.query(func.max(Player.code)).scalar() + 1
+        player_import = {
+            "code": code,
+            "age": player.age,
+            "birth": player.birth.isoformat(),
+            "height": player.height,
+            "weight": player.weight,
+            "first_name": player.first_name.value,
+            "last_name": player.last_name.value,
+            "club_id": player.club_id,
+            "rarity_id": player.rarity_id,
+            "country_ids": [country.id for country in player.countries],
+            "position_ids": [position.id for position in reversed(player.positions)],
+            "stats": {},
+        }
+    yield player_import
+    with SessionLocal() as db:
+        db.query(Player).filter(Player.code == code).delete()
+        db.commit()
+
+
+def test_import_players(player_import: dict):
+    """Test de l'import de joueurs.
+
+    Args:
+        player_import (dict): joueur à importer.
+
+    Raises:
+        AssertionError: Le statut code n'est pas correct.
+        AssertionError: Les positions doivent garder l'ordre de l'import.
+    """
+    response = client.post(
+        "/players/import", data={"players": json.dumps([player_import])}
+    )
+    if response.status_code != 200:
+        raise AssertionError("Le statut code n'est pas correct.")
+    if [position["id"] for position in response.json()[0]["positions"]] != (
+        player_import["position_ids"]
+    ):
+        raise AssertionError("Les positions doivent garder l'ordre de l'import.")
+
+
+def test_import_players_unknown_country(player_import: dict):
+    """Test du rejet d'un import dont un pays n'existe pas.
+
+    Args:
+        player_import (dict): joueur à importer.
+
+    Raises:
+        AssertionError: Le statut code n'est pas correct.
+        AssertionError: Aucun joueur ne doit être importé.
+    """
+    with SessionLocal() as db:
+        unknown_country_id = db.query(func.max(Country.id)).scalar() + 1
+    player_import["country_ids"].append(unknown_country_id)
+    response = client.post(
+        "/players/import", data={"players": json.dumps([player_import])}
+    )
+    if response.status_code != 404 or response.json()["detail"] != (
+        f"Countries not found: {unknown_country_id}"
+    ):
+        raise AssertionError("Le statut code n'est pas correct.")
+    with SessionLocal() as db:
+        if db.query(Player).filter(Player.code == player_import["code"]).count():
+            raise AssertionError("Aucun joueur ne doit être importé.")
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_api/tests/test_queries.py
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.generation_nft_api.dependencies import get_current_active_superuser
+from app.generation_nft_api.main import app
+from app.generation_nft_api.tests.utils import assert_num_queries
+from app.generation_nft_db.core.cache import reference_cache
+from app.generation_nft_db.database import SessionLocal
+from app.generation_nft_db.models.clubs import Club
+from app.generation_nft_db.models.players import Player
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def superuser():
+    """Désactive l'authentification pour les routes protégées.
+
+    Yields:
+        None: rien.
+    """
+    app.dependency_overrides[get_current_active_superuser] = lambda: None
+    yield
+    app.dependency_overrides.pop(get_current_active_superuser, None)
+
+
+@pytest.fixture
+def player() -> Player:
+    """Récupère un joueur dont le club est complet.
+
+    Returns:
+        Player: joueur.
+    """
+    with SessionLocal() as db:
+        return (
+            db.query(Player)
+            .join(Player.club)
+            .filter(Club.country_id.isnot(None), Club.division_id.isnot(None))
+            .order_by(Player.id)
+            .first()
+        )
+
+
+def test_read_players_queries():
+    """Test du nombre de requêtes de la liste des joueurs.
+
+    Raises:
+        AssertionError: Le statut code n'est pas correct.
+    """
+    with assert_num_queries(4):
+        response = client.get("/players/", params={"limit": 50})
+    if response.status_code != 200:
+        raise AssertionError("Le statut code n'est pas correct.")
+
+
+def test_read_players_by_club_queries(player: Player):
+    """Test du nombre de requêtes de la liste des joueurs par club.
+
+    Args:
+        player (Player): joueur.
+
+    Raises:
+        AssertionError: Le statut code n'est pas correct.
+    """
+    with assert_num_queries(5):
+        response = client.get(f"/players/club/{player.club_id}")
+    if response.status_code != 200:
+        raise AssertionError("Le statut code n'est pas correct.")
+
+
+def test_read_clubs_queries(player: Player):
+    """Test du nombre de requêtes des routes de clubs.
+
+    Args:
+        player (Player): joueur.
+
+    Raises:
+        AssertionError: Le statut code n'est pas correct.
+    """
+    with assert_num_queries(1):
+        response = client.get(f"/clubs/player/{player.id}")
+    if response.status_code != 200:
+        raise AssertionError("Le statut code n'est pas correct.")
+    with assert_num_queries(2):
+        response = client.get(f"/clubs/country/{response.json()['country']['id']}")
+    if response.status_code != 200:
+        raise AssertionError("Le statut code n'est pas correct.")
+
+
+def test_read_countries_queries():
+    """Test du nombre de requêtes de la liste des pays, sans puis avec le cache.
+
+    Raises:
+        AssertionError: Le statut code n'est pas correct.
+    """
+    reference_cache.clear()
+    with assert_num_queries(1):
+        response = client.get("/countries/", params={"limit": 50})
+    if response.status_code != 200:
+        raise AssertionError("Le statut code n'est pas correct.")
+    with assert_num_queries(0):
+        response = client.get("/countries/", params={"limit": 50})
+    if response.status_code != 200:
+        raise AssertionError("Le statut code n'est pas correct.")
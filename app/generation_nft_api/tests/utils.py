@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_api/tests/utils.py
+"""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.generation_nft_db.database import engine
+
+
+@contextmanager
+def count_queries(bind: Engine = engine) -> Iterator[List[str]]:
+    """Enregistre les requêtes SQL exécutées sur le moteur.
+
+    Args:
+        bind (Engine, optional): moteur de la base de donnée. Défaut à engine.
+
+    Yields:
+        Iterator[List[str]]: liste des requêtes exécutées.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_num_queries(expected: int, bind: Engine = engine) -> Iterator[List[str]]:
+    """Vérifie le nombre de requêtes SQL exécutées dans le bloc.
+
+    Args:
+        expected (int): nombre de requêtes attendu.
+        bind (Engine, optional): moteur de la base de donnée. Défaut à engine.
+
+    Raises:
+        AssertionError: Le nombre de requêtes n'est pas correct.
+
+    Yields:
+        Iterator[List[str]]: liste des requêtes exécutées.
+    """
+    with count_queries(bind) as statements:
+        yield statements
+    if len(statements) != expected:
+        raise AssertionError(
+            f"Le nombre de requêtes n'est pas correct : {len(statements)} au lieu de {expected}.\n"
+            + "\n".join(statements)
+        )
@@ -54,6 +54,7 @@ def convert_players_names(players: List[Player]) -> List[PlayerNestedOut]:
             countries=player.countries,
             positions=player.positions,
             stats=player.stats,
+            Rarity=player.rarity,
         )
         for player in players
     ]
@@ -82,5 +83,6 @@ def convert_player_names(player: Player) -> Optional[PlayerNestedOut]:
             countries=player.countries,
             positions=player.positions,
             stats=player.stats,
+            Rarity=player.rarity,
         )
     return None
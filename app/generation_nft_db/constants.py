@@ -24,6 +24,7 @@ ______                           _           _
 
 File: app/generation_nft_db/constants.py
 """
+import re
 from enum import Enum
 
 from app.settings import settings
@@ -169,6 +170,9 @@ FIXTURES_ORDER = [
     {"table": FixtureEnum.FACE_PARTS_COLORS.value},
 ]
 
+# espaces ignorés lors de la comparaison des valeurs des fixtures
+WHITESPACE_PATTERN = re.compile(r"\s")
+
 
 class NameTypeCode(Enum):
     """Name type code liste.
@@ -761,3 +765,18 @@ class EyesColor(Enum):
     COLOR_7 = "#96421D"
     COLOR_8 = "#2E1C1C"
     COLOR_9 = "#9A9ABE"
+
+
+class CacheNamespace(Enum):
+    """Cache namespace liste des données de référence.
+
+    Args:
+        Enum (enum): enumération.
+    """
+
+    COUNTRIES = "countries"
+    DIVISIONS = "divisions"
+    NFT_PARTS = "nft_parts"
+    POSITIONS = "positions"
+    RARITIES = "rarities"
+    STATS = "stats"
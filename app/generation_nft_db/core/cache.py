@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_db/core/cache.py
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.generation_nft_db.constants import CacheNamespace
+from app.settings import settings
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Entrée du cache des données de référence."""
+
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class ReferenceCache:
+    """Cache en mémoire des données de référence, partagé par le processus.
+
+    Le nombre d'entrées est borné : les moins récemment lues sont retirées en premier.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.REFERENCE_CACHE_TTL,
+        max_entries: int = settings.REFERENCE_CACHE_MAX_ENTRIES,
+    ):
+        """Initialise le cache.
+
+        Args:
+            ttl (int, optional): durée de vie d'une entrée en secondes. Défaut à settings.REFERENCE_CACHE_TTL.
+            max_entries (int, optional): nombre maximum d'entrées. Défaut à settings.REFERENCE_CACHE_MAX_ENTRIES.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = Lock()
+        self.entries: Dict[Tuple[CacheNamespace, Hashable], CacheEntry] = OrderedDict()
+        self.versions: Dict[CacheNamespace, int] = {}
+
+    def version(self, namespace: CacheNamespace) -> int:
+        """Récupère la version d'un espace de noms, incrémentée à chaque invalidation.
+
+        Args:
+            namespace (CacheNamespace): espace de noms.
+
+        Returns:
+            int: version.
+        """
+        with self.lock:
+            return self.versions.get(namespace, 0)
+
+    def get(self, namespace: CacheNamespace, key: Hashable) -> Optional[CacheEntry]:
+        """Récupère une entrée du cache.
+
+        Args:
+            namespace (CacheNamespace): espace de noms.
+            key (Hashable): clé.
+
+        Returns:
+            Optional[CacheEntry]: entrée ou None si absente ou expirée.
+        """
+        with self.lock:
+            entry = self.entries.get((namespace, key))
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                del self.entries[(namespace, key)]
+                return None
+            self.entries.move_to_end((namespace, key))
+            return entry
+
+    def set(
+        self, namespace: CacheNamespace, key: Hashable, value: Any, version: int
+    ) -> CacheEntry:
+        """Ajoute une valeur sérialisable en JSON dans le cache.
+
+        La valeur n'est pas conservée si l'espace de noms a été invalidé
+        depuis la lecture de sa version, pour ne pas garder une donnée
+        chargée avant une écriture. Les entrées expirées sont retirées, puis
+        les moins récemment lues au-delà de max_entries.
+
+        Args:
+            namespace (CacheNamespace): espace de noms.
+            key (Hashable): clé.
+            value (Any): valeur sérialisable en JSON.
+            version (int): version de l'espace de noms avant le chargement.
+
+        Returns:
+            CacheEntry: entrée.
+        """
+        body = json.dumps(value, separators=(",", ":")).encode()
+        entry = CacheEntry(
+            body=body,
+            etag=hashlib.sha1(body).hexdigest(),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self.lock:
+            if self.versions.get(namespace, 0) != version:
+                return entry
+            now = time.monotonic()
+            for cache_key in [
+                cache_key
+                for cache_key, cached in self.entries.items()
+                if cached.expires_at < now
+            ]:
+                del self.entries[cache_key]
+            self.entries[(namespace, key)] = entry
+            self.entries.move_to_end((namespace, key))
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, *namespaces: CacheNamespace):
+        """Invalide des espaces de noms.
+
+        Args:
+            namespaces (CacheNamespace): espaces de noms.
+        """
+        with self.lock:
+            for namespace in namespaces:
+                self.versions[namespace] = self.versions.get(namespace, 0) + 1
+            self.entries = OrderedDict(
+                (cache_key, entry)
+                for cache_key, entry in self.entries.items()
+                if cache_key[0] not in namespaces
+            )
+
+    def clear(self):
+        """Vide le cache."""
+        self.invalidate(*CacheNamespace)
+
+
+reference_cache = ReferenceCache()
+
+
+def invalidates(*namespaces: CacheNamespace) -> Callable:
+    """Décorateur qui invalide des espaces de noms après une écriture.
+
+    Args:
+        namespaces (CacheNamespace): espaces de noms.
+
+    Returns:
+        Callable: décorateur.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            try:
+                return function(*args, **kwargs)
+            finally:
+                reference_cache.invalidate(*namespaces)
+
+        return wrapper
+
+    return decorator
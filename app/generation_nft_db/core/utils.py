@@ -24,10 +24,14 @@ ______                           _           _
 
 File: app/generation_nft_db/core/utils.py
 """
+from typing import Callable, Optional
+
+from sqlalchemy import Column
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from app import logger_api
+from app.generation_nft_db.schemas.pagination import Page
 
 
 def add_multiple_into_database(db: Session, models: list):
@@ -64,3 +68,36 @@ def add_into_database(db: Session, model: object):
     except IntegrityError as e:
         logger_api.error(e)
         raise e
+
+
+def paginate(
+    query: Query,
+    column: Column,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    convert: Optional[Callable[[list], list]] = None,
+) -> Page:
+    """Pagine une requête par curseur (keyset) sur une colonne unique.
+
+    La page commence après la valeur du curseur au lieu de sauter les lignes précédentes : une page
+    profonde coûte autant que la première.
+
+    Args:
+        query (Query): requête à paginer.
+        column (Column): colonne unique triée, en général l'id.
+        cursor (Optional[int], optional): valeur de la colonne du dernier élément de la page précédente. Défaut à None.
+        limit (int, optional): limit. Défaut à 100.
+        convert (Optional[Callable[[list], list]], optional): conversion des éléments de la page. Défaut à None.
+
+    Returns:
+        Page: éléments de la page et curseur de la page suivante, None si c'est la dernière.
+    """
+    if cursor is not None:
+        query = query.filter(column > cursor)
+    items = query.order_by(column).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = getattr(items[-1], column.key) if items else None
+    return Page(items=convert(items) if convert else items, next_cursor=next_cursor)
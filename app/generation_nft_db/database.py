@@ -24,8 +24,15 @@ ______                           _           _
 
 File: app/generation_nft_db/database.py
 """
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.settings import settings
 
@@ -45,5 +52,96 @@ def get_url() -> str:
     return f"postgresql://{user}:{password}@{server_port}/{db}"
 
 
-engine = create_engine(get_url(), pool_pre_ping=True)
+class PoolWaits:
+    """Statistiques d'attente d'une connexion du pool."""
+
+    def __init__(self):
+        """Initialise les statistiques d'attente."""
+        self.lock = Lock()
+        self.count = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float, timeout: bool = False):
+        """Enregistre une attente.
+
+        Args:
+            duration (float): durée de l'attente en secondes.
+            timeout (bool, optional): l'attente a dépassé pool_timeout ? Défaut à False.
+        """
+        with self.lock:
+            self.count += 1
+            self.timeouts += timeout
+            self.total += duration
+            self.max = max(self.max, duration)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool qui mesure le temps d'attente d'une connexion."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialise le pool."""
+        super().__init__(*args, **kwargs)
+        self.waits = PoolWaits()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            self.waits.record(time.perf_counter() - start, timeout=True)
+            raise
+        self.waits.record(time.perf_counter() - start)
+        return connection
+
+
+engine = create_engine(
+    get_url(),
+    poolclass=TimedQueuePool,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Ouvre une session hors d'une requête API et la ferme dans tous les cas.
+
+    Yields:
+        Iterator[Session]: session de la base de donnée.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def get_pool_metrics() -> dict:
+    """Récupère les métriques du pool de connexions.
+
+    Returns:
+        dict: métriques du pool de connexions.
+    """
+    pool = engine.pool
+    waits = pool.waits
+    with waits.lock:
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "waits": waits.count,
+            "wait_timeouts": waits.timeouts,
+            "wait_time_total": waits.total,
+            "wait_time_max": waits.max,
+        }
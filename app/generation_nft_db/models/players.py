@@ -29,6 +29,7 @@ from sqlalchemy import (
     Column,
     Date,
     ForeignKey,
+    Identity,
     Integer,
     SmallInteger,
     String,
@@ -56,6 +57,8 @@ players_positions = Table(
     Column(
         "position_id", ForeignKey("positions.id", ondelete="cascade"), primary_key=True
     ),
+    # ordre d'insertion des postes, le premier est le poste principal du joueur
+    Column("rank", BigInteger, Identity(), nullable=False),
 )
 
 
@@ -117,6 +120,7 @@ class Player(Base):
         secondary=players_positions,
         back_populates="players",
         cascade=all_delete,
+        order_by=players_positions.c.rank,
     )
     rarity = relationship("Rarity", back_populates="players", cascade=all_delete)
     combinations = relationship(
@@ -24,17 +24,26 @@ ______                           _           _
 
 File: app/generation_nft_db/repositories/clubs.py
 """
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.exceptions import PronochainException
+from app.generation_nft_db.core.utils import paginate
 from app.generation_nft_db.models import clubs as model_clubs
 from app.generation_nft_db.models import countries as model_countries
 from app.generation_nft_db.models import divisions as model_divisions
 from app.generation_nft_db.models import players as model_players
 from app.generation_nft_db.schemas import clubs as schema_clubs
+from app.generation_nft_db.schemas import pagination as schema_pagination
+
+club_nested_options = (
+    joinedload(model_clubs.Club.country).lazyload("*"),
+    joinedload(model_clubs.Club.division).lazyload("*"),
+    joinedload(model_clubs.Club.first_color).lazyload("*"),
+    joinedload(model_clubs.Club.second_color).lazyload("*"),
+)
 
 
 def get_club(
@@ -50,7 +59,11 @@ def get_club(
     Returns:
         schema_clubs.ClubNestedOut: club.
     """
-    club_query = db.query(model_clubs.Club).filter(model_clubs.Club.id == club_id)
+    club_query = (
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .filter(model_clubs.Club.id == club_id)
+    )
     return club_query.first() if return_one else club_query
 
 
@@ -67,8 +80,10 @@ def get_club_by_code(
     Returns:
         schema_clubs.ClubNestedOut: club
     """
-    club_code_query = db.query(model_clubs.Club).filter(
-        model_clubs.Club.code == club_code
+    club_code_query = (
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .filter(model_clubs.Club.code == club_code)
     )
     return club_code_query.first() if return_one else club_code_query
 
@@ -84,10 +99,11 @@ def get_club_by_player(db: Session, player_id: str) -> schema_clubs.ClubNestedOu
         schema_clubs.ClubNestedOut: club.
     """
     return (
-        db.query(model_players.Player)
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .join(model_clubs.Club.players)
         .filter(model_players.Player.id == player_id)
         .first()
-        .club
     )
 
 
@@ -104,10 +120,11 @@ def get_club_by_player_code(
         schema_clubs.ClubNestedOut: club.
     """
     return (
-        db.query(model_players.Player)
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .join(model_clubs.Club.players)
         .filter(model_players.Player.code == player_code)
         .first()
-        .club
     )
 
 
@@ -124,7 +141,13 @@ def get_clubs(
     Returns:
         List[schema_clubs.ClubNestedOut]: liste de club.
     """
-    return db.query(model_clubs.Club).offset(skip).limit(limit).all()
+    return (
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
 def get_clubs_by_division(
@@ -142,18 +165,19 @@ def get_clubs_by_division(
     Returns:
         List[schema_clubs.ClubNestedOut]: liste de club.
     """
-    try:
-        division_clubs = (
-            db.query(model_divisions.Division)
-            .filter(model_divisions.Division.id == division_id)
-            .first()
-            .clubs
-        )
-    except Exception:
+    division_id = (
+        db.query(model_divisions.Division.id)
+        .filter(model_divisions.Division.id == division_id)
+        .scalar()
+    )
+    if division_id is None:
         raise AttributeError
-    if any(division_clubs):
-        return division_clubs
-    return []
+    return (
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .filter(model_clubs.Club.division_id == division_id)
+        .all()
+    )
 
 
 def get_clubs_by_division_code(
@@ -171,74 +195,87 @@ def get_clubs_by_division_code(
     Returns:
         List[schema_clubs.ClubNestedOut]: liste de club.
     """
-    try:
-        division_clubs_code = (
-            db.query(model_divisions.Division)
-            .filter(model_divisions.Division.code == division_code)
-            .first()
-            .clubs
-        )
-    except Exception:
+    division_id = (
+        db.query(model_divisions.Division.id)
+        .filter(model_divisions.Division.code == division_code)
+        .scalar()
+    )
+    if division_id is None:
         raise AttributeError
-    if any(division_clubs_code):
-        return division_clubs_code
-    return []
+    return (
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .filter(model_clubs.Club.division_id == division_id)
+        .all()
+    )
 
 
 def get_clubs_by_country(
-    db: Session, country_id: int, skip: int = 0, limit: int = 100
-) -> List[schema_clubs.ClubNestedOut]:
+    db: Session, country_id: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_clubs.ClubNestedOut]:
     """Récupère une liste de clubs par pays.
 
     Args:
         db (Session): session de la base de donnée.
         country_id (int): id country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le pays n'existe pas.
 
     Returns:
-        List[schema_clubs.ClubNestedOut]: liste de club.
+        schema_pagination.Page[schema_clubs.ClubNestedOut]: page de club et curseur de la page suivante.
     """
-    try:
-        return (
-            db.query(model_countries.Country)
-            .filter(model_countries.Country.id == country_id)
-            .first()
-            .clubs[skip : skip + limit]
-        )
-    except Exception:
+    country_id = (
+        db.query(model_countries.Country.id)
+        .filter(model_countries.Country.id == country_id)
+        .scalar()
+    )
+    if country_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .filter(model_clubs.Club.country_id == country_id),
+        model_clubs.Club.id,
+        cursor,
+        limit,
+    )
 
 
 def get_clubs_by_country_code(
-    db: Session, country_code: str, skip: int = 0, limit: int = 100
-) -> List[schema_clubs.ClubNestedOut]:
+    db: Session, country_code: str, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_clubs.ClubNestedOut]:
     """Récupère une liste de clubs par pays par code.
 
     Args:
         db (Session): session de la base de donnée.
         country_code (str): code country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le pays n'existe pas.
 
     Returns:
-        List[schema_clubs.ClubNestedOut]: liste de club.
+        schema_pagination.Page[schema_clubs.ClubNestedOut]: page de club et curseur de la page suivante.
     """
-    try:
-        return (
-            db.query(model_countries.Country)
-            .filter(model_countries.Country.code == country_code)
-            .first()
-            .clubs[skip : skip + limit]
-        )
-    except Exception:
+    country_id = (
+        db.query(model_countries.Country.id)
+        .filter(model_countries.Country.code == country_code)
+        .scalar()
+    )
+    if country_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_clubs.Club)
+        .options(*club_nested_options)
+        .filter(model_clubs.Club.country_id == country_id),
+        model_clubs.Club.id,
+        cursor,
+        limit,
+    )
 
 
 def create_club(
@@ -28,16 +28,20 @@ from typing import List
 
 from fastapi import UploadFile
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload
 
 from app.exceptions import PronochainException
 from app.generation_nft.libraries.storage.storage import Storage
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import invalidates
 from app.generation_nft_db.models import countries as model_countries
 from app.generation_nft_db.schemas import countries as schema_countries
 from app.settings import settings
 
 nft_storage = Storage()
 
+country_out_options = (lazyload("*"),)
+
 
 def get_country(
     db: Session, country_id: int, return_one: bool = True
@@ -52,8 +56,10 @@ def get_country(
     Returns:
         schema_countries.CountryOut: country.
     """
-    country_query = db.query(model_countries.Country).filter(
-        model_countries.Country.id == country_id
+    country_query = (
+        db.query(model_countries.Country)
+        .options(*country_out_options)
+        .filter(model_countries.Country.id == country_id)
     )
     return country_query.first() if return_one else country_query
 
@@ -71,8 +77,10 @@ def get_country_by_code(
     Returns:
         schema_countries.CountryOut: country.
     """
-    country_code_query = db.query(model_countries.Country).filter(
-        model_countries.Country.code == country_code
+    country_code_query = (
+        db.query(model_countries.Country)
+        .options(*country_out_options)
+        .filter(model_countries.Country.code == country_code)
     )
     return country_code_query.first() if return_one else country_code_query
 
@@ -90,9 +98,16 @@ def get_countries(
     Returns:
         List[schema_countries.CountryOut]: liste de country.
     """
-    return db.query(model_countries.Country).offset(skip).limit(limit).all()
+    return (
+        db.query(model_countries.Country)
+        .options(*country_out_options)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
+@invalidates(CacheNamespace.COUNTRIES, CacheNamespace.DIVISIONS)
 def create_country(
     db: Session, code: str, value: str, file: UploadFile
 ) -> schema_countries.CountryOut:
@@ -129,6 +144,7 @@ def create_country(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.COUNTRIES, CacheNamespace.DIVISIONS)
 def update_country(
     db: Session, country_id: int, code: str, value: str, file: UploadFile
 ) -> schema_countries.CountryOut:
@@ -165,6 +181,7 @@ def update_country(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.COUNTRIES, CacheNamespace.DIVISIONS)
 def delete_country(db: Session, country_id: int):
     """Supprime un pays.
 
@@ -185,6 +202,7 @@ def delete_country(db: Session, country_id: int):
         raise PronochainException("Country not found")
 
 
+@invalidates(CacheNamespace.COUNTRIES, CacheNamespace.DIVISIONS)
 def delete_country_by_code(db: Session, country_code: str):
     """Supprime un pays par code.
 
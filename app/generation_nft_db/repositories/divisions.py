@@ -30,6 +30,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.exceptions import PronochainException
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import invalidates
 from app.generation_nft_db.models import countries as model_countries
 from app.generation_nft_db.models import divisions as model_divisions
 from app.generation_nft_db.schemas import divisions as schema_divisions
@@ -147,6 +149,7 @@ def get_divisions_by_country_code(
     return []
 
 
+@invalidates(CacheNamespace.DIVISIONS)
 def create_division(
     db: Session, division: schema_divisions.DivisionCreate
 ) -> schema_divisions.DivisionNestedOut:
@@ -172,6 +175,7 @@ def create_division(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.DIVISIONS)
 def update_division(
     db: Session, division_id: int, division: schema_divisions.DivisionUpdate
 ) -> schema_divisions.DivisionNestedOut:
@@ -199,6 +203,7 @@ def update_division(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.DIVISIONS)
 def delete_division(db: Session, division_id: int):
     """Supprime une division.
 
@@ -217,6 +222,7 @@ def delete_division(db: Session, division_id: int):
         raise PronochainException("Division not found")
 
 
+@invalidates(CacheNamespace.DIVISIONS)
 def delete_division_by_code(db: Session, division_code: int):
     """Supprime une division par code.
 
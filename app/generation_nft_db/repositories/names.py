@@ -24,14 +24,16 @@ ______                           _           _
 
 File: app/generation_nft_db/repositories/names.py
 """
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.exceptions import PronochainException
+from app.generation_nft_db.core.utils import paginate
 from app.generation_nft_db.models import names as model_names
 from app.generation_nft_db.schemas import names as schema_names
+from app.generation_nft_db.schemas import pagination as schema_pagination
 
 
 def get_name(
@@ -118,59 +120,67 @@ def get_name_types(db: Session) -> List[schema_names.NameTypeOut]:
 
 
 def get_names_by_type(
-    db: Session, name_type_id: int, skip: int = 0, limit: int = 100
-) -> List[schema_names.NameOut]:
+    db: Session, name_type_id: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_names.NameOut]:
     """Récupère une liste de noms par type.
 
     Args:
         db (Session): session de la base de donnée.
         name_type_id (int): id name type.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le type de nom n'existe pas.
 
     Returns:
-        List[schema_names.NameOut]: liste de name.
+        schema_pagination.Page[schema_names.NameOut]: page de name et curseur de la page suivante.
     """
-    try:
-        return (
-            db.query(model_names.NameType)
-            .filter(model_names.NameType.id == name_type_id)
-            .first()
-            .names[skip : skip + limit]
-        )
-    except Exception:
+    name_type_id = (
+        db.query(model_names.NameType.id)
+        .filter(model_names.NameType.id == name_type_id)
+        .scalar()
+    )
+    if name_type_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_names.Name).filter(model_names.Name.type_id == name_type_id),
+        model_names.Name.id,
+        cursor,
+        limit,
+    )
 
 
 def get_names_by_type_code(
-    db: Session, name_type_code: int, skip: int = 0, limit: int = 100
-) -> List[schema_names.NameOut]:
+    db: Session, name_type_code: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_names.NameOut]:
     """Récupère une liste de noms par type par code.
 
     Args:
         db (Session): session de la base de donnée.
         name_type_code (int): code name type.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le type de nom n'existe pas.
 
     Returns:
-        List[schema_names.NameOut]: liste de name.
+        schema_pagination.Page[schema_names.NameOut]: page de name et curseur de la page suivante.
     """
-    try:
-        return (
-            db.query(model_names.NameType)
-            .filter(model_names.NameType.code == name_type_code)
-            .first()
-            .names[skip : skip + limit]
-        )
-    except Exception:
+    name_type_id = (
+        db.query(model_names.NameType.id)
+        .filter(model_names.NameType.code == name_type_code)
+        .scalar()
+    )
+    if name_type_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_names.Name).filter(model_names.Name.type_id == name_type_id),
+        model_names.Name.id,
+        cursor,
+        limit,
+    )
 
 
 def create_name(
@@ -32,6 +32,8 @@ from sqlalchemy.orm import Session, joinedload
 
 from app.exceptions import PronochainException
 from app.generation_nft.libraries.storage.storage import Storage
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import invalidates
 from app.generation_nft_db.models import nft_parts as model_nft
 from app.generation_nft_db.models import rarities as model_rarities
 from app.generation_nft_db.schemas import nft_parts as schema_nft
@@ -90,6 +92,7 @@ def get_nft_parts(db: Session) -> List[schema_nft.NftPartNestedOut]:
     return db.query(model_nft.NftPart).all()
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def create_nft_part(
     db: Session, nft_part: schema_nft.NftPartCreate
 ) -> schema_nft.NftPartNestedOut:
@@ -115,6 +118,7 @@ def create_nft_part(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def update_nft_part(
     db: Session, nft_part_id: int, nft_part: schema_nft.NftPartUpdate
 ) -> schema_nft.NftPartNestedOut:
@@ -142,6 +146,7 @@ def update_nft_part(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_nft_part(db: Session, nft_part_id: int):
     """Supprime une partie d'un NFT.
 
@@ -160,6 +165,7 @@ def delete_nft_part(db: Session, nft_part_id: int):
         raise PronochainException("Nft part not found")
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_nft_part_by_code(db: Session, nft_part_code: int):
     """Supprime une partie d'un NFT par code.
 
@@ -238,6 +244,7 @@ def get_face_parts(db: Session) -> List[schema_nft.FacePartNestedOut]:
     )
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def create_face_part(
     db: Session, face_part: schema_nft.FacePartCreate
 ) -> schema_nft.FacePartNestedOut:
@@ -274,6 +281,7 @@ def create_face_part(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def update_face_part(
     db: Session, face_part_id: int, face_part: schema_nft.FacePartUpdate
 ) -> schema_nft.FacePartNestedOut:
@@ -323,6 +331,7 @@ def update_face_part(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_face_part(db: Session, face_part_id: int):
     """Supprime une partie de visage.
 
@@ -341,6 +350,7 @@ def delete_face_part(db: Session, face_part_id: int):
         raise PronochainException("Face part not found")
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_face_part_by_code(db: Session, face_part_code: int):
     """Supprime une partie de visage par code.
 
@@ -411,6 +421,7 @@ def get_element_types(db: Session) -> List[schema_nft.ElementTypeNestedOut]:
     return db.query(model_nft.ElementType).all()
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def create_element_type(
     db: Session, element_type: schema_nft.ElementTypeCreate
 ) -> schema_nft.ElementTypeNestedOut:
@@ -436,6 +447,7 @@ def create_element_type(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def update_element_type(
     db: Session, element_type_id: int, element_type: schema_nft.ElementTypeUpdate
 ) -> schema_nft.ElementTypeNestedOut:
@@ -465,6 +477,7 @@ def update_element_type(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_element_type(db: Session, element_type_id: int):
     """Supprime un type d'élément.
 
@@ -485,6 +498,7 @@ def delete_element_type(db: Session, element_type_id: int):
         raise PronochainException("Element type not found")
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_element_type_by_code(db: Session, element_type_code: int):
     """Supprime un type d'élément par code.
 
@@ -607,6 +621,7 @@ def get_elements(db: Session) -> List[schema_nft.ElementNestedOut]:
     return db.query(model_nft.Element).all()
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def create_element(
     db: Session,
     code: int,
@@ -664,6 +679,7 @@ def create_element(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def update_element(
     db: Session,
     element_id: int,
@@ -723,6 +739,7 @@ def update_element(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_element(db: Session, element_id: int):
     """Supprime un élément.
 
@@ -743,6 +760,7 @@ def delete_element(db: Session, element_id: int):
         raise PronochainException("Element not found")
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_element_by_code(db: Session, element_code: int):
     """Supprime un élément par code.
 
@@ -964,6 +982,7 @@ def get_colors(
     return db.query(model_nft.Color).offset(skip).limit(limit).all()
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def create_color(
     db: Session, color: schema_nft.ColorCreate
 ) -> schema_nft.ColorNestedOut:
@@ -989,6 +1008,7 @@ def create_color(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def update_color(
     db: Session, color_id: int, color: schema_nft.ColorUpdate
 ) -> schema_nft.ColorNestedOut:
@@ -1016,6 +1036,7 @@ def update_color(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_color(db: Session, color_id: int):
     """Supprime une couleur.
 
@@ -1090,6 +1111,7 @@ def get_colors_by_nft_part_code(
     return []
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def create_dependent_face_parts_colors(
     db: Session,
     dependent_face_parts_colors: List[schema_nft.DependentFacePartColorCreate],
@@ -1125,6 +1147,7 @@ def create_dependent_face_parts_colors(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.NFT_PARTS, CacheNamespace.POSITIONS)
 def delete_dependent_face_parts_colors(
     db: Session,
     dependent_face_parts_colors: List[schema_nft.DependentFacePartColorDelete],
@@ -26,19 +26,25 @@ File: app/generation_nft_db/repositories/players.py
 """
 import warnings
 from dataclasses import fields
-from typing import List
+from typing import Dict, List, Optional, Set
+from zipfile import ZipFile
 
 import requests
 from fastapi import UploadFile
 from psycopg2 import IntegrityError
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, joinedload, lazyload, selectinload
 
 from app.exceptions import PronochainException
 from app.generation_nft.libraries.storage.storage import Storage
 from app.generation_nft_api.utils import convert_player_names, convert_players_names
 from app.generation_nft_db.constants import NameTypeCode, StatCode
-from app.generation_nft_db.core.utils import add_into_database
+from app.generation_nft_db.core.utils import (
+    add_into_database,
+    add_multiple_into_database,
+    paginate,
+)
 from app.generation_nft_db.models import clubs as model_clubs
 from app.generation_nft_db.models import countries as model_countries
 from app.generation_nft_db.models import names as model_names
@@ -46,6 +52,7 @@ from app.generation_nft_db.models import players as model_players
 from app.generation_nft_db.models import positions as model_positions
 from app.generation_nft_db.models import rarities as model_rarities
 from app.generation_nft_db.models import stats as model_stats
+from app.generation_nft_db.schemas import pagination as schema_pagination
 from app.generation_nft_db.schemas import players as schema_players
 from app.settings import settings
 
@@ -55,6 +62,16 @@ nft_storage = Storage()
 
 application_json = "application/json"
 
+player_nested_options = (
+    joinedload(model_players.Player.first_name).lazyload("*"),
+    joinedload(model_players.Player.last_name).lazyload("*"),
+    joinedload(model_players.Player.club).lazyload("*"),
+    joinedload(model_players.Player.rarity).lazyload("*"),
+    selectinload(model_players.Player.countries).lazyload("*"),
+    selectinload(model_players.Player.positions).lazyload("*"),
+    selectinload(model_players.Player.stats).lazyload("*"),
+)
+
 
 def get_player(
     db: Session, player_id: int, return_one: bool = True
@@ -69,8 +86,10 @@ def get_player(
     Returns:
         schema_players.PlayerNestedOut: player.
     """
-    player_query = db.query(model_players.Player).filter(
-        model_players.Player.id == player_id
+    player_query = (
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.id == player_id)
     )
     return convert_player_names(player_query.first()) if return_one else player_query
 
@@ -88,8 +107,10 @@ def get_player_by_code(
     Returns:
         schema_players.PlayerNestedOut: player.
     """
-    player_code_query = db.query(model_players.Player).filter(
-        model_players.Player.code == player_code
+    player_code_query = (
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.code == player_code)
     )
     return (
         convert_player_names(player_code_query.first())
@@ -112,288 +133,364 @@ def get_players(
         List[schema_players.PlayerNestedOut]: liste de players.
     """
     return convert_players_names(
-        db.query(model_players.Player).offset(skip).limit(limit).all()
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .offset(skip)
+        .limit(limit)
+        .all()
     )
 
 
 def get_players_by_country(
-    db: Session, country_id: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, country_id: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par pays.
 
     Args:
         db (Session): session de la base de donnée.
         country_id (int): id country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le pays n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_countries.Country)
-            .filter(model_countries.Country.id == country_id)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    country_id = (
+        db.query(model_countries.Country.id)
+        .filter(model_countries.Country.id == country_id)
+        .scalar()
+    )
+    if country_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(
+            model_players.Player.countries.any(model_countries.Country.id == country_id)
+        ),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_country_code(
-    db: Session, country_code: str, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, country_code: str, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par pays par code.
 
     Args:
         db (Session): session de la base de donnée.
         country_code (str): code country.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le pays n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_countries.Country)
-            .filter(model_countries.Country.code == country_code)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    country_id = (
+        db.query(model_countries.Country.id)
+        .filter(model_countries.Country.code == country_code)
+        .scalar()
+    )
+    if country_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(
+            model_players.Player.countries.any(model_countries.Country.id == country_id)
+        ),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_club(
-    db: Session, club_id: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, club_id: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par club.
 
     Args:
         db (Session): session de la base de donnée.
         club_id (int): id club.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le club n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_clubs.Club)
-            .filter(model_clubs.Club.id == club_id)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    club_id = (
+        db.query(model_clubs.Club.id).filter(model_clubs.Club.id == club_id).scalar()
+    )
+    if club_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.club_id == club_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_club_code(
-    db: Session, club_code: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, club_code: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par club par code.
 
     Args:
         db (Session): session de la base de donnée.
         club_code (int): code club.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le club n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_clubs.Club)
-            .filter(model_clubs.Club.code == club_code)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    club_id = (
+        db.query(model_clubs.Club.id)
+        .filter(model_clubs.Club.code == club_code)
+        .scalar()
+    )
+    if club_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.club_id == club_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_rarity(
-    db: Session, rarity_id: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, rarity_id: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par rareté.
 
     Args:
         db (Session): session de la base de donnée.
         rarity_id (int): id rareté.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: la rareté n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_rarities.Rarity)
-            .filter(model_rarities.Rarity.id == rarity_id)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    rarity_id = (
+        db.query(model_rarities.Rarity.id)
+        .filter(model_rarities.Rarity.id == rarity_id)
+        .scalar()
+    )
+    if rarity_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.rarity_id == rarity_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_rarity_code(
-    db: Session, rarity_code: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, rarity_code: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par rareté par code.
 
     Args:
         db (Session): session de la base de donnée.
         rarity_code (int): code rareté.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: la rareté n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_rarities.Rarity)
-            .filter(model_rarities.Rarity.code == rarity_code)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    rarity_id = (
+        db.query(model_rarities.Rarity.id)
+        .filter(model_rarities.Rarity.code == rarity_code)
+        .scalar()
+    )
+    if rarity_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.rarity_id == rarity_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_first_name(
-    db: Session, first_name_id: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, first_name_id: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par prénom.
 
     Args:
         db (Session): session de la base de donnée.
         first_name_id (int): id first name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le prénom n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_names.Name)
-            .filter(model_names.Name.id == first_name_id)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    first_name_id = (
+        db.query(model_names.Name.id)
+        .filter(model_names.Name.id == first_name_id)
+        .scalar()
+    )
+    if first_name_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.first_name_id == first_name_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_first_name_code(
-    db: Session, first_name_code: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, first_name_code: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par prénom par code.
 
     Args:
         db (Session): session de la base de donnée.
         first_name_code (int): code first name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le prénom n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_names.Name)
-            .filter(model_names.Name.code == first_name_code)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    first_name_id = (
+        db.query(model_names.Name.id)
+        .filter(model_names.Name.code == first_name_code)
+        .scalar()
+    )
+    if first_name_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.first_name_id == first_name_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_last_name(
-    db: Session, last_name_id: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, last_name_id: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par nom de famille.
 
     Args:
         db (Session): session de la base de donnée.
         last_name_id (int): id last name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le nom de famille n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_names.Name)
-            .filter(model_names.Name.id == last_name_id)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    last_name_id = (
+        db.query(model_names.Name.id)
+        .filter(model_names.Name.id == last_name_id)
+        .scalar()
+    )
+    if last_name_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.last_name_id == last_name_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_last_name_code(
-    db: Session, last_name_code: int, skip: int = 0, limit: int = 100
-) -> List[schema_players.PlayerNestedOut]:
+    db: Session, last_name_code: int, cursor: Optional[int] = None, limit: int = 100
+) -> schema_pagination.Page[schema_players.PlayerNestedOut]:
     """Récupère une liste de players par nom de famille par code.
 
     Args:
         db (Session): session de la base de donnée.
         last_name_code (int): code last name.
-        skip (int, optional): skip. Défaut à 0.
+        cursor (Optional[int], optional): id du dernier élément de la page précédente. Défaut à None.
         limit (int, optional): limit. Défaut à 100.
 
     Raises:
         AttributeError: le nom de famille n'existe pas.
 
     Returns:
-        List[schema_players.PlayerNestedOut]: liste de players.
+        schema_pagination.Page[schema_players.PlayerNestedOut]: page de players et curseur de la page suivante.
     """
-    try:
-        return convert_players_names(
-            db.query(model_names.Name)
-            .filter(model_names.Name.code == last_name_code)
-            .first()
-            .players[skip : skip + limit]
-        )
-    except Exception:
+    last_name_id = (
+        db.query(model_names.Name.id)
+        .filter(model_names.Name.code == last_name_code)
+        .scalar()
+    )
+    if last_name_id is None:
         raise AttributeError
+    return paginate(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.last_name_id == last_name_id),
+        model_players.Player.id,
+        cursor,
+        limit,
+        convert=convert_players_names,
+    )
 
 
 def get_players_by_height(
@@ -412,6 +509,7 @@ def get_players_by_height(
     """
     return convert_players_names(
         db.query(model_players.Player)
+        .options(*player_nested_options)
         .filter(model_players.Player.height == height)
         .offset(skip)
         .limit(limit)
@@ -435,6 +533,7 @@ def get_players_by_weight(
     """
     return convert_players_names(
         db.query(model_players.Player)
+        .options(*player_nested_options)
         .filter(model_players.Player.weight == weight)
         .offset(skip)
         .limit(limit)
@@ -458,6 +557,7 @@ def get_players_by_age(
     """
     return convert_players_names(
         db.query(model_players.Player)
+        .options(*player_nested_options)
         .filter(model_players.Player.age == age)
         .offset(skip)
         .limit(limit)
@@ -599,6 +699,183 @@ def create_player(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+def get_or_create_names(
+    db: Session, values: Set[str], name_type_code: NameTypeCode
+) -> Dict[str, model_names.Name]:
+    """Récupère ou crée des noms d'un même type en une seule requête.
+
+    Args:
+        db (Session): session de la base de donnée.
+        values (Set[str]): noms.
+        name_type_code (NameTypeCode): type des noms.
+
+    Returns:
+        Dict[str, model_names.Name]: noms par valeur en minuscule.
+    """
+    names = {
+        db_name.value.lower(): db_name
+        for db_name in db.query(model_names.Name)
+        .join(model_names.Name.type)
+        .filter(
+            model_names.NameType.code == name_type_code.value,
+            func.lower(model_names.Name.value).in_([value.lower() for value in values]),
+        )
+        .order_by(model_names.Name.id.desc())
+    }
+    if missing := {
+        value.lower(): value for value in values if value.lower() not in names
+    }:
+        name_type = (
+            db.query(model_names.NameType)
+            .filter(model_names.NameType.code == name_type_code.value)
+            .first()
+        )
+        db_names = [
+            model_names.Name(value=value, type=name_type) for value in missing.values()
+        ]
+        add_multiple_into_database(db, db_names)
+        names.update(zip(missing, db_names))
+    return names
+
+
+def import_players(
+    db: Session,
+    players: List[schema_players.PlayerImport],
+    archive: Optional[UploadFile] = None,
+) -> List[schema_players.PlayerNestedOut]:
+    """Importe plusieurs players en une seule transaction.
+
+    Les statistiques, noms, pays et positions sont résolus en quelques
+    requêtes, les photos de l'archive sont envoyées en parallèle et toutes
+    les statistiques sont insérées en une seule requête.
+
+    Args:
+        db (Session): session de la base de donnée.
+        players (List[schema_players.PlayerImport]): players.
+        archive (Optional[UploadFile], optional): archive zip des photos. Défaut à None.
+
+    Raises:
+        PronochainException: une photo est absente de l'archive.
+        PronochainException: un club, un pays ou une position n'existe pas.
+        PronochainException: les players n'ont pas été crées.
+
+    Returns:
+        List[schema_players.PlayerNestedOut]: players.
+    """
+    pictures = {}
+    if archive is not None:
+        with ZipFile(archive.file) as zip_file:
+            archive_names = set(zip_file.namelist())
+            for player in players:
+                if player.filename is None:
+                    continue
+                if player.filename not in archive_names:
+                    raise PronochainException(f"{player.filename} not found in archive")
+                pictures[player.filename] = zip_file.read(player.filename)
+
+    club_ids = {player.club_id for player in players}
+    country_ids = {
+        country_id for player in players for country_id in player.country_ids
+    }
+    position_ids = {
+        position_id for player in players for position_id in player.position_ids
+    }
+    countries = {
+        db_country.id: db_country
+        for db_country in db.query(model_countries.Country).filter(
+            model_countries.Country.id.in_(country_ids)
+        )
+    }
+    positions = {
+        db_position.id: db_position
+        for db_position in db.query(model_positions.Position)
+        .options(lazyload("*"))
+        .filter(model_positions.Position.id.in_(position_ids))
+    }
+    known_club_ids = {
+        club_id
+        for club_id, in db.query(model_clubs.Club.id).filter(
+            model_clubs.Club.id.in_(club_ids)
+        )
+    }
+    # un identifiant inconnu rejette tout l'import plutôt que de créer un joueur incomplet
+    for label, ids, known_ids in (
+        ("Clubs", club_ids, known_club_ids),
+        ("Countries", country_ids, countries),
+        ("Positions", position_ids, positions),
+    ):
+        if unknown_ids := sorted(ids.difference(known_ids)):
+            raise PronochainException(
+                f"{label} not found: {', '.join(map(str, unknown_ids))}"
+            )
+
+    stat_ids = dict(
+        db.query(model_stats.Stat.code, model_stats.Stat.id).filter(
+            model_stats.Stat.code.in_([stat_code.value for stat_code in StatCode])
+        )
+    )
+    first_names = get_or_create_names(
+        db, {player.first_name for player in players}, NameTypeCode.FIRST_NAME
+    )
+    last_names = get_or_create_names(
+        db, {player.last_name for player in players}, NameTypeCode.LAST_NAME
+    )
+
+    cids = {}
+    if settings.STORE_NFT_PART and pictures:
+        cids = dict(zip(pictures, nft_storage.add_many(list(pictures.values()))))
+
+    try:
+        db_players = [
+            model_players.Player(
+                code=player.code,
+                age=player.age,
+                birth=player.birth,
+                height=player.height,
+                weight=player.weight,
+                club_id=player.club_id,
+                rarity_id=player.rarity_id,
+                cid=cids.get(player.filename),
+                filename=player.filename if player.filename in cids else None,
+                first_name=first_names[player.first_name.lower()],
+                last_name=last_names[player.last_name.lower()],
+                countries=[countries[country_id] for country_id in player.country_ids],
+                positions=[
+                    positions[position_id] for position_id in player.position_ids
+                ],
+            )
+            for player in players
+        ]
+        add_multiple_into_database(db, db_players)
+        player_ids = [db_player.id for db_player in db_players]
+
+        if player_stats := [
+            {
+                "player_id": player_id,
+                "stat_id": stat_ids[getattr(StatCode, name.upper()).value],
+                "value": value,
+            }
+            for player, player_id in zip(players, player_ids)
+            for name, value in player.stats.items()
+        ]:
+            db.execute(insert(model_players.PlayerStat).values(player_stats))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        nft_storage.delete_many(list(cids.values()))
+        if isinstance(e, DBAPIError):
+            raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
+        raise
+
+    return convert_players_names(
+        db.query(model_players.Player)
+        .options(*player_nested_options)
+        .filter(model_players.Player.id.in_(player_ids))
+        .order_by(model_players.Player.id)
+        .all()
+    )
+
+
 def update_player(
     db: Session, player_id: int, player: schema_players.PlayerUpdate, file: UploadFile
 ) -> schema_players.PlayerNestedOut:
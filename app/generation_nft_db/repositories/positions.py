@@ -30,6 +30,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from app.exceptions import PronochainException
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import invalidates
 from app.generation_nft_db.models import positions as model_positions
 from app.generation_nft_db.schemas import positions as schema_positions
 
@@ -198,6 +200,7 @@ def get_positions_by_type_code(
     return []
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def create_position(
     db: Session, position: schema_positions.PositionCreate
 ) -> schema_positions.PositionNestedOut:
@@ -223,6 +226,7 @@ def create_position(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def create_position_type(
     db: Session, position_type: schema_positions.PositionTypeCreate
 ) -> schema_positions.PositionTypeNestedOut:
@@ -248,6 +252,7 @@ def create_position_type(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def update_position(
     db: Session, position_id: int, position: schema_positions.PositionUpdate
 ) -> schema_positions.PositionNestedOut:
@@ -275,6 +280,7 @@ def update_position(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def update_position_type(
     db: Session,
     position_type_id: int,
@@ -306,6 +312,7 @@ def update_position_type(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def delete_position(db: Session, position_id: int):
     """Supprime une position.
 
@@ -324,6 +331,7 @@ def delete_position(db: Session, position_id: int):
         raise PronochainException("Position not found")
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def delete_position_by_code(db: Session, position_code: int):
     """Supprime une position par code.
 
@@ -344,6 +352,7 @@ def delete_position_by_code(db: Session, position_code: int):
         raise PronochainException("Position not found")
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def delete_position_type(db: Session, position_type_id: int):
     """Supprime un type de position.
 
@@ -364,6 +373,7 @@ def delete_position_type(db: Session, position_type_id: int):
         raise PronochainException("PositionType not found")
 
 
+@invalidates(CacheNamespace.POSITIONS, CacheNamespace.STATS)
 def delete_position_type_by_code(db: Session, position_type_code: int):
     """Supprime un type de position par code.
 
@@ -30,6 +30,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.exceptions import PronochainException
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import invalidates
 from app.generation_nft_db.models import rarities as model_rarities
 from app.generation_nft_db.schemas import rarities as schema_rarities
 
@@ -84,6 +86,7 @@ def get_rarities(db: Session) -> List[schema_rarities.RarityOut]:
     return db.query(model_rarities.Rarity).all()
 
 
+@invalidates(CacheNamespace.RARITIES, CacheNamespace.NFT_PARTS)
 def create_rarity(
     db: Session, rarity: schema_rarities.RarityCreate
 ) -> schema_rarities.RarityOut:
@@ -109,6 +112,7 @@ def create_rarity(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.RARITIES, CacheNamespace.NFT_PARTS)
 def update_rarity(
     db: Session, rarity_id: int, rarity: schema_rarities.RarityUpdate
 ) -> schema_rarities.RarityOut:
@@ -136,6 +140,7 @@ def update_rarity(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.RARITIES, CacheNamespace.NFT_PARTS)
 def delete_rarity(db: Session, rarity_id: int):
     """Supprime une rareté.
 
@@ -154,6 +159,7 @@ def delete_rarity(db: Session, rarity_id: int):
         raise PronochainException("Rarity not found")
 
 
+@invalidates(CacheNamespace.RARITIES, CacheNamespace.NFT_PARTS)
 def delete_rarity_by_code(db: Session, rarity_code: int):
     """Supprime une rareté par code.
 
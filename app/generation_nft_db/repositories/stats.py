@@ -30,6 +30,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.exceptions import PronochainException
+from app.generation_nft_db.constants import CacheNamespace
+from app.generation_nft_db.core.cache import invalidates
 from app.generation_nft_db.models import positions as model_positions
 from app.generation_nft_db.models import stats as model_stats
 from app.generation_nft_db.schemas import stats as schema_stats
@@ -189,6 +191,7 @@ def get_stats_by_type_code(
     return []
 
 
+@invalidates(CacheNamespace.STATS)
 def create_stat(
     db: Session, stat: schema_stats.StatCreate
 ) -> schema_stats.StatNestedOut:
@@ -229,6 +232,7 @@ def create_stat(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.STATS)
 def create_stat_type(
     db: Session, stat_type: schema_stats.StatTypeCreate
 ) -> schema_stats.StatTypeOut:
@@ -254,6 +258,7 @@ def create_stat_type(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.STATS)
 def update_stat(
     db: Session, stat_id: int, stat: schema_stats.StatUpdate
 ) -> schema_stats.StatNestedOut:
@@ -300,6 +305,7 @@ def update_stat(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.STATS)
 def update_stat_type(
     db: Session, stat_type_id: int, stat_type: schema_stats.StatTypeUpdate
 ) -> schema_stats.StatTypeOut:
@@ -327,6 +333,7 @@ def update_stat_type(
         raise PronochainException(str(e.orig).split("DETAIL: ")[-1])
 
 
+@invalidates(CacheNamespace.STATS)
 def delete_stat(db: Session, stat_id: int):
     """Supprime une stat.
 
@@ -345,6 +352,7 @@ def delete_stat(db: Session, stat_id: int):
         raise PronochainException("Stat not found")
 
 
+@invalidates(CacheNamespace.STATS)
 def delete_stat_by_code(db: Session, stat_code: int):
     """Supprime une stat par code.
 
@@ -363,6 +371,7 @@ def delete_stat_by_code(db: Session, stat_code: int):
         raise PronochainException("Stat not found")
 
 
+@invalidates(CacheNamespace.STATS)
 def delete_stat_type(db: Session, stat_type_id: int):
     """Supprime un type de stat.
 
@@ -381,6 +390,7 @@ def delete_stat_type(db: Session, stat_type_id: int):
         raise PronochainException("StatType not found")
 
 
+@invalidates(CacheNamespace.STATS)
 def delete_stat_type_by_code(db: Session, stat_type_code: int):
     """Supprime un type de stat par code.
 
@@ -24,7 +24,7 @@ ______                           _           _
 
 File: app/generation_nft_db/schemas/generation.py
 """
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 from fastapi import Form
 from pydantic import BaseModel
@@ -108,3 +108,58 @@ class ResponseIsAlive(BaseModel):
 
     status: int
     is_active: bool
+
+
+class ResponsePoolMetrics(BaseModel):
+    """ResponsePoolMetrics schéma.
+
+    Args:
+        BaseModel (BaseModel): modèle pydantic.
+    """
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    waits: int
+    wait_timeouts: int
+    wait_time_total: float
+    wait_time_max: float
+
+
+class ResponseWarmupStep(BaseModel):
+    """ResponseWarmupStep schéma.
+
+    Args:
+        BaseModel (BaseModel): modèle pydantic.
+    """
+
+    state: str
+    duration: Optional[float]
+    detail: Optional[str]
+
+
+class ResponseReadiness(BaseModel):
+    """ResponseReadiness schéma.
+
+    Args:
+        BaseModel (BaseModel): modèle pydantic.
+    """
+
+    ready: bool
+    state: str
+    duration: Optional[float]
+    steps: Dict[str, ResponseWarmupStep]
+
+
+class ResponseQualityGateMetrics(BaseModel):
+    """ResponseQualityGateMetrics schéma.
+
+    Args:
+        BaseModel (BaseModel): modèle pydantic.
+    """
+
+    candidates: int
+    accepted: int
+    rejected: Dict[str, int]
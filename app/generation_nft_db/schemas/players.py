@@ -25,12 +25,13 @@ ______                           _           _
 File: app/generation_nft_db/schemas/players.py
 """
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from fastapi import Form, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 from pydantic.dataclasses import dataclass
 
+from app.generation_nft_db.constants import StatCode
 from app.generation_nft_db.schemas.clubs import ClubOut
 from app.generation_nft_db.schemas.countries import CountryOut
 from app.generation_nft_db.schemas.positions import PositionOut
@@ -189,6 +190,40 @@ class PlayerCreate:
     adaptability: int = Form(..., title="Adaptability")
 
 
+class PlayerImport(Player):
+    """PlayerImport schéma pour l'import de plusieurs joueurs.
+
+    Args:
+        Player (Player): modèle Player.
+    """
+
+    first_name: str
+    last_name: str
+    club_id: int
+    rarity_id: int
+    country_ids: List[int] = []
+    position_ids: List[int] = []
+    stats: Dict[str, int]
+    filename: Optional[str]
+
+    @validator("stats")
+    def check_stats(cls, v: Dict[str, int]) -> Dict[str, int]:
+        """Vérifie que les statistiques existent.
+
+        Args:
+            v (Dict[str, int]): valeurs des statistiques par nom.
+
+        Raises:
+            ValueError: une statistique n'existe pas.
+
+        Returns:
+            Dict[str, int]: v.
+        """
+        if unknown := [name for name in v if not hasattr(StatCode, name.upper())]:
+            raise ValueError(f"Unknown stats: {', '.join(unknown)}")
+        return v
+
+
 class PlayerUpdate(PlayerCreate):
     """PlayerUpdate schéma.
 
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_db/scripts/bulk.py
+"""
+import argparse
+import io
+import time
+
+import pandas as pd
+from tqdm import tqdm
+
+from app.generation_nft.libraries.storage.storage import Storage
+from app.generation_nft_db.constants import FIXTURES_ORDER, FixtureEnum, NameTypeCode
+from app.generation_nft_db.scripts.fixtures import Fixtures
+from app.generation_nft_db.scripts.queries import (
+    COUNT_EXISTING_PLAYERS,
+    INSERT_STAGED_PLAYERS,
+    INSERT_STAGED_PLAYERS_COUNTRIES,
+    INSERT_STAGED_PLAYERS_POSITIONS,
+    INSERT_STAGED_PLAYERS_STATS,
+)
+from app.settings import settings
+from app.utils import check_files
+
+
+class BulkFixtures(Fixtures):
+    """Chargement des fixtures en masse via COPY PostgreSQL.
+
+    Les joueurs et leurs statistiques sont chargés par blocs : chaque bloc est copié dans une table
+    temporaire puis les clés étrangères sont résolues en SQL. Chaque bloc est validé séparément,
+    un chargement interrompu reprend donc au premier bloc incomplet.
+    """
+
+    def __init__(self, reset: bool = False, resume: bool = False):
+        """Initialise le classe BulkFixtures.
+
+        Args:
+            reset (bool, optional): supprime les données au lieu de les ajouter. Défaut à False.
+            resume (bool, optional): reprend le chargement des joueurs sans recharger les autres fixtures. Défaut à False.
+        """
+        super().__init__(reset=reset)
+        self.resume = resume
+
+    def copy_into_staging(self, table: str, data: pd.DataFrame):
+        """Copie un bloc de données dans une table temporaire, vidée à chaque commit.
+
+        Args:
+            table (str): nom de la table temporaire.
+            data (pd.DataFrame): données à copier, toutes les colonnes sont stockées en texte.
+        """
+        columns = ", ".join(f'"{column}" TEXT' for column in data.columns)
+        buffer = io.StringIO()
+        data.to_csv(buffer, index=False, header=False, date_format="%Y-%m-%d")
+        buffer.seek(0)
+
+        connection = self.db.connection().connection
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {table} ({columns}) ON COMMIT DELETE ROWS"
+            )
+            cursor.copy_expert(f"COPY {table} FROM STDIN WITH (FORMAT csv)", buffer)
+
+    def add_players(self, table: str, parse_dates: list, **_):
+        """Ajouter les joueurs et leurs statistiques par blocs.
+
+        Un bloc dont tous les joueurs existent déjà est ignoré, les autres sont insérés sans
+        doublons (ON CONFLICT DO NOTHING).
+
+        Args:
+            table (str): nom de la table.
+            parse_dates (list): liste des colonnes de dates.
+        """
+        print("|-- START BULK ADD PLAYERS --|")
+        chunks = self.csv_to_dataframe(
+            table,
+            parse_dates,
+            chunksize=settings.FIXTURES_BULK_CHUNK_SIZE,
+            nrows=1000 if settings.LIMIT_PLAYER else None,
+        )
+        start = time.perf_counter()
+        loaded_players, skipped_players = 0, 0
+        progress = tqdm(unit="player")
+
+        for chunk in chunks:
+            codes = chunk["code"].tolist()
+            existing_players = self.db.execute(
+                COUNT_EXISTING_PLAYERS, {"codes": codes}
+            ).scalar()
+            self.db.commit()
+            if existing_players == len(set(codes)):
+                skipped_players += len(codes)
+                progress.update(len(codes))
+                continue
+
+            cids_by_code = self.get_players_cid(codes)
+
+            with self.db.begin():
+                self.copy_into_staging(
+                    "staging_players", chunk.assign(cid=chunk["code"].map(cids_by_code))
+                )
+                self.db.execute(
+                    INSERT_STAGED_PLAYERS,
+                    {
+                        "first_name_code": NameTypeCode.FIRST_NAME.value,
+                        "last_name_code": NameTypeCode.LAST_NAME.value,
+                    },
+                )
+                self.db.execute(INSERT_STAGED_PLAYERS_COUNTRIES)
+                self.db.execute(INSERT_STAGED_PLAYERS_POSITIONS)
+                self.db.execute(INSERT_STAGED_PLAYERS_STATS)
+
+            loaded_players += len(codes)
+            progress.update(len(codes))
+            progress.set_postfix(
+                loaded=loaded_players,
+                skipped=skipped_players,
+                rate=f"{loaded_players / (time.perf_counter() - start):.0f}/s",
+            )
+
+        progress.close()
+        print(
+            f"|-- END BULK ADD PLAYERS : {loaded_players} chargés, {skipped_players} déjà présents, {time.perf_counter() - start:.2f}s --|"
+        )
+
+    def set_fixtures(self):
+        """Applique les fixtures en masse ou les supprimes.
+
+        Les fixtures de référence sont chargées dans une seule transaction, puis les joueurs bloc
+        par bloc, puis les raretés des joueurs sont calculées.
+        """
+        if self.reset:
+            return super().set_fixtures()
+
+        nft_storage = Storage()
+        if settings.DOWNLOAD_DATA:
+            check_files()
+
+        players_fixture = next(
+            fixture
+            for fixture in FIXTURES_ORDER
+            if fixture.get("table") == FixtureEnum.PLAYERS.value
+        )
+        if not self.resume:
+            with self.db.begin():
+                for fixture in FIXTURES_ORDER:
+                    if fixture is not players_fixture:
+                        getattr(self, f"add_{fixture.get('table')}")(
+                            **fixture, nft_storage=nft_storage
+                        )
+
+        self.add_players(**players_fixture)
+
+        with self.db.begin():
+            self.calcul_player_rarities()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-r",
+        "--resume",
+        action="store_true",
+        help="Reprend le chargement des joueurs sans recharger les autres fixtures.",
+    )
+    args = parser.parse_args()
+
+    with BulkFixtures(resume=args.resume) as fixtures:
+        fixtures.set_fixtures()
@@ -26,22 +26,32 @@ File: app/generation_nft_db/scripts/fixtures.py
 """
 
 import argparse
+import hashlib
 import re
+import time
 import warnings
-from typing import Union
+from io import BufferedReader
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Union
 
+import multihash
 import pandas as pd
 from tqdm import tqdm
 
 from app import logger_api
 from app.exceptions import PronochainException
+from app.generation_nft.libraries.storage.cid import compute_cids, digest_to_cid
+from app.generation_nft.libraries.storage.models import ResponseStorage, Value
 from app.generation_nft.libraries.storage.storage import Storage
-from app.generation_nft_api.dependencies import get_db
-from app.generation_nft_db.constants import FIXTURES_ORDER, NameTypeCode
+from app.generation_nft_db.constants import (
+    FIXTURES_ORDER,
+    WHITESPACE_PATTERN,
+    NameTypeCode,
+)
 from app.generation_nft_db.core.utils import (
     add_into_database,
     add_multiple_into_database,
 )
+from app.generation_nft_db.database import SessionLocal
 from app.generation_nft_db.models import (
     Club,
     Country,
@@ -66,18 +76,60 @@ from app.generation_nft_db.models.nft_parts import (
 )
 from app.generation_nft_db.models.rarities import Rarity
 from app.generation_nft_db.repositories.users import create_user
+from app.generation_nft_db.schemas.players import FileCID, ResponseCarApi
 from app.generation_nft_db.schemas.users import UserCreate
-from app.generation_nft_db.scripts.queries import (
-    PLAYER_OTHERS_STATS_VALUES,
-    PLAYER_POSITION_STATS_VALUES,
-    PLAYER_POSITIONS,
-)
+from app.generation_nft_db.scripts.queries import UPDATE_PLAYER_RARITIES
 from app.settings import settings
 from app.utils import check_files
 
 warnings.filterwarnings("ignore")
 
 
+class LocalStorage(Storage):
+    """Stockage sans appel réseau pour le benchmark des fixtures, les CID sont calculés localement."""
+
+    def add(
+        self, file: Union[BufferedReader, bytes], is_bytes: bool = False
+    ) -> ResponseStorage:
+        """Calcule le CID d'un élément sans l'envoyer sur nft.storage.
+
+        Args:
+            file (Union[BufferedReader, bytes]): élément.
+            is_bytes (bool, optional): est sous format bytes ? Défaut à False.
+
+        Returns:
+            ResponseStorage: modèle ResponseStorage.
+        """
+        content = file if is_bytes else file.read()
+        return ResponseStorage(
+            ok=True, value=Value(cid=digest_to_cid(hashlib.sha256(content).digest()))
+        )
+
+    def get_cid(self, files: list) -> ResponseCarApi:
+        """Convertit les CID en CIDv1 sans appeler le car-api.
+
+        Args:
+            files (list): liste de fichiers, avec leur code et leur CID base58.
+
+        Returns:
+            ResponseCarApi: modèle ResponseCarApi.
+        """
+        return ResponseCarApi(
+            status=200,
+            files=[
+                FileCID(
+                    code=file.get("code"),
+                    cid=digest_to_cid(
+                        multihash.decode(
+                            multihash.from_b58_string(file.get("base58"))
+                        ).digest
+                    ),
+                )
+                for file in files
+            ],
+        )
+
+
 class Fixtures:
     """Classe pour appliquer les données fixes dans la base de données."""
 
@@ -87,23 +139,54 @@ class Fixtures:
         Args:
             reset (bool, optional): supprime les données au lieu de les ajouter. Défaut à False.
         """
-        self.db = next(get_db())
+        self.db = SessionLocal()
         self.reset = reset
 
+    def __enter__(self):
+        """Entre dans le contexte, la session est fermée à sa sortie.
+
+        Returns:
+            Fixtures: instance.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """Sort du contexte et ferme la session."""
+        self.close()
+
+    def close(self):
+        """Ferme la session de la base de donnée et rend sa connexion au pool."""
+        self.db.close()
+
     def csv_to_dict(
         self, filename: str, parse_dates: Union[list, bool] = False
-    ) -> pd.DataFrame:
+    ) -> List[dict]:
         """Converti un fichier CSV en dictionnaire python.
 
         Args:
             filename (str): nom du fichier csv.
             parse_dates (Union[list, bool], optional): liste des champs dates. Défaut à False.
 
+        Returns:
+            List[dict]: liste des lignes du fichier.
+        """
+        return self.csv_to_dataframe(filename, parse_dates).to_dict("records")
+
+    def csv_to_dataframe(
+        self, filename: str, parse_dates: Union[list, bool] = False, **kwargs
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Lit un fichier CSV de fixture.
+
+        Args:
+            filename (str): nom du fichier csv.
+            parse_dates (Union[list, bool], optional): liste des champs dates. Défaut à False.
+            kwargs: options supplémentaires de pandas.read_csv (chunksize, nrows...).
+
         Raises:
             PronochainException: le fichier csv n'a pas été trouvé.
 
         Returns:
-            pd.DataFrame: dictionnaire python avec les données.
+            Union[pd.DataFrame, Iterator[pd.DataFrame]]: données du fichier, par blocs si chunksize est renseigné.
         """
         try:
             return pd.read_csv(
@@ -112,12 +195,51 @@ class Fixtures:
                 parse_dates=parse_dates,
                 encoding="utf-8",
                 keep_default_na=False,
-            ).to_dict("record")
+                **kwargs,
+            )
         except FileNotFoundError:
             error_message = f"Le fichier de fixture {filename} n'a pas été trouvé."
             logger_api.error(error_message)
             raise PronochainException(error_message)
 
+    def normalize(self, value: str) -> str:
+        """Normalise une valeur pour la comparer (minuscules, sans espaces).
+
+        Args:
+            value (str): valeur.
+
+        Returns:
+            str: valeur normalisée.
+        """
+        return WHITESPACE_PATTERN.sub("", str(value).lower())
+
+    def normalize_column(self, column: pd.Series) -> pd.Series:
+        """Normalise toutes les valeurs d'une colonne en une seule passe.
+
+        Args:
+            column (pd.Series): colonne.
+
+        Returns:
+            pd.Series: colonne normalisée.
+        """
+        return (
+            column.astype(str)
+            .str.lower()
+            .str.replace(WHITESPACE_PATTERN, "", regex=True)
+        )
+
+    def index_by(self, models: list, key: Callable[[object], Hashable]) -> dict:
+        """Indexe une liste de modèles par clé, le premier modèle d'une clé est conservé.
+
+        Args:
+            models (list): modèles.
+            key (Callable[[object], Hashable]): calcule la clé d'un modèle.
+
+        Returns:
+            dict: modèles par clé.
+        """
+        return {key(model): model for model in reversed(models)}
+
     def add_stat_types(self, table: str, **_):
         """Ajouter les stat types.
 
@@ -133,19 +255,17 @@ class Fixtures:
             if not bool(stat_type.get("type"))
         ]
         add_multiple_into_database(self.db, stat_types_models)
+        stat_types_by_code = self.index_by(stat_types_models, lambda model: model.code)
         stats_models = []
 
-        positions_models = self.db.query(Position).all()
+        positions_by_code = self.index_by(
+            self.db.query(Position).all(), lambda model: str(model.code)
+        )
 
         for stat in tqdm(data):
             if bool(types := stat.get("type")):
                 stat_types = [
-                    next(
-                        stat_type_model
-                        for stat_type_model in stat_types_models
-                        if stat_type_model.code == int(type)
-                    )
-                    for type in types.split(",")
+                    stat_types_by_code[int(type)] for type in types.split(",")
                 ]
                 stats_models.append(
                     Stat(
@@ -154,26 +274,16 @@ class Fixtures:
                 )
 
         add_multiple_into_database(self.db, stats_models)
-
-        stats_positions = [
-            stat_position
-            for stat_position in data
-            if bool(stat_position.get("positions_codes"))
-        ]
-        for stat_position in stats_positions:
-            stat_model = next(
-                stat_model
-                for stat_model in stats_models
-                if stat_model.code == stat_position.get("code")
-            )
-            position_models = [
-                position_model
-                for position_model in positions_models
-                if str(position_model.code)
-                in stat_position.get("positions_codes").split(",")
-            ]
-            stat_model.positions = position_models
-            self.db.flush()
+        stats_by_code = self.index_by(stats_models, lambda model: model.code)
+
+        for stat_position in data:
+            if bool(positions_codes := stat_position.get("positions_codes")):
+                stats_by_code[stat_position.get("code")].positions = [
+                    positions_by_code[position_code]
+                    for position_code in positions_codes.split(",")
+                    if position_code in positions_by_code
+                ]
+        self.db.flush()
 
         print("|-- END ADD STAT TYPES --|")
 
@@ -186,43 +296,34 @@ class Fixtures:
         print("|-- START ADD POSITIONS --|")
         data = self.csv_to_dict(table)
 
-        elements_models = self.db.query(Element).all()
-        position_types_models = []
-        for position_type in data:
-            if not bool(position_type.get("type")):
-                try:
-                    element = next(
-                        element_model
-                        for element_model in elements_models
-                        if str(element_model.code) == position_type.get("element_code")
-                    )
-                except Exception:
-                    element = None
-                position_types_models.append(
-                    PositionType(
-                        code=position_type.get("code"),
-                        abbreviation=position_type.get("abbreviation"),
-                        value=position_type.get("value"),
-                        element=element,
-                    )
-                )
+        elements_by_code = self.index_by(
+            self.db.query(Element).all(), lambda model: str(model.code)
+        )
+        position_types_models = [
+            PositionType(
+                code=position_type.get("code"),
+                abbreviation=position_type.get("abbreviation"),
+                value=position_type.get("value"),
+                element=elements_by_code.get(str(position_type.get("element_code"))),
+            )
+            for position_type in data
+            if not bool(position_type.get("type"))
+        ]
 
         add_multiple_into_database(self.db, position_types_models)
+        position_types_by_code = self.index_by(
+            position_types_models, lambda model: model.code
+        )
         positions_models = []
 
         for position in tqdm(data):
             if bool(type := position.get("type")):
-                position_type = next(
-                    position_types_model
-                    for position_types_model in position_types_models
-                    if position_types_model.code == int(type)
-                )
                 positions_models.append(
                     Position(
                         code=position.get("code"),
                         abbreviation=position.get("abbreviation"),
                         value=position.get("value"),
-                        type=position_type,
+                        type=position_types_by_code[int(type)],
                     )
                 )
 
@@ -279,23 +380,17 @@ class Fixtures:
         print("|-- START ADD DIVISIONS --|")
         data = self.csv_to_dict(table)
 
-        countries_models = self.db.query(Country).all()
-        divisions_models = []
-
-        for division in tqdm(data):
-            country = next(
-                country_model
-                for country_model in countries_models
-                if re.sub("\s", "", country_model.value.lower())
-                == re.sub("\s", "", division.get("country").lower())
-            )
-            divisions_models.append(
-                Division(
-                    code=division.get("code"),
-                    name=division.get("name"),
-                    country=country,
-                )
+        countries_by_value = self.index_by(
+            self.db.query(Country).all(), lambda model: self.normalize(model.value)
+        )
+        divisions_models = [
+            Division(
+                code=division.get("code"),
+                name=division.get("name"),
+                country=countries_by_value[self.normalize(division.get("country"))],
             )
+            for division in tqdm(data)
+        ]
 
         add_multiple_into_database(self.db, divisions_models)
         print("|-- END ADD DIVISIONS --|")
@@ -321,6 +416,22 @@ class Fixtures:
         add_multiple_into_database(self.db, rarities_models)
         print("|-- END ADD RARITIES --|")
 
+    def get_color(self, colors_by_hex: Dict[str, Color], hex_code: str) -> Color:
+        """Récupère une couleur par son code hexadécimal, la crée si elle n'existe pas.
+
+        Args:
+            colors_by_hex (Dict[str, Color]): couleurs indexées par code hexadécimal, complété par les couleurs créées.
+            hex_code (str): code hexadécimal.
+
+        Returns:
+            Color: couleur.
+        """
+        if (color := colors_by_hex.get(hex_code)) is None:
+            color = Color(hex=hex_code)
+            add_into_database(self.db, color)
+            colors_by_hex[hex_code] = color
+        return color
+
     def add_clubs(self, table: str, **_):
         """Ajouter les clubs.
 
@@ -330,70 +441,36 @@ class Fixtures:
         print("|-- START ADD CLUBS --|")
         data = self.csv_to_dict(table)
 
-        countries_models = self.db.query(Country).all()
-        divisions_models = self.db.query(Division).all()
-        colors_models = self.db.query(Color).all()
+        countries_by_value = self.index_by(
+            self.db.query(Country).all(), lambda model: self.normalize(model.value)
+        )
+        divisions_by_code = self.index_by(
+            self.db.query(Division).all(), lambda model: model.code
+        )
+        colors_by_hex = self.index_by(
+            self.db.query(Color).all(), lambda model: model.hex
+        )
         clubs_models = []
 
         for club in tqdm(data):
+            country = countries_by_value.get(self.normalize(club.get("country")))
             try:
-                country = next(
-                    country_model
-                    for country_model in countries_models
-                    if re.sub("\s", "", country_model.value.lower())
-                    == re.sub("\s", "", club.get("country").lower())
-                )
-            except Exception:
-                country = None
-            try:
-                division = next(
-                    division_model
-                    for division_model in divisions_models
-                    if division_model.code == int(club.get("division_code"))
-                )
-            except Exception:
+                division = divisions_by_code.get(int(club.get("division_code")))
+            except ValueError:
                 division = None
 
-            club_first_color = club.get("first_color")
-            if club_first_color != "":
-                try:
-                    first_color = next(
-                        color_model
-                        for color_model in colors_models
-                        if color_model.hex == club_first_color
-                    )
-                except Exception:
-                    first_color = Color(hex=club_first_color)
-            else:
-                first_color = Color(hex="#010101")
-
-            add_into_database(self.db, first_color)
-            colors_models.append(first_color)
-
-            club_second_color = club.get("second_color")
-            if club_second_color != "":
-                try:
-                    second_color = next(
-                        color_model
-                        for color_model in colors_models
-                        if color_model.hex == club_second_color
-                    )
-                except Exception:
-                    second_color = Color(hex=club_second_color)
-            else:
-                second_color = Color(hex="#FEFEFE")
-
-            add_into_database(self.db, second_color)
-            colors_models.append(second_color)
-
             clubs_models.append(
                 Club(
                     code=club.get("code"),
                     name=club.get("name"),
                     country=country,
                     division=division,
-                    first_color=first_color,
-                    second_color=second_color,
+                    first_color=self.get_color(
+                        colors_by_hex, club.get("first_color") or "#010101"
+                    ),
+                    second_color=self.get_color(
+                        colors_by_hex, club.get("second_color") or "#FEFEFE"
+                    ),
                 )
             )
 
@@ -446,109 +523,111 @@ class Fixtures:
         self.add_names(data)
         print("|-- END ADD LAST NAMES --|")
 
-    def add_players(self, table: str, parse_dates: list, nft_storage: Storage, **_):
+    def get_players_cid(self, codes: List[int]) -> Dict[int, Optional[str]]:
+        """Calcule localement les CID des images des joueurs.
+
+        Args:
+            codes (List[int]): codes des joueurs.
+
+        Returns:
+            Dict[int, Optional[str]]: CID indexés par code joueur, None si l'image est manquante.
+        """
+        return dict(
+            zip(
+                codes,
+                compute_cids(
+                    [
+                        f"{settings.FIXTURE_FILES_PATH}/pictures/players/{code}.png"
+                        for code in codes
+                    ]
+                ),
+            )
+        )
+
+    def add_players(self, table: str, parse_dates: list, **_):
         """Ajouter les joueurs.
 
+        Les valeurs de référence (noms, pays, postes, clubs, CID) sont indexées une seule fois,
+        chaque joueur est ensuite résolu par des recherches en dictionnaire.
+
         Args:
             table (str): nom de la table.
             parse_dates (list): liste des colonnes de dates.
-            nft_storage (Storage): classe pour stocker sur nft.storage.
         """
         print("|-- START ADD PLAYERS --|")
-        data = self.csv_to_dict(table, parse_dates)
+        data = self.csv_to_dataframe(table, parse_dates)
         if settings.LIMIT_PLAYER:
             data = data[:1000]
 
-        print("|-- GENERATING BASE58 --|")
-        players_code = [
-            {
-                "code": player.get("code"),
-                "base58": nft_storage.convert_to_base58(
-                    f"{settings.FIXTURE_FILES_PATH}/pictures/players/{player.get('code')}.png"
-                ),
-            }
-            for player in tqdm(data)
-        ]
-        print("|-- BASE58 GENERATED --|")
-        players_cid = nft_storage.get_cid(players_code)
+        print("|-- GENERATING CID --|")
+        cids_by_code = self.get_players_cid(data["code"].tolist())
+        print("|-- CID GENERATED --|")
 
-        countries_models = self.db.query(Country).all()
-        positions_models = self.db.query(Position).all()
+        countries_by_value = self.index_by(
+            self.db.query(Country).all(), lambda model: self.normalize(model.value)
+        )
+        positions_by_abbreviation = self.index_by(
+            self.db.query(Position).all(), lambda model: model.abbreviation.lower()
+        )
         stats_models = self.db.query(Stat).all()
 
-        first_names_models = (
+        first_names_by_value = self.index_by(
             self.db.query(Name)
             .join(NameType)
             .filter(NameType.code == NameTypeCode.FIRST_NAME.value)
-            .all()
+            .all(),
+            lambda model: self.normalize(model.value),
         )
-        last_names_models = (
+        last_names_by_value = self.index_by(
             self.db.query(Name)
             .join(NameType)
             .filter(NameType.code == NameTypeCode.LAST_NAME.value)
-            .all()
+            .all(),
+            lambda model: self.normalize(model.value),
+        )
+        clubs_by_code = self.index_by(
+            self.db.query(Club).all(), lambda model: model.code
         )
-        clubs_models = self.db.query(Club).all()
 
-        for player in tqdm(data):
-            try:
-                cid_index = next(
-                    index
-                    for (index, player_cid) in enumerate(players_cid.files)
-                    if player_cid.code == player.get("code")
+        # les pays et postes sont partagés par beaucoup de joueurs : chaque valeur distincte n'est résolue qu'une fois
+        countries_by_player_country = {
+            player_country: list(
+                dict.fromkeys(
+                    countries_by_value[country]
+                    for country in self.normalize(player_country).split("/")
+                    if country in countries_by_value
                 )
-                cid = players_cid.files[cid_index].cid
-                del players_cid.files[cid_index]
-            except Exception:
-                cid = None
-
-            countries = [
-                country_model
-                for country_model in countries_models
-                if re.sub("\s", "", country_model.value.lower())
-                in re.sub("\s", "", player.get("country").lower()).split("/")
-            ]
-            positions = [
-                position_model
-                for position_model in positions_models
-                if position_model.abbreviation.lower()
-                in re.split(r"\/|,\s", player.get("position").lower())
-            ]
-
-            try:
-                first_name_model = next(
-                    first_name_model
-                    for first_name_model in first_names_models
-                    if re.sub("\s", "", first_name_model.value.lower())
-                    == re.sub("\s", "", player.get("first_name").lower())
-                )
-            except Exception:
-                first_name_model = None
-
-            last_name_model = next(
-                last_name_model
-                for last_name_model in last_names_models
-                if re.sub("\s", "", last_name_model.value.lower())
-                == re.sub("\s", "", player.get("last_name").lower())
             )
-            club_model = next(
-                clubs_model
-                for clubs_model in clubs_models
-                if clubs_model.code == player.get("club_code")
+            for player_country in data["country"].unique()
+        }
+        positions_by_player_position = {
+            player_position: list(
+                dict.fromkeys(
+                    positions_by_abbreviation[position]
+                    for position in re.split(r"\/|,\s", player_position.lower())
+                    if position in positions_by_abbreviation
+                )
             )
+            for player_position in data["position"].unique()
+        }
+        data = data.assign(
+            first_name_key=self.normalize_column(data["first_name"]),
+            last_name_key=self.normalize_column(data["last_name"]),
+        )
 
+        for player in tqdm(data.to_dict("records")):
             player_model = Player(
                 code=player.get("code"),
-                first_name=first_name_model,
-                last_name=last_name_model,
+                first_name=first_names_by_value.get(player.get("first_name_key")),
+                last_name=last_names_by_value[player.get("last_name_key")],
                 age=player.get("age"),
                 birth=player.get("birth"),
                 height=player.get("height"),
                 weight=player.get("weight"),
-                club=club_model,
-                countries=countries,
-                positions=positions,
-                cid=cid,
+                club=clubs_by_code[player.get("club_code")],
+                countries=list(countries_by_player_country[player.get("country")]),
+                positions=list(positions_by_player_position[player.get("position")]),
+                cid=cids_by_code.get(player.get("code")),
                 filename=None,
             )
 
@@ -643,34 +722,24 @@ class Fixtures:
         data = self.csv_to_dict(table)
         pictures_path = f"{settings.FIXTURE_FILES_PATH}/pictures"
 
-        nft_parts_models = self.db.query(NftPart).all()
-        element_types_models = self.db.query(ElementType).all()
-        rarity_models = self.db.query(Rarity).all()
+        nft_parts_by_code = self.index_by(
+            self.db.query(NftPart).all(), lambda model: model.code
+        )
+        element_types_by_code = self.index_by(
+            self.db.query(ElementType).all(), lambda model: model.code
+        )
+        rarities_by_code = self.index_by(
+            self.db.query(Rarity).all(), lambda model: model.code
+        )
         elements_models = []
 
-        elements_with_parent = [
-            element for element in data if bool(element.get("parent_code"))
-        ]
-
         for element in tqdm(data):
-            nft_part = next(
-                nft_part_model
-                for nft_part_model in nft_parts_models
-                if nft_part_model.code == element.get("nft_part_code")
-            )
-            element_type = next(
-                element_type_model
-                for element_type_model in element_types_models
-                if element_type_model.code == element.get("element_type_code")
-            )
+            nft_part = nft_parts_by_code[element.get("nft_part_code")]
+            element_type = element_types_by_code[element.get("element_type_code")]
 
             try:
-                rarity = next(
-                    rarity_model
-                    for rarity_model in rarity_models
-                    if rarity_model.code == int(element.get("rarity_code"))
-                )
-            except Exception:
+                rarity = rarities_by_code.get(int(element.get("rarity_code")))
+            except ValueError:
                 rarity = None
 
             if settings.STORE_NFT_PART:
@@ -706,20 +775,14 @@ class Fixtures:
                 )
 
         add_multiple_into_database(self.db, elements_models)
+        elements_by_code = self.index_by(elements_models, lambda model: model.code)
 
-        for element in elements_with_parent:
-            element_model = next(
-                element_model
-                for element_model in elements_models
-                if element_model.code == int(element.get("code"))
-            )
-            element_parent_model = next(
-                element_model
-                for element_model in elements_models
-                if element_model.code == int(element.get("parent_code"))
-            )
-            element_model.parent = element_parent_model
-            self.db.flush()
+        for element in data:
+            if bool(parent_code := element.get("parent_code")):
+                elements_by_code[int(element.get("code"))].parent = elements_by_code[
+                    int(parent_code)
+                ]
+        self.db.flush()
 
         print("|-- END ADD ELEMENTS --|")
 
@@ -732,27 +795,23 @@ class Fixtures:
         print("|-- START ADD COLORS --|")
         data = self.csv_to_dict(table)
 
-        nft_parts_models = self.db.query(NftPart).all()
-        rarity_models = self.db.query(Rarity).all()
+        nft_parts_by_code = self.index_by(
+            self.db.query(NftPart).all(), lambda model: model.code
+        )
+        rarities_by_code = self.index_by(
+            self.db.query(Rarity).all(), lambda model: model.code
+        )
         colors_models = []
 
         for color in tqdm(data):
             try:
-                nft_part = next(
-                    nft_part_model
-                    for nft_part_model in nft_parts_models
-                    if nft_part_model.code == int(color.get("nft_part_code"))
-                )
-            except Exception:
+                nft_part = nft_parts_by_code.get(int(color.get("nft_part_code")))
+            except ValueError:
                 nft_part = None
 
             try:
-                rarity = next(
-                    rarity_model
-                    for rarity_model in rarity_models
-                    if rarity_model.code == int(color.get("rarity_code"))
-                )
-            except Exception:
+                rarity = rarities_by_code.get(int(color.get("rarity_code")))
+            except ValueError:
                 rarity = None
 
             colors_models.append(
@@ -777,155 +836,62 @@ class Fixtures:
         print("|-- START ADD FACE PARTS COLORS --|")
         data = self.csv_to_dict(table)
 
-        face_parts_models = self.db.query(FacePart).all()
+        face_parts_by_code = self.index_by(
+            self.db.query(FacePart).all(), lambda model: model.code
+        )
         colors_models = self.db.query(Color).all()
-        face_parts_colors_models = []
-
-        for face_part_color in tqdm(data):
-            depend_face_parts_colors = face_part_color.get("depend_face_parts_colors")
-
-            face_part = next(
-                face_part_model
-                for face_part_model in face_parts_models
-                if face_part_model.code == face_part_color.get("face_part_code")
-            )
-            color = next(
-                color_model
-                for color_model in colors_models
-                if color_model.id == face_part_color.get("color_id")
-            )
+        colors_by_id = self.index_by(colors_models, lambda model: model.id)
 
-            face_parts_colors_models.append(
-                FacePartColor(
-                    id=face_part_color.get("id"), face_part=face_part, color=color
-                )
+        face_parts_colors_models = [
+            FacePartColor(
+                id=face_part_color.get("id"),
+                face_part=face_parts_by_code[face_part_color.get("face_part_code")],
+                color=colors_by_id[face_part_color.get("color_id")],
             )
+            for face_part_color in tqdm(data)
+        ]
 
         add_multiple_into_database(self.db, colors_models)
+        face_parts_colors_by_id = self.index_by(
+            face_parts_colors_models, lambda model: str(model.id)
+        )
 
-        depended_face_part_color = [
-            face_part_color
-            for face_part_color in data
-            if bool(face_part_color.get("depend_face_parts_colors"))
-        ]
-        for face_part_color in depended_face_part_color:
-            depended_face_part_color = next(
-                face_part_color_model
-                for face_part_color_model in face_parts_colors_models
-                if face_part_color_model.id == face_part_color.get("id")
-            )
-            depend_face_parts_colors = [
-                face_part_color_model
-                for face_part_color_model in face_parts_colors_models
-                if str(face_part_color_model.id)
-                in face_part_color.get("depend_face_parts_colors").split(",")
-            ]
-            depended_face_part_color.depend_face_part_colors = depend_face_parts_colors
-            self.db.flush()
+        for face_part_color in data:
+            if bool(
+                depend_face_parts_colors := face_part_color.get(
+                    "depend_face_parts_colors"
+                )
+            ):
+                face_parts_colors_by_id[
+                    str(face_part_color.get("id"))
+                ].depend_face_part_colors = [
+                    face_parts_colors_by_id[depend_face_part_color_id]
+                    for depend_face_part_color_id in depend_face_parts_colors.split(",")
+                    if depend_face_part_color_id in face_parts_colors_by_id
+                ]
+        self.db.flush()
 
         print("|-- END ADD FACE PARTS COLORS --|")
 
-    def calcul_player_rarities(self):
-        """Calculer la rareté d'un joueur."""
-        rarities = self.db.query(Rarity).all()
-        players = self.db.execute(PLAYER_POSITIONS)
-        players_stats = []
-        players_stats_sum_by_positions = []
-        print("|-- START CALCUL PLAYER RARITIES --|")
-        for player in tqdm(players.mappings()):
-            position_code = player.get("position_codes")[0]
-            position_stats_values = self.db.execute(
-                PLAYER_POSITION_STATS_VALUES,
-                {"position_code": position_code, "player_id": player.get("player_id")},
-            ).mappings()
-            others_stats_values = self.db.execute(
-                PLAYER_OTHERS_STATS_VALUES, {"player_id": player.get("player_id")}
-            ).mappings()
-            player_stats_sum = sum(
-                position_stats_values.all()[0].get("values")
-                + others_stats_values.all()[0].get("values")
-            )
-            try:
-                player_stat_sum_by_position = next(
-                    players_stats_sum_by_position
-                    for players_stats_sum_by_position in players_stats_sum_by_positions
-                    if players_stats_sum_by_position.get("position_code")
-                    == position_code
-                )
-                player_stat_sum_by_position = {
-                    **player_stat_sum_by_position,
-                    "values": player_stat_sum_by_position.get("values").append(
-                        player_stats_sum
-                    ),
-                }
-            except Exception:
-                players_stats_sum_by_positions.append(
-                    {"position_code": position_code, "values": [player_stats_sum]}
-                )
-            players_stats.append(
-                {
-                    "player_id": player.get("player_id"),
-                    "position_code": position_code,
-                    "stat": player_stats_sum,
-                }
-            )
-
-        rarities_positions = []
-        for players_stats_sum_by_position in tqdm(players_stats_sum_by_positions):
-            values = players_stats_sum_by_position.get("values")
-            minimum_value = min(values)
-            values = [value - minimum_value for value in values]
-            maximum_value = max(values)
-
-            positions_rarities = []
-            for rarity in rarities[:-1]:
-                rarity_value = maximum_value - int(
-                    (rarity.percentage * maximum_value) / 100
-                )
-                positions_rarities.append(
-                    {
-                        "rarity_id": rarity.id,
-                        "value": rarity_value - 1
-                        if rarity_value == maximum_value
-                        else rarity_value,
-                    }
-                )
-            positions_rarities.append(
-                {"rarity_id": rarities[-1].id, "value": maximum_value}
-            )
+    def calcul_player_rarities(self, player_ids: Optional[List[int]] = None) -> int:
+        """Calculer la rareté des joueurs.
 
-            rarities_positions.append(
-                {
-                    "position_code": players_stats_sum_by_position.get("position_code"),
-                    "minimum_value": minimum_value,
-                    "rarity_steps": positions_rarities,
-                }
-            )
+        La somme des statistiques de chaque joueur est comparée à celles des joueurs de son poste
+        principal, le calcul est fait en une seule requête. Les seuils sont toujours calculés sur
+        l'ensemble des joueurs, seuls les joueurs demandés sont mis à jour.
 
-        for player in tqdm(players_stats):
-            player_id = player.get("player_id")
-            position_code = player.get("position_code")
-            rarity_position = next(
-                rarities_position
-                for rarities_position in rarities_positions
-                if rarities_position.get("position_code") == position_code
-            )
-            player_stat = player.get("stat") - rarity_position.get("minimum_value")
-            try:
-                player_rarity_id = [
-                    rarity_step.get("rarity_id")
-                    for rarity_step in rarity_position.get("rarity_steps")
-                    if rarity_step.get("value") <= player_stat
-                ][-1]
-            except IndexError:
-                player_rarity_id = rarity_position.get("rarity_steps")[0].get(
-                    "rarity_id"
-                )
-            self.db.query(Player).filter(Player.id == player_id).update(
-                {"rarity_id": player_rarity_id}, synchronize_session=False
-            )
+        Args:
+            player_ids (Optional[List[int]], optional): ids des joueurs à recalculer, tous si None. Défaut à None.
 
-        print("|-- END CALCUL PLAYER RARITIES --|")
+        Returns:
+            int: nombre de joueurs dont la rareté a changé.
+        """
+        print("|-- START CALCUL PLAYER RARITIES --|")
+        updated_players = self.db.execute(
+            UPDATE_PLAYER_RARITIES, {"player_ids": player_ids}
+        ).rowcount
+        print(f"|-- END CALCUL PLAYER RARITIES : {updated_players} mis à jour --|")
+        return updated_players
 
     def set_fixtures(self):
         """Applique les fixtures ou les supprimes."""
@@ -946,34 +912,15 @@ class Fixtures:
                             .filter(model_with_file.cid is not None)
                             .all()
                         )
-                        for model_result in tqdm(model_results):
-                            try:
-                                nft_storage.delete(model_result.cid)
-                            except Exception:
-                                pass
-
-                models = [
-                    User,
-                    model_with_files[0],
-                    Name,
-                    NameType,
-                    Club,
-                    Division,
-                    model_with_files[1],
-                    Position,
-                    PositionType,
-                    Stat,
-                    StatType,
-                    NftPart,
-                    FacePart,
-                    ElementType,
-                    model_with_files[-1],
-                    Color,
-                    FacePartColor,
-                    Rarity,
-                ]
-                for model in tqdm(models):
-                    self.db.query(model).delete()
+                        nft_storage.delete_many(
+                            [
+                                model_result.cid
+                                for model_result in model_results
+                                if model_result.cid
+                            ]
+                        )
+
+                self.delete_fixtures()
                 self.db.commit()
             print("|-- END REMOVE DATA --|")
         else:
@@ -987,6 +934,64 @@ class Fixtures:
                 self.calcul_player_rarities()
                 self.db.commit()
 
+    def delete_fixtures(self):
+        """Supprime les données des fixtures, dans l'ordre des dépendances."""
+        models = [
+            User,
+            Player,
+            Name,
+            NameType,
+            Club,
+            Division,
+            Country,
+            Position,
+            PositionType,
+            Stat,
+            StatType,
+            NftPart,
+            FacePart,
+            ElementType,
+            Element,
+            Color,
+            FacePartColor,
+            Rarity,
+        ]
+        for model in tqdm(models):
+            self.db.query(model).delete()
+
+    def benchmark_fixtures(self):
+        """Mesure le temps de chargement de chaque fixture sur toutes les données, sans rien enregistrer.
+
+        Les fixtures sont chargées dans un savepoint annulé à la fin, après avoir vidé les tables
+        pour éviter les doublons : les tables restent verrouillées pendant la mesure. Aucune image
+        n'est envoyée (LocalStorage) et LIMIT_PLAYER est désactivé le temps de la mesure.
+        """
+        limit_player = settings.LIMIT_PLAYER
+        settings.LIMIT_PLAYER = False
+        nft_storage = LocalStorage()
+        durations = []
+        try:
+            with self.db.begin():
+                savepoint = self.db.begin_nested()
+                try:
+                    self.delete_fixtures()
+                    for fixture in FIXTURES_ORDER:
+                        start = time.perf_counter()
+                        getattr(self, f"add_{fixture.get('table')}")(
+                            **fixture, nft_storage=nft_storage
+                        )
+                        durations.append(
+                            (fixture.get("table"), time.perf_counter() - start)
+                        )
+                finally:
+                    savepoint.rollback()
+        finally:
+            settings.LIMIT_PLAYER = limit_player
+
+        for table, duration in durations:
+            print(f"|-- {table} : {duration:.2f}s --|")
+        print(f"|-- TOTAL : {sum(duration for _, duration in durations):.2f}s --|")
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -1000,12 +1005,28 @@ if __name__ == "__main__":
         "-r",
         "--rarity",
         action="store_true",
-        help="Supprime toutes les données.",
+        help="Recalcule la rareté des joueurs.",
+    )
+    parser.add_argument(
+        "-p",
+        "--players",
+        nargs="+",
+        type=int,
+        help="Ids des joueurs dont la rareté est recalculée, avec --rarity.",
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmark",
+        action="store_true",
+        help="Mesure le temps de chargement des fixtures sans limite de joueurs, sans enregistrer les données.",
     )
     args = parser.parse_args()
 
-    fixtures = Fixtures(reset=args.delete)
-    if args.rarity:
-        fixtures.calcul_player_rarities()
-    else:
-        fixtures.set_fixtures()
+    with Fixtures(reset=args.delete) as fixtures:
+        if args.benchmark:
+            fixtures.benchmark_fixtures()
+        elif args.rarity:
+            with fixtures.db.begin():
+                fixtures.calcul_player_rarities(args.players)
+        else:
+            fixtures.set_fixtures()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_db/scripts/preprocess.py
+"""
+import argparse
+import time
+
+import requests
+from tqdm import tqdm
+
+from app import logger_api
+from app.exceptions import PronochainException
+from app.generation_nft.handler import PreprocessPlayer
+from app.generation_nft.libraries.face.face_preprocessing.face_preprocessing import (
+    get_preprocessed_face_path,
+)
+from app.generation_nft_db.database import session_scope
+from app.generation_nft_db.models.players import Player
+
+
+def preprocess_players(codes: list = None, force: bool = False):
+    """Prétraite les photos des joueurs absentes du cache des visages prétraités.
+
+    Args:
+        codes (list, optional): codes des joueurs à prétraiter, tous si None. Défaut à None.
+        force (bool, optional): prétraite aussi les photos déjà en cache. Défaut à False.
+    """
+    print("|-- START PREPROCESS PLAYERS --|")
+    start = time.perf_counter()
+    with session_scope() as db:
+        query = db.query(Player).filter(Player.cid.isnot(None))
+        if codes:
+            query = query.filter(Player.code.in_(codes))
+        players = query.order_by(Player.id).all()
+
+    preprocessed, skipped, failed = 0, 0, []
+    progress = tqdm(players, unit="player")
+    for player in progress:
+        if not force and get_preprocessed_face_path(player.cid).is_file():
+            skipped += 1
+            continue
+        try:
+            PreprocessPlayer(player).handler()
+            preprocessed += 1
+        except PronochainException:
+            failed.append(player.code)
+        except requests.RequestException as err:
+            # un téléchargement en échec n'interrompt pas le lot
+            logger_api.warning(f"Photo du joueur {player.code} non téléchargée : {err}")
+            failed.append(player.code)
+        progress.set_postfix(
+            preprocessed=preprocessed, skipped=skipped, failed=len(failed)
+        )
+
+    progress.close()
+    if failed:
+        print(f"Joueurs en échec : {', '.join(map(str, failed))}")
+    print(
+        f"|-- END PREPROCESS PLAYERS : {preprocessed} prétraités, {skipped} déjà en cache, {len(failed)} en échec, {time.perf_counter() - start:.2f}s --|"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--codes",
+        nargs="*",
+        type=int,
+        help="Codes des joueurs à prétraiter, tous les joueurs par défaut.",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Prétraite aussi les photos déjà présentes dans le cache.",
+    )
+    args = parser.parse_args()
+
+    preprocess_players(codes=args.codes, force=args.force)
@@ -26,37 +26,68 @@ File: app/generation_nft_db/scripts/queries.py
 """
 from sqlalchemy.sql import text
 
-PLAYER_POSITIONS = text(
+UPDATE_PLAYER_RARITIES = text(
     """
-    SELECT pl.id as player_id, ARRAY_AGG(po.code) as position_codes
-    FROM players pl
-        JOIN players_positions pp ON pl.id = pp.player_id
-        JOIN positions po ON pp.position_id = po.id
-    GROUP BY pl.id
-    """
-)
-
-PLAYER_POSITION_STATS_VALUES = text(
-    """
-    SELECT ARRAY_AGG(ps.value) AS values
-    FROM players_stats ps
-        JOIN stats s ON ps.stat_id = s.id
-        JOIN stats_positions sp ON s.id = sp.stat_id
-        JOIN positions p ON sp.position_id = p.id
-    WHERE p.code = :position_code
-    AND ps.player_id = :player_id;
-    """
-)
-
-PLAYER_OTHERS_STATS_VALUES = text(
-    """
-    SELECT ARRAY_AGG(ps.value) AS values
-    FROM players_stats ps
-        JOIN stats s ON ps.stat_id = s.id
-        JOIN stats_stat_types sst ON s.id = sst.stat_id
-        JOIN stat_types st ON sst.type_id = st.id
-    WHERE st.code IN (2, 3)
-    AND ps.player_id = :player_id;
+    WITH player_positions AS (
+        SELECT pl.id AS player_id, (ARRAY_AGG(po.code ORDER BY pp.rank))[1] AS position_code
+        FROM players pl
+            JOIN players_positions pp ON pl.id = pp.player_id
+            JOIN positions po ON pp.position_id = po.id
+        GROUP BY pl.id
+    ), player_position_stats AS (
+        SELECT pp.player_id, SUM(ps.value) AS value
+        FROM player_positions pp
+            JOIN players_stats ps ON ps.player_id = pp.player_id
+            JOIN stats_positions sp ON ps.stat_id = sp.stat_id
+            JOIN positions p ON sp.position_id = p.id AND p.code = pp.position_code
+        GROUP BY pp.player_id
+    ), player_others_stats AS (
+        SELECT ps.player_id, SUM(ps.value) AS value
+        FROM players_stats ps
+            JOIN stats_stat_types sst ON ps.stat_id = sst.stat_id
+            JOIN stat_types st ON sst.type_id = st.id
+        WHERE st.code IN (2, 3)
+        GROUP BY ps.player_id
+    ), player_sums AS (
+        SELECT pp.player_id,
+               pp.position_code,
+               pps.value + pos.value - MIN(pps.value + pos.value) OVER (PARTITION BY pp.position_code) AS value,
+               MAX(pps.value + pos.value) OVER (PARTITION BY pp.position_code)
+                   - MIN(pps.value + pos.value) OVER (PARTITION BY pp.position_code) AS maximum_value
+        FROM player_positions pp
+            JOIN player_position_stats pps ON pps.player_id = pp.player_id
+            JOIN player_others_stats pos ON pos.player_id = pp.player_id
+    ), rarity_steps AS (
+        SELECT r.id AS rarity_id,
+               r.percentage,
+               ROW_NUMBER() OVER (ORDER BY r.id) AS rank,
+               LEAD(r.id) OVER (ORDER BY r.id) IS NULL AS is_last
+        FROM rarities r
+    ), player_rarities AS (
+        SELECT ps.player_id,
+               COALESCE(
+                   (
+                       SELECT rs.rarity_id
+                       FROM rarity_steps rs
+                       WHERE CASE
+                                 WHEN rs.is_last THEN ps.maximum_value
+                                 WHEN ps.maximum_value - TRUNC(CAST(rs.percentage AS DOUBLE PRECISION) * ps.maximum_value / 100) = ps.maximum_value
+                                     THEN ps.maximum_value - 1
+                                 ELSE ps.maximum_value - TRUNC(CAST(rs.percentage AS DOUBLE PRECISION) * ps.maximum_value / 100)
+                             END <= ps.value
+                       ORDER BY rs.rank DESC
+                       LIMIT 1
+                   ),
+                   (SELECT rs.rarity_id FROM rarity_steps rs WHERE rs.rank = 1)
+               ) AS rarity_id
+        FROM player_sums ps
+    )
+    UPDATE players pl
+    SET rarity_id = pr.rarity_id
+    FROM player_rarities pr
+    WHERE pl.id = pr.player_id
+      AND pl.rarity_id IS DISTINCT FROM pr.rarity_id
+      AND (CAST(:player_ids AS INTEGER[]) IS NULL OR pl.id = ANY(CAST(:player_ids AS INTEGER[])))
     """
 )
 
@@ -105,3 +136,227 @@ FILTER_NAMES = text(
     AND LOWER(n.value) = :name
     """
 )
+
+COUNT_EXISTING_PLAYERS = text(
+    """
+    SELECT COUNT(*)
+    FROM players
+    WHERE code = ANY(:codes)
+    """
+)
+
+# tables communes des requêtes sur la table temporaire staging_players
+STAGED_PLAYERS = """
+    WITH first_names AS (
+        SELECT DISTINCT ON (LOWER(REGEXP_REPLACE(n.value, '\\s', '', 'g')))
+               LOWER(REGEXP_REPLACE(n.value, '\\s', '', 'g')) AS value, n.id
+        FROM names               n
+                 JOIN name_types nt ON nt.id = n.type_id
+        WHERE nt.code = :first_name_code
+        ORDER BY 1, n.id
+    ), last_names AS (
+        SELECT DISTINCT ON (LOWER(REGEXP_REPLACE(n.value, '\\s', '', 'g')))
+               LOWER(REGEXP_REPLACE(n.value, '\\s', '', 'g')) AS value, n.id
+        FROM names               n
+                 JOIN name_types nt ON nt.id = n.type_id
+        WHERE nt.code = :last_name_code
+        ORDER BY 1, n.id
+    ), staged_players AS (
+        SELECT CAST(sp.code AS BIGINT)     AS code,
+               fn.id                       AS first_name_id,
+               ln.id                       AS last_name_id,
+               CAST(sp.age AS INTEGER)     AS age,
+               CAST(sp.birth AS DATE)      AS birth,
+               CAST(sp.height AS SMALLINT) AS height,
+               CAST(sp.weight AS SMALLINT) AS weight,
+               c.id                        AS club_id,
+               NULLIF(sp.cid, '')          AS cid
+        FROM staging_players           sp
+                 LEFT JOIN first_names fn ON fn.value = LOWER(REGEXP_REPLACE(sp.first_name, '\\s', '', 'g'))
+                 LEFT JOIN last_names  ln ON ln.value = LOWER(REGEXP_REPLACE(sp.last_name, '\\s', '', 'g'))
+                 LEFT JOIN clubs       c ON c.code = CAST(NULLIF(sp.club_code, '') AS BIGINT)
+    )
+"""
+
+STAGED_PLAYERS_COUNTRIES = """
+    WITH countries_by_value AS (
+        SELECT DISTINCT ON (LOWER(REGEXP_REPLACE(c.value, '\\s', '', 'g')))
+               LOWER(REGEXP_REPLACE(c.value, '\\s', '', 'g')) AS value, c.id
+        FROM countries c
+        ORDER BY 1, c.id
+    ), staged_countries AS (
+        SELECT p.id AS player_id, c.id AS country_id, MIN(pc.rank) AS rank
+        FROM staging_players  sp
+                 JOIN players p ON p.code = CAST(sp.code AS BIGINT)
+                 CROSS JOIN LATERAL UNNEST(
+                    STRING_TO_ARRAY(LOWER(REGEXP_REPLACE(sp.country, '\\s', '', 'g')), '/')
+                 ) WITH ORDINALITY AS pc(value, rank)
+                 JOIN countries_by_value c ON c.value = pc.value
+        GROUP BY p.id, c.id
+    )
+"""
+
+STAGED_PLAYERS_POSITIONS = """
+    WITH positions_by_abbreviation AS (
+        SELECT DISTINCT ON (LOWER(po.abbreviation)) LOWER(po.abbreviation) AS value, po.id
+        FROM positions po
+        ORDER BY 1, po.id
+    ), staged_positions AS (
+        SELECT p.id AS player_id, po.id AS position_id, MIN(pp.rank) AS rank
+        FROM staging_players  sp
+                 JOIN players p ON p.code = CAST(sp.code AS BIGINT)
+                 CROSS JOIN LATERAL REGEXP_SPLIT_TO_TABLE(LOWER(sp.position), '/|,\\s')
+                     WITH ORDINALITY AS pp(value, rank)
+                 JOIN positions_by_abbreviation po ON po.value = pp.value
+        GROUP BY p.id, po.id
+    )
+"""
+
+INSERT_STAGED_PLAYERS = text(
+    f"""
+    {STAGED_PLAYERS}
+    INSERT INTO players (code, first_name_id, last_name_id, age, birth, height, weight, club_id, cid)
+    SELECT code, first_name_id, last_name_id, age, birth, height, weight, club_id, cid
+    FROM staged_players
+    ON CONFLICT (code) DO NOTHING
+    """
+)
+
+INSERT_STAGED_PLAYERS_COUNTRIES = text(
+    f"""
+    {STAGED_PLAYERS_COUNTRIES}
+    INSERT INTO players_countries (player_id, country_id)
+    SELECT player_id, country_id
+    FROM staged_countries
+    ORDER BY player_id, rank
+    ON CONFLICT DO NOTHING
+    """
+)
+
+INSERT_STAGED_PLAYERS_POSITIONS = text(
+    f"""
+    {STAGED_PLAYERS_POSITIONS}
+    INSERT INTO players_positions (player_id, position_id)
+    SELECT player_id, position_id
+    FROM staged_positions
+    ORDER BY player_id, rank
+    ON CONFLICT DO NOTHING
+    """
+)
+
+INSERT_STAGED_PLAYERS_STATS = text(
+    """
+    INSERT INTO players_stats (player_id, stat_id, value)
+    SELECT p.id, s.id, CAST(NULLIF(TO_JSONB(sp) ->> CAST(s.code AS TEXT), '') AS SMALLINT)
+    FROM staging_players  sp
+             JOIN players p ON p.code = CAST(sp.code AS BIGINT)
+             CROSS JOIN stats s
+    ON CONFLICT DO NOTHING
+    """
+)
+
+UPDATE_STAGED_PLAYERS = text(
+    f"""
+    {STAGED_PLAYERS}
+    UPDATE players p
+    SET first_name_id = sp.first_name_id,
+        last_name_id  = sp.last_name_id,
+        age           = sp.age,
+        birth         = sp.birth,
+        height        = sp.height,
+        weight        = sp.weight,
+        club_id       = sp.club_id,
+        cid           = sp.cid
+    FROM staged_players          sp
+             JOIN players        previous ON previous.code = sp.code
+    WHERE p.id = previous.id
+      AND (p.first_name_id, p.last_name_id, p.age, p.birth, p.height, p.weight, p.club_id, p.cid)
+        IS DISTINCT FROM
+          (sp.first_name_id, sp.last_name_id, sp.age, sp.birth, sp.height, sp.weight, sp.club_id, sp.cid)
+    RETURNING previous.cid AS previous_cid, p.cid
+    """
+)
+
+# les joueurs d'une combinaison déjà générée sont conservés : la suppression effacerait l'historique
+DELETE_UNSTAGED_PLAYERS = text(
+    """
+    DELETE
+    FROM players p
+    WHERE NOT EXISTS(SELECT 1 FROM staging_players sp WHERE CAST(sp.code AS BIGINT) = p.code)
+      AND NOT EXISTS(SELECT 1 FROM combinations c WHERE c.player_picture_id = p.id)
+    RETURNING p.cid
+    """
+)
+
+COUNT_KEPT_UNSTAGED_PLAYERS = text(
+    """
+    SELECT COUNT(*)
+    FROM players p
+    WHERE NOT EXISTS(SELECT 1 FROM staging_players sp WHERE CAST(sp.code AS BIGINT) = p.code)
+    """
+)
+
+DELETE_CHANGED_PLAYERS_COUNTRIES = text(
+    f"""
+    {STAGED_PLAYERS_COUNTRIES}, staged_players_countries AS (
+        SELECT player_id, ARRAY_AGG(country_id ORDER BY country_id) AS countries_ids
+        FROM staged_countries
+        GROUP BY player_id
+    ), players_countries_ids AS (
+        SELECT pc.player_id, ARRAY_AGG(pc.country_id ORDER BY pc.country_id) AS countries_ids
+        FROM players_countries pc
+        GROUP BY pc.player_id
+    ), changed_players AS (
+        SELECT p.id
+        FROM staging_players                          sp
+                 JOIN players                         p ON p.code = CAST(sp.code AS BIGINT)
+                 LEFT JOIN staged_players_countries   spc ON spc.player_id = p.id
+                 LEFT JOIN players_countries_ids      pci ON pci.player_id = p.id
+        WHERE spc.countries_ids IS DISTINCT FROM pci.countries_ids
+    )
+    DELETE
+    FROM players_countries pc
+        USING changed_players cp
+    WHERE pc.player_id = cp.id
+    RETURNING pc.player_id
+    """
+)
+
+# l'ordre des postes est comparé : le premier est le poste principal du joueur
+DELETE_CHANGED_PLAYERS_POSITIONS = text(
+    f"""
+    {STAGED_PLAYERS_POSITIONS}, staged_players_positions AS (
+        SELECT player_id, ARRAY_AGG(position_id ORDER BY rank) AS positions_ids
+        FROM staged_positions
+        GROUP BY player_id
+    ), players_positions_ids AS (
+        SELECT pp.player_id, ARRAY_AGG(pp.position_id ORDER BY pp.rank) AS positions_ids
+        FROM players_positions pp
+        GROUP BY pp.player_id
+    ), changed_players AS (
+        SELECT p.id
+        FROM staging_players                          sp
+                 JOIN players                         p ON p.code = CAST(sp.code AS BIGINT)
+                 LEFT JOIN staged_players_positions   spp ON spp.player_id = p.id
+                 LEFT JOIN players_positions_ids      ppi ON ppi.player_id = p.id
+        WHERE spp.positions_ids IS DISTINCT FROM ppi.positions_ids
+    )
+    DELETE
+    FROM players_positions pp
+        USING changed_players cp
+    WHERE pp.player_id = cp.id
+    RETURNING pp.player_id
+    """
+)
+
+UPSERT_STAGED_PLAYERS_STATS = text(
+    """
+    INSERT INTO players_stats (player_id, stat_id, value)
+    SELECT p.id, s.id, CAST(NULLIF(TO_JSONB(sp) ->> CAST(s.code AS TEXT), '') AS SMALLINT)
+    FROM staging_players  sp
+             JOIN players p ON p.code = CAST(sp.code AS BIGINT)
+             CROSS JOIN stats s
+    ON CONFLICT (player_id, stat_id) DO UPDATE SET value = EXCLUDED.value
+    WHERE players_stats.value IS DISTINCT FROM EXCLUDED.value
+    """
+)
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+r"""
+.-----------------------------------------------------.
+
+______                           _           _
+| ___ \                         | |         (_)
+| |_/ / __ ___  _ __   ___   ___| |__   __ _ _ _ __
+|  __/ '__/ _ \| '_ \ / _ \ / __| '_ \ / _` | | '_ \
+| |  | | | (_) | | | | (_) | (__| | | | (_| | | | | |
+\_|  |_|  \___/|_| |_|\___/ \___|_| |_|\__,_|_|_| |_|
+
+
+.-----------------------------------------------------.
+
+ _____                           _   _               _   _ ______ _____
+|  __ \                         | | (_)             | \ | ||  ___|_   _|
+| |  \/ ___ _ __   ___ _ __ __ _| |_ _  ___  _ __   |  \| || |_    | |
+| | __ / _ \ '_ \ / _ \ '__/ _` | __| |/ _ \| '_ \  | . ` ||  _|   | |
+| |_\ \  __/ | | |  __/ | | (_| | |_| | (_) | | | | | |\  || |     | |
+ \____/\___|_| |_|\___|_|  \__,_|\__|_|\___/|_| |_| \_| \_/\_|     \_/
+
+
+.------------------------------------------------------------------------.
+
+File: app/generation_nft_db/scripts/sync.py
+"""
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Column
+
+from app.generation_nft.libraries.storage.cid import compute_cids
+from app.generation_nft.libraries.storage.storage import Storage
+from app.generation_nft_db.constants import FIXTURES_ORDER, FixtureEnum, NameTypeCode
+from app.generation_nft_db.core.utils import add_multiple_into_database
+from app.generation_nft_db.models import (
+    Club,
+    Color,
+    Combination,
+    Country,
+    Division,
+    Name,
+    NameType,
+    Player,
+)
+from app.generation_nft_db.models.players import players_countries
+from app.generation_nft_db.scripts.bulk import BulkFixtures
+from app.generation_nft_db.scripts.queries import (
+    COUNT_KEPT_UNSTAGED_PLAYERS,
+    DELETE_CHANGED_PLAYERS_COUNTRIES,
+    DELETE_CHANGED_PLAYERS_POSITIONS,
+    DELETE_UNSTAGED_PLAYERS,
+    INSERT_STAGED_PLAYERS,
+    INSERT_STAGED_PLAYERS_COUNTRIES,
+    INSERT_STAGED_PLAYERS_POSITIONS,
+    UPDATE_STAGED_PLAYERS,
+    UPSERT_STAGED_PLAYERS_STATS,
+)
+from app.settings import settings
+from app.utils import check_files
+
+
+class SyncFixtures(BulkFixtures):
+    """Synchronisation incrémentale des fixtures.
+
+    Les fichiers CSV sont comparés à la base par clés naturelles (codes, valeurs des noms) et seules
+    les différences sont appliquées, dans une seule transaction : la base reste lisible pendant la
+    synchronisation. Les pays, divisions, clubs, noms et joueurs sont synchronisés, les autres
+    fixtures (parties du NFT, postes, statistiques...) ne changent pas entre deux mises à jour.
+    """
+
+    def __init__(self):
+        """Initialise le classe SyncFixtures."""
+        super().__init__()
+        self.nft_storage = Storage()
+        self.removed_cids = []
+
+    def sync_by_code(
+        self, model: type, rows: List[dict], get_values: Callable[[dict], dict]
+    ) -> Tuple[list, int, list]:
+        """Compare les lignes d'un fichier de fixture aux modèles existants par code.
+
+        Args:
+            model (type): classe du modèle.
+            rows (List[dict]): lignes du fichier csv.
+            get_values (Callable[[dict], dict]): valeurs des colonnes du modèle pour une ligne.
+
+        Returns:
+            Tuple[list, int, list]: modèles ajoutés, nombre de modèles modifiés, modèles absents du fichier.
+        """
+        models_by_code = self.index_by(
+            self.db.query(model).all(), lambda model_result: model_result.code
+        )
+        added_models, updated_models = [], 0
+
+        for row in rows:
+            values = get_values(row)
+            if (model_result := models_by_code.pop(row.get("code"), None)) is None:
+                added_models.append(model(code=row.get("code"), **values))
+            elif any(
+                getattr(model_result, key) != value for key, value in values.items()
+            ):
+                for key, value in values.items():
+                    setattr(model_result, key, value)
+                updated_models += 1
+
+        add_multiple_into_database(self.db, added_models)
+        return added_models, updated_models, list(models_by_code.values())
+
+    def sync_countries(self, table: str) -> list:
+        """Synchronise les pays, seuls les drapeaux nouveaux ou modifiés sont envoyés sur nft.storage.
+
+        Args:
+            table (str): nom de la table.
+
+        Returns:
+            list: pays absents du fichier.
+        """
+        print("|-- START SYNC COUNTRIES --|")
+        data = self.csv_to_dict(table)
+        added_countries, updated_countries, removed_countries = self.sync_by_code(
+            Country, data, lambda country: {"value": country.get("value")}
+        )
+
+        uploaded_flags = 0
+        if settings.STORE_NFT_PART:
+            countries = (
+                self.db.query(Country)
+                .filter(Country.code.in_([country.get("code") for country in data]))
+                .all()
+            )
+            flag_paths = {
+                country.code: f"{settings.FIXTURE_FILES_PATH}/pictures/flags/{country.code.lower()}.png"
+                for country in countries
+            }
+            flag_cids = dict(zip(flag_paths, compute_cids(list(flag_paths.values()))))
+            for country in countries:
+                # drapeau manquant : le CID enregistré est conservé
+                if flag_cids[country.code] in (None, country.cid):
+                    continue
+                if country.cid is not None:
+                    self.removed_cids.append(country.cid)
+                with open(flag_paths[country.code], "rb") as country_flag_file:
+                    country.cid = self.nft_storage.add(country_flag_file).value.cid
+                country.filename = f"{country.code.lower()}.png"
+                uploaded_flags += 1
+
+        print(
+            f"|-- END SYNC COUNTRIES : {len(added_countries)} ajoutés, {updated_countries} modifiés, {len(removed_countries)} absents, {uploaded_flags} drapeaux envoyés --|"
+        )
+        return removed_countries
+
+    def sync_divisions(self, table: str) -> list:
+        """Synchronise les divisions.
+
+        Args:
+            table (str): nom de la table.
+
+        Returns:
+            list: divisions absentes du fichier.
+        """
+        print("|-- START SYNC DIVISIONS --|")
+        countries_by_value = self.index_by(
+            self.db.query(Country).all(), lambda model: self.normalize(model.value)
+        )
+        added_divisions, updated_divisions, removed_divisions = self.sync_by_code(
+            Division,
+            self.csv_to_dict(table),
+            lambda division: {
+                "name": division.get("name"),
+                "country": countries_by_value[self.normalize(division.get("country"))],
+            },
+        )
+        print(
+            f"|-- END SYNC DIVISIONS : {len(added_divisions)} ajoutées, {updated_divisions} modifiées, {len(removed_divisions)} absentes --|"
+        )
+        return removed_divisions
+
+    def sync_clubs(self, table: str) -> list:
+        """Synchronise les clubs.
+
+        Args:
+            table (str): nom de la table.
+
+        Returns:
+            list: clubs absents du fichier.
+        """
+        print("|-- START SYNC CLUBS --|")
+        countries_by_value = self.index_by(
+            self.db.query(Country).all(), lambda model: self.normalize(model.value)
+        )
+        divisions_by_code = self.index_by(
+            self.db.query(Division).all(), lambda model: model.code
+        )
+        colors_by_hex = self.index_by(
+            self.db.query(Color).all(), lambda model: model.hex
+        )
+
+        def get_club_values(club: dict) -> dict:
+            """Valeurs des colonnes d'un club."""
+            try:
+                division = divisions_by_code.get(int(club.get("division_code")))
+            except ValueError:
+                division = None
+            return {
+                "name": club.get("name"),
+                "country": countries_by_value.get(self.normalize(club.get("country"))),
+                "division": division,
+                "first_color": self.get_color(
+                    colors_by_hex, club.get("first_color") or "#010101"
+                ),
+                "second_color": self.get_color(
+                    colors_by_hex, club.get("second_color") or "#FEFEFE"
+                ),
+            }
+
+        added_clubs, updated_clubs, removed_clubs = self.sync_by_code(
+            Club, self.csv_to_dict(table), get_club_values
+        )
+        print(
+            f"|-- END SYNC CLUBS : {len(added_clubs)} ajoutés, {updated_clubs} modifiés, {len(removed_clubs)} absents --|"
+        )
+        return removed_clubs
+
+    def sync_names(self, table: str):
+        """Ajoute les noms absents de la base, les noms existants peuvent être partagés et ne sont jamais supprimés.
+
+        Args:
+            table (str): nom de la table.
+        """
+        print(f"|-- START SYNC {table.upper()} --|")
+        data = self.csv_to_dataframe(table)
+        name_type_code = int(data.loc[data["code"] != "", "code"].iloc[0])
+        name_type = (
+            self.db.query(NameType).filter(NameType.code == name_type_code).one()
+        )
+        names = data.loc[data["code"] == "", "value"]
+
+        existing_names = {
+            self.normalize(value)
+            for value, in self.db.query(Name.value).filter(Name.type == name_type)
+        }
+        names_models = [
+            Name(value=value, type=name_type)
+            for value, key in dict(zip(names, self.normalize_column(names))).items()
+            if key not in existing_names
+        ]
+
+        add_multiple_into_database(self.db, names_models)
+        print(f"|-- END SYNC {table.upper()} : {len(names_models)} ajoutés --|")
+
+    def sync_players(self, table: str, parse_dates: list, **_):
+        """Synchronise les joueurs, leurs pays, leurs postes et leurs statistiques.
+
+        Le fichier est copié dans la table temporaire, puis les joueurs absents sont supprimés, les
+        joueurs modifiés mis à jour et les nouveaux ajoutés. Les joueurs absents d'une combinaison déjà
+        générée sont conservés, et aucun joueur n'est supprimé si le fichier est tronqué (LIMIT_PLAYER).
+        L'ancienne photo d'un joueur dont le CID change est supprimée, et les postes sont réécrits si
+        leur ordre change.
+        La rareté n'est recalculée que si un joueur, un poste ou une statistique a changé, et n'est
+        écrite que pour les joueurs dont elle change.
+
+        Args:
+            table (str): nom de la table.
+            parse_dates (list): liste des colonnes de dates.
+        """
+        print("|-- START SYNC PLAYERS --|")
+        chunks = self.csv_to_dataframe(
+            table,
+            parse_dates,
+            chunksize=settings.FIXTURES_BULK_CHUNK_SIZE,
+            nrows=1000 if settings.LIMIT_PLAYER else None,
+        )
+        for chunk in chunks:
+            cids_by_code = self.get_players_cid(chunk["code"].tolist())
+            self.copy_into_staging(
+                "staging_players", chunk.assign(cid=chunk["code"].map(cids_by_code))
+            )
+
+        names_codes = {
+            "first_name_code": NameTypeCode.FIRST_NAME.value,
+            "last_name_code": NameTypeCode.LAST_NAME.value,
+        }
+        removed_players_cids = []
+        if not settings.LIMIT_PLAYER:
+            removed_players_cids = (
+                self.db.execute(DELETE_UNSTAGED_PLAYERS).scalars().all()
+            )
+        kept_players = self.db.execute(COUNT_KEPT_UNSTAGED_PLAYERS).scalar()
+        updated_players = self.db.execute(UPDATE_STAGED_PLAYERS, names_codes).all()
+        added_players = self.db.execute(INSERT_STAGED_PLAYERS, names_codes).rowcount
+
+        changed_countries = set(
+            self.db.execute(DELETE_CHANGED_PLAYERS_COUNTRIES).scalars()
+        )
+        self.db.execute(INSERT_STAGED_PLAYERS_COUNTRIES)
+        changed_positions = set(
+            self.db.execute(DELETE_CHANGED_PLAYERS_POSITIONS).scalars()
+        )
+        self.db.execute(INSERT_STAGED_PLAYERS_POSITIONS)
+        changed_stats = self.db.execute(UPSERT_STAGED_PLAYERS_STATS).rowcount
+
+        if settings.STORE_NFT_PART:
+            self.removed_cids.extend(cid for cid in removed_players_cids if cid)
+            self.removed_cids.extend(
+                previous_cid
+                for previous_cid, cid in updated_players
+                if previous_cid and previous_cid != cid
+            )
+        print(
+            f"|-- END SYNC PLAYERS : {added_players} ajoutés, {len(updated_players)} modifiés, {len(removed_players_cids)} supprimés, {kept_players} absents conservés, "
+            f"{len(changed_countries)} pays et {len(changed_positions)} postes modifiés, {changed_stats} statistiques modifiées --|"
+        )
+
+        if added_players or removed_players_cids or changed_positions or changed_stats:
+            self.calcul_player_rarities()
+
+    def delete_unreferenced(
+        self, model: type, removed_models: list, references: List[Column]
+    ) -> list:
+        """Supprime les modèles absents du fichier qui ne sont plus référencés.
+
+        Les clés étrangères sont en suppression en cascade : un modèle encore référencé
+        (joueurs d'un club, combinaisons d'un pays...) est conservé.
+
+        Args:
+            model (type): classe du modèle.
+            removed_models (list): modèles absents du fichier.
+            references (List[Column]): colonnes référençant le modèle.
+
+        Returns:
+            list: modèles supprimés.
+        """
+        removed_ids = {removed_model.id for removed_model in removed_models}
+        referenced_ids = set()
+        for reference in references:
+            referenced_ids.update(
+                referenced_id
+                for referenced_id, in self.db.query(reference)
+                .filter(reference.in_(removed_ids))
+                .distinct()
+            )
+        self.db.query(model).filter(model.id.in_(removed_ids - referenced_ids)).delete(
+            synchronize_session=False
+        )
+        return [
+            removed_model
+            for removed_model in removed_models
+            if removed_model.id not in referenced_ids
+        ]
+
+    def sync_fixtures(self):
+        """Synchronise les fixtures avec les fichiers CSV.
+
+        Les lignes de référence absentes des fichiers et plus référencées sont supprimées après les
+        joueurs, les images supprimées ne sont retirées de nft.storage qu'une fois la transaction validée.
+        """
+        if settings.DOWNLOAD_DATA:
+            check_files()
+
+        players_fixture = next(
+            fixture
+            for fixture in FIXTURES_ORDER
+            if fixture.get("table") == FixtureEnum.PLAYERS.value
+        )
+        with self.db.begin():
+            removed_countries = self.sync_countries(FixtureEnum.COUNTRIES.value)
+            removed_divisions = self.sync_divisions(FixtureEnum.DIVISIONS.value)
+            removed_clubs = self.sync_clubs(FixtureEnum.CLUBS.value)
+            self.sync_names(FixtureEnum.FIRST_NAMES.value)
+            self.sync_names(FixtureEnum.LAST_NAMES.value)
+            self.sync_players(**players_fixture)
+
+            deleted_models = {}
+            for model, removed_models, references in (
+                (Club, removed_clubs, [Player.club_id]),
+                (Division, removed_divisions, [Club.division_id]),
+                (
+                    Country,
+                    removed_countries,
+                    [
+                        Division.country_id,
+                        Club.country_id,
+                        players_countries.c.country_id,
+                        Combination.country_flag_id,
+                    ],
+                ),
+            ):
+                deleted_models[model] = self.delete_unreferenced(
+                    model, removed_models, references
+                )
+                if kept_models := len(removed_models) - len(deleted_models[model]):
+                    print(
+                        f"|-- {kept_models} {model.__tablename__} absents conservés, encore référencés --|"
+                    )
+            if settings.STORE_NFT_PART:
+                self.removed_cids.extend(
+                    country.cid for country in deleted_models[Country] if country.cid
+                )
+
+        if self.removed_cids:
+            self.nft_storage.delete_many(self.removed_cids)
+
+
+if __name__ == "__main__":
+    with SyncFixtures() as fixtures:
+        fixtures.sync_fixtures()
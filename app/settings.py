@@ -55,6 +55,10 @@ class GlobalSettings(BaseSettings):
     POSTGRES_SERVER: Optional[str] = Field("localhost", env="POSTGRES_SERVER")
     POSTGRES_PORT: Optional[int] = Field("5436", env="POSTGRES_PORT")
     POSTGRES_DB: Optional[str] = Field("generation-nft", env="POSTGRES_DB")
+    DB_POOL_SIZE: int = Field(5, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(10, env="DB_MAX_OVERFLOW")
+    DB_POOL_RECYCLE: int = Field(1800, env="DB_POOL_RECYCLE")
+    DB_POOL_TIMEOUT: int = Field(30, env="DB_POOL_TIMEOUT")
 
     # Models
     DEPLOY_PROTOTXT_URL_ID: Optional[str] = Field(None, env="DEPLOY_PROTOTXT_URL_ID")
@@ -117,15 +121,25 @@ class GlobalSettings(BaseSettings):
     )
     FIXTURES_CARD_FONT_ID: Optional[str] = Field(None, env="FIXTURES_CARD_FONT_ID")
     FIXTURE_FILES_PATH: str = f"{GENERATION_NFT_DB}/scripts/data"
+    FIXTURES_BULK_CHUNK_SIZE: int = 10000
 
     # Storage
     NFT_STORAGE_API_KEY: Optional[str] = Field(None, env="NFT_STORAGE_API_KEY")
     NFT_STORAGE_URL: Optional[str] = Field(None, env="NFT_STORAGE_URL")
     NFT_STORAGE_GATEWAY: Optional[str] = Field(None, env="NFT_STORAGE_GATEWAY")
+    NFT_STORAGE_WORKERS: int = 8
+    NFT_STORAGE_PICTURE_CACHE_SIZE: int = Field(
+        128, env="NFT_STORAGE_PICTURE_CACHE_SIZE"
+    )
+    CID_WORKERS: Optional[int] = Field(None, env="CID_WORKERS")
+    CID_CACHE_FILE: str = f"{GENERATION_NFT_DB}/scripts/data/cids.json"
 
     # FastAPI
     PROJECT_NAME: str = "Pronochain Generation NFT"
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
+    REFERENCE_CACHE_TTL: int = 300
+    REFERENCE_CACHE_MAX_ENTRIES: int = 1024
+    REFERENCE_CACHE_MAX_AGE: int = 60
 
     # CAR API
     CAR_API_SERVER: Optional[str] = Field(None, env="CAR_API_SERVER")
@@ -162,6 +176,8 @@ class GlobalSettings(BaseSettings):
     # Face parsing
     FACE_PARSING_MODEL_FILE: str = "face_parts.pth"
     RESNET_FILE: str = "resnet18.pth"
+    FACE_PARSING_TORCHSCRIPT: bool = Field(False, env="FACE_PARSING_TORCHSCRIPT")
+    FACE_PARSING_TORCHSCRIPT_FILE: str = "face_parts.pt"
     FACE_PARSING_MODEL_PATH: str = (
         f"{GENERATION_NFT_PATH}/libraries/face/face_parsing/pre_trained"
     )
@@ -189,6 +205,57 @@ class GlobalSettings(BaseSettings):
         f"{GENERATION_NFT_PATH}/libraries/face/tilt_learning/pre_trained"
     )
 
+    # Timing
+    TIMING_ENABLED: bool = Field(False, env="TIMING_ENABLED")
+    TIMING_BUCKETS: List[float] = [
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    ]
+
+    # Face preprocessing cache
+    FACE_PREPROCESSING_CACHE: bool = Field(True, env="FACE_PREPROCESSING_CACHE")
+    FACE_PREPROCESSING_CACHE_PATH: str = Field(
+        f"{GENERATION_NFT_PATH}/libraries/face/face_preprocessing/cache",
+        env="FACE_PREPROCESSING_CACHE_PATH",
+    )
+
+    # Face quality gate
+    QUALITY_GATE_ENABLED: bool = Field(True, env="QUALITY_GATE_ENABLED")
+    QUALITY_GATE_MIN_CONFIDENCE: float = Field(0.8, env="QUALITY_GATE_MIN_CONFIDENCE")
+    QUALITY_GATE_MIN_FACE_SIZE: int = Field(64, env="QUALITY_GATE_MIN_FACE_SIZE")
+    QUALITY_GATE_TILT: str = Field("rank", env="QUALITY_GATE_TILT")
+    FACE_CANDIDATE_WORKERS: int = Field(0, env="FACE_CANDIDATE_WORKERS")
+
+    # Warm-up des workers de génération
+    WARMUP_ENABLED: bool = Field(False, env="WARMUP_ENABLED")
+    WARMUP_RETRIES: int = Field(2, env="WARMUP_RETRIES")
+    WARMUP_RETRY_DELAY: float = Field(1.0, env="WARMUP_RETRY_DELAY")
+
+    # Threads des workers de génération, None : valeur par défaut de la bibliothèque
+    OPENCV_THREADS: Optional[int] = Field(None, env="OPENCV_THREADS")
+    TORCH_THREADS: Optional[int] = Field(None, env="TORCH_THREADS")
+    TORCH_INTEROP_THREADS: Optional[int] = Field(None, env="TORCH_INTEROP_THREADS")
+    # liste de CPU au format de taskset, ex. "0-3,8"
+    WORKER_CPU_AFFINITY: Optional[str] = Field(None, env="WORKER_CPU_AFFINITY")
+
+    # Card encoding
+    CARD_PREVIEW_FORMAT: str = "png"
+    CARD_PREVIEW_PNG_COMPRESSION: int = 1
+    CARD_PREVIEW_QUALITY: int = 80
+    CARD_ARTIFACT_PNG_COMPRESSION: int = 9
+    CARD_ARTIFACT_PALETTE_COLORS: Optional[int] = None
+    CARD_ENCODING_WORKERS: int = 2
+
     # Migrations
     ALEMBIC_MIGRATION_PATH: str = "alembic/versions"
     ALEMBIC_CONFIG_PATH: str = "alembic.ini"